@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import hashlib
+import os
+
 from pyowm.agroapi10.enums import PresetEnum, PaletteEnum
 from pyowm.agroapi10.imagery import MetaTile, MetaGeoTiffImage, MetaPNGImage, SatelliteImage
 from pyowm.agroapi10.polygon import Polygon, GeoPolygon
@@ -8,13 +11,68 @@ from pyowm.agroapi10.search import SatelliteImagerySearchResultSet
 from pyowm.agroapi10.soil import Soil
 from pyowm.agroapi10.uris import ROOT_AGRO_API, ROOT_DOWNLOAD_PNG_API, ROOT_DOWNLOAD_GEOTIFF_API, POLYGONS_URI, \
     NAMED_POLYGON_URI, SOIL_URI, SATELLITE_IMAGERY_SEARCH_URI
+from pyowm.commons import exceptions
 from pyowm.commons.http_client import HttpClient
-from pyowm.commons.image import Image
+from pyowm.commons.image import Image, MappedImage
 from pyowm.commons.tile import Tile
 from pyowm.constants import AGRO_API_VERSION
 from pyowm.utils import timestamps
 
 
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+# downloads to a path go to a sidecar file named after it, which is renamed into place once complete...
+PARTIAL_DOWNLOAD_SUFFIX = '.part'
+
+# ... while the validator of the data it holds is kept in this other one, so that the download can be resumed
+VALIDATOR_SUFFIX = '.validator'
+
+
+def _file_digest(path, algorithm):
+    hasher = hashlib.new(algorithm)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DIGEST_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _read_validator(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _write_validator(path, headers):
+    # weak ETags cannot be used with If-Range
+    etag = headers.get('ETag')
+    validator = etag if etag is not None and not etag.startswith('W/') else headers.get('Last-Modified')
+    if validator is None:
+        _remove_if_exists(path)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(validator)
+
+
+def _remove_if_exists(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class _HashingWriter:
+    # a write-only file object that hashes data on its way to the wrapped one
+    def __init__(self, fileobj, hasher):
+        self.fileobj = fileobj
+        self.hasher = hasher
+
+    def write(self, data):
+        self.hasher.update(data)
+        return self.fileobj.write(data)
+
+
 class AgroManager:
 
     """
@@ -24,18 +82,27 @@ class AgroManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param session: a `requests.Session` shared among the HTTP clients (if not provided, each client handles its own)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
     :returns: an `AgroManager` instance
     :raises: `AssertionError` when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
         assert isinstance(API_key, str), 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_AGRO_API)
-        self.geotiff_downloader_http_client = HttpClient(self.API_key, config, ROOT_DOWNLOAD_GEOTIFF_API)
-        self.png_downloader_http_client = HttpClient(self.API_key, config, ROOT_DOWNLOAD_PNG_API)
+        self.http_client = HttpClient(API_key, config, ROOT_AGRO_API, session=session, cache=cache,
+                                      rate_limiter=rate_limiter)
+        self.geotiff_downloader_http_client = HttpClient(self.API_key, config, ROOT_DOWNLOAD_GEOTIFF_API,
+                                                         session=session, rate_limiter=rate_limiter)
+        self.png_downloader_http_client = HttpClient(self.API_key, config, ROOT_DOWNLOAD_PNG_API, session=session,
+                                                     rate_limiter=rate_limiter)
 
     def agro_api_version(self):
         return AGRO_API_VERSION
@@ -307,6 +374,95 @@ class AgroManager:
         else:
             raise ValueError("Cannot download: unsupported MetaImage subtype")
 
+    def download_satellite_image_to(self, metaimage, target, x=None, y=None, zoom=None, palette=None, resume=True,
+                                    checksum=None, checksum_algorithm='sha256'):
+        """
+        Downloads the satellite image described by the provided metadata straight into a file, streaming data to disk
+        chunk by chunk so that memory usage stays low whatever the size of the image is. In case the satellite image
+        is a tile, then tile coordinates and zoom must be provided. An optional palette ID can be provided, if
+        supported by the downloaded preset (currently only NDVI is supported)
+
+        When the target is a path, data is downloaded into a `<target>.part` file that is renamed to the target once
+        the download is complete, along with a `<target>.part.validator` file holding the `ETag` or `Last-Modified`
+        value of the image. If they are left over by an interrupted download, only the missing bytes are requested
+        (unless `resume` is ``False``), provided that the image has not changed on the server in the meantime. If a
+        checksum is provided, the downloaded data is verified against it: on mismatch the downloaded data is deleted,
+        so that the next attempt starts over.
+
+        :param metaimage: the satellite image's metadata, in the form of a `MetaImage` subtype instance
+        :type metaimage: a `pyowm.agroapi10.imagery.MetaImage` subtype
+        :param target: path to the target file, or a file-like object opened for binary writing
+        :type target: str, `os.PathLike` or a binary file-like object
+        :param x: x tile coordinate (only needed in case you are downloading a tile image)
+        :type x: int or `None`
+        :param y: y tile coordinate (only needed in case you are downloading a tile image)
+        :type y: int or `None`
+        :param zoom: zoom level (only needed in case you are downloading a tile image)
+        :type zoom: int or `None`
+        :param palette: ID of the color palette of the downloaded images. Values are provided by `pyowm.agroapi10.enums.PaletteEnum`
+        :type palette: str or `None`
+        :param resume: whether interrupted downloads to the target path should be resumed (defaults to ``True``)
+        :type resume: bool
+        :param checksum: the expected hex digest of the image data, if known
+        :type checksum: str or `None`
+        :param checksum_algorithm: the `hashlib` algorithm the checksum was computed with (defaults to 'sha256')
+        :type checksum_algorithm: str
+        :return: when the target is a path, a `pyowm.agroapi10.imagery.SatelliteImage` instance whose data is a
+            `pyowm.commons.image.MappedImage` lazily reading the target file; ``None`` when the target is a file object
+        :raises: *ChecksumMismatchError* when the downloaded data does not match the checksum, *ValueError* when the
+            metaimage type is not supported
+        """
+        if palette is not None:
+            assert isinstance(palette, str)
+            params = dict(paletteid=palette)
+        else:
+            palette = PaletteEnum.GREEN
+            params = {}
+        if isinstance(metaimage, MetaPNGImage):
+            http_client, prepared_url = self.png_downloader_http_client, metaimage.url
+        elif isinstance(metaimage, MetaGeoTiffImage):
+            http_client, prepared_url = self.geotiff_downloader_http_client, metaimage.url
+        elif isinstance(metaimage, MetaTile):
+            assert x is not None
+            assert y is not None
+            assert zoom is not None
+            http_client, prepared_url = self.http_client, self._fill_url(metaimage.url, x, y, zoom)
+        else:
+            raise ValueError("Cannot download: unsupported MetaImage subtype")
+        if checksum is not None:
+            assert isinstance(checksum, str)
+            hashlib.new(checksum_algorithm)  # fail fast on unknown algorithms
+        mime_type = metaimage.image_type.mime_type
+
+        if not isinstance(target, (str, os.PathLike)):
+            hasher = hashlib.new(checksum_algorithm) if checksum is not None else None
+            http_client.download_to(prepared_url, target if hasher is None else _HashingWriter(target, hasher),
+                                    params=params, mime_type=mime_type)
+            if hasher is not None and hasher.hexdigest() != checksum.lower():
+                raise exceptions.ChecksumMismatchError('Downloaded data does not match the expected checksum')
+            return None
+
+        path = os.fspath(target)
+        part_path = path + PARTIAL_DOWNLOAD_SUFFIX
+        validator_path = part_path + VALIDATOR_SUFFIX
+        # without a validator there is no telling whether the partial data is still valid
+        validator = _read_validator(validator_path) if resume else None
+        offset = os.path.getsize(part_path) if validator is not None and os.path.isfile(part_path) else 0
+        with open(part_path, 'r+b' if offset > 0 else 'wb') as f:
+            f.seek(offset)
+            http_client.download_to(prepared_url, f, params=params, mime_type=mime_type, offset=offset,
+                                    if_range=validator,
+                                    on_response=lambda status, headers: _write_validator(validator_path, headers))
+        if checksum is not None and _file_digest(part_path, checksum_algorithm) != checksum.lower():
+            os.remove(part_path)
+            _remove_if_exists(validator_path)
+            raise exceptions.ChecksumMismatchError('Downloaded data does not match the expected checksum')
+        os.replace(part_path, path)
+        _remove_if_exists(validator_path)
+        img = MappedImage(path, metaimage.image_type)
+        data = Tile(x, y, zoom, None, img) if isinstance(metaimage, MetaTile) else img
+        return SatelliteImage(metaimage, data, downloaded_on=timestamps.now(timeformat='unix'), palette=palette)
+
     def stats_for_satellite_image(self, metaimage):
         """
         Retrieves statistics for the satellite image described by the provided metadata.
@@ -17,21 +17,29 @@ class AirPollutionManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param session: a `requests.Session` shared among the HTTP clients (if not provided, each client handles its own)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
     :returns: an *AirPollutionManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
         self.ap_client = airpollution_client.AirPollutionHttpClient(
             API_key,
-            HttpClient(API_key, config, ROOT_POLLUTION_API_URL))
+            HttpClient(API_key, config, ROOT_POLLUTION_API_URL, session=session, cache=cache,
+                       rate_limiter=rate_limiter))
         self.new_ap_client = airpollution_client.AirPollutionHttpClient(
             API_key,
-            HttpClient(API_key, config, NEW_ROOT_POLLUTION_API_URL))
+            HttpClient(API_key, config, NEW_ROOT_POLLUTION_API_URL, session=session, cache=cache,
+                       rate_limiter=rate_limiter))
 
     def airpollution_api_version(self):
         return AIRPOLLUTION_API_VERSION
@@ -208,14 +216,8 @@ class AirPollutionManager:
             cannot be parsed, *APICallException* when OWM AirPollution API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        json_data = self.new_ap_client.get_air_pollution(params)
-        try:
-            return airstatus.AirStatus.from_dict(json_data)
-        except:
-            return None
+        json_data = self.new_ap_client.get_air_pollution(_coords_params(lat, lon))
+        return _parse_air_status(json_data, None)
 
     def air_quality_forecast_at_coords(self, lat, lon):
         """
@@ -230,14 +232,8 @@ class AirPollutionManager:
             cannot be parsed, *APICallException* when OWM AirPollution API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        json_data = self.new_ap_client.get_forecast_air_pollution(params)
-        try:
-            return airstatus.AirStatus.from_dict(json_data)
-        except:
-            return []
+        json_data = self.new_ap_client.get_forecast_air_pollution(_coords_params(lat, lon))
+        return _parse_air_status(json_data, [])
 
     def air_quality_history_at_coords(self, lat, lon, start, end=None):
         """
@@ -257,24 +253,39 @@ class AirPollutionManager:
             cannot be parsed, *APICallException* when OWM AirPollution API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        now = timestamps.now(timeformat='unix')
-        assert start is not None
-        start = formatting.timeformat(start, 'unix')
-        if end is None:
-            end = now
-        else:
-            end = formatting.timeformat(end, 'unix')
-            if end > now:
-                end = now
-
-        params = {'lon': lon, 'lat': lat, 'start': start, 'end': end}
+        params = _history_params(lat, lon, start, end)
         json_data = self.new_ap_client.get_historical_air_pollution(params)
-        try:
-            return airstatus.AirStatus.from_dict(json_data)
-        except:
-            return []
+        return _parse_air_status(json_data, [])
 
     def __repr__(self):
         return '<%s.%s>' % (__name__, self.__class__.__name__)
+
+
+# Validation, request building and response parsing are shared by AirPollutionManager and AsyncAirPollutionManager
+
+def _coords_params(lat, lon):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    return {'lon': lon, 'lat': lat}
+
+
+def _history_params(lat, lon, start, end):
+    params = _coords_params(lat, lon)
+    now = timestamps.now(timeformat='unix')
+    assert start is not None
+    start = formatting.timeformat(start, 'unix')
+    if end is None:
+        end = now
+    else:
+        end = formatting.timeformat(end, 'unix')
+        if end > now:
+            end = now
+    params.update(start=start, end=end)
+    return params
+
+
+def _parse_air_status(json_data, default):
+    try:
+        return airstatus.AirStatus.from_dict(json_data)
+    except:
+        return default
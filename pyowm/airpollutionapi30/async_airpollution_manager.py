@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.airpollutionapi30 import airpollution_manager
+from pyowm.airpollutionapi30.uris import NEW_ROOT_POLLUTION_API_URL, AIR_POLLUTION_URL, AIR_POLLUTION_FORECAST_URL, \
+    AIR_POLLUTION_HISTORY_URL
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.constants import AIRPOLLUTION_API_VERSION
+
+
+class AsyncAirPollutionManager:
+
+    """
+    The asyncio twin of `pyowm.airpollutionapi30.airpollution_manager.AirPollutionManager`: it exposes the same
+    methods as coroutines, except for the deprecated ones (`coindex_around_coords`, `ozone_around_coords`,
+    `no2index_around_coords` and `so2index_around_coords`).
+
+    :param API_key: the OWM AirPollution API key
+    :type API_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param session: an `aiohttp.ClientSession` shared among the HTTP clients (if not provided, each client handles
+        its own)
+    :type session: `aiohttp.ClientSession` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
+    :returns: an *AsyncAirPollutionManager* instance
+    :raises: *AssertionError* when no API Key is provided
+
+    """
+
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
+        assert API_key is not None, 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, NEW_ROOT_POLLUTION_API_URL, session=session, cache=cache,
+                                           rate_limiter=rate_limiter)
+
+    def airpollution_api_version(self):
+        return AIRPOLLUTION_API_VERSION
+
+    async def air_quality_at_coords(self, lat, lon):
+        """
+        Coroutine version of `AirPollutionManager.air_quality_at_coords`
+
+        :param lat: the location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: the location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :return: a *AirStatus* instance or ``None`` if data is not available
+        """
+        params = airpollution_manager._coords_params(lat, lon)
+        _, json_data = await self.http_client.get_json(AIR_POLLUTION_URL, params=params)
+        return airpollution_manager._parse_air_status(json_data, None)
+
+    async def air_quality_forecast_at_coords(self, lat, lon):
+        """
+        Coroutine version of `AirPollutionManager.air_quality_forecast_at_coords`
+
+        :param lat: the location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: the location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :return: a `list` of *AirStatus* instances or an empty `list` if data is not available
+        """
+        params = airpollution_manager._coords_params(lat, lon)
+        _, json_data = await self.http_client.get_json(AIR_POLLUTION_FORECAST_URL, params=params)
+        return airpollution_manager._parse_air_status(json_data, [])
+
+    async def air_quality_history_at_coords(self, lat, lon, start, end=None):
+        """
+        Coroutine version of `AirPollutionManager.air_quality_history_at_coords`
+
+        :param lat: the location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: the location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :param start: the object conveying the start value of the search time window
+        :type start: int, ``datetime.datetime`` or ISO8601-formatted string
+        :param end: the object conveying the end value of the search time window. Values in the future will be clipped
+           to the current timestamp. Defaults to the current UNIX timestamp.
+        :type end: int, ``datetime.datetime`` or ISO8601-formatted string
+        :return: a `list` of *AirStatus* instances or an empty `list` if data is not available
+        """
+        params = airpollution_manager._history_params(lat, lon, start, end)
+        _, json_data = await self.http_client.get_json(AIR_POLLUTION_HISTORY_URL, params=params)
+        return airpollution_manager._parse_air_status(json_data, [])
+
+    async def close(self):
+        """
+        Releases the HTTP session owned by this manager
+        """
+        await self.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
@@ -19,16 +19,23 @@ class AlertManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param session: a `requests.Session` shared among the HTTP clients (if not provided, each client handles its own)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
     :returns: an *AlertManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_ALERT_API_URL)
+        self.http_client = HttpClient(API_key, config, ROOT_ALERT_API_URL, session=session, cache=cache,
+                                      rate_limiter=rate_limiter)
 
     def alert_api_version(self):
         return ALERT_API_VERSION
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from pyowm.commons import exceptions
+from pyowm.commons.cache import cache_key, cache_ttl_for
+from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.json_backend import json_backend_from
+from pyowm.commons.rate_limiter import retry_after_secs
+from pyowm.commons.http_client import HttpClient, HttpRequestBuilder, DEFAULT_POOL_CONNECTIONS, \
+    DEFAULT_POOL_MAXSIZE
+
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+RETRY_METHODS = ['GET', 'PUT', 'DELETE']
+
+
+def _assert_aiohttp_available():
+    if aiohttp is None:
+        raise ImportError('The asyncio client requires the aiohttp package: install it with `pip install pyowm[async]`')
+
+
+def new_async_session(config):
+    """
+    Creates a keep-alive `aiohttp.ClientSession` whose connection pool is sized according to the `connection` section
+    of the supplied configuration. Must be invoked from within a running event loop.
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :returns: an `aiohttp.ClientSession` instance
+    """
+    _assert_aiohttp_available()
+    assert isinstance(config, dict)
+    conn = config['connection']
+    pool_connections = conn.get('pool_connections', DEFAULT_POOL_CONNECTIONS)
+    pool_maxsize = conn.get('pool_maxsize', DEFAULT_POOL_MAXSIZE)
+    connector = aiohttp.TCPConnector(limit=pool_connections * pool_maxsize, limit_per_host=pool_maxsize,
+                                     ssl=None if conn['verify_ssl_certs'] else False)
+    return aiohttp.ClientSession(connector=connector)
+
+
+class AsyncHttpClient:
+
+    """
+    An asyncio HTTP client that is the coroutine-based twin of `pyowm.commons.http_client.HttpClient`: it exposes the
+    same methods (as coroutines) and maps errors onto the same exceptions. It is backed by the `aiohttp` package.
+
+    :param api_key: the OWM API key
+    :type api_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param root_uri: the root URI of the API endpoint
+    :type root_uri: str
+    :param admits_subdomains: if the root URI of the API endpoint admits subdomains based on the subcription type (default: True)
+    :type admits_subdomains: bool
+    :param session: an `aiohttp.ClientSession` to be shared with other clients (if not provided, a per-client one is
+        lazily created and then released by `close()`)
+    :type session: `aiohttp.ClientSession` or `None`
+    :param cache: a cache for the responses of `get_json` calls (see `pyowm.commons.http_client.HttpClient`)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter that all API calls (retries included) go through before being performed
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
+    """
+
+    def __init__(self, api_key, config, root_uri, admits_subdomains=True, session=None, cache=None,
+                 rate_limiter=None):
+        _assert_aiohttp_available()
+        assert isinstance(api_key, str)
+        self.api_key = api_key
+        assert isinstance(config, dict)
+        self.config = config
+        assert isinstance(root_uri, str)
+        self.root_uri = root_uri
+        assert isinstance(admits_subdomains, bool)
+        self.admits_subdomains = admits_subdomains
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.json_backend = json_backend_from(config)
+        self._session = session
+        self._owns_session = session is None
+
+    @property
+    def session(self):
+        if self._session is None or self._session.closed:
+            self._session = new_async_session(self.config)
+            self._owns_session = True
+        return self._session
+
+    async def close(self):
+        """
+        Releases the underlying HTTP session, unless it was provided by the caller
+        """
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _builder(self, path, params, headers):
+        return HttpRequestBuilder(self.root_uri, self.api_key, self.config, has_subdomains=self.admits_subdomains)\
+            .with_path(path)\
+            .with_api_key()\
+            .with_language()\
+            .with_query_params(params if params is not None else dict())\
+            .with_headers(headers if headers is not None else dict())
+
+    def _partial_path(self, path):
+        # check URL fromt the metaimage: if it looks like a complete URL, use that one (I know, it's a hack...)
+        try:
+            return path.split(self.root_uri)[1].lstrip('/')
+        except:
+            return path
+
+    def _proxy_for(self, url, proxies):
+        if not proxies:
+            return None
+        proxy = proxies.get('https' if url.startswith('https') else 'http')
+        if proxy is not None and proxy.startswith('socks'):
+            raise exceptions.ConfigurationError('SOCKS proxies are not supported by the asyncio client')
+        return proxy
+
+    async def _request(self, method, builder, data=None):
+        url, params, headers, proxies = builder.build()
+        # aiohttp only accepts str values for query params, and requests skips those having None values
+        params = {k: v if isinstance(v, str) else str(v) for k, v in params.items() if v is not None}
+        max_retries = self.config['connection']['max_retries']
+        attempts = 1 + (max_retries if max_retries is not None and method in RETRY_METHODS else 0)
+        timeout = aiohttp.ClientTimeout(total=self.config['connection']['timeout_secs'])
+        # passed on each request, so that it is honoured by sessions provided by the caller too
+        ssl = None if self.config['connection']['verify_ssl_certs'] else False
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                async with self.session.request(method, url, params=params, json=data, headers=headers,
+                                                proxy=self._proxy_for(url, proxies), timeout=timeout,
+                                                ssl=ssl) as resp:
+                    body = await resp.read()
+                    status = resp.status
+                    if status == 429 and self.rate_limiter is not None:
+                        self.rate_limiter.throttle(retry_after_secs(resp.headers))
+            except aiohttp.ClientSSLError as e:
+                raise exceptions.InvalidSSLCertificateError(str(e))
+            except aiohttp.ClientConnectionError as e:
+                if last_attempt:
+                    raise exceptions.InvalidSSLCertificateError(str(e))
+                continue
+            except asyncio.TimeoutError:
+                if last_attempt:
+                    raise exceptions.TimeoutError('API call timed out')
+                continue
+            if status in RETRY_STATUS_CODES and not last_attempt:
+                continue
+            HttpClient.check_status_code(status, body.decode('utf-8', errors='replace'))
+            return status, body
+
+    async def get_json(self, path, params=None, headers=None):
+        builder = self._builder(path, params, headers)
+        cacheable, ttl = cache_ttl_for(self.config, path) if self.cache is not None else (False, None)
+        if cacheable:
+            url, query_params, _, _ = builder.build()
+            key = cache_key(url, query_params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return 200, self._loads(cached)
+        status, body = await self._request('GET', builder)
+        try:
+            json_data = self._loads(body)
+        except:
+            raise exceptions.ParseAPIResponseError('Impossible to parse API response data')
+        if cacheable:
+            self.cache.set(key, body.decode('utf-8'), ttl)
+        return status, json_data
+
+    async def get_png(self, path, params=None, headers=None):
+        builder = self._builder(self._partial_path(path), params, headers)\
+            .with_header('Accept', ImageTypeEnum.PNG.mime_type)
+        return await self._request('GET', builder)
+
+    async def get_geotiff(self, path, params=None, headers=None):
+        builder = self._builder(self._partial_path(path), params, headers)\
+            .with_header('Accept', ImageTypeEnum.GEOTIFF.mime_type)
+        return await self._request('GET', builder)
+
+    async def post(self, path, params=None, data=None, headers=None):
+        status, body = await self._request('POST', self._builder(path, params, headers), data=data)
+        # this is a defense against OWM API responses containing an empty body!
+        try:
+            json_data = self._loads(body)
+        except:
+            json_data = {}
+        return status, json_data
+
+    async def put(self, path, params=None, data=None, headers=None):
+        status, body = await self._request('PUT', self._builder(path, params, headers), data=data)
+        # this is a defense against OWM API responses containing an empty body!
+        try:
+            json_data = self._loads(body)
+        except:
+            json_data = {}
+        return status, json_data
+
+    async def delete(self, path, params=None, data=None, headers=None):
+        status, body = await self._request('DELETE', self._builder(path, params, headers), data=data)
+        # this is a defense against OWM API responses containing an empty body!
+        try:
+            json_data = self._loads(body)
+        except:
+            json_data = None
+        return status, json_data
+
+    def _loads(self, data):
+        return json.loads(data) if self.json_backend is None else self.json_backend.loads(data)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return "<%s.%s - root: %s>" % (__name__, self.__class__.__name__, self.root_uri)
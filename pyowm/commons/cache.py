@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import shelve
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from pyowm.commons import exceptions
+
+# query params that are never part of cache keys
+API_KEY_PARAMS = ('APPID', 'appid')
+
+
+def cache_key(url, params):
+    """
+    Gives the cache key for an API call, made of the URL and of the query params sorted by name. The API key is left
+    out of the key, so that the same entries can be shared among different API keys.
+
+    :param url: the full URL of the API call
+    :type url: str
+    :param params: the query params of the API call
+    :type params: dict
+    :returns: str
+    """
+    items = sorted((k, str(v)) for k, v in params.items() if k not in API_KEY_PARAMS and v is not None)
+    return url + '?' + urlencode(items) if items else url
+
+
+def cache_ttl_for(config, path):
+    """
+    Tells whether the responses of an API endpoint are to be cached and for how long, according to the `ttls`
+    sub-dict of the `cache` section of the supplied configuration.
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :param path: the path of the API endpoint
+    :type path: str
+    :returns: a `(cacheable, ttl)` tuple, where `ttl` is ``None`` for entries that never expire
+    """
+    ttls = config.get('cache', dict()).get('ttls', dict())
+    if path not in ttls:
+        return False, None
+    return True, ttls[path]
+
+
+class Cache:
+    """
+    Abstract base class for caches of API responses. Entries are strings, each one having its own time-to-live.
+    Implementations are thread-safe and evict the least recently used entries when they grow over `max_size` items.
+    """
+
+    def get(self, key):
+        """
+        Looks up for the value bound to the key
+
+        :param key: the key
+        :type key: str
+        :returns: the `str` value or ``None`` if the key is not in the cache or its entry is expired
+        """
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=None):
+        """
+        Binds the value to the key
+
+        :param key: the key
+        :type key: str
+        :param value: the value
+        :type value: str
+        :param ttl: time-to-live of the entry in seconds (``None`` means: never expires)
+        :type ttl: int or ``None``
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        Removes all entries
+        """
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    @staticmethod
+    def _expiry(ttl):
+        return None if ttl is None else time.time() + ttl
+
+    @staticmethod
+    def _is_expired(expires_at):
+        return expires_at is not None and expires_at <= time.time()
+
+    def __repr__(self):
+        return "<%s.%s - size=%s>" % (__name__, self.__class__.__name__, len(self))
+
+
+class LRUCache(Cache):
+    """
+    In-memory cache
+
+    :param max_size: the max number of entries (defaults to 1000)
+    :type max_size: int
+    """
+
+    def __init__(self, max_size=1000):
+        assert isinstance(max_size, int) and max_size > 0, "'max_size' must be a positive int"
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if self._is_expired(expires_at):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._entries[key] = (value, self._expiry(ttl))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteCache(Cache):
+    """
+    On-disk cache backed by a SQLite database file
+
+    :param path: path to the database file, which is created if it does not exist
+    :type path: str
+    :param max_size: the max number of entries (defaults to 1000)
+    :type max_size: int
+    """
+
+    def __init__(self, path, max_size=1000):
+        assert isinstance(path, str), "'path' must be a str"
+        assert isinstance(max_size, int) and max_size > 0, "'max_size' must be a positive int"
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                                 'expires_at REAL, accessed_at REAL NOT NULL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)')
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute('SELECT value, expires_at FROM entries WHERE key=?', (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if self._is_expired(expires_at):
+                self._connection.execute('DELETE FROM entries WHERE key=?', (key,))
+                return None
+            self._connection.execute('UPDATE entries SET accessed_at=? WHERE key=?', (time.time(), key))
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._connection.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)',
+                                     (key, value, self._expiry(ttl), time.time()))
+            size = self._connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+            if size > self.max_size:
+                self._connection.execute('DELETE FROM entries WHERE key IN (SELECT key FROM entries '
+                                         'ORDER BY accessed_at LIMIT ?)', (size - self.max_size,))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute('DELETE FROM entries')
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+
+class ShelveCache(Cache):
+    """
+    On-disk cache backed by a `shelve` file
+
+    :param path: path to the shelve file, which is created if it does not exist
+    :type path: str
+    :param max_size: the max number of entries (defaults to 1000)
+    :type max_size: int
+    """
+
+    def __init__(self, path, max_size=1000):
+        assert isinstance(path, str), "'path' must be a str"
+        assert isinstance(max_size, int) and max_size > 0, "'max_size' must be a positive int"
+        self.path = path
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._shelf = shelve.open(path)
+        # the recency order is kept in memory and rebuilt from the stored access times upon opening
+        self._recency = OrderedDict(sorted(((k, entry[2]) for k, entry in self._shelf.items()),
+                                           key=lambda item: item[1]))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._shelf.get(key)
+            if entry is None:
+                return None
+            value, expires_at, _ = entry
+            if self._is_expired(expires_at):
+                del self._shelf[key]
+                del self._recency[key]
+                return None
+            now = time.time()
+            self._shelf[key] = (value, expires_at, now)
+            self._recency[key] = now
+            self._recency.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            now = time.time()
+            self._shelf[key] = (value, self._expiry(ttl), now)
+            self._recency[key] = now
+            self._recency.move_to_end(key)
+            while len(self._recency) > self.max_size:
+                oldest, _ = self._recency.popitem(last=False)
+                del self._shelf[oldest]
+
+    def clear(self):
+        with self._lock:
+            self._shelf.clear()
+            self._recency.clear()
+
+    def close(self):
+        with self._lock:
+            self._shelf.close()
+
+    def __len__(self):
+        return len(self._recency)
+
+
+def cache_from(config):
+    """
+    Builds the cache described by the `cache` section of the supplied configuration.
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :returns: a *Cache* instance or ``None`` if caching is not enabled
+    :raises: *ConfigurationError* when the cache backend is unknown or its file path is missing
+    """
+    assert isinstance(config, dict)
+    cache_config = config.get('cache')
+    if not cache_config or cache_config.get('backend') is None:
+        return None
+    backend = cache_config['backend']
+    max_size = cache_config.get('max_size', 1000)
+    if backend == 'memory':
+        return LRUCache(max_size)
+    if backend not in ('sqlite', 'shelve'):
+        raise exceptions.ConfigurationError('Unknown cache backend: {}'.format(backend))
+    path = cache_config.get('path')
+    if path is None:
+        raise exceptions.ConfigurationError('A file path is needed by the {} cache backend'.format(backend))
+    path = os.path.expanduser(path)
+    return SQLiteCache(path, max_size) if backend == 'sqlite' else ShelveCache(path, max_size)
@@ -3,81 +3,415 @@
 
 import os
 import bz2
+import math
+import re
+import shutil
 import sqlite3
 import sys
 import tempfile
+import threading
+from importlib.metadata import version, PackageNotFoundError
+from urllib.request import pathname2url
 
 if sys.version_info >= (3, 12):
     from importlib.resources import as_file, files
 else:
     from importlib_resources import as_file, files
 
+from pyowm.utils import geo
 from pyowm.weatherapi30.location import Location
 
 CITY_ID_DB_PATH = 'cityids/cities.db.bz2'
+CITY_ID_DB_FILENAME = 'cities.db'
+MMAP_SIZE = 256 * 1024 * 1024
+
+# how many candidates found via the trigram index are ranked by edit distance in `fuzzy` matching
+FUZZY_CANDIDATES = 200
+
+# the radius of the first search performed by `nearest`, which is then widened until enough cities are found
+NEAREST_START_RADIUS_KM = 25.
+
+# names up to this length are also fuzzy-matched against the cities whose name starts with the same letter
+SHORT_NAME_LENGTH = 5
+
+NAME_INDEX = [
+    "CREATE INDEX IF NOT EXISTS city_name_nocase ON city (name COLLATE NOCASE)"
+]
+
+FTS_INDEX = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS city_fts USING fts5(name, content='city', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "INSERT INTO city_fts(city_fts) VALUES ('rebuild')"
+]
+
+SPATIAL_INDEX = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS city_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon)",
+    "INSERT INTO city_rtree SELECT id, lat, lat, lon, lon FROM city"
+]
+
+# used instead of the R*Tree when the SQLite library is built without it
+FALLBACK_SPATIAL_INDEX = "CREATE INDEX IF NOT EXISTS city_lat_lon ON city (lat, lon)"
+
+TRIGRAM_INDEX = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS city_trigram USING fts5(name, content='city', content_rowid='id', "
+    "tokenize='trigram')",
+    "INSERT INTO city_trigram(city_trigram) VALUES ('rebuild')"
+]
+
+
+# the indexes that can be added to the cities database, by the name `build_index` knows them
+INDEXES = ('name', 'fts', 'trigram', 'spatial')
+
+
+def build_index(connection, index):
+    """
+    Adds to the cities database one of the indexes needed by the `prefix`, `fts` and `fuzzy` matchings and by the
+    spatial lookups: `name` (case-insensitive names), `fts` (full-text search), `trigram` (candidates for `fuzzy`
+    matching) or `spatial`. The trigram index is skipped when the SQLite library does not support it (it requires
+    SQLite 3.34+), while a plain index on coordinates replaces the spatial R*Tree index when the library is built
+    without it
+    :param connection: a `sqlite3.Connection` to a writable cities database
+    :param index: str, one of `INDEXES`
+    :raises ValueError if the index is unknown
+    :return: None
+    """
+    if index not in INDEXES:
+        raise ValueError("Unknown index: allowed values are %s" % ", ".join(INDEXES))
+    with connection:
+        if index == 'name':
+            for statement in NAME_INDEX:
+                connection.execute(statement)
+        elif index == 'fts':
+            for statement in FTS_INDEX:
+                connection.execute(statement)
+        elif index == 'spatial':
+            try:
+                for statement in SPATIAL_INDEX:
+                    connection.execute(statement)
+            except sqlite3.OperationalError:
+                connection.execute(FALLBACK_SPATIAL_INDEX)
+        else:
+            try:
+                for statement in TRIGRAM_INDEX:
+                    connection.execute(statement)
+            except sqlite3.OperationalError:
+                pass
+
+
+def build_search_indexes(connection):
+    """
+    Adds to the cities database all of the indexes that `build_index` knows
+    :param connection: a `sqlite3.Connection` to a writable cities database
+    :return: None
+    """
+    for index in INDEXES:
+        build_index(connection, index)
+
+
+def has_search_indexes(connection):
+    """
+    Tells if the cities database has the indexes created by `build_search_indexes`
+    :param connection: a `sqlite3.Connection` to the cities database
+    :return: bool
+    """
+    names = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+    return {'city_name_nocase', 'city_fts'} <= names and bool({'city_rtree', 'city_lat_lon'} & names)
+
+
+def _like_prefix(text):
+    """
+    Escapes the wildcards of a LIKE pattern matching strings that start with the provided text
+    """
+    return re.sub(r'([\\%_])', r'\\\1', text) + '%'
+
+
+def _edit_distance(a, b):
+    """
+    Edit distance between two strings, where swapping two adjacent chars counts as one edit like inserting, deleting
+    or replacing a char does (optimal string alignment distance)
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                distance = min(distance, before_previous[j - 2] + 1)
+            current.append(distance)
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+def _typo_variants(city_name):
+    """
+    Gives the strings that the provided one turns into when a char is dropped or two adjacent chars are swapped,
+    which are the typos that can leave a short name with no trigrams in common with the right one
+    """
+    name = city_name.lower()
+    variants = dict.fromkeys(name[:i] + name[i + 1:] for i in range(len(name)))
+    variants.update(dict.fromkeys(name[:i] + name[i + 1] + name[i] + name[i + 2:] for i in range(len(name) - 1)))
+    variants.pop(name, None)
+    return list(variants)
+
+
+def _distance_km(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance between two points, via the haversine formula
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2) ** 2 + \
+        math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 2 * geo.EARTH_RADIUS_KM * math.asin(min(1., math.sqrt(a)))
+
+
+def _bounding_boxes(lat, lon, radius_km):
+    """
+    Gives the boxes that cover the circle having the specified centre and radius, as a list of
+    `(min_lat, max_lat, min_lon, max_lon)` tuples: the box is split in two when it crosses the 180th meridian.
+    See: http://janmatuschek.de/LatitudeLongitudeBoundingCoordinates
+    """
+    rad_distance = radius_km / geo.EARTH_RADIUS_KM
+    min_lat = math.radians(lat) - rad_distance
+    max_lat = math.radians(lat) + rad_distance
+    if min_lat <= -math.pi / 2 or max_lat >= math.pi / 2 or rad_distance >= math.pi / 2:
+        # a pole is in the circle, so all longitudes are
+        return [(math.degrees(max(min_lat, -math.pi / 2)), math.degrees(min(max_lat, math.pi / 2)), -180., 180.)]
+    delta_lon = math.degrees(math.asin(min(1., math.sin(rad_distance) / math.cos(math.radians(lat)))))
+    min_lat, max_lat = math.degrees(min_lat), math.degrees(max_lat)
+    min_lon, max_lon = lon - delta_lon, lon + delta_lon
+    if min_lon < -180.:
+        return [(min_lat, max_lat, min_lon + 360., 180.), (min_lat, max_lat, -180., max_lon)]
+    if max_lon > 180.:
+        return [(min_lat, max_lat, min_lon, 180.), (min_lat, max_lat, -180., max_lon - 360.)]
+    return [(min_lat, max_lat, min_lon, max_lon)]
+
+
+def _max_edit_distance(city_name):
+    """
+    Tells how many typos are tolerated by `fuzzy` matching, depending on the length of the searched name
+    """
+    length = len(city_name)
+    return 1 if length <= 4 else 2 if length <= 8 else 3
 
 
 class CityIDRegistry:
 
     MATCHINGS = {
         'exact': "SELECT city_id, name, country, state, lat, lon FROM city WHERE name=?",
-        'like': r"SELECT city_id, name, country, state, lat, lon FROM city WHERE name LIKE ?"
+        'like': r"SELECT city_id, name, country, state, lat, lon FROM city WHERE name LIKE ?",
+        'prefix': r"SELECT city_id, name, country, state, lat, lon FROM city WHERE name LIKE ? ESCAPE '\'",
+        'fts': "SELECT city_id, city.name, country, state, lat, lon FROM city_fts "
+               "JOIN city ON city.id = city_fts.rowid WHERE city_fts MATCH ?",
+        'fuzzy': "SELECT city_id, city.name, country, state, lat, lon FROM city_trigram "
+                 "JOIN city ON city.id = city_trigram.rowid WHERE city_trigram MATCH ?"
+    }
+
+    # the indexes each matching needs
+    MATCHING_INDEXES = {
+        'prefix': ('name',),
+        'fts': ('fts',),
+        'fuzzy': ('trigram', 'name')
+    }
+
+    TYPO_VARIANTS_QUERY = "SELECT city_id, name, country, state, lat, lon FROM city " \
+                          "WHERE name COLLATE NOCASE IN (%s)"
+
+    BATCH_MATCHINGS = {
+        'exact': "SELECT q.idx, c.city_id, c.name, c.country, c.state, c.lat, c.lon FROM temp.city_query q "
+                 "JOIN city c ON c.name = q.name COLLATE NOCASE AND c.name = q.name",
+        'like': "SELECT q.idx, c.city_id, c.name, c.country, c.state, c.lat, c.lon FROM temp.city_query q "
+                "JOIN city c ON c.name LIKE '%' || q.name || '%'"
+    }
+
+    BATCH_FILTERS = " AND (q.country IS NULL OR c.country = q.country) AND (q.state IS NULL OR c.state = q.state) " \
+                    "ORDER BY q.idx, c.id"
+
+    SPATIAL_QUERIES = {
+        'city_rtree': "SELECT city_id, name, country, state, lat, lon FROM city_rtree JOIN city "
+                      "ON city.id = city_rtree.id "
+                      "WHERE max_lat >= ? AND min_lat <= ? AND max_lon >= ? AND min_lon <= ?",
+        'city_lat_lon': "SELECT city_id, name, country, state, lat, lon FROM city "
+                        "WHERE lat BETWEEN ? AND ? AND lon BETWEEN ? AND ?"
+    }
+
+    ORDERINGS = {
+        'prefix': " ORDER BY length(name), name",
+        'fts': " ORDER BY city_fts.rank, length(city.name)",
+        'fuzzy': " ORDER BY city_trigram.rank"
     }
 
-    def __init__(self, sqlite_db_path: str):
-        self.connection = self.__decompress_db_to_memory(sqlite_db_path)
+    _instances = dict()
+    _instances_lock = threading.Lock()
+
+    def __init__(self, sqlite_db_path: str, cache_dir=None):
+        """
+        :param sqlite_db_path: path to the bz2-compressed SQLite database of cities
+        :param cache_dir: path to a directory where the database is decompressed once and then opened read-only by
+        any registry (across processes too). Defaults to `None`, which means: decompress the database into memory
+        """
+        self._lock = threading.Lock()
+        if cache_dir is None:
+            self.connection = self.__decompress_db_to_memory(sqlite_db_path)
+        else:
+            self.connection = self.__open_cached_db(sqlite_db_path, cache_dir)
+        # cached DBs are indexed once and for all when decompressed, while in-memory ones get each index the first
+        # time a query needs it
+        self._indexes = set(INDEXES) if has_search_indexes(self.connection) else set()
 
     @classmethod
-    def get_instance(cls):
+    def get_instance(cls, cache_dir=None):
         """
-        Factory method returning the default city ID registry
+        Factory method returning the default city ID registry. The registry is a process-wide singleton, one for
+        each cache directory
+        :param cache_dir: see the class constructor
         :return: a `CityIDRegistry` instance
         """
-        return CityIDRegistry(CITY_ID_DB_PATH)
+        key = None if cache_dir is None else os.path.abspath(os.path.expanduser(cache_dir))
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = CityIDRegistry(CITY_ID_DB_PATH, cache_dir=key)
+            return cls._instances[key]
 
     def __decompress_db_to_memory(self, sqlite_db_path: str):
         """
         Decompresses to memory the SQLite database at the provided path
         :param sqlite_db_path: str
-        :return: None
+        :return: a `sqlite3.Connection` to the in-memory database
         """
         # https://stackoverflow.com/questions/3850022/how-to-load-existing-db-file-to-memory-in-python-sqlite3
         # https://stackoverflow.com/questions/32681761/how-can-i-attach-an-in-memory-sqlite-database-in-python
         # https://pymotw.com/2/bz2/
 
-        # read and uncompress data from compressed DB
-        with as_file(files() / sqlite_db_path) as res_name:
-            bz2_db = bz2.BZ2File(res_name)
-        decompressed_data = bz2_db.read()
-
         # dump decompressed data to a temp DB
         try:
             with tempfile.NamedTemporaryFile(mode='wb', delete=False) as tmpf:
-                tmpf.write(decompressed_data)
                 tmpf_name = tmpf.name
+                self.__decompress_db_to(sqlite_db_path, tmpf)
 
-                # read temp DB to memory and return handle
-                src_conn = sqlite3.connect(tmpf_name)
-                dest_conn = sqlite3.connect(':memory:')
-                src_conn.backup(dest_conn)
-                src_conn.close()
-                return dest_conn
+            # read temp DB to memory and return handle
+            src_conn = sqlite3.connect(tmpf_name)
+            dest_conn = sqlite3.connect(':memory:', check_same_thread=False)
+            src_conn.backup(dest_conn)
+            src_conn.close()
+            return dest_conn
         finally:
             os.remove(tmpf_name)
 
+    def __open_cached_db(self, sqlite_db_path: str, cache_dir: str):
+        """
+        Opens read-only the decompressed copy of the SQLite database at the provided path, which lives in a
+        sub-folder of the cache directory named after the library version: the copy is created if it does not exist
+        :param sqlite_db_path: str
+        :param cache_dir: str
+        :return: a `sqlite3.Connection` to the decompressed database
+        """
+        try:
+            lib_version = version('pyowm')
+        except PackageNotFoundError:
+            lib_version = 'unknown'
+        target_dir = os.path.join(os.path.expanduser(cache_dir), lib_version)
+        target = os.path.join(target_dir, CITY_ID_DB_FILENAME)
+        if os.path.isfile(target):
+            conn = self.__open_immutable_db(target)
+            if has_search_indexes(conn):
+                return conn
+            # left there by a release that did not index the DB
+            conn.close()
+        os.makedirs(target_dir, exist_ok=True)
+        # decompress to a temp file that is then atomically renamed, so that concurrent processes never see a
+        # partially written DB
+        with tempfile.NamedTemporaryFile(mode='wb', dir=target_dir, delete=False) as tmpf:
+            pass
+        try:
+            with open(tmpf.name, 'wb') as f:
+                self.__decompress_db_to(sqlite_db_path, f)
+            # the search indexes are built once here, as the DB is read-only from now on
+            conn = sqlite3.connect(tmpf.name)
+            try:
+                if not has_search_indexes(conn):
+                    build_search_indexes(conn)
+            finally:
+                conn.close()
+        except:
+            os.remove(tmpf.name)
+            raise
+        os.replace(tmpf.name, target)
+        return self.__open_immutable_db(target)
+
+    def __open_immutable_db(self, path: str):
+        """
+        Opens read-only the SQLite database at the provided path, with memory-mapped I/O
+        :param path: str
+        :return: a `sqlite3.Connection`
+        """
+        # the DB is never modified once decompressed: opening it as immutable skips locking and change detection
+        conn = sqlite3.connect('file:{}?mode=ro&immutable=1'.format(pathname2url(path)), uri=True,
+                               check_same_thread=False)
+        conn.execute('PRAGMA mmap_size={}'.format(MMAP_SIZE))
+        return conn
+
+    def __decompress_db_to(self, sqlite_db_path: str, target_file):
+        """
+        Streams the decompressed data of the SQLite database at the provided path into the target file
+        :param sqlite_db_path: str
+        :param target_file: a binary file object
+        :return: None
+        """
+        with as_file(files() / sqlite_db_path) as res_name:
+            with bz2.open(res_name, 'rb') as bz2_db:
+                shutil.copyfileobj(bz2_db, target_file, 1024 * 1024)
+
+    def __ensure_indexes(self, *indexes):
+        """
+        Builds the specified indexes if they are missing from the DB, which can only happen to in-memory DBs
+        :param indexes: names of indexes, see `build_index`
+        :return: None
+        """
+        if self._indexes.issuperset(indexes):
+            return
+        with self._lock:
+            for index in indexes:
+                if index not in self._indexes:
+                    build_index(self.connection, index)
+                    self._indexes.add(index)
+
+    @staticmethod
+    def __fts_query(city_name: str):
+        """
+        Turns the string fed to the `fts` matching into a FTS5 query where each word matches as a prefix
+        :param city_name: str
+        :return: str, empty if the string has no words
+        """
+        return ' '.join('"{}"*'.format(word) for word in re.findall(r'\w+', city_name))
+
+    @staticmethod
+    def __trigrams_query(city_name: str):
+        """
+        Turns the string fed to the `fuzzy` matching into a FTS5 query matching any of its trigrams
+        :param city_name: str
+        :return: str, empty if the string is shorter than 3 chars
+        """
+        name = city_name.lower()
+        trigrams = dict.fromkeys(name[i:i + 3] for i in range(len(name) - 2))
+        return ' OR '.join('"{}"'.format(t.replace('"', '""')) for t in trigrams)
+
     def __query(self, sql_query: str, *args):
         """
         Queries the DB with the specified SQL query
         :param sql_query: str
         :return: list of tuples
         """
-        cursor = self.connection.cursor()
-        try:
-            return cursor.execute(sql_query, args).fetchall()
-        finally:
-            cursor.close()
+        with self._lock:
+            cursor = self.connection.cursor()
+            try:
+                return cursor.execute(sql_query, args).fetchall()
+            finally:
+                cursor.close()
 
-    def ids_for(self, city_name, country=None, state=None, matching='like'):
+    def ids_for(self, city_name, country=None, state=None, matching='like', limit=None):
         """
         Returns a list of tuples in the form (city_id, name, country, state, lat, lon )
         The rule for querying follows the provided `matching` parameter value.
@@ -93,6 +427,13 @@ class CityIDRegistry:
         `exact` - literal, case-sensitive matching
         `like` - matches cities whose name contains, as a substring, the string
         fed to the function, case-insensitive,
+        `prefix` - matches cities whose name starts with the string fed to the function,
+        case-insensitive, shortest names first
+        `fts` - full-text matching: matches cities whose name has words starting with
+        all of the words fed to the function, case and diacritics insensitive, best matches first
+        `fuzzy` - matches cities whose name is within a few typos from the string
+        fed to the function, case-insensitive, closest matches first
+        :param limit: the max number of results. Defaults to `None`, which means: no limit
         :raises ValueError if the value for `matching` is unknown
         :return: list of tuples
         """
@@ -105,13 +446,36 @@ class CityIDRegistry:
             raise ValueError("Country must be a 2-char string")
         if state is not None and country is None:
             raise ValueError("A country must be specified whenever a state is specified too")
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("Limit must be a positive int")
+
+        if matching in self.MATCHING_INDEXES:
+            self.__ensure_indexes(*self.MATCHING_INDEXES[matching])
+        if matching == 'fuzzy':
+            return self.__fuzzy_ids_for(city_name, country, state, limit)
 
         q = self.MATCHINGS[matching]
         if matching == 'exact':
             params = [city_name]
+        elif matching == 'prefix':
+            params = [_like_prefix(city_name)]
+        elif matching == 'fts':
+            params = [self.__fts_query(city_name)]
+            if not params[0]:
+                return []
         else:
             params = ['%' + city_name + '%']
 
+        q, params = self.__with_filters(q, params, country, state)
+        q = q + self.ORDERINGS.get(matching, '')
+        if limit is not None:
+            q = q + ' LIMIT ?'
+            params.append(limit)
+
+        rows = self.__query(q, *params)
+        return rows
+
+    def __with_filters(self, q, params, country, state):
         if country is not None:
             q = q + ' AND country=?'
             params.append(country)
@@ -119,11 +483,141 @@ class CityIDRegistry:
         if state is not None:
             q = q + ' AND state=?'
             params.append(state)
+        return q, params
 
-        rows = self.__query(q, *params)
-        return rows
+    def __fuzzy_ids_for(self, city_name, country, state, limit):
+        """
+        Candidates sharing trigrams with the searched name are looked up via the trigram index, among the cities
+        whose name is the searched one with a char dropped or two adjacent chars swapped (typos that can leave no
+        trigram in common) and, for short names (which have too few trigrams to survive typos) or when the index is
+        not available, among the cities whose name starts with the same letter: candidates are then ranked by edit
+        distance
+        """
+        trigrams = self.__trigrams_query(city_name)
+        max_distance = _max_edit_distance(city_name)
+        has_trigram_index = self.__query("SELECT COUNT(*) FROM sqlite_master WHERE name='city_trigram'")[0][0] == 1
+        candidates = []
+        if trigrams and has_trigram_index:
+            q, params = self.__with_filters(self.MATCHINGS['fuzzy'], [trigrams], country, state)
+            q = q + self.ORDERINGS['fuzzy'] + ' LIMIT ?'
+            candidates.extend(self.__query(q, *params, FUZZY_CANDIDATES))
+        variants = _typo_variants(city_name)
+        if variants:
+            q = self.TYPO_VARIANTS_QUERY % ', '.join('?' * len(variants))
+            q, params = self.__with_filters(q, variants, country, state)
+            candidates.extend(self.__query(q, *params))
+        if len(city_name) <= SHORT_NAME_LENGTH or not has_trigram_index:
+            q, params = self.__with_filters(self.MATCHINGS['prefix'], [_like_prefix(city_name[0])], country, state)
+            q = q + ' AND length(name) BETWEEN ? AND ?' + self.ORDERINGS['prefix'] + ' LIMIT ?'
+            candidates.extend(self.__query(q, *params, len(city_name) - max_distance, len(city_name) + max_distance,
+                                           FUZZY_CANDIDATES))
+        searched = city_name.lower()
+        ranked = dict()
+        for row in candidates:
+            distance = _edit_distance(searched, row[1].lower())
+            if distance <= max_distance:
+                ranked[row] = (distance, len(row[1]))
+        rows = sorted(ranked, key=ranked.get)
+        return rows if limit is None else rows[:limit]
 
-    def locations_for(self, city_name, country=None, state=None, matching='like'):
+    def ids_for_many(self, queries, matching='exact'):
+        """
+        Bulk version of `ids_for`: all of the queries are resolved at once, by joining them with the cities
+        :param queries: iterable of `(city_name, country, state)` tuples, where `country` and `state` can be left
+        out or be `None` (see `ids_for`). Plain city names are allowed as well
+        :param matching: str. Default is `exact`, unlike `ids_for` whose default is `like`: the same arguments
+        give different results unless `matching` is passed explicitly. Possible values:
+        `exact` - literal, case-sensitive matching, looked up by means of an index
+        `like` - matches cities whose name contains, as a substring, the string
+        fed to the function, case-insensitive. No index can serve substring matches, so each query scans the whole
+        table and this is no faster than calling `ids_for` for each query: prefer `ids_for` with `prefix` or `fts`
+        matching when possible
+        :raises ValueError if the value for `matching` is unknown or any query is malformed
+        :return: list having, for each query and in the same order, the list of tuples that `ids_for` would return
+        """
+        if matching not in self.BATCH_MATCHINGS:
+            raise ValueError("Unknown type of matching: "
+                             "allowed values are %s" % ", ".join(self.BATCH_MATCHINGS))
+        rows = []
+        results = []
+        for idx, query in enumerate(queries):
+            results.append([])
+            query = (query,) if query is None or isinstance(query, str) else tuple(query)
+            if not 1 <= len(query) <= 3:
+                raise ValueError("Queries must be (city_name, country, state) tuples")
+            city_name, country, state = query + (None,) * (3 - len(query))
+            if country is not None and len(country) != 2:
+                raise ValueError("Country must be a 2-char string")
+            if state is not None and country is None:
+                raise ValueError("A country must be specified whenever a state is specified too")
+            if city_name:
+                rows.append((idx, city_name, country, state))
+        if not rows:
+            return results
+        if matching == 'exact':
+            self.__ensure_indexes('name')
+        with self._lock:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute("CREATE TEMP TABLE IF NOT EXISTS city_query "
+                               "(idx INTEGER PRIMARY KEY, name TEXT NOT NULL, country TEXT, state TEXT)")
+                cursor.executemany("INSERT INTO temp.city_query VALUES (?, ?, ?, ?)", rows)
+                for row in cursor.execute(self.BATCH_MATCHINGS[matching] + self.BATCH_FILTERS):
+                    results[row[0]].append(row[1:])
+            finally:
+                cursor.execute("DELETE FROM temp.city_query")
+                cursor.close()
+        return results
+
+    def within(self, lat, lon, radius_km):
+        """
+        Returns a list of tuples in the form (city_id, name, country, state, lat, lon ) for the cities lying within
+        the specified distance from the specified point, nearest cities first
+        :param lat: the latitude of the point
+        :param lon: the longitude of the point
+        :param radius_km: the max distance from the point, in kilometers
+        :raises ValueError if coordinates are out of bounds or the radius is not positive
+        :return: list of tuples
+        """
+        geo.assert_is_lat(lat)
+        geo.assert_is_lon(lon)
+        if not isinstance(radius_km, (int, float)) or radius_km <= 0:
+            raise ValueError("Radius must be a positive number")
+        self.__ensure_indexes('spatial')
+        index = 'city_rtree' if self.__query("SELECT COUNT(*) FROM sqlite_master WHERE name='city_rtree'")[0][0] \
+            else 'city_lat_lon'
+        ranked = dict()
+        for box in _bounding_boxes(lat, lon, radius_km):
+            for row in self.__query(self.SPATIAL_QUERIES[index], *box):
+                distance = _distance_km(lat, lon, row[4], row[5])
+                if distance <= radius_km:
+                    ranked[row] = (distance, row[0])
+        return sorted(ranked, key=ranked.get)
+
+    def nearest(self, lat, lon, k=5):
+        """
+        Returns a list of tuples in the form (city_id, name, country, state, lat, lon ) for the `k` cities which are
+        nearest to the specified point, nearest cities first
+        :param lat: the latitude of the point
+        :param lon: the longitude of the point
+        :param k: how many cities to look for. Defaults to 5
+        :raises ValueError if coordinates are out of bounds or `k` is not a positive int
+        :return: list of tuples
+        """
+        geo.assert_is_lat(lat)
+        geo.assert_is_lon(lon)
+        if not isinstance(k, int) or k < 1:
+            raise ValueError("k must be a positive int")
+        # the search radius is widened until it contains k cities or covers the whole planet
+        max_radius_km = math.pi * geo.EARTH_RADIUS_KM
+        radius_km = NEAREST_START_RADIUS_KM
+        while True:
+            rows = self.within(lat, lon, min(radius_km, max_radius_km))
+            if len(rows) >= k or radius_km >= max_radius_km:
+                return rows[:k]
+            radius_km *= 4
+
+    def locations_for(self, city_name, country=None, state=None, matching='like', limit=None):
         """
         Returns a list of `Location` objects
         The rule for querying follows the provided `matching` parameter value.
@@ -139,13 +633,15 @@ class CityIDRegistry:
         `exact` - literal, case-sensitive matching
         `like` - matches cities whose name contains, as a substring, the string
         fed to the function, case-insensitive,
+        `prefix`, `fts`, `fuzzy` - see `ids_for`
+        :param limit: the max number of results. Defaults to `None`, which means: no limit
         :raises ValueError if the value for `matching` is unknown
         :return: list of `Location` objects
         """
-        items = self.ids_for(city_name, country=country, state=state, matching=matching)
+        items = self.ids_for(city_name, country=country, state=state, matching=matching, limit=limit)
         return [Location(item[1], item[5], item[4], item[0], country=item[2]) for item in items]
 
-    def geopoints_for(self, city_name, country=None, state=None, matching='like'):
+    def geopoints_for(self, city_name, country=None, state=None, matching='like', limit=None):
         """
         Returns a list of ``pyowm.utils.geo.Point`` objects corresponding to
         the int IDs and relative toponyms and 2-chars country of the cities
@@ -164,8 +660,34 @@ class CityIDRegistry:
         `exact` - literal, case-sensitive matching
         `like` - matches cities whose name contains, as a substring, the string
         fed to the function, case-insensitive,
+        `prefix`, `fts`, `fuzzy` - see `ids_for`
+        :param limit: the max number of results. Defaults to `None`, which means: no limit
         :raises ValueError if the value for `matching` is unknown
         :return: list of `pyowm.utils.geo.Point` objects
         """
-        locations = self.locations_for(city_name, country=country, state=state, matching=matching)
+        locations = self.locations_for(city_name, country=country, state=state, matching=matching, limit=limit)
         return [loc.to_geopoint() for loc in locations]
+
+    def locations_for_many(self, queries, matching='exact'):
+        """
+        Bulk version of `locations_for`: see `ids_for_many`
+        :param queries: iterable of `(city_name, country, state)` tuples or of city names
+        :param matching: str. Default is `exact`, unlike `locations_for`. Possible values: `exact`, `like` (see
+        `ids_for_many`)
+        :raises ValueError if the value for `matching` is unknown or any query is malformed
+        :return: list having, for each query and in the same order, a list of `Location` objects
+        """
+        return [[Location(item[1], item[5], item[4], item[0], country=item[2]) for item in items]
+                for items in self.ids_for_many(queries, matching=matching)]
+
+    def geopoints_for_many(self, queries, matching='exact'):
+        """
+        Bulk version of `geopoints_for`: see `ids_for_many`
+        :param queries: iterable of `(city_name, country, state)` tuples or of city names
+        :param matching: str. Default is `exact`, unlike `geopoints_for`. Possible values: `exact`, `like` (see
+        `ids_for_many`)
+        :raises ValueError if the value for `matching` is unknown or any query is malformed
+        :return: list having, for each query and in the same order, a list of `pyowm.utils.geo.Point` objects
+        """
+        return [[loc.to_geopoint() for loc in locations]
+                for locations in self.locations_for_many(queries, matching=matching)]
@@ -53,6 +53,14 @@ class InvalidSSLCertificateError(APIRequestError):
     pass
 
 
+class RateLimitExceededError(APIRequestError):
+    """
+    Error class that represents API calls that are not performed as they would exceed the
+    API calls budget of the subscription plan
+    """
+    pass
+
+
 class APIResponseError(PyOWMError):
     """
     Generic base class for exceptions representing HTTP error status codes in OWM Weather API
@@ -76,6 +84,14 @@ class UnauthorizedError(APIResponseError):
     pass
 
 
+class ChecksumMismatchError(APIResponseError):
+    """
+    Error class that represents the situation when downloaded data does not
+    match the expected checksum, eg. because it was corrupted in transit.
+    """
+    pass
+
+
 class ParseAPIResponseError(PyOWMError):
     """
     Error class that represents failures when parsing payload data in HTTP
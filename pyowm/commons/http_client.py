@@ -7,7 +7,46 @@ from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
 from pyowm.commons import exceptions
+from pyowm.commons.cache import cache_key, cache_ttl_for
 from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.json_backend import json_backend_from
+from pyowm.commons.json_stream import JSONListStream
+from pyowm.commons.rate_limiter import retry_after_secs
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+STREAM_CHUNK_SIZE = 16384
+
+
+def new_session(config):
+    """
+    Creates a keep-alive `requests.Session` whose connection pools are sized according to the `connection` section
+    of the supplied configuration. Retries are performed on failures if `max_retries` is set.
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :returns: a `requests.Session` instance
+    """
+    assert isinstance(config, dict)
+    conn = config['connection']
+    if conn.get('max_retries') is not None:
+        # this tells how to perform retries: when rate limiting is on, 429 responses are not retried blindly, as it's
+        # up to the rate limiter to hold back calls
+        rate_limited = config.get('rate_limiting', dict()).get('mode') is not None
+        retries = Retry(
+            total=conn['max_retries'],
+            status_forcelist=[500, 502, 503, 504] if rate_limited else [429, 500, 502, 503, 504],
+            allowed_methods =["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"]
+        )
+    else:
+        retries = 0
+    adapter = HTTPAdapter(pool_connections=conn.get('pool_connections', DEFAULT_POOL_CONNECTIONS),
+                          pool_maxsize=conn.get('pool_maxsize', DEFAULT_POOL_MAXSIZE),
+                          max_retries=retries)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class HttpRequestBuilder:
@@ -109,9 +148,18 @@ class HttpClient:
     :type root_uri: str
     :param admits_subdomains: if the root URI of the API endpoint admits subdomains based on the subcription type (default: True)
     :type admits_subdomains: bool
+    :param session: a `requests.Session` to be shared with other clients (if not provided, a per-client one or the
+        `requests` module will be used)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for the responses of `get_json` calls (only the API endpoints having a time-to-live in the
+        `ttls` sub-dict of the `cache` config section are cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter that all API calls go through before being performed (cached responses excluded)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
     """
 
-    def __init__(self, api_key, config, root_uri, admits_subdomains=True):
+    def __init__(self, api_key, config, root_uri, admits_subdomains=True, session=None, cache=None,
+                 rate_limiter=None):
         assert isinstance(api_key, str)
         self.api_key = api_key
         assert isinstance(config, dict)
@@ -120,20 +168,16 @@ class HttpClient:
         self.root_uri = root_uri
         assert isinstance(admits_subdomains, bool)
         self.admits_subdomains = admits_subdomains
-
-        if self.config['connection']['max_retries'] is not None:
-            # this adapter tells how to perform retries
-            self.session_adapter = HTTPAdapter(
-                max_retries=Retry(
-                    total=self.config['connection']['max_retries'],
-                    status_forcelist=[429, 500, 502, 503, 504],
-                    allowed_methods =["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"]
-                )
-            )
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.json_backend = json_backend_from(config)
+
+        if session is not None:
+            # a pooled session shared with other clients
+            self.http = session
+        elif self.config['connection']['max_retries'] is not None:
             # this is the adapted requests client
-            self.http = requests.Session()
-            self.http.mount("https://", self.session_adapter)
-            self.http.mount("http://", self.session_adapter)
+            self.http = new_session(self.config)
         else:
             self.http = requests
 
@@ -145,6 +189,13 @@ class HttpClient:
             .with_query_params(params if params is not None else dict())\
             .with_headers(headers if headers is not None else dict())
         url, params, headers, proxies = builder.build()
+        cacheable, ttl = cache_ttl_for(self.config, path) if self.cache is not None else (False, None)
+        if cacheable:
+            key = cache_key(url, params)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return 200, self._loads(cached)
+        self._acquire()
         try:
             resp = self.http.get(url, params=params, headers=headers, proxies=proxies,
                                 timeout=self.config['connection']['timeout_secs'],
@@ -155,11 +206,76 @@ class HttpClient:
             raise exceptions.InvalidSSLCertificateError(str(e))
         except requests.exceptions.Timeout:
             raise exceptions.TimeoutError('API call timed out')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        self._check_response(resp)
         try:
-            return resp.status_code, resp.json()
+            json_data = self._decode(resp)
         except:
             raise exceptions.ParseAPIResponseError('Impossible to parse API response data')
+        if cacheable:
+            self.cache.set(key, resp.text, ttl)
+        return resp.status_code, json_data
+
+    def stream_json_list(self, path, key='list', params=None, headers=None):
+        """
+        Performs a GET call whose JSON response embeds a (possibly huge) list and returns a stream yielding the list
+        items one at a time, as the response body is being downloaded.
+
+        When caching is enabled the raw response body is retained while streaming and it is cached once the stream
+        has been fully consumed; cached responses are streamed as well.
+
+        :param path: the path of the API endpoint
+        :type path: str
+        :param key: the name of the top-level member of the response holding the list (default: 'list')
+        :type key: str
+        :param params: the query parameters
+        :type params: dict or `None`
+        :param headers: the HTTP headers
+        :type headers: dict or `None`
+        :returns: a tuple of the HTTP status code and a `pyowm.commons.json_stream.JSONListStream` instance
+        """
+        builder = HttpRequestBuilder(self.root_uri, self.api_key, self.config, has_subdomains=self.admits_subdomains)\
+            .with_path(path)\
+            .with_api_key()\
+            .with_language()\
+            .with_query_params(params if params is not None else dict())\
+            .with_headers(headers if headers is not None else dict())
+        url, params, headers, proxies = builder.build()
+        cacheable, ttl = cache_ttl_for(self.config, path) if self.cache is not None else (False, None)
+        cached_key = None
+        if cacheable:
+            cached_key = cache_key(url, params)
+            cached = self.cache.get(cached_key)
+            if cached is not None:
+                return 200, JSONListStream([cached], key=key)
+        self._acquire()
+        try:
+            resp = self.http.get(url, stream=True, params=params, headers=headers, proxies=proxies,
+                                timeout=self.config['connection']['timeout_secs'],
+                                verify=self.config['connection']['verify_ssl_certs'])
+        except requests.exceptions.SSLError as e:
+            raise exceptions.InvalidSSLCertificateError(str(e))
+        except requests.exceptions.ConnectionError as e:
+            raise exceptions.InvalidSSLCertificateError(str(e))
+        except requests.exceptions.Timeout:
+            raise exceptions.TimeoutError('API call timed out')
+        self._check_response(resp)
+        return resp.status_code, JSONListStream(self._iter_chunks(resp, cached_key, ttl), key=key)
+
+    def _iter_chunks(self, resp, cached_key=None, ttl=None):
+        kept = [] if cached_key is not None else None
+        try:
+            for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                if kept is not None:
+                    kept.append(chunk)
+                yield chunk
+        except requests.exceptions.Timeout:
+            raise exceptions.TimeoutError('API call timed out')
+        except requests.exceptions.RequestException as e:
+            raise exceptions.APIRequestError(str(e))
+        finally:
+            resp.close()
+        if kept is not None:
+            self.cache.set(cached_key, b''.join(kept).decode('utf-8'), ttl)
 
     def get_png(self, path, params=None, headers=None):
         # check URL fromt the metaimage: if it looks like a complete URL, use that one (I know, it's a hack...)
@@ -176,6 +292,7 @@ class HttpClient:
             .with_headers(headers if headers is not None else dict())\
             .with_header('Accept', ImageTypeEnum.PNG.mime_type)
         url, params, headers, proxies = builder.build()
+        self._acquire()
         try:
             resp = self.http.get(url, stream=True, params=params, headers=headers, proxies=proxies,
                                 timeout=self.config['connection']['timeout_secs'],
@@ -186,13 +303,64 @@ class HttpClient:
             raise exceptions.InvalidSSLCertificateError(str(e))
         except requests.exceptions.Timeout:
             raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        self._check_response(resp)
         try:
             return resp.status_code, resp.content
         except:
             raise exceptions.ParseAPIResponseError('Impossible to parse'
                                                           'API response data')
 
+    def get_png_if_modified(self, path, params=None, headers=None, etag=None, last_modified=None):
+        """
+        Performs a conditional GET call for a PNG image: when the validators of a previously downloaded copy of the
+        image are provided, the image is downloaded only if it has changed since then.
+
+        :param path: the path of the API endpoint
+        :type path: str
+        :param params: the query parameters
+        :type params: dict or `None`
+        :param headers: the HTTP headers
+        :type headers: dict or `None`
+        :param etag: the `ETag` header value of the previously downloaded copy, if any
+        :type etag: str or `None`
+        :param last_modified: the `Last-Modified` header value of the previously downloaded copy, if any
+        :type last_modified: str or `None`
+        :returns: a tuple of the HTTP status code, the image data (``None`` if the status code is 304, meaning that
+            the previously downloaded copy is still valid) and the response headers
+        """
+        try:
+            partial_path = path.split(self.root_uri)[1].lstrip('/')
+        except:
+            partial_path = path
+
+        builder = HttpRequestBuilder(self.root_uri, self.api_key, self.config, has_subdomains=self.admits_subdomains)\
+            .with_path(partial_path)\
+            .with_api_key()\
+            .with_language()\
+            .with_query_params(params if params is not None else dict())\
+            .with_headers(headers if headers is not None else dict())\
+            .with_header('Accept', ImageTypeEnum.PNG.mime_type)
+        if etag is not None:
+            builder.with_header('If-None-Match', etag)
+        if last_modified is not None:
+            builder.with_header('If-Modified-Since', last_modified)
+        url, params, headers, proxies = builder.build()
+        self._acquire()
+        try:
+            resp = self.http.get(url, stream=True, params=params, headers=headers, proxies=proxies,
+                                timeout=self.config['connection']['timeout_secs'],
+                                verify=self.config['connection']['verify_ssl_certs'])
+        except requests.exceptions.SSLError as e:
+            raise exceptions.InvalidSSLCertificateError(str(e))
+        except requests.exceptions.ConnectionError as e:
+            raise exceptions.InvalidSSLCertificateError(str(e))
+        except requests.exceptions.Timeout:
+            raise exceptions.TimeoutError('API call timeouted')
+        self._check_response(resp)
+        if resp.status_code == 304:
+            return resp.status_code, None, resp.headers
+        return resp.status_code, resp.content, resp.headers
+
     def get_geotiff(self, path, params=None, headers=None):
         # check URL fromt the metaimage: if it looks like a complete URL, use that one (I know, it's a hack...)
         try:
@@ -208,6 +376,7 @@ class HttpClient:
             .with_headers(headers if headers is not None else dict())\
             .with_header('Accept', ImageTypeEnum.GEOTIFF.mime_type)
         url, params, headers, proxies = builder.build()
+        self._acquire()
         try:
             resp = self.http.get(url, stream=True, params=params, headers=headers, proxies=proxies,
                                 timeout=self.config['connection']['timeout_secs'],
@@ -218,13 +387,94 @@ class HttpClient:
             raise exceptions.InvalidSSLCertificateError(str(e))
         except requests.exceptions.Timeout:
             raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        self._check_response(resp)
         try:
             return resp.status_code, resp.content
         except:
             raise exceptions.ParseAPIResponseError('Impossible to parse'
                                                           'API response data')
 
+    def download_to(self, path, fileobj, params=None, headers=None, mime_type=None, offset=0, if_range=None,
+                    on_response=None):
+        """
+        Performs a GET call and streams the response body into a writable binary file object, chunk by chunk, so
+        that memory usage does not depend on the size of the downloaded data.
+
+        When a non-zero `offset` is provided, only the bytes from that position onwards are requested by means of a
+        `Range` header and they are written at the current position of the file object: if the server does not
+        honour the range, the file object is rewound and truncated and the whole data is written instead. The
+        `if_range` validator (the `ETag` or `Last-Modified` value of the response the first bytes came from) is sent
+        along via a `If-Range` header, so that the server sends the whole data instead of the range if it has
+        changed in the meantime.
+
+        :param path: the path of the API endpoint or a complete URL
+        :type path: str
+        :param fileobj: the target file object, opened in binary mode
+        :type fileobj: a binary file-like object
+        :param params: the query parameters
+        :type params: dict or `None`
+        :param headers: the HTTP headers
+        :type headers: dict or `None`
+        :param mime_type: the MIME type that is accepted for the response, if any
+        :type mime_type: str or `None`
+        :param offset: the number of bytes that were already downloaded (default: 0)
+        :type offset: int
+        :param if_range: the validator of the data that was already downloaded, if any
+        :type if_range: str or `None`
+        :param on_response: a callable invoked with the status code and the headers of the response before its body
+            is downloaded, eg. to store the validator needed to resume the download later on
+        :type on_response: callable or `None`
+        :returns: a tuple of the HTTP status code and the total number of bytes that the target now holds: the
+            status code is 416 when the requested range is past the end of the data, ie. nothing was left to download
+        """
+        assert isinstance(offset, int) and offset >= 0, "'offset' must be a non-negative int"
+        # check URL fromt the metaimage: if it looks like a complete URL, use that one (I know, it's a hack...)
+        try:
+            partial_path = path.split(self.root_uri)[1].lstrip('/')
+        except:
+            partial_path = path
+
+        builder = HttpRequestBuilder(self.root_uri, self.api_key, self.config, has_subdomains=self.admits_subdomains)\
+            .with_path(partial_path)\
+            .with_api_key()\
+            .with_language()\
+            .with_query_params(params if params is not None else dict())\
+            .with_headers(headers if headers is not None else dict())
+        if mime_type is not None:
+            builder.with_header('Accept', mime_type)
+        if offset > 0:
+            builder.with_header('Range', 'bytes=%d-' % offset)
+            if if_range is not None:
+                builder.with_header('If-Range', if_range)
+        url, params, headers, proxies = builder.build()
+        self._acquire()
+        try:
+            resp = self.http.get(url, stream=True, params=params, headers=headers, proxies=proxies,
+                                timeout=self.config['connection']['timeout_secs'],
+                                verify=self.config['connection']['verify_ssl_certs'])
+        except requests.exceptions.SSLError as e:
+            raise exceptions.InvalidSSLCertificateError(str(e))
+        except requests.exceptions.ConnectionError as e:
+            raise exceptions.InvalidSSLCertificateError(str(e))
+        except requests.exceptions.Timeout:
+            raise exceptions.TimeoutError('API call timeouted')
+        if resp.status_code == 416 and offset > 0:
+            resp.close()
+            return resp.status_code, offset
+        self._check_response(resp)
+        if resp.status_code != 206:
+            if offset > 0:
+                fileobj.seek(0)
+                fileobj.truncate()
+            offset = 0
+        if on_response is not None:
+            on_response(resp.status_code, resp.headers)
+        written = offset
+        for chunk in self._iter_chunks(resp):
+            fileobj.write(chunk)
+            written += len(chunk)
+        return resp.status_code, written
+
     def post(self, path, params=None, data=None, headers=None):
         builder = HttpRequestBuilder(self.root_uri, self.api_key, self.config, has_subdomains=self.admits_subdomains)\
             .with_path(path)\
@@ -233,6 +483,7 @@ class HttpClient:
             .with_query_params(params if params is not None else dict())\
             .with_headers(headers if headers is not None else dict())
         url, params, headers, proxies = builder.build()
+        self._acquire()
         try:
             resp = self.http.post(url, params=params, json=data, headers=headers, proxies=proxies,
                                  timeout=self.config['connection']['timeout_secs'],
@@ -243,10 +494,10 @@ class HttpClient:
             raise exceptions.InvalidSSLCertificateError(str(e))
         except requests.exceptions.Timeout:
             raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        self._check_response(resp)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = self._decode(resp)
         except:
             json_data = {}
         return resp.status_code, json_data
@@ -259,6 +510,7 @@ class HttpClient:
             .with_query_params(params if params is not None else dict())\
             .with_headers(headers if headers is not None else dict())
         url, params, headers, proxies = builder.build()
+        self._acquire()
         try:
             resp = self.http.put(url, params=params, json=data, headers=headers, proxies=proxies,
                                 timeout=self.config['connection']['timeout_secs'],
@@ -269,10 +521,10 @@ class HttpClient:
             raise exceptions.InvalidSSLCertificateError(str(e))
         except requests.exceptions.Timeout:
             raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        self._check_response(resp)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = self._decode(resp)
         except:
             json_data = {}
         return resp.status_code, json_data
@@ -285,6 +537,7 @@ class HttpClient:
             .with_query_params(params if params is not None else dict())\
             .with_headers(headers if headers is not None else dict())
         url, params, headers, proxies = builder.build()
+        self._acquire()
         try:
             resp = self.http.delete(url, params=params, json=data, headers=headers, proxies=proxies,
                                    timeout=self.config['connection']['timeout_secs'],
@@ -295,14 +548,31 @@ class HttpClient:
             raise exceptions.InvalidSSLCertificateError(str(e))
         except requests.exceptions.Timeout:
             raise exceptions.TimeoutError('API call timeouted')
-        HttpClient.check_status_code(resp.status_code, resp.text)
+        self._check_response(resp)
         # this is a defense against OWM API responses containing an empty body!
         try:
-            json_data = resp.json()
+            json_data = self._decode(resp)
         except:
             json_data = None
         return resp.status_code, json_data
 
+    def _loads(self, text):
+        return json.loads(text) if self.json_backend is None else self.json_backend.loads(text)
+
+    def _decode(self, resp):
+        return resp.json() if self.json_backend is None else self.json_backend.decode_response(resp)
+
+    def _acquire(self):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def _check_response(self, resp):
+        if resp.status_code == 429 and self.rate_limiter is not None:
+            self.rate_limiter.throttle(retry_after_secs(resp.headers))
+        # the body is read only to report errors, as successful responses may be streamed
+        if resp.status_code >= 400:
+            HttpClient.check_status_code(resp.status_code, resp.text)
+
     @classmethod
     def check_status_code(cls, status_code, payload):
         if status_code < 400:
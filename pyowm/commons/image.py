@@ -1,6 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import mmap
+import os
+import shutil
+import threading
+
 from pyowm.commons.databoxes import ImageType
 from pyowm.commons.enums import ImageTypeEnum
 
@@ -52,3 +57,76 @@ class Image:
 
     def __repr__(self):
         return "<%s.%s - type=%s>" % (__name__, self.__class__.__name__, str(self.image_type))
+
+
+class MappedImage(Image):
+
+    """
+    An image whose data is stored on a file on disk, which is memory-mapped upon first access to the `data`
+    attribute: only the parts of the image that are actually read are ever loaded in memory, so that very large
+    images can be handled with a small footprint. The file must not be changed while the image is in use.
+
+    :param path_to_file: path to the image file
+    :type path_to_file: str
+    :param image_type: the type of the image, if known
+    :type image_type: `pyowm.commons.databoxes.ImageType` or `None`
+    """
+
+    def __init__(self, path_to_file, image_type=None):
+        assert isinstance(path_to_file, (str, os.PathLike)), "'path_to_file' must be a path"
+        self.path = os.fspath(path_to_file)
+        if image_type is not None:
+            assert isinstance(image_type, ImageType)
+        self.image_type = image_type
+        self._file = None
+        self._mmap = None
+        self._lock = threading.Lock()
+
+    @property
+    def data(self):
+        """
+        The image data, as a read-only memory map of the image file (``b''`` for empty files). Memory maps
+        support the buffer protocol, slicing and `len`: use `bytes(image.data)` to get a copy of the whole data
+
+        :returns: a `mmap.mmap` instance or ``b''``
+        """
+        with self._lock:
+            if self._mmap is None:
+                if os.path.getsize(self.path) == 0:
+                    return b''
+                self._file = open(self.path, 'rb')
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._mmap
+
+    @property
+    def size(self):
+        """
+        The size of the image file in bytes
+
+        :returns: int
+        """
+        return os.path.getsize(self.path)
+
+    def persist(self, path_to_file):
+        """
+        Copies the image file to another file on disk
+
+        :param path_to_file: path to the target file
+        :type path_to_file: str
+        :return: `None`
+        """
+        shutil.copyfile(self.path, path_to_file)
+
+    def close(self):
+        """
+        Releases the memory map of the image file, if any: it is created again upon next access to the data
+        """
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._file.close()
+                self._mmap = None
+                self._file = None
+
+    def __repr__(self):
+        return "<%s.%s - type=%s, path=%s>" % (__name__, self.__class__.__name__, str(self.image_type), self.path)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import importlib
+
+from pyowm.commons import exceptions
+
+LIBRARIES = ('json', 'orjson', 'ujson', 'msgspec')
+AUTO = 'auto'
+# the order in which libraries are picked when the choice is left to PyOWM (fastest first)
+AUTO_PREFERENCE = ('orjson', 'msgspec', 'ujson', 'json')
+
+
+def _is_installed(library):
+    try:
+        importlib.import_module(library)
+    except ImportError:
+        return False
+    return True
+
+
+class JSONBackend:
+    """
+    Encodes and decodes JSON data by means of one among the supported JSON libraries: the standard library `json`
+    module, `orjson`, `ujson` or `msgspec`. All of them but `json` are optional dependencies, that must be installed
+    separately.
+
+    Instances expose a `loads(data)` callable, parsing a JSON `str` or `bytes` into Python objects, and a
+    `dumps(obj)` callable, serializing Python objects to a JSON `str`.
+
+    :param library: the name of the JSON library to be used, among the `LIBRARIES` ones, or 'auto' to pick the
+        fastest installed one (default: 'json')
+    :type library: str
+    :param decode_from_bytes: if HTTP responses should be decoded straight from their raw body bytes, without building
+        the intermediate text string (default: ``False``)
+    :type decode_from_bytes: bool
+    :returns: a *JSONBackend* instance
+    :raises: *ConfigurationError* if the library is not supported, *ImportError* if it is not installed
+
+    """
+
+    def __init__(self, library='json', decode_from_bytes=False):
+        if library == AUTO:
+            library = next(lib for lib in AUTO_PREFERENCE if _is_installed(lib))
+        if library not in LIBRARIES:
+            raise exceptions.ConfigurationError('Unknown JSON library: {}'.format(library))
+        try:
+            module = importlib.import_module(library)
+        except ImportError:
+            raise ImportError('The {0} JSON backend requires the {0} package: install it with '
+                              '`pip install {0}`'.format(library))
+        assert isinstance(decode_from_bytes, bool)
+        self.library = library
+        self.decode_from_bytes = decode_from_bytes
+        if library == 'orjson':
+            self.loads = module.loads
+            self.dumps = lambda obj: module.dumps(obj).decode('utf-8')
+        elif library == 'msgspec':
+            decoder = module.json.Decoder()
+            encoder = module.json.Encoder()
+            self.loads = decoder.decode
+            self.dumps = lambda obj: encoder.encode(obj).decode('utf-8')
+        else:
+            self.loads = module.loads
+            self.dumps = module.dumps
+
+    def decode_response(self, resp):
+        """
+        Decodes the JSON body of an HTTP response
+
+        :param resp: the HTTP response
+        :type resp: `requests.Response`
+        :returns: the decoded Python objects
+        """
+        return self.loads(resp.content if self.decode_from_bytes else resp.text)
+
+    def __repr__(self):
+        return '<%s.%s - library=%s, decode_from_bytes=%s>' % (__name__, self.__class__.__name__, self.library,
+                                                             self.decode_from_bytes)
+
+
+def json_backend_from(config):
+    """
+    Builds the JSON backend described by the `json_backend` section of the supplied configuration.
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :returns: a *JSONBackend* instance or ``None`` if the default decoding provided by the HTTP library must be used
+    :raises: *ConfigurationError* when the JSON library is not supported, *ImportError* when it is not installed
+    """
+    assert isinstance(config, dict)
+    backend_config = config.get('json_backend') or dict()
+    library = backend_config.get('library') or 'json'
+    decode_from_bytes = backend_config.get('decode_from_bytes', False)
+    if library == 'json' and not decode_from_bytes:
+        return None
+    return JSONBackend(library, decode_from_bytes=decode_from_bytes)
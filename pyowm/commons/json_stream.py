@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import codecs
+import json
+
+from pyowm.commons import exceptions
+
+_WHITESPACE = ' \t\n\r'
+# the characters that can follow a JSON value in a well-formed document
+_DELIMITERS = _WHITESPACE + ',:]}'
+_DECODER = json.JSONDecoder()
+
+
+class JSONListStream:
+    """
+    Incrementally parses a JSON object that is received in chunks, yielding the items of one of its top-level array
+    members (eg: the `list` of an OWM API group observations response) as soon as each of them has been received,
+    without ever holding the whole document in memory.
+
+    The other top-level members of the object are collected as they are met into the `header` dict: as OWM API
+    responses carry small scalar values such as `cod` and `cnt` besides the list, the header is a cheap way to check
+    for embedded errors once the items have been consumed.
+
+    Instances can be iterated only once.
+
+    :param chunks: the chunks of the JSON document
+    :type chunks: iterable of `bytes` or `str`
+    :param key: the name of the top-level array member whose items must be yielded (default: 'list')
+    :type key: str
+    :returns: a *JSONListStream* instance
+    :raises: *ParseAPIResponseError* while iterating, if the data is not a well-formed JSON object
+
+    """
+
+    def __init__(self, chunks, key='list'):
+        assert isinstance(key, str)
+        self.key = key
+        self.header = dict()
+        self.found = False
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+        self._consumed = False
+
+    def _fill(self):
+        # appends the next chunk to the buffer, dropping the already parsed text: returns False when no data is left
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._eof = True
+            chunk = self._text_decoder.decode(b'', final=True)
+        else:
+            if isinstance(chunk, bytes):
+                chunk = self._text_decoder.decode(chunk)
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        # skips whitespace and returns the next character, or '' at the end of the data
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char == '' or char not in chars:
+            self._fail()
+        self._pos += 1
+        return char
+
+    def _value(self):
+        # decodes the next JSON value: the value is accepted only when followed by a delimiter, so that truncated
+        # values (eg: numbers split between two chunks, such as '12.' + '5') are never returned
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except ValueError:
+                value, end = None, None
+            if end is not None and (self._eof or (end < len(self._buf) and self._buf[end] in _DELIMITERS)):
+                self._pos = end
+                return value
+            if not self._fill():
+                self._fail()
+
+    def _fail(self):
+        raise exceptions.ParseAPIResponseError('Impossible to parse API response data')
+
+    def __iter__(self):
+        if self._consumed:
+            raise RuntimeError('JSON streams can be iterated only once')
+        self._consumed = True
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+        else:
+            while True:
+                name = self._value()
+                if not isinstance(name, str):
+                    self._fail()
+                self._expect(':')
+                if name == self.key and self._peek() == '[':
+                    self.found = True
+                    self._pos += 1
+                    if self._peek() == ']':
+                        self._pos += 1
+                    else:
+                        while True:
+                            yield self._value()
+                            if self._expect(',]') == ']':
+                                break
+                else:
+                    self.header[name] = self._value()
+                if self._expect(',}') == '}':
+                    break
+        if self._peek() != '':
+            self._fail()
+
+    def __repr__(self):
+        return '<%s.%s - key=%s>' % (__name__, self.__class__.__name__, self.key)
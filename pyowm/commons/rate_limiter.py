@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import threading
+import time
+
+from pyowm.commons import exceptions
+
+# (calls per minute, calls per day) granted by each subscription plan: daily budgets are 1/30 of the monthly quotas
+SUBSCRIPTION_BUDGETS = {
+    'free': (60, 1000000 // 30),
+    'startup': (600, 10000000 // 30),
+    'developer': (3000, 100000000 // 30),
+    'professional': (30000, 1000000000 // 30),
+    'enterprise': (200000, 5000000000 // 30)
+}
+
+MODES = ('block', 'fail', 'queue')
+
+# how long calls are held back after the API responds with 429 and does not tell when to retry
+DEFAULT_COOLDOWN_SECS = 60
+
+
+class TokenBucket:
+    """
+    A bucket holding up to `capacity` tokens, which is continuously refilled at the rate of `capacity` tokens
+    every `period` seconds. Not thread-safe on its own.
+
+    :param capacity: the max number of tokens
+    :type capacity: int
+    :param period: the time (in seconds) needed to refill an empty bucket
+    :type period: int or float
+    """
+
+    def __init__(self, capacity, period):
+        assert isinstance(capacity, int) and capacity > 0, "'capacity' must be a positive int"
+        assert period > 0, "'period' must be positive"
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def wait_time(self, now):
+        """
+        Tells how long it takes to have a token available
+
+        :param now: the current value of `time.monotonic()`
+        :type now: float
+        :returns: the time to wait in seconds (0 if a token is available)
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        return 0. if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        """
+        Takes a token: the balance can go negative, so that tokens can be reserved in advance
+        """
+        self.tokens -= 1
+
+    def __repr__(self):
+        return "<%s.%s - capacity=%s tokens=%s>" % (__name__, self.__class__.__name__, self.capacity, self.tokens)
+
+
+class RateLimiter:
+    """
+    A thread-safe client-side rate limiter, keeping API calls within the per-minute and per-day budgets of a
+    subscription plan. Before being performed, each call acquires a token from both buckets; when no tokens are
+    available the call is handled according to `mode`:
+
+      * `block`: waits until a token is available
+      * `fail`: raises `RateLimitExceededError` straight away
+      * `queue`: reserves the first token that becomes available and waits for it, so that calls are performed in
+        the same order they were issued
+
+    When the API responds with HTTP 429 the limiter can be told to hold back all calls for a while (see `throttle`).
+
+    :param calls_per_minute: the max number of calls per minute
+    :type calls_per_minute: int
+    :param calls_per_day: the max number of calls per day (if ``None``, calls are not limited on a daily basis)
+    :type calls_per_day: int or ``None``
+    :param mode: one among `block`, `fail` and `queue` (defaults to `block`)
+    :type mode: str
+    :param max_wait_secs: the max time a call can be held back before `RateLimitExceededError` is raised (if
+        ``None``, calls wait as long as needed)
+    :type max_wait_secs: int, float or ``None``
+    """
+
+    def __init__(self, calls_per_minute, calls_per_day=None, mode='block', max_wait_secs=None):
+        assert isinstance(calls_per_minute, int) and calls_per_minute > 0, "'calls_per_minute' must be a positive int"
+        assert calls_per_day is None or (isinstance(calls_per_day, int) and calls_per_day > 0), \
+            "'calls_per_day' must be a positive int or None"
+        if mode not in MODES:
+            raise ValueError("'mode' must be one among: {}".format(', '.join(MODES)))
+        assert max_wait_secs is None or max_wait_secs >= 0, "'max_wait_secs' must be non-negative or None"
+        self.calls_per_minute = calls_per_minute
+        self.calls_per_day = calls_per_day
+        self.mode = mode
+        self.max_wait_secs = max_wait_secs
+        self._buckets = [TokenBucket(calls_per_minute, 60)]
+        if calls_per_day is not None:
+            self._buckets.append(TokenBucket(calls_per_day, 86400))
+        self._blocked_until = 0.
+        self._lock = threading.Lock()
+
+    def _reserve(self, started_at):
+        # returns how long the caller must wait before performing the call and whether it owns a token already
+        with self._lock:
+            now = time.monotonic()
+            wait = max([b.wait_time(now) for b in self._buckets] + [self._blocked_until - now])
+            if wait <= 0:
+                for b in self._buckets:
+                    b.take()
+                return 0., True
+            if self.mode == 'fail':
+                raise exceptions.RateLimitExceededError('API calls budget exhausted: retry in {:.2f} secs'.format(wait))
+            if self.max_wait_secs is not None and now + wait - started_at > self.max_wait_secs:
+                raise exceptions.RateLimitExceededError('API calls budget would not be available within {} secs'
+                                                        .format(self.max_wait_secs))
+            if self.mode == 'queue':
+                for b in self._buckets:
+                    b.take()
+                return wait, True
+            return wait, False
+
+    def acquire(self):
+        """
+        Acquires the right to perform an API call, possibly waiting for it
+
+        :raises: *RateLimitExceededError* when the call cannot be performed according to the limiter mode
+        """
+        started_at = time.monotonic()
+        while True:
+            wait, reserved = self._reserve(started_at)
+            if wait > 0:
+                time.sleep(wait)
+            if reserved:
+                return
+
+    async def acquire_async(self):
+        """
+        Same as `acquire`, but waits without blocking the event loop
+
+        :raises: *RateLimitExceededError* when the call cannot be performed according to the limiter mode
+        """
+        started_at = time.monotonic()
+        while True:
+            wait, reserved = self._reserve(started_at)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if reserved:
+                return
+
+    def throttle(self, secs=None):
+        """
+        Holds back all API calls for the specified time. To be used when the API responds with HTTP 429
+
+        :param secs: how long to hold back calls (defaults to `DEFAULT_COOLDOWN_SECS`)
+        :type secs: int, float or ``None``
+        """
+        with self._lock:
+            until = time.monotonic() + (DEFAULT_COOLDOWN_SECS if secs is None else secs)
+            self._blocked_until = max(self._blocked_until, until)
+
+    def __repr__(self):
+        return "<%s.%s - calls_per_minute=%s calls_per_day=%s mode=%s>" % (
+            __name__, self.__class__.__name__, self.calls_per_minute, self.calls_per_day, self.mode)
+
+
+def retry_after_secs(headers):
+    """
+    Parses the `Retry-After` header of an HTTP response, when it expresses a delay in seconds
+
+    :param headers: the response headers
+    :type headers: dict-like
+    :returns: the delay in seconds or ``None``
+    """
+    value = headers.get('Retry-After') if headers is not None else None
+    try:
+        return max(0., float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def rate_limiter_from(config):
+    """
+    Builds the rate limiter described by the `rate_limiting` section of the supplied configuration. Unspecified
+    budgets default to the ones of the configured subscription type.
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :returns: a *RateLimiter* instance or ``None`` if rate limiting is not enabled
+    :raises: *ConfigurationError* when the mode is unknown or the budgets cannot be inferred
+    """
+    assert isinstance(config, dict)
+    limiter_config = config.get('rate_limiting')
+    if not limiter_config or limiter_config.get('mode') is None:
+        return None
+    mode = limiter_config['mode']
+    if mode not in MODES:
+        raise exceptions.ConfigurationError('Unknown rate limiting mode: {}'.format(mode))
+    calls_per_minute = limiter_config.get('calls_per_minute')
+    calls_per_day = limiter_config.get('calls_per_day')
+    if calls_per_minute is None or calls_per_day is None:
+        subscription_type = config.get('subscription_type')
+        name = getattr(subscription_type, 'name', None)
+        if name not in SUBSCRIPTION_BUDGETS:
+            raise exceptions.ConfigurationError('Cannot infer rate limits for subscription type: {}'
+                                                .format(subscription_type))
+        default_per_minute, default_per_day = SUBSCRIPTION_BUDGETS[name]
+        calls_per_minute = default_per_minute if calls_per_minute is None else calls_per_minute
+        calls_per_day = default_per_day if calls_per_day is None else calls_per_day
+    return RateLimiter(calls_per_minute, calls_per_day, mode=mode, max_wait_secs=limiter_config.get('max_wait_secs'))
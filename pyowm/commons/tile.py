@@ -6,6 +6,10 @@ from pyowm.commons.image import Image
 from pyowm.utils.geo import Polygon
 
 
+# the max latitude that can be represented in the Web Mercator projection used by map tiles
+MAX_TILE_LATITUDE = 85.0511287798
+
+
 class Tile:
 
     """
@@ -88,6 +92,60 @@ class Tile:
         y = int((1.0 - math.log(math.tan(math.radians(lat)) + (1 / math.cos(math.radians(lat)))) / math.pi) / 2.0 * n)
         return x, y
 
+    @classmethod
+    def tiles_coords_for_bbox(cls, lon_left, lat_bottom, lon_right, lat_top, zoom):
+        """
+        Returns the coordinates of all the tiles at the specified zoom level that overlap with the specified bounding
+        box. Latitudes beyond the limits of the Mercator Projection are clamped.
+
+        :param lon_left: longitude for the left margin of the bounding box
+        :type lon_left: int or float
+        :param lat_bottom: latitude for the bottom margin of the bounding box
+        :type lat_bottom: int or float
+        :param lon_right: longitude for the right margin of the bounding box
+        :type lon_right: int or float
+        :param lat_top: latitude for the top margin of the bounding box
+        :type lat_top: int or float
+        :param zoom: zoom level
+        :type zoom: int
+        :return: a list of (x, y) tuples, row by row from the north-west corner to the south-east one
+        :raises: *ValueError* if the left margin is east of the right one or the bottom margin is north of the top one
+        """
+        x_min, y_min, x_max, y_max = cls._tiles_range_for_bbox(lon_left, lat_bottom, lon_right, lat_top, zoom)
+        return [(x, y) for y in range(y_min, y_max + 1) for x in range(x_min, x_max + 1)]
+
+    @classmethod
+    def tiles_count_for_bbox(cls, lon_left, lat_bottom, lon_right, lat_top, zoom):
+        """
+        Returns the number of tiles that `tiles_coords_for_bbox` would return, without listing them.
+
+        :param lon_left: longitude for the left margin of the bounding box
+        :type lon_left: int or float
+        :param lat_bottom: latitude for the bottom margin of the bounding box
+        :type lat_bottom: int or float
+        :param lon_right: longitude for the right margin of the bounding box
+        :type lon_right: int or float
+        :param lat_top: latitude for the top margin of the bounding box
+        :type lat_top: int or float
+        :param zoom: zoom level
+        :type zoom: int
+        :return: int
+        :raises: *ValueError* if the left margin is east of the right one or the bottom margin is north of the top one
+        """
+        x_min, y_min, x_max, y_max = cls._tiles_range_for_bbox(lon_left, lat_bottom, lon_right, lat_top, zoom)
+        return (x_max - x_min + 1) * (y_max - y_min + 1)
+
+    @classmethod
+    def _tiles_range_for_bbox(cls, lon_left, lat_bottom, lon_right, lat_top, zoom):
+        if lon_left > lon_right or lat_bottom > lat_top:
+            raise ValueError('Invalid bounding box: margins are swapped')
+        max_index = 2 ** zoom - 1
+        x_min, y_min = Tile.geoocoords_to_tile_coords(lon_left, min(lat_top, MAX_TILE_LATITUDE), zoom)
+        x_max, y_max = Tile.geoocoords_to_tile_coords(lon_right, max(lat_bottom, -MAX_TILE_LATITUDE), zoom)
+        x_min, y_min = min(max(x_min, 0), max_index), min(max(y_min, 0), max_index)
+        x_max, y_max = min(max(x_max, 0), max_index), min(max(y_max, 0), max_index)
+        return x_min, y_min, x_max, y_max
+
     @classmethod
     def tile_coords_to_bbox(cls, x, y, zoom):
         """
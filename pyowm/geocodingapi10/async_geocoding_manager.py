@@ -0,0 +1,77 @@
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.commons.uris import ROOT_GEOCODING_API_URL, DIRECT_GEOCODING_URI, REVERSE_GEOCODING_URI
+from pyowm.constants import GEOCODING_API_VERSION
+from pyowm.geocodingapi10 import geocoding_manager
+
+
+class AsyncGeocodingManager:
+
+    """
+    The asyncio twin of `pyowm.geocodingapi10.geocoding_manager.GeocodingManager`: it exposes the same methods as
+    coroutines.
+
+    :param API_key: the OWM API key
+    :type API_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param session: an `aiohttp.ClientSession` shared among the HTTP clients (if not provided, each client handles
+        its own)
+    :type session: `aiohttp.ClientSession` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
+    :returns: an *AsyncGeocodingManager* instance
+    :raises: *AssertionError* when no API Key is provided
+
+    """
+
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
+        assert API_key is not None, 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_GEOCODING_API_URL, session=session, cache=cache,
+                                           rate_limiter=rate_limiter)
+
+    def geocoding_api_version(self):
+        return GEOCODING_API_VERSION
+
+    async def geocode(self, toponym, country=None, state_code=None, limit=None):
+        """
+        Coroutine version of `GeocodingManager.geocode`
+
+        :param toponym: the name of the location
+        :type toponym: `str`
+        :param country: the 2-chars ISO symbol of the country
+        :type country: `str` or `None`
+        :param state_code: the 2-chars ISO symbol of state (only useful in case the country is US)
+        :type state_code: `str` or `None`
+        :param limit: the max number of results to be returned in case of multiple matchings (no limits by default)
+        :type limit: `int` or `None`
+        :returns: a list of *Location* instances
+        :raises: *AssertionError*, *ValueError*, *APIRequestError*
+
+        """
+        params = geocoding_manager._geocode_params(toponym, country, state_code, limit)
+        _, json_data = await self.http_client.get_json(DIRECT_GEOCODING_URI, params=params)
+        return geocoding_manager._parse_locations(json_data)
+
+    async def reverse_geocode(self, lat, lon, limit=None):
+        params = geocoding_manager._reverse_geocode_params(lat, lon, limit)
+        _, json_data = await self.http_client.get_json(REVERSE_GEOCODING_URI, params=params)
+        return geocoding_manager._parse_locations(json_data)
+
+    async def close(self):
+        """
+        Releases the HTTP session owned by this manager
+        """
+        await self.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
@@ -14,16 +14,23 @@ class GeocodingManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param session: a `requests.Session` shared among the HTTP clients (if not provided, each client handles its own)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
     :returns: an *GeocodingManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_GEOCODING_API_URL)
+        self.http_client = HttpClient(API_key, config, ROOT_GEOCODING_API_URL, session=session, cache=cache,
+                                      rate_limiter=rate_limiter)
 
     def geocoding_api_version(self):
         return GEOCODING_API_VERSION
@@ -44,42 +51,58 @@ class GeocodingManager:
         :raises: *AssertionError*, *ValueError*, *APIRequestError*
 
         """
-        assert toponym, 'Toponym must be specified'
-        if country is not None and len(country) != 2:
-            raise ValueError("Country must be a 2-char string")
-        if state_code is not None and len(state_code) != 2:
-            raise ValueError("State Code must be a 2-char string")
-        if limit is not None:
-            assert isinstance(limit, int)
-            assert limit > 0
-
-        query = toponym
-        if state_code is not None:
-            query += ',' + state_code
-        if country is not None:
-            query += ',' + country
-
-        params = {'q': query}
-
-        if limit is not None:
-            params['limit'] = limit
-
+        params = _geocode_params(toponym, country, state_code, limit)
         _, json_data = self.http_client.get_json(DIRECT_GEOCODING_URI, params=params)
-        return [Location.from_dict(item) for item in json_data]
+        return _parse_locations(json_data)
 
     def reverse_geocode(self, lat, lon, limit=None):
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        if limit is not None:
-            assert isinstance(limit, int)
-            assert limit > 0
-
-        params = {'lat': lat, 'lon': lon}
-        if limit is not None:
-            params['limit'] = limit
-
+        params = _reverse_geocode_params(lat, lon, limit)
         _, json_data = self.http_client.get_json(REVERSE_GEOCODING_URI, params=params)
-        return [Location.from_dict(item) for item in json_data]
+        return _parse_locations(json_data)
 
     def __repr__(self):
-        return '<%s.%s>' % (__name__, self.__class__.__name__)
\ No newline at end of file
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
+
+
+# Validation, request building and response parsing are shared by GeocodingManager and AsyncGeocodingManager
+
+def _assert_limit(limit):
+    if limit is not None:
+        assert isinstance(limit, int)
+        assert limit > 0
+
+
+def _geocode_params(toponym, country, state_code, limit):
+    assert toponym, 'Toponym must be specified'
+    if country is not None and len(country) != 2:
+        raise ValueError("Country must be a 2-char string")
+    if state_code is not None and len(state_code) != 2:
+        raise ValueError("State Code must be a 2-char string")
+    _assert_limit(limit)
+
+    query = toponym
+    if state_code is not None:
+        query += ',' + state_code
+    if country is not None:
+        query += ',' + country
+
+    params = {'q': query}
+
+    if limit is not None:
+        params['limit'] = limit
+    return params
+
+
+def _reverse_geocode_params(lat, lon, limit):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    _assert_limit(limit)
+
+    params = {'lat': lat, 'lon': lon}
+    if limit is not None:
+        params['limit'] = limit
+    return params
+
+
+def _parse_locations(json_data):
+    return [Location.from_dict(item) for item in json_data]
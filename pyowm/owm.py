@@ -5,16 +5,16 @@ from importlib.metadata import version
 
 from pyowm import constants
 from pyowm.agroapi10 import agro_manager
-from pyowm.airpollutionapi30 import airpollution_manager
+from pyowm.airpollutionapi30 import airpollution_manager, async_airpollution_manager
 from pyowm.alertapi30 import alert_manager
-from pyowm.geocodingapi10 import geocoding_manager
+from pyowm.geocodingapi10 import geocoding_manager, async_geocoding_manager
 from pyowm.stationsapi30 import stations_manager
-from pyowm.tiles import tile_manager
+from pyowm.tiles import tile_manager, async_tile_manager, tile_cache
 from pyowm.utils import strings
-from pyowm.uvindexapi30 import uvindex_manager
+from pyowm.uvindexapi30 import uvindex_manager, async_uvindex_manager
 from pyowm.utils import config as cfg
-from pyowm.commons import cityidregistry
-from pyowm.weatherapi30 import weather_manager
+from pyowm.commons import cache, cityidregistry, http_client, rate_limiter
+from pyowm.weatherapi30 import weather_manager, async_weather_manager
 
 
 class OWM:
@@ -35,6 +35,10 @@ class OWM:
         else:
             assert isinstance(config, dict)
             self.config = config
+        self._session = None
+        self._cache = None
+        self._rate_limiter = None
+        self._tile_cache = None
 
     @property
     def configuration(self):
@@ -56,6 +60,58 @@ class OWM:
         """
         return tuple(version('pyowm').split('.'))
 
+    @property
+    def http_session(self):
+        """
+        Returns the keep-alive HTTP session that is shared by all the managers created by this object. The session
+        is lazily created upon first access and its connection pools are sized after the `connection` config section
+
+        :returns: a `requests.Session` instance
+
+        """
+        if self._session is None:
+            self._session = http_client.new_session(self.config)
+        return self._session
+
+    @property
+    def cache(self):
+        """
+        Returns the cache of API responses that is shared by all the managers created by this object, as described
+        by the `cache` config section. The cache is lazily created upon first access
+
+        :returns: a `pyowm.commons.cache.Cache` instance or ``None`` if caching is not enabled
+
+        """
+        if self._cache is None:
+            self._cache = cache.cache_from(self.config)
+        return self._cache
+
+    @property
+    def rate_limiter(self):
+        """
+        Returns the limiter of API calls that is shared by all the managers created by this object, as described by
+        the `rate_limiting` config section. The limiter is lazily created upon first access
+
+        :returns: a `pyowm.commons.rate_limiter.RateLimiter` instance or ``None`` if rate limiting is not enabled
+
+        """
+        if self._rate_limiter is None:
+            self._rate_limiter = rate_limiter.rate_limiter_from(self.config)
+        return self._rate_limiter
+
+    @property
+    def tile_cache(self):
+        """
+        Returns the on-disk cache of map tiles that is shared by all the tile managers created by this object, as
+        described by the `tile_cache` config section. The cache is lazily created upon first access
+
+        :returns: a `pyowm.tiles.tile_cache.TileCache` instance or ``None`` if tile caching is not enabled
+
+        """
+        if self._tile_cache is None:
+            self._tile_cache = tile_cache.tile_cache_from(self.config)
+        return self._tile_cache
+
     @property
     def supported_languages(self):
         """
@@ -72,7 +128,8 @@ class OWM:
         Agricultural API.
         :return: a `pyowm.agro10.agro_manager.AgroManager` instance
         """
-        return agro_manager.AgroManager(self.api_key, self.config)
+        return agro_manager.AgroManager(self.api_key, self.config, session=self.http_session, cache=self.cache,
+                                        rate_limiter=self.rate_limiter)
 
     def airpollution_manager(self):
         """
@@ -80,22 +137,26 @@ class OWM:
         pollution data.
         :return: a `pyowm.airpollutionapi30.airpollution_manager.AirPollutionManager` instance
         """
-        return airpollution_manager.AirPollutionManager(self.api_key, self.config)
+        return airpollution_manager.AirPollutionManager(self.api_key, self.config, session=self.http_session,
+                                                        cache=self.cache, rate_limiter=self.rate_limiter)
 
     def alert_manager(self):
         """
         Gives an *AlertManager* instance that can be used to read/write weather triggers and alerts data.
         :return: an *AlertManager* instance
         """
-        return alert_manager.AlertManager(self.api_key, self.config)
+        return alert_manager.AlertManager(self.api_key, self.config, session=self.http_session, cache=self.cache,
+                                          rate_limiter=self.rate_limiter)
 
     def city_id_registry(self):
         """
-        Gives the *CityIDRegistry* singleton instance that can be used to lookup for city IDs.
+        Gives the *CityIDRegistry* singleton instance that can be used to lookup for city IDs. The cities database
+        is decompressed into the `cache_dir` of the `city_id_registry` config section, or into memory if not set.
 
         :returns: a *CityIDRegistry* instance
         """
-        return cityidregistry.CityIDRegistry.get_instance()
+        cache_dir = self.config.get('city_id_registry', dict()).get('cache_dir')
+        return cityidregistry.CityIDRegistry.get_instance(cache_dir=cache_dir)
 
     def stations_manager(self):
         """
@@ -103,7 +164,8 @@ class OWM:
         meteostations data.
         :returns: a *StationsManager* instance
         """
-        return stations_manager.StationsManager(self.api_key, self.config)
+        return stations_manager.StationsManager(self.api_key, self.config, session=self.http_session, cache=self.cache,
+                                                rate_limiter=self.rate_limiter)
 
     def tile_manager(self, layer_name):
         """
@@ -111,14 +173,16 @@ class OWM:
         :param layer_name: the layer name for the tiles (values can be looked up on `pyowm.tiles.enums.MapLayerEnum`)
         :return: a `pyowm.tiles.tile_manager.TileManager` instance
         """
-        return tile_manager.TileManager(self.api_key, layer_name, self.config)
+        return tile_manager.TileManager(self.api_key, layer_name, self.config, session=self.http_session,
+                                        cache=self.cache, rate_limiter=self.rate_limiter, tile_cache=self.tile_cache)
 
     def uvindex_manager(self):
         """
         Gives a `pyowm.uvindexapi30.uvindex_manager.UVIndexManager` instance that can be used to fetch UV data.
         :return: a `pyowm.uvindexapi30.uvindex_manager.UVIndexManager` instance
         """
-        return uvindex_manager.UVIndexManager(self.api_key, self.config)
+        return uvindex_manager.UVIndexManager(self.api_key, self.config, session=self.http_session, cache=self.cache,
+                                              rate_limiter=self.rate_limiter)
 
     def weather_manager(self):
         """
@@ -126,7 +190,8 @@ class OWM:
         pollution data.
         :return: a `pyowm.weatherapi30.weather_manager.WeatherManager` instance
         """
-        return weather_manager.WeatherManager(self.api_key, self.config)
+        return weather_manager.WeatherManager(self.api_key, self.config, session=self.http_session, cache=self.cache,
+                                              rate_limiter=self.rate_limiter)
 
     def geocoding_manager(self):
         """
@@ -134,7 +199,59 @@ class OWM:
         and reverse geocoding
         :return: a `pyowm.geocoding10.geocoding_manager.GeocodingManager` instance
         """
-        return geocoding_manager.GeocodingManager(self.api_key, self.config)
+        return geocoding_manager.GeocodingManager(self.api_key, self.config, session=self.http_session,
+                                                  cache=self.cache, rate_limiter=self.rate_limiter)
+
+    def async_airpollution_manager(self, session=None):
+        """
+        Gives a `pyowm.airpollutionapi30.async_airpollution_manager.AsyncAirPollutionManager` instance, which is the
+        asyncio twin of the manager returned by `airpollution_manager()`. Requires the `aiohttp` package.
+        :param session: an `aiohttp.ClientSession` to be shared with other async managers (optional)
+        :return: a `pyowm.airpollutionapi30.async_airpollution_manager.AsyncAirPollutionManager` instance
+        """
+        return async_airpollution_manager.AsyncAirPollutionManager(self.api_key, self.config, session=session,
+                                                                   cache=self.cache, rate_limiter=self.rate_limiter)
+
+    def async_geocoding_manager(self, session=None):
+        """
+        Gives a `pyowm.geocodingapi10.async_geocoding_manager.AsyncGeocodingManager` instance, which is the asyncio
+        twin of the manager returned by `geocoding_manager()`. Requires the `aiohttp` package.
+        :param session: an `aiohttp.ClientSession` to be shared with other async managers (optional)
+        :return: a `pyowm.geocodingapi10.async_geocoding_manager.AsyncGeocodingManager` instance
+        """
+        return async_geocoding_manager.AsyncGeocodingManager(self.api_key, self.config, session=session,
+                                                             cache=self.cache, rate_limiter=self.rate_limiter)
+
+    def async_tile_manager(self, layer_name, session=None):
+        """
+        Gives a `pyowm.tiles.async_tile_manager.AsyncTileManager` instance, which is the asyncio twin of the manager
+        returned by `tile_manager()`. Requires the `aiohttp` package.
+        :param layer_name: the layer name for the tiles (values can be looked up on `pyowm.tiles.enums.MapLayerEnum`)
+        :param session: an `aiohttp.ClientSession` to be shared with other async managers (optional)
+        :return: a `pyowm.tiles.async_tile_manager.AsyncTileManager` instance
+        """
+        return async_tile_manager.AsyncTileManager(self.api_key, layer_name, self.config, session=session,
+                                                   cache=self.cache, rate_limiter=self.rate_limiter)
+
+    def async_uvindex_manager(self, session=None):
+        """
+        Gives a `pyowm.uvindexapi30.async_uvindex_manager.AsyncUVIndexManager` instance, which is the asyncio twin of
+        the manager returned by `uvindex_manager()`. Requires the `aiohttp` package.
+        :param session: an `aiohttp.ClientSession` to be shared with other async managers (optional)
+        :return: a `pyowm.uvindexapi30.async_uvindex_manager.AsyncUVIndexManager` instance
+        """
+        return async_uvindex_manager.AsyncUVIndexManager(self.api_key, self.config, session=session, cache=self.cache,
+                                                         rate_limiter=self.rate_limiter)
+
+    def async_weather_manager(self, session=None):
+        """
+        Gives a `pyowm.weatherapi30.async_weather_manager.AsyncWeatherManager` instance, which is the asyncio twin of
+        the manager returned by `weather_manager()`. Requires the `aiohttp` package.
+        :param session: an `aiohttp.ClientSession` to be shared with other async managers (optional)
+        :return: a `pyowm.weatherapi30.async_weather_manager.AsyncWeatherManager` instance
+        """
+        return async_weather_manager.AsyncWeatherManager(self.api_key, self.config, session=session, cache=self.cache,
+                                                         rate_limiter=self.rate_limiter)
 
     def __repr__(self):
         return "<%s.%s - API key=%s, subscription type=%s, PyOWM version=%s>" % \
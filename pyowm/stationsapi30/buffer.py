@@ -2,7 +2,9 @@
 # -*- coding: utf-8 -*-
 
 import copy
+import heapq
 import json
+from bisect import bisect_left, bisect_right
 from pyowm.stationsapi30.measurement import Measurement
 from pyowm.utils import timestamps, formatting
 
@@ -106,3 +108,178 @@ class Buffer:
         return '<%s.%s - station_id=%s, n_samples=%s>' \
                % (__name__, self.__class__.__name__,
                   self.station_id, len(self))
+
+
+def _timestamp(measurement):
+    return measurement.timestamp
+
+
+class SortedBuffer(Buffer):
+
+    """
+    A buffer whose measurements are always kept in chronological order and are unique by timestamp: as all of the
+    measurements of a buffer belong to the same station, this means that there is at most one measurement per
+    (station ID, timestamp) pair.
+
+    Appending measurements in chronological order takes constant time, while out-of-order ones are inserted in
+    place. Measurements can be looked up by timestamp or time range in logarithmic time, and buffers are merged in
+    linear time: the result shares the measurement objects of the merged buffers instead of copying them.
+
+    The `measurements` list must not be modified directly.
+
+    :param station_id: unique OWM-provided ID of the station the measurements belong to
+    :type station_id: str
+    :param keep: which measurement is kept when two of them have the same timestamp: 'last' (default) for the
+        most recently appended or merged one, 'first' for the one already in the buffer
+    :type keep: str
+    :raises: *ValueError* when `keep` is not valid
+    """
+
+    def __init__(self, station_id, keep='last'):
+        super().__init__(station_id)
+        if keep not in ('first', 'last'):
+            raise ValueError('"keep" must be among: first, last')
+        self.keep = keep
+        self._timestamps = []
+
+    @classmethod
+    def merge(cls, buffers, station_id=None, keep='last'):
+        """
+        Merges many buffers of the same station into a new one in a single pass, which is much faster than adding
+        them one by one. Measurements having the same timestamp are de-duplicated: the ones of later buffers win
+        when `keep` is 'last'.
+
+        :param buffers: the buffers to be merged
+        :type buffers: iterable of *Buffer* instances
+        :param station_id: the station ID of the resulting buffer (defaults to the one of the first buffer)
+        :type station_id: str or `None`
+        :param keep: which measurement is kept when two of them have the same timestamp ('first' or 'last')
+        :type keep: str
+        :returns: a *SortedBuffer* instance
+        :raises: *ValueError* when no buffers and no station ID are provided
+        """
+        buffers = list(buffers)
+        if station_id is None:
+            if not buffers:
+                raise ValueError('No buffers and no station ID provided')
+            station_id = buffers[0].station_id
+        result = cls(station_id, keep=keep)
+        result._merge_runs([result._run(b) for b in buffers])
+        return result
+
+    def append(self, measurement):
+        """
+        Appends the specified ``Measurement`` object to the buffer, at the place its timestamp dictates. If the
+        buffer already holds a measurement with the same timestamp, only one of the two is kept
+        :param measurement: a ``measurement.Measurement`` instance
+
+        """
+        assert isinstance(measurement, Measurement)
+        assert measurement.station_id == self.station_id
+        timestamp = measurement.timestamp
+        if not self._timestamps or timestamp > self._timestamps[-1]:
+            self._timestamps.append(timestamp)
+            self.measurements.append(measurement)
+            return
+        i = bisect_left(self._timestamps, timestamp)
+        if self._timestamps[i] == timestamp:
+            if self.keep == 'last':
+                self.measurements[i] = measurement
+            return
+        self._timestamps.insert(i, timestamp)
+        self.measurements.insert(i, measurement)
+
+    def extend(self, other):
+        """
+        Merges the measurements of another buffer (or of any iterable of ``Measurement`` objects) into this one, in
+        linear time when the other buffer is a *SortedBuffer* too
+        :param other: the measurements to be merged
+
+        """
+        self._merge_runs([self.measurements, self._run(other)])
+
+    def get(self, timestamp):
+        """
+        Gives the measurement having the specified timestamp
+        :param timestamp: the UNIX timestamp
+        :type timestamp: int
+        :returns: a ``measurement.Measurement`` instance or ``None``
+
+        """
+        i = bisect_left(self._timestamps, timestamp)
+        if i < len(self._timestamps) and self._timestamps[i] == timestamp:
+            return self.measurements[i]
+        return None
+
+    def between(self, from_timestamp=None, to_timestamp=None):
+        """
+        Gives the measurements recorded in the specified time window, in chronological order
+        :param from_timestamp: the UNIX timestamp of the beginning of the window (included), if any
+        :type from_timestamp: int or ``None``
+        :param to_timestamp: the UNIX timestamp of the end of the window (included), if any
+        :type to_timestamp: int or ``None``
+        :returns: list of ``measurement.Measurement`` instances
+
+        """
+        start = 0 if from_timestamp is None else bisect_left(self._timestamps, from_timestamp)
+        end = len(self._timestamps) if to_timestamp is None else bisect_right(self._timestamps, to_timestamp)
+        return self.measurements[start:end]
+
+    def empty(self):
+        super().empty()
+        self._timestamps = []
+
+    def sort_chronologically(self):
+        """
+        Does nothing, as the measurements of this buffer are always in chronological order
+
+        """
+        pass
+
+    def sort_reverse_chronologically(self):
+        """
+        Not supported, as the measurements of this buffer are always in chronological order: iterate over
+        ``reversed(buffer)`` instead
+        :raises: ValueError
+
+        """
+        raise ValueError('Measurements of a SortedBuffer are always in chronological order: use reversed()')
+
+    def _run(self, other):
+        # gives the measurements of the other buffer in chronological order, sorting them only if needed
+        if isinstance(other, SortedBuffer):
+            run = other.measurements
+        else:
+            run = sorted(other, key=_timestamp)
+        assert all(isinstance(m, Measurement) and m.station_id == self.station_id for m in run)
+        return run
+
+    def _merge_runs(self, runs):
+        # merges lists of measurements sorted by timestamp: as they are sorted, duplicates are always adjacent
+        measurements = []
+        timestamps = []
+        for m in heapq.merge(*runs, key=_timestamp):
+            if timestamps and timestamps[-1] == m.timestamp:
+                if self.keep == 'last':
+                    measurements[-1] = m
+                continue
+            measurements.append(m)
+            timestamps.append(m.timestamp)
+        self.measurements = measurements
+        self._timestamps = timestamps
+
+    def __add__(self, other):
+        result = SortedBuffer(self.station_id, keep=self.keep)
+        result.created_at = self.created_at
+        result._merge_runs([self.measurements, self._run(other)])
+        return result
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __contains__(self, measurement):
+        return measurement.station_id == self.station_id and self.get(measurement.timestamp) is not None
+
+    def __reversed__(self):
+        return reversed(self.measurements)
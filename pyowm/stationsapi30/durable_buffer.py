@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import sqlite3
+import threading
+import time
+
+from pyowm.stationsapi30.buffer import Buffer
+from pyowm.stationsapi30.measurement import Measurement
+
+
+class DurableBuffer:
+
+    """
+    A write-ahead buffer of measurements that survives process crashes, flushing its content to the Stations API in
+    the background.
+
+    Measurements are appended to a SQLite database file in WAL mode, and a flusher thread posts them to the API in
+    micro-batches by means of `StationsManager.send_measurements`: a batch is sent as soon as `batch_size`
+    measurements are pending or the oldest pending measurement is older than `max_age_secs`. Measurements are
+    removed from the file only once the API has acknowledged them, and failed batches are retried with an
+    exponential backoff, so nothing is lost if the API is unreachable for a while or the process dies: a new buffer
+    on the same file picks up the pending measurements and sends them.
+
+    Delivery is at-least-once: if the process dies after a batch has been posted but before its removal from the
+    file, the batch is sent again on restart.
+
+    Appending a measurement takes one SQLite transaction: use `extend` to append many of them at once with a single
+    one. With `synchronous_commits` set, each transaction is also synced to disk, so that measurements survive
+    operating system crashes and power losses too, at the cost of lower throughput.
+
+    :param path: path to the database file, which is created if it does not exist
+    :type path: str
+    :param stations_manager: the manager used to send measurements
+    :type stations_manager: a `pyowm.stationsapi30.stations_manager.StationsManager` instance
+    :param batch_size: the max number of measurements sent with a single API call (defaults to 100)
+    :type batch_size: int
+    :param max_age_secs: the max time in seconds a measurement waits before being sent (defaults to 5)
+    :type max_age_secs: int or float
+    :param backoff_secs: the wait time in seconds before retrying a failed batch, doubled at each new failure
+        (defaults to 1)
+    :type backoff_secs: int or float
+    :param max_backoff_secs: the max wait time in seconds before retrying a failed batch (defaults to 60)
+    :type max_backoff_secs: int or float
+    :param synchronous_commits: whether each append must be synced to disk (defaults to ``False``)
+    :type synchronous_commits: bool
+    :param on_error: a callable invoked by the flusher with the raised exception whenever a batch cannot be sent
+    :type on_error: callable or `None`
+    :returns: a *DurableBuffer* instance
+
+    """
+
+    def __init__(self, path, stations_manager, batch_size=100, max_age_secs=5, backoff_secs=1,
+                 max_backoff_secs=60, synchronous_commits=False, on_error=None):
+        assert isinstance(path, str), "'path' must be a str"
+        assert stations_manager is not None
+        assert isinstance(batch_size, int) and batch_size > 0, "'batch_size' must be a positive int"
+        assert max_age_secs >= 0, "'max_age_secs' must be non-negative"
+        assert 0 < backoff_secs <= max_backoff_secs, "'backoff_secs' must be positive and at most 'max_backoff_secs'"
+        assert on_error is None or callable(on_error)
+        self.path = path
+        self.stations_manager = stations_manager
+        self.batch_size = batch_size
+        self.max_age_secs = max_age_secs
+        self.backoff_secs = backoff_secs
+        self.max_backoff_secs = max_backoff_secs
+        self.on_error = on_error
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=%s' % ('FULL' if synchronous_commits else 'NORMAL'))
+        self._connection.execute('CREATE TABLE IF NOT EXISTS measurements (seq INTEGER PRIMARY KEY AUTOINCREMENT, '
+                                 'station_id TEXT NOT NULL, timestamp INTEGER NOT NULL, data TEXT NOT NULL, '
+                                 'enqueued_at REAL NOT NULL)')
+        self._pending, self._oldest = self._connection.execute(
+            'SELECT COUNT(*), MIN(enqueued_at) FROM measurements').fetchone()
+
+    def append(self, measurement):
+        """
+        Durably appends a measurement to the buffer
+
+        :param measurement: the measurement
+        :type measurement: a `pyowm.stationsapi30.measurement.Measurement` instance
+        """
+        self.extend([measurement])
+
+    def extend(self, measurements):
+        """
+        Durably appends many measurements to the buffer, with a single transaction
+
+        :param measurements: the measurements
+        :type measurements: iterable of `pyowm.stationsapi30.measurement.Measurement` or a
+            `pyowm.stationsapi30.buffer.Buffer` instance
+        """
+        if isinstance(measurements, Buffer):
+            measurements = measurements.measurements
+        measurements = list(measurements)
+        assert all(isinstance(m, Measurement) for m in measurements)
+        if not measurements:
+            return
+        now = time.time()
+        rows = [(m.station_id, m.timestamp, json.dumps(m.to_dict()), now) for m in measurements]
+        with self._lock:
+            self._connection.execute('BEGIN')
+            try:
+                self._connection.executemany('INSERT INTO measurements (station_id, timestamp, data, enqueued_at) '
+                                             'VALUES (?, ?, ?, ?)', rows)
+            except BaseException:
+                self._connection.execute('ROLLBACK')
+                raise
+            self._connection.execute('COMMIT')
+            self._pending += len(rows)
+            # the flusher must also be woken up when the buffer was empty, so that it starts waiting for max age
+            wakeup = self._oldest is None or self._pending >= self.batch_size
+            if self._oldest is None:
+                self._oldest = now
+        if wakeup:
+            self._wakeup.set()
+
+    def pending(self):
+        """
+        Gives the measurements that have not been acknowledged by the API yet, in the order they were appended
+
+        :returns: list of `pyowm.stationsapi30.measurement.Measurement` objects
+        """
+        with self._lock:
+            rows = self._connection.execute('SELECT data FROM measurements ORDER BY seq').fetchall()
+        return [Measurement.from_dict(json.loads(data)) for data, in rows]
+
+    def flush(self):
+        """
+        Sends all of the pending measurements to the API, in batches, from the calling thread
+
+        :returns: the number of sent measurements
+        :raises: any error raised by `StationsManager.send_measurements`: the measurements that could not be sent are
+            kept in the buffer
+        """
+        total = 0
+        while True:
+            sent = self._send_batch()
+            if sent == 0:
+                return total
+            total += sent
+
+    def start(self):
+        """
+        Starts the background flusher thread. Buffers can also be used as context managers, starting the flusher
+        upon entering the context and stopping it upon exiting
+        """
+        if self._thread is not None:
+            raise RuntimeError('The flusher is already running')
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name='pyowm-durable-buffer-flusher', daemon=True)
+        self._thread.start()
+
+    def stop(self, flush=True, timeout=None):
+        """
+        Stops the background flusher thread, if running
+
+        :param flush: whether the pending measurements must be sent before returning (defaults to ``True``)
+        :type flush: bool
+        :param timeout: the max time in seconds to wait for the flusher to finish its current batch (defaults to
+            ``None``, meaning: no limit)
+        :type timeout: int or float or `None`
+        :raises: any error raised while flushing
+        """
+        if self._thread is not None:
+            self._stopping.set()
+            self._wakeup.set()
+            self._thread.join(timeout)
+            self._thread = None
+        if flush:
+            self.flush()
+
+    def close(self):
+        """
+        Stops the flusher without flushing and closes the database file: pending measurements are sent by the next
+        buffer opened on the same file
+        """
+        self.stop(flush=False)
+        with self._lock:
+            self._connection.close()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _send_batch(self):
+        with self._send_lock:
+            with self._lock:
+                rows = self._connection.execute('SELECT seq, data FROM measurements ORDER BY seq LIMIT ?',
+                                                (self.batch_size,)).fetchall()
+            if not rows:
+                return 0
+            batch = [Measurement.from_dict(json.loads(data)) for _, data in rows]
+            self.stations_manager.send_measurements(batch)
+            with self._lock:
+                # checkpoint: acknowledged measurements are dropped
+                self._connection.execute('DELETE FROM measurements WHERE seq <= ?', (rows[-1][0],))
+                self._pending, self._oldest = self._connection.execute(
+                    'SELECT COUNT(*), MIN(enqueued_at) FROM measurements').fetchone()
+            return len(rows)
+
+    def _seconds_to_next_batch(self):
+        with self._lock:
+            if self._pending >= self.batch_size:
+                return 0
+            if self._pending == 0:
+                return None
+            return max(0, self._oldest + self.max_age_secs - time.time())
+
+    def _run(self):
+        backoff = 0
+        while not self._stopping.is_set():
+            if backoff:
+                if self._stopping.wait(backoff):
+                    break
+            else:
+                timeout = self._seconds_to_next_batch()
+                if timeout is None or timeout > 0:
+                    self._wakeup.wait(timeout)
+                    self._wakeup.clear()
+                    continue
+            try:
+                self._send_batch()
+                backoff = 0
+            except Exception as e:
+                self.last_error = e
+                backoff = min(max(2 * backoff, self.backoff_secs), self.max_backoff_secs)
+                if self.on_error is not None:
+                    try:
+                        self.on_error(e)
+                    except Exception:
+                        pass
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop(flush=exc_type is None)
+
+    def __len__(self):
+        with self._lock:
+            return self._pending
+
+    def __repr__(self):
+        return '<%s.%s - path=%s, pending=%s>' % (__name__, self.__class__.__name__, self.path, len(self))
@@ -3,7 +3,7 @@
 
 import json
 from pyowm.commons import exceptions
-from pyowm.utils import formatting
+from pyowm.utils import decorators, formatting
 
 
 class AggregatedMeasurement:
@@ -30,6 +30,9 @@ class AggregatedMeasurement:
     :type precipitation: dict or `None`
     """
 
+    __slots__ = ('station_id', 'timestamp', 'aggregated_on', 'temp', 'humidity', 'wind', 'pressure',
+                 'precipitation')
+
     ALLOWED_AGGREGATION_TIME_FRAMES = ['m', 'h', 'd']
 
     def __init__(self, station_id, timestamp, aggregated_on, temp=None,
@@ -89,8 +92,8 @@ class AggregatedMeasurement:
         wind = the_dict.get('wind', dict())
         pressure = the_dict.get('pressure', dict())
         precipitation = the_dict.get('precipitation', dict())
-        return AggregatedMeasurement(station_id, ts, aggregated_on, temp=temp, humidity=humidity, wind=wind,
-                                     pressure=pressure, precipitation=precipitation)
+        return cls(station_id, ts, aggregated_on, temp=temp, humidity=humidity, wind=wind,
+                   pressure=pressure, precipitation=precipitation)
 
     def to_dict(self):
         """Dumps object fields into a dict
@@ -115,6 +118,12 @@ class AggregatedMeasurement:
 
 class Measurement:
 
+    __slots__ = ('station_id', 'timestamp', 'temperature', 'wind_speed', 'wind_gust', 'wind_deg', 'pressure',
+                 'humidity', 'rain_1h', 'rain_6h', 'rain_24h', 'snow_1h', 'snow_6h', 'snow_24h', 'dew_point',
+                 'humidex', 'heat_index', 'visibility_distance', 'visibility_prefix', 'clouds_distance',
+                 'clouds_condition', 'clouds_cumulus', 'weather_precipitation', 'weather_descriptor',
+                 'weather_intensity', 'weather_proximity', 'weather_obscuration', 'weather_other')
+
     def __init__(self, station_id, timestamp, temperature=None, wind_speed=None,
                  wind_gust=None, wind_deg=None, pressure=None, humidity=None,
                  rain_1h=None, rain_6h=None, rain_24h=None, snow_1h=None,
@@ -207,7 +216,7 @@ class Measurement:
         weather_proximity = the_dict.get('weather_proximity', None)
         weather_obscuration = the_dict.get('weather_obscuration', None)
         weather_other = the_dict.get('weather_other', None)
-        return Measurement(station_id, timestamp, temperature=temperature,
+        return cls(station_id, timestamp, temperature=temperature,
             wind_speed=wind_speed, wind_gust=wind_gust, wind_deg=wind_deg,
             pressure=pressure, humidity=humidity,rain_1h=rain_1h,rain_6h=rain_6h,
             rain_24h=rain_24h,snow_1h=snow_1h,snow_6h=snow_6h,snow_24h=snow_24h,
@@ -255,15 +264,23 @@ class Measurement:
             'weather_obscuration': self.weather_obscuration,
             'weather_other': self.weather_other}
 
-    def to_JSON(self):
+    def to_JSON(self, json_backend=None):
         """Dumps object fields into a JSON formatted string
 
+        :param json_backend: the JSON backend to be used for encoding (defaults to the `json` module)
+        :type json_backend: a `pyowm.commons.json_backend.JSONBackend` instance or `None`
         :returns: the JSON string
 
         """
-        return json.dumps(self.to_dict())
+        if json_backend is None:
+            return json.dumps(self.to_dict())
+        return json_backend.dumps(self.to_dict())
 
     def __repr__(self):
         return '<%s.%s - station_id=%s, created_at=%s>' \
                % (__name__, self.__class__.__name__,
                   self.station_id, self.creation_time())
+
+
+FrozenAggregatedMeasurement = decorators.frozen(AggregatedMeasurement)
+FrozenMeasurement = decorators.frozen(Measurement)
@@ -3,8 +3,65 @@
 
 import os
 import json
+import sqlite3
+import time
+import uuid
 from abc import ABCMeta, abstractmethod
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
 from pyowm.stationsapi30.buffer import Buffer
+from pyowm.stationsapi30.measurement import Measurement
+
+# typed columns of the columnar backends, besides the station ID and the timestamp: values that do not fit the type
+# of their column (eg. a dict of min/max temperatures, or an int that would be read back as a float) are stored,
+# JSON-encoded, into an "extras" column instead
+_FLOAT_FIELDS = ('temperature', 'wind_speed', 'wind_gust', 'wind_deg', 'pressure', 'humidity', 'rain_1h', 'rain_6h',
+                 'rain_24h', 'snow_1h', 'snow_6h', 'snow_24h', 'dew_point', 'humidex', 'heat_index',
+                 'visibility_distance', 'clouds_distance')
+_STR_FIELDS = ('visibility_prefix', 'clouds_condition', 'clouds_cumulus', 'weather_precipitation',
+               'weather_descriptor', 'weather_intensity', 'weather_proximity', 'weather_obscuration', 'weather_other')
+_VALUE_FIELDS = _FLOAT_FIELDS + _STR_FIELDS
+_COLUMNS = ('station_id', 'timestamp') + _VALUE_FIELDS + ('extras',)
+
+
+def _assert_pyarrow_available():
+    if pyarrow is None:
+        raise ImportError('Arrow and Parquet persistence backends require the pyarrow package: install it with '
+                          '`pip install pyowm[arrow]`')
+
+
+def _fits(value, field):
+    if field in _STR_FIELDS:
+        return isinstance(value, str)
+    return isinstance(value, float)
+
+
+def _to_row(measurement):
+    row = [measurement.station_id, measurement.timestamp]
+    extras = dict()
+    for field in _VALUE_FIELDS:
+        value = getattr(measurement, field)
+        if value is None or _fits(value, field):
+            row.append(value)
+        else:
+            row.append(None)
+            extras[field] = value
+    row.append(json.dumps(extras) if extras else None)
+    return row
+
+
+def _from_row(row):
+    values = dict(zip(_VALUE_FIELDS, row[2:-1]))
+    if row[-1] is not None:
+        values.update(json.loads(row[-1]))
+    return Measurement(row[0], row[1], **values)
 
 
 class PersistenceBackend:   # pragma: no cover
@@ -54,28 +111,351 @@ class JSONPersistenceBackend(PersistenceBackend):
     :type json_file_path: str
     :param station_id: unique OWM-provided ID of the station whose data is read/saved
     :type station_id: str
+    :param json_backend: the JSON backend used to read/save data (defaults to the `json` module)
+    :type json_backend: a `pyowm.commons.json_backend.JSONBackend` instance or `None`
     """
 
     _file_path = None
     _station_id = None
 
-    def __init__(self, json_file_path, station_id):
+    def __init__(self, json_file_path, station_id, json_backend=None):
         assert json_file_path is not None
         self._station_id = station_id
         assert os.path.isfile(json_file_path)
         self._file_path = json_file_path
+        self._json_backend = json_backend
 
     def load_to_buffer(self):
         if self._station_id is None:
             raise ValueError('No station ID specified')
         result = Buffer(self._station_id)
-        with open(self._file_path, 'r') as f:
-            list_of_dicts = json.load(f)
-            for _dict in list_of_dicts:
-                result.append_from_dict(_dict)
-            return result
+        if self._json_backend is None:
+            with open(self._file_path, 'r') as f:
+                list_of_dicts = json.load(f)
+        else:
+            with open(self._file_path, 'rb') as f:
+                list_of_dicts = self._json_backend.loads(f.read())
+        for _dict in list_of_dicts:
+            result.append_from_dict(_dict)
+        return result
 
     def persist_buffer(self, buffer):
         with open(self._file_path, 'w') as f:
-            data = [msmt.to_JSON() for msmt in buffer]
+            data = [msmt.to_JSON(self._json_backend) for msmt in buffer]
             f.write('[%s]' % ','.join(data))
+
+
+class SQLitePersistenceBackend(PersistenceBackend):
+
+    """
+    A `PersistenceBackend` loading/saving data to a table of a SQLite database file, having one typed column per
+    *pyowm.stationsapi30.measurement.Measurement* field. Saving a buffer appends its measurements to the table,
+    without rewriting the data that is already there. Data can be read lazily and filtered on a time range, which is
+    done by the database by means of an index.
+
+    Measurement values that do not fit the type of their column (eg. a dict of min/max temperatures instead of a
+    number, or an integer in a floating point column) are stored JSON-encoded into an extra column, so that they are
+    read back as they were saved.
+
+    :param db_file_path: path to the database file, which is created if it does not exist
+    :type db_file_path: str
+    :param station_id: unique OWM-provided ID of the station whose data is read/saved
+    :type station_id: str
+    """
+
+    def __init__(self, db_file_path, station_id):
+        assert db_file_path is not None
+        self._file_path = db_file_path
+        self._station_id = station_id
+        with self._connect() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS measurements (station_id TEXT NOT NULL, timestamp INTEGER '
+                               'NOT NULL, %s, %s, extras TEXT)' % (', '.join('%s REAL' % f for f in _FLOAT_FIELDS),
+                                                                  ', '.join('%s TEXT' % f for f in _STR_FIELDS)))
+            connection.execute('CREATE INDEX IF NOT EXISTS measurements_station_id_timestamp ON measurements '
+                               '(station_id, timestamp)')
+        connection.close()
+
+    def _connect(self):
+        return sqlite3.connect(self._file_path)
+
+    def load_to_buffer(self, from_timestamp=None, to_timestamp=None):
+        """
+        Reads the measurements of the station into a *pyowm.stationsapi30.buffer.Buffer* object, optionally
+        filtering them on a time range
+
+        :param from_timestamp: the Unix timestamp of the oldest measurement to be read, if any
+        :type from_timestamp: int or `None`
+        :param to_timestamp: the Unix timestamp of the newest measurement to be read, if any
+        :type to_timestamp: int or `None`
+        :returns: a *pyowm.stationsapi30.buffer.Buffer* instance
+        """
+        if self._station_id is None:
+            raise ValueError('No station ID specified')
+        result = Buffer(self._station_id)
+        for measurement in self.iter_measurements(from_timestamp, to_timestamp):
+            result.append(measurement)
+        return result
+
+    def iter_measurements(self, from_timestamp=None, to_timestamp=None):
+        """
+        Lazily reads the measurements of the station in the order they were saved, optionally filtering them on a
+        time range
+
+        :param from_timestamp: the Unix timestamp of the oldest measurement to be read, if any
+        :type from_timestamp: int or `None`
+        :param to_timestamp: the Unix timestamp of the newest measurement to be read, if any
+        :type to_timestamp: int or `None`
+        :returns: a generator of *pyowm.stationsapi30.measurement.Measurement* objects
+        """
+        if self._station_id is None:
+            raise ValueError('No station ID specified')
+        query = 'SELECT %s FROM measurements WHERE station_id = ?' % ', '.join(_COLUMNS)
+        params = [self._station_id]
+        if from_timestamp is not None:
+            query += ' AND timestamp >= ?'
+            params.append(from_timestamp)
+        if to_timestamp is not None:
+            query += ' AND timestamp <= ?'
+            params.append(to_timestamp)
+        return self._iter_rows(query + ' ORDER BY rowid', params)
+
+    def _iter_rows(self, query, params):
+        connection = self._connect()
+        try:
+            cursor = connection.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                for row in rows:
+                    yield _from_row(row)
+        finally:
+            connection.close()
+
+    def persist_buffer(self, buffer):
+        """
+        Appends the measurements of a *pyowm.stationsapi30.buffer.Buffer* object to the database
+
+        :param buffer: the Buffer object to be persisted
+        :type buffer:  *pyowm.stationsapi30.buffer.Buffer* instance
+        """
+        with self._connect() as connection:
+            connection.executemany('INSERT INTO measurements (%s) VALUES (%s)' % (
+                ', '.join(_COLUMNS), ', '.join('?' * len(_COLUMNS))), (_to_row(m) for m in buffer))
+        connection.close()
+
+
+class _ArrowPersistenceBackend(PersistenceBackend):
+
+    # data is saved into a directory holding one file per persisted buffer, that is read as a pyarrow dataset
+
+    _extension = None
+
+    # max number of rows written at once when compacting
+    _compaction_rows = 65536
+
+    def __init__(self, directory_path, station_id):
+        _assert_pyarrow_available()
+        assert directory_path is not None
+        self._directory_path = directory_path
+        self._station_id = station_id
+        self._schema = pyarrow.schema([('station_id', pyarrow.string()), ('timestamp', pyarrow.int64())] +
+                                      [(f, pyarrow.float64()) for f in _FLOAT_FIELDS] +
+                                      [(f, pyarrow.string()) for f in _STR_FIELDS] +
+                                      [('extras', pyarrow.string())])
+
+    def load_to_buffer(self, from_timestamp=None, to_timestamp=None):
+        """
+        Reads the measurements of the station into a *pyowm.stationsapi30.buffer.Buffer* object, optionally
+        filtering them on a time range
+
+        :param from_timestamp: the Unix timestamp of the oldest measurement to be read, if any
+        :type from_timestamp: int or `None`
+        :param to_timestamp: the Unix timestamp of the newest measurement to be read, if any
+        :type to_timestamp: int or `None`
+        :returns: a *pyowm.stationsapi30.buffer.Buffer* instance
+        """
+        if self._station_id is None:
+            raise ValueError('No station ID specified')
+        result = Buffer(self._station_id)
+        for measurement in self.iter_measurements(from_timestamp, to_timestamp):
+            result.append(measurement)
+        return result
+
+    def iter_measurements(self, from_timestamp=None, to_timestamp=None):
+        """
+        Lazily reads the measurements of the station in the order they were saved, one record batch at a time,
+        optionally filtering them on a time range
+
+        :param from_timestamp: the Unix timestamp of the oldest measurement to be read, if any
+        :type from_timestamp: int or `None`
+        :param to_timestamp: the Unix timestamp of the newest measurement to be read, if any
+        :type to_timestamp: int or `None`
+        :returns: a generator of *pyowm.stationsapi30.measurement.Measurement* objects
+        """
+        if self._station_id is None:
+            raise ValueError('No station ID specified')
+        condition = pyarrow.dataset.field('station_id') == self._station_id
+        if from_timestamp is not None:
+            condition = condition & (pyarrow.dataset.field('timestamp') >= from_timestamp)
+        if to_timestamp is not None:
+            condition = condition & (pyarrow.dataset.field('timestamp') <= to_timestamp)
+        return self._iter_batches(condition)
+
+    def _iter_batches(self, condition):
+        paths = self._files()
+        if not paths:
+            return
+        dataset = pyarrow.dataset.dataset(paths, schema=self._schema, format=self._format())
+        for batch in dataset.to_batches(filter=condition):
+            columns = [batch.column(name).to_pylist() for name in _COLUMNS]
+            for row in zip(*columns):
+                yield _from_row(row)
+
+    def _files(self):
+        if not os.path.isdir(self._directory_path):
+            return []
+        return [os.path.join(self._directory_path, name) for name in sorted(os.listdir(self._directory_path))
+                if name.endswith(self._extension) and not name.startswith('.')]
+
+    def persist_buffer(self, buffer):
+        """
+        Appends the measurements of a *pyowm.stationsapi30.buffer.Buffer* object to the directory, as a new file
+
+        :param buffer: the Buffer object to be persisted
+        :type buffer:  *pyowm.stationsapi30.buffer.Buffer* instance
+        """
+        rows = [_to_row(m) for m in buffer]
+        if not rows:
+            return
+        table = pyarrow.Table.from_arrays([pyarrow.array(column, type=self._schema.field(i).type)
+                                           for i, column in enumerate(zip(*rows))], schema=self._schema)
+        os.makedirs(self._directory_path, exist_ok=True)
+        # file names sort in the order the files were written, and files are written under a hidden name that is
+        # then atomically renamed, so that readers never see partial files
+        name = '%020d-%s%s' % (time.time_ns(), uuid.uuid4().hex[:8], self._extension)
+        tmp_path = os.path.join(self._directory_path, '.' + name)
+        with self._writer(tmp_path) as writer:
+            self._write_table(writer, table)
+        os.replace(tmp_path, os.path.join(self._directory_path, name))
+
+    def compact(self):
+        """
+        Merges the files of the directory, one per persisted buffer, into a single one, keeping the order of the
+        measurements. Reading many small files is slower than reading a big one, so this is worth doing every now and
+        then when buffers are persisted often.
+
+        Buffers can be persisted while compacting, but data should not be read meanwhile, as the merged files are
+        removed before the new one takes their place.
+
+        :returns: the number of merged files
+        """
+        paths = self._files()
+        if len(paths) < 2:
+            return 0
+        dataset = pyarrow.dataset.dataset(paths, schema=self._schema, format=self._format())
+        # the new file takes the name of the newest merged one, so that it sorts before the files persisted meanwhile
+        tmp_path = os.path.join(self._directory_path, '.' + os.path.basename(paths[-1]))
+        with self._writer(tmp_path) as writer:
+            batches = []
+            rows = 0
+            for batch in dataset.to_batches():
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= self._compaction_rows:
+                    self._write_table(writer, pyarrow.Table.from_batches(batches, schema=self._schema))
+                    batches = []
+                    rows = 0
+            if batches:
+                self._write_table(writer, pyarrow.Table.from_batches(batches, schema=self._schema))
+        for path in paths[:-1]:
+            os.remove(path)
+        os.replace(tmp_path, paths[-1])
+        return len(paths)
+
+    def _format(self):
+        raise NotImplementedError()  # pragma: no cover
+
+    def _writer(self, path):
+        raise NotImplementedError()  # pragma: no cover
+
+    def _write_table(self, writer, table):
+        raise NotImplementedError()  # pragma: no cover
+
+    def __repr__(self):
+        return '<%s.%s - path=%s>' % (__name__, self.__class__.__name__, self._directory_path)
+
+
+class ArrowIPCPersistenceBackend(_ArrowPersistenceBackend):
+
+    """
+    A `PersistenceBackend` loading/saving data to Arrow IPC (aka Feather v2) files, having one typed column per
+    *pyowm.stationsapi30.measurement.Measurement* field. Data is kept into a directory: saving a buffer appends a new
+    file to it, without rewriting the data that is already there, and `compact` merges the files into a single one.
+    Files are memory-mapped when read, and data can be read lazily and filtered on a time range.
+
+    Measurement values that do not fit the type of their column (eg. a dict of min/max temperatures instead of a
+    number, or an integer in a floating point column) are stored JSON-encoded into an extra column, so that they are
+    read back as they were saved.
+
+    Requires the `pyarrow` package.
+
+    :param directory_path: path to the directory holding the files, which is created if it does not exist
+    :type directory_path: str
+    :param station_id: unique OWM-provided ID of the station whose data is read/saved
+    :type station_id: str
+    :raises: *ImportError* if pyarrow is not installed
+    """
+
+    _extension = '.arrow'
+
+    def _format(self):
+        return pyarrow.dataset.IpcFileFormat()
+
+    def _writer(self, path):
+        return pyarrow.ipc.new_file(path, self._schema)
+
+    def _write_table(self, writer, table):
+        writer.write_table(table)
+
+
+class ParquetPersistenceBackend(_ArrowPersistenceBackend):
+
+    """
+    A `PersistenceBackend` loading/saving data to Parquet files, having one typed column per
+    *pyowm.stationsapi30.measurement.Measurement* field. Data is kept into a directory: saving a buffer appends a new
+    file to it, without rewriting the data that is already there, and `compact` merges the files into a single one.
+    Data can be read lazily and filtered on a time range: the filter is checked against the statistics of row groups,
+    so that those which are out of range are not read at all.
+
+    Measurement values that do not fit the type of their column (eg. a dict of min/max temperatures instead of a
+    number, or an integer in a floating point column) are stored JSON-encoded into an extra column, so that they are
+    read back as they were saved.
+
+    Requires the `pyarrow` package.
+
+    :param directory_path: path to the directory holding the files, which is created if it does not exist
+    :type directory_path: str
+    :param station_id: unique OWM-provided ID of the station whose data is read/saved
+    :type station_id: str
+    :param row_group_size: the max number of rows per row group (defaults to 65536)
+    :type row_group_size: int
+    :raises: *ImportError* if pyarrow is not installed
+    """
+
+    _extension = '.parquet'
+
+    def __init__(self, directory_path, station_id, row_group_size=65536):
+        super().__init__(directory_path, station_id)
+        assert isinstance(row_group_size, int) and row_group_size > 0
+        self._row_group_size = row_group_size
+        self._compaction_rows = row_group_size
+
+    def _format(self):
+        return pyarrow.dataset.ParquetFileFormat()
+
+    def _writer(self, path):
+        return pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def _write_table(self, writer, table):
+        writer.write_table(table, row_group_size=self._row_group_size)
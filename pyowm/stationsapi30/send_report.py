@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+class SendReport:
+    """
+    The outcome of sending measurements to the Stations API in batches: it records the size and the success or
+    failure of each batch, in the order batches were built. The measurements of failed batches are kept so that they
+    can be sent again, while the ones of successful batches are not retained.
+
+    :returns: a *SendReport* instance
+
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.failed_batches = []
+
+    def add(self, batch, error=None):
+        """
+        Records the outcome of sending a batch
+
+        :param batch: the measurements of the batch
+        :type batch: list of `pyowm.stationsapi30.measurement.Measurement`
+        :param error: the error raised while sending the batch (``None`` on success)
+        :type error: `Exception` or `None`
+        """
+        self.batches.append((len(batch), error))
+        if error is not None:
+            self.failed_batches.append((batch, error))
+
+    @property
+    def sent(self):
+        """
+        :returns: the number of measurements that were sent successfully
+        """
+        return sum(size for size, error in self.batches if error is None)
+
+    @property
+    def failed(self):
+        """
+        :returns: the number of measurements that could not be sent
+        """
+        return sum(size for size, error in self.batches if error is not None)
+
+    @property
+    def succeeded(self):
+        """
+        :returns: ``True`` if all of the batches were sent successfully
+        """
+        return not self.failed_batches
+
+    @property
+    def errors(self):
+        """
+        :returns: the list of errors raised by the failed batches
+        """
+        return [error for _, error in self.failed_batches]
+
+    def failed_measurements(self):
+        """
+        Gives the measurements that could not be sent, eg. to send them again
+
+        :returns: list of `pyowm.stationsapi30.measurement.Measurement` objects
+        """
+        return [m for batch, _ in self.failed_batches for m in batch]
+
+    def raise_for_errors(self):
+        """
+        Raises the error of the first failed batch, if any
+        """
+        if self.failed_batches:
+            raise self.failed_batches[0][1]
+
+    def __repr__(self):
+        return '<%s.%s - batches=%s, sent=%s, failed=%s>' % (__name__, self.__class__.__name__, len(self.batches),
+                                                            self.sent, self.failed)
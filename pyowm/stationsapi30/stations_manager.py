@@ -1,11 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import json
+
 from pyowm.commons.http_client import HttpClient
 from pyowm.constants import STATIONS_API_VERSION
 from pyowm.stationsapi30.measurement import AggregatedMeasurement
+from pyowm.stationsapi30.send_report import SendReport
 from pyowm.stationsapi30.station import Station
 from pyowm.stationsapi30.uris import ROOT_STATIONS_API_URL, STATIONS_URI, NAMED_STATION_URI, MEASUREMENTS_URI
+from pyowm.utils import concurrency
+
+MAX_MEASUREMENTS_PER_CALL = 500
+MAX_BYTES_PER_CALL = 512 * 1024
+AGGREGATION_TIME_FRAMES_SECS = dict(m=60, h=3600, d=86400)
 
 
 class StationsManager:
@@ -19,16 +27,23 @@ class StationsManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param session: a `requests.Session` shared among the HTTP clients (if not provided, each client handles its own)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
     :returns: a *StationsManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_STATIONS_API_URL)
+        self.http_client = HttpClient(API_key, config, ROOT_STATIONS_API_URL, session=session, cache=cache,
+                                      rate_limiter=rate_limiter)
 
     def stations_api_version(self):
         return STATIONS_API_VERSION
@@ -150,25 +165,93 @@ class StationsManager:
             data=[self._structure_dict(measurement)],
             headers={'Content-Type': 'application/json'})
 
-    def send_measurements(self, list_of_measurements):
+    def send_measurements(self, list_of_measurements, max_workers=8, raise_on_error=True,
+                          max_batch_size=MAX_MEASUREMENTS_PER_CALL, max_batch_bytes=MAX_BYTES_PER_CALL):
         """
-        Posts data about the provided list of Measurement objects to the
-        Station API. The objects may be related to different station IDs.
+        Posts data about the provided Measurement objects to the Station API.
+        The objects may be related to different station IDs.
+
+        Measurements are split into batches holding at most `max_batch_size`
+        measurements and weighing at most `max_batch_bytes` bytes once
+        serialized, which are posted concurrently with at most `max_workers`
+        calls at the same time. Any iterable is accepted, and it is consumed
+        lazily: only the batches being sent, and those that were sent ahead
+        of their turn (at most twice `max_workers`), are held in memory.
 
-        :param list_of_measurements: list of *pyowm.stationsapi30.measurement.Measurement*
+        For the calls to really run in parallel, the HTTP connection pool
+        should be at least as large as `max_workers` (see the `pool_maxsize`
+        config key).
+
+        :param list_of_measurements: the *pyowm.stationsapi30.measurement.Measurement*
           objects to be posted
-        :type list_of_measurements: list of *pyowm.stationsapi30.measurement.Measurement*
+        :type list_of_measurements: list or iterable of *pyowm.stationsapi30.measurement.Measurement*
           instances
-        :returns: `None` if creation is successful, an exception otherwise
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :param raise_on_error: whether the error of the first failed batch must be raised,
+          without sending the remaining batches: no new batches are sent once one fails,
+          and the ones already being sent are waited for (defaults to ``True``)
+        :type raise_on_error: bool
+        :param max_batch_size: the max number of measurements per API call (defaults to 500)
+        :type max_batch_size: int
+        :param max_batch_bytes: the max size in bytes of the body of each API call (defaults to 512 KiB)
+        :type max_batch_bytes: int
+        :returns: a *pyowm.stationsapi30.send_report.SendReport* instance recording
+          the outcome of each batch
+        :raises: *AssertionError* when a measurement has no station ID, the
+          error of the first failed batch when `raise_on_error` is ``True``:
+          its `report` attribute holds the *SendReport* of all of the batches
+          that were sent, failed ones included
         """
         assert list_of_measurements is not None
-        assert all(m.station_id is not None for m in list_of_measurements)
-        msmts = [self._structure_dict(m) for m in list_of_measurements]
-        status, _ = self.http_client.post(
-            MEASUREMENTS_URI,
-            params={'appid': self.API_key},
-            data=msmts,
-            headers={'Content-Type': 'application/json'})
+        if isinstance(list_of_measurements, (list, tuple)):
+            assert all(m.station_id is not None for m in list_of_measurements)
+        report = SendReport()
+        for batch, error in self.send_measurements_batches(list_of_measurements, max_workers=max_workers,
+                                                           max_batch_size=max_batch_size,
+                                                           max_batch_bytes=max_batch_bytes,
+                                                           stop_on_error=raise_on_error):
+            report.add(batch, error)
+        if raise_on_error and not report.succeeded:
+            error = report.errors[0]
+            # what has been sent must not be lost along with the report
+            error.report = report
+            raise error
+        return report
+
+    def send_measurements_batches(self, measurements, max_workers=8, max_batch_size=MAX_MEASUREMENTS_PER_CALL,
+                                  max_batch_bytes=MAX_BYTES_PER_CALL, stop_on_error=False):
+        """
+        Generator variant of `send_measurements`: measurements are consumed
+        lazily from the provided iterable (eg. a generator reading them from a
+        file) and posted in size-capped batches, concurrently. Failures are
+        reported per-batch and do not abort the whole process.
+
+        :param measurements: the *pyowm.stationsapi30.measurement.Measurement* objects to be posted
+        :type measurements: iterable of *pyowm.stationsapi30.measurement.Measurement* instances
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :param max_batch_size: the max number of measurements per API call (defaults to 500)
+        :type max_batch_size: int
+        :param max_batch_bytes: the max size in bytes of the body of each API call (defaults to 512 KiB)
+        :type max_batch_bytes: int
+        :param stop_on_error: whether no new batches must be sent once one fails: the outcome of the
+          batches already being sent is yielded anyway (defaults to ``False``)
+        :type stop_on_error: bool
+        :returns: a generator of `(batch, error)` tuples in the order of the
+          supplied measurements, where `batch` is the list of measurements of
+          the call and `error` is the exception raised for that call (``None``
+          on success)
+        :raises: *ValueError* when `max_workers` is not a positive integer
+        """
+        assert measurements is not None
+        assert isinstance(max_batch_size, int) and max_batch_size > 0, "'max_batch_size' must be a positive int"
+        assert isinstance(max_batch_bytes, int) and max_batch_bytes > 0, "'max_batch_bytes' must be a positive int"
+        results = concurrency.fan_out_ordered(self._post_measurements_batch,
+                                              self._measurements_batches(measurements, max_batch_size,
+                                                                         max_batch_bytes),
+                                              max_workers=max_workers, stop_on_error=stop_on_error)
+        return ((batch, error) for (batch, _), _, error in results)
 
     def get_measurements(self, station_id, aggregated_on, from_timestamp,
                          to_timestamp, limit=100):
@@ -202,6 +285,121 @@ class StationsManager:
             raise ValueError("End timestamp can't be earlier than begin timestamp")
         assert isinstance(limit, int)
         assert limit >= 0
+        return self._get_measurements_page(station_id, aggregated_on, from_timestamp, to_timestamp, limit)
+
+    def iter_measurements(self, station_id, aggregated_on, from_timestamp, to_timestamp, page_size=100,
+                          max_workers=8):
+        """
+        Reads all of the measurements of a specified station recorded in the
+        specified time window and aggregated on minute, hour or day, however
+        many they are.
+
+        The time window is split into pages, each one spanning `page_size`
+        aggregation time-frames (eg: 100 hours when aggregating on hours), so
+        that no page can hold more than `page_size` measurements. Pages are
+        fetched concurrently, with at most `max_workers` calls at the same
+        time, and measurements are yielded in chronological order as soon as
+        the pages holding them are available.
+
+        :param station_id: unique station identifier
+        :type station_id: str
+        :param aggregated_on: aggregation time-frame for this measurement
+        :type aggregated_on: string between 'm','h' and 'd'
+        :param from_timestamp: Unix timestamp corresponding to the beginning of
+          the time window
+        :type from_timestamp: int
+        :param to_timestamp: Unix timestamp corresponding to the end of the
+          time window
+        :type to_timestamp: int
+        :param page_size: the number of aggregation time-frames per page (defaults to 100)
+        :type page_size: int
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :returns: a generator of *pyowm.stationsapi30.measurement.AggregatedMeasurement*
+          objects
+        :raises: *ValueError* when the time window or the aggregation time-frame
+          are not valid or when `max_workers` is not a positive integer, the
+          error of the first failed page while iterating
+        """
+        assert station_id is not None
+        pages = self._measurements_pages(aggregated_on, from_timestamp, to_timestamp, page_size)
+        results = concurrency.fan_out_ordered(
+            lambda page: self._get_measurements_in_page(station_id, aggregated_on, page, page_size),
+            pages, max_workers=max_workers)
+        return self._iter_pages(results)
+
+    def get_measurements_many(self, station_ids, aggregated_on, from_timestamp, to_timestamp, page_size=100,
+                              max_workers=8):
+        """
+        Reads all of the measurements of many stations recorded in the
+        specified time window and aggregated on minute, hour or day. The pages
+        of all of the stations (see `iter_measurements`) are fetched
+        concurrently, with at most `max_workers` calls at the same time.
+
+        :param station_ids: the unique station identifiers
+        :type station_ids: iterable of str
+        :param aggregated_on: aggregation time-frame for this measurement
+        :type aggregated_on: string between 'm','h' and 'd'
+        :param from_timestamp: Unix timestamp corresponding to the beginning of
+          the time window
+        :type from_timestamp: int
+        :param to_timestamp: Unix timestamp corresponding to the end of the
+          time window
+        :type to_timestamp: int
+        :param page_size: the number of aggregation time-frames per page (defaults to 100)
+        :type page_size: int
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :returns: a dict mapping each station ID to the list of its
+          *pyowm.stationsapi30.measurement.AggregatedMeasurement* objects, in
+          chronological order
+        :raises: *ValueError* when the time window or the aggregation time-frame
+          are not valid or when `max_workers` is not a positive integer, the
+          error of the first failed page
+        """
+        assert station_ids is not None
+        station_ids = list(station_ids)
+        assert all(station_id is not None for station_id in station_ids)
+        pages = self._measurements_pages(aggregated_on, from_timestamp, to_timestamp, page_size)
+        result = {station_id: [] for station_id in station_ids}
+        jobs = ((station_id, page) for station_id in station_ids for page in pages)
+        for (station_id, _), page_items, error in concurrency.fan_out_ordered(
+                lambda job: self._get_measurements_in_page(job[0], aggregated_on, job[1], page_size),
+                jobs, max_workers=max_workers):
+            if error is not None:
+                raise error
+            result[station_id].extend(page_items)
+        return result
+
+    def _measurements_pages(self, aggregated_on, from_timestamp, to_timestamp, page_size):
+        # splits the time window into (start, end, is_last) pages, each one spanning page_size time-frames
+        if aggregated_on not in AGGREGATION_TIME_FRAMES_SECS:
+            raise ValueError('"aggregated_on" must be among: m, h, d')
+        assert isinstance(from_timestamp, int) and from_timestamp > 0
+        assert isinstance(to_timestamp, int) and to_timestamp > 0
+        if to_timestamp < from_timestamp:
+            raise ValueError("End timestamp can't be earlier than begin timestamp")
+        assert isinstance(page_size, int) and page_size > 0, "'page_size' must be a positive int"
+        span = page_size * AGGREGATION_TIME_FRAMES_SECS[aggregated_on]
+        return [(start, min(start + span, to_timestamp), start + span > to_timestamp)
+                for start in range(from_timestamp, to_timestamp + 1, span)]
+
+    def _get_measurements_in_page(self, station_id, aggregated_on, page, page_size):
+        # pages are queried up to their end included, so that nothing is missed whether the API treats the end
+        # of the window as inclusive or not: measurements belonging to the next page are then filtered out
+        start, end, is_last = page
+        items = self._get_measurements_page(station_id, aggregated_on, start, end, page_size + 1)
+        items = [m for m in items if start <= m.timestamp and (m.timestamp < end or is_last and m.timestamp == end)]
+        items.sort(key=lambda m: m.timestamp)
+        return items
+
+    def _iter_pages(self, results):
+        for _, page_items, error in results:
+            if error is not None:
+                raise error
+            yield from page_items
+
+    def _get_measurements_page(self, station_id, aggregated_on, from_timestamp, to_timestamp, limit):
         query = {'appid': self.API_key,
                  'station_id': station_id,
                  'type': aggregated_on,
@@ -214,19 +412,45 @@ class StationsManager:
             headers={'Content-Type': 'application/json'})
         return [AggregatedMeasurement.from_dict(item) for item in data]
 
-    def send_buffer(self, buffer):
+    def send_buffer(self, buffer, max_workers=8, raise_on_error=True):
         """
         Posts to the Stations API data about the Measurement objects contained
-        into the provided Buffer instance.
+        into the provided Buffer instance. Large buffers are sent in
+        concurrent batches, as with `send_measurements`.
 
         :param buffer: the *pyowm.stationsapi30.buffer.Buffer* instance whose
           measurements are to be posted
         :type buffer: *pyowm.stationsapi30.buffer.Buffer* instance
-        :returns: `None` if creation is successful, an exception otherwise
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :param raise_on_error: whether the error of the first failed batch must be raised,
+          without sending the remaining batches (defaults to ``True``)
+        :type raise_on_error: bool
+        :returns: a *pyowm.stationsapi30.send_report.SendReport* instance
         """
         assert buffer is not None
-        msmts = [self._structure_dict(m) for m in buffer.measurements]
-        status, _ = self.http_client.post(
+        return self.send_measurements(buffer.measurements, max_workers=max_workers, raise_on_error=raise_on_error)
+
+    def _measurements_batches(self, measurements, max_batch_size, max_batch_bytes):
+        # yields (measurements, structured dicts) tuples: a batch is closed as soon as adding a measurement would
+        # exceed one of the limits, and a measurement exceeding the bytes limit on its own is sent alone
+        batch, dicts, size = [], [], 2
+        for m in measurements:
+            assert m.station_id is not None
+            d = self._structure_dict(m)
+            item_size = len(json.dumps(d)) + 2
+            if batch and (len(batch) == max_batch_size or size + item_size > max_batch_bytes):
+                yield batch, dicts
+                batch, dicts, size = [], [], 2
+            batch.append(m)
+            dicts.append(d)
+            size += item_size
+        if batch:
+            yield batch, dicts
+
+    def _post_measurements_batch(self, batch):
+        _, msmts = batch
+        self.http_client.post(
             MEASUREMENTS_URI,
             params={'appid': self.API_key},
             data=msmts,
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.tiles import tile_manager
+from pyowm.tiles.uris import ROOT_TILE_URL
+
+
+class AsyncTileManager:
+
+    """
+    The asyncio twin of `pyowm.tiles.tile_manager.TileManager`: it exposes the same methods as coroutines.
+
+    :param API_key: the OWM Weather API key
+    :type API_key: str
+    :param map_layer: the layer for which you want tiles fetched. Allowed map layers are specified by
+        the `pyowm.tiles.enum.MapLayerEnum` enumerator class.
+    :type map_layer: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param session: an `aiohttp.ClientSession` shared among the HTTP clients (if not provided, each client handles
+        its own)
+    :type session: `aiohttp.ClientSession` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
+    :returns: an *AsyncTileManager* instance
+    :raises: *AssertionError* when no API Key or no map layer is provided, or map layer name is not a string
+
+    """
+
+    def __init__(self, API_key, map_layer, config, session=None, cache=None, rate_limiter=None):
+        assert API_key is not None, 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert map_layer is not None, 'You must provide a valid map layer name'
+        assert isinstance(map_layer, str), 'Map layer name must be a string'
+        self.map_layer = map_layer
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_TILE_URL, admits_subdomains=False, session=session,
+                                           cache=cache, rate_limiter=rate_limiter)
+
+    async def get_tile(self, x, y, zoom):
+        """
+        Coroutine version of `TileManager.get_tile`
+
+        :param x: horizontal tile number in OWM tile reference system
+        :type x: int
+        :param y: vertical tile number in OWM tile reference system
+        :type y: int
+        :param zoom: zoom level for the tile
+        :type zoom: int
+        :returns: a `pyowm.tiles.Tile` instance
+
+        """
+        status, data = await self.http_client.get_png(tile_manager._tile_path(self.map_layer, x, y, zoom),
+                                                      params={'appid': self.API_key})
+        return tile_manager._parse_tile(data, x, y, zoom, self.map_layer)
+
+    async def close(self):
+        """
+        Releases the HTTP session owned by this manager
+        """
+        await self.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return "<%s.%s - layer_name=%s>" % (__name__, self.__class__.__name__, self.map_layer)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import io
+
+try:
+    from PIL import Image as PILImage
+except ImportError:  # pragma: no cover
+    PILImage = None
+
+from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.image import Image
+
+
+def _assert_pillow_available():
+    if PILImage is None:
+        raise ImportError('Tile mosaics require the Pillow package: install it with `pip install pyowm[mosaic]`')
+
+
+def stitch(tiles):
+    """
+    Stitches map tiles into a single PNG image. Tiles are placed according to their x/y coordinates, so that the
+    resulting image covers the rectangle going from the north-westernmost tile to the south-easternmost one: missing
+    tiles are left transparent.
+
+    Requires the `Pillow` package.
+
+    :param tiles: the tiles, all having the same zoom level and size
+    :type tiles: list of `pyowm.commons.tile.Tile`
+    :returns: a `pyowm.commons.image.Image` instance
+    :raises: *ImportError* if Pillow is not installed, *ValueError* if no tiles are provided or tiles have different
+        zoom levels
+
+    """
+    _assert_pillow_available()
+    if not tiles:
+        raise ValueError('No tiles to be stitched')
+    if len(set(tile.zoom for tile in tiles)) > 1:
+        raise ValueError('Tiles must have the same zoom level')
+    x_min = min(tile.x for tile in tiles)
+    y_min = min(tile.y for tile in tiles)
+    columns = max(tile.x for tile in tiles) - x_min + 1
+    rows = max(tile.y for tile in tiles) - y_min + 1
+    result = None
+    for tile in tiles:
+        with PILImage.open(io.BytesIO(tile.image.data)) as img:
+            img = img.convert('RGBA')
+            width, height = img.size
+            if result is None:
+                result = PILImage.new('RGBA', (columns * width, rows * height))
+            result.paste(img, ((tile.x - x_min) * width, (tile.y - y_min) * height))
+    out = io.BytesIO()
+    result.save(out, format='PNG')
+    return Image(out.getvalue(), ImageTypeEnum.PNG)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sqlite3
+import threading
+import time
+
+# tells that the time-to-live of the cache must be applied to a tile
+_CACHE_TTL = object()
+
+# max number of tile accesses kept in memory before being written to the database file
+ACCESSES_BATCH_SIZE = 100
+
+
+class TileCache:
+    """
+    On-disk cache of map tile images, backed by a single SQLite database file whose layout resembles the MBTiles
+    one: each tile is a row keyed by (map layer, zoom, x, y), holding the raw image data along with the validators
+    (`ETag` and `Last-Modified` header values) that the server sent with it.
+
+    Entries expire after their time-to-live: expired entries are not evicted straight away, so that they can be
+    revalidated against the server with a conditional request instead of being downloaded again. When the cache
+    grows over `max_size` tiles the least recently used ones are evicted.
+
+    Lookups do not write to the file each time: access times are kept in memory and written in batches, at the
+    latest before evicting tiles and upon closing the cache. The number of tiles is kept in memory as well, so a
+    database file should not be shared by many caches at the same time.
+
+    The cache is thread-safe, so that it can be shared by concurrent downloads.
+
+    :param path: path to the database file, which is created if it does not exist
+    :type path: str
+    :param max_size: the max number of tiles (defaults to 10000)
+    :type max_size: int
+    :param ttl: the default time-to-live of tiles in seconds (defaults to 600, ``None`` means: never expires)
+    :type ttl: int or ``None``
+    :returns: a *TileCache* instance
+
+    """
+
+    def __init__(self, path, max_size=10000, ttl=600):
+        assert isinstance(path, str), "'path' must be a str"
+        assert isinstance(max_size, int) and max_size > 0, "'max_size' must be a positive int"
+        assert ttl is None or (isinstance(ttl, int) and ttl >= 0), "'ttl' must be a non-negative int or None"
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._accesses = dict()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        # a cache can afford losing its last writes upon power losses, not paying a sync to disk per write
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS tiles (map_layer TEXT NOT NULL, zoom_level INTEGER '
+                                 'NOT NULL, tile_column INTEGER NOT NULL, tile_row INTEGER NOT NULL, tile_data BLOB '
+                                 'NOT NULL, etag TEXT, last_modified TEXT, expires_at REAL, accessed_at REAL NOT '
+                                 'NULL, PRIMARY KEY (map_layer, zoom_level, tile_column, tile_row)) WITHOUT ROWID')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS tiles_accessed_at ON tiles (accessed_at)')
+        self._size = self._connection.execute('SELECT COUNT(*) FROM tiles').fetchone()[0]
+
+    def lookup(self, map_layer, zoom, x, y):
+        """
+        Looks up for a tile, either fresh or expired
+
+        :param map_layer: the name of the map layer
+        :type map_layer: str
+        :param zoom: zoom level of the tile
+        :type zoom: int
+        :param x: horizontal tile number
+        :type x: int
+        :param y: vertical tile number
+        :type y: int
+        :returns: a `(data, etag, last_modified, fresh)` tuple, where `fresh` tells if the tile has not expired yet,
+            or ``None`` if the tile is not in the cache
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT tile_data, etag, last_modified, expires_at FROM tiles WHERE map_layer=? AND zoom_level=? '
+                'AND tile_column=? AND tile_row=?', (map_layer, zoom, x, y)).fetchone()
+            if row is None:
+                return None
+            data, etag, last_modified, expires_at = row
+            now = time.time()
+            self._accesses[(map_layer, zoom, x, y)] = now
+            if len(self._accesses) >= ACCESSES_BATCH_SIZE:
+                self._write_accesses()
+            return bytes(data), etag, last_modified, expires_at is None or expires_at > now
+
+    def get(self, map_layer, zoom, x, y):
+        """
+        Gives the image data of a tile, if it has not expired
+
+        :param map_layer: the name of the map layer
+        :type map_layer: str
+        :param zoom: zoom level of the tile
+        :type zoom: int
+        :param x: horizontal tile number
+        :type x: int
+        :param y: vertical tile number
+        :type y: int
+        :returns: the `bytes` image data or ``None`` if the tile is not in the cache or it has expired
+        """
+        entry = self.lookup(map_layer, zoom, x, y)
+        if entry is None or not entry[3]:
+            return None
+        return entry[0]
+
+    def set(self, map_layer, zoom, x, y, data, etag=None, last_modified=None, ttl=_CACHE_TTL):
+        """
+        Stores a tile
+
+        :param map_layer: the name of the map layer
+        :type map_layer: str
+        :param zoom: zoom level of the tile
+        :type zoom: int
+        :param x: horizontal tile number
+        :type x: int
+        :param y: vertical tile number
+        :type y: int
+        :param data: the image data
+        :type data: bytes
+        :param etag: the `ETag` header value the tile was served with, if any
+        :type etag: str or ``None``
+        :param last_modified: the `Last-Modified` header value the tile was served with, if any
+        :type last_modified: str or ``None``
+        :param ttl: time-to-live of the tile in seconds (defaults to the one of the cache, ``None`` means: never
+            expires)
+        :type ttl: int or ``None``
+        """
+        now = time.time()
+        values = (sqlite3.Binary(data), etag, last_modified, self._expiry(ttl, now), now)
+        with self._lock:
+            self._accesses.pop((map_layer, zoom, x, y), None)
+            updated = self._connection.execute(
+                'UPDATE tiles SET tile_data=?, etag=?, last_modified=?, expires_at=?, accessed_at=? WHERE '
+                'map_layer=? AND zoom_level=? AND tile_column=? AND tile_row=?',
+                values + (map_layer, zoom, x, y)).rowcount
+            if updated:
+                return
+            self._connection.execute('INSERT INTO tiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                     (map_layer, zoom, x, y) + values)
+            self._size += 1
+            if self._size > self.max_size:
+                # least recently used tiles can only be told once all of the accesses are in the file
+                self._write_accesses()
+                self._size -= self._connection.execute(
+                    'DELETE FROM tiles WHERE (map_layer, zoom_level, tile_column, tile_row) IN (SELECT map_layer, '
+                    'zoom_level, tile_column, tile_row FROM tiles ORDER BY accessed_at LIMIT ?)',
+                    (self._size - self.max_size,)).rowcount
+
+    def refresh(self, map_layer, zoom, x, y, ttl=_CACHE_TTL):
+        """
+        Renews the time-to-live of a tile, eg. after the server has told that it has not changed
+
+        :param map_layer: the name of the map layer
+        :type map_layer: str
+        :param zoom: zoom level of the tile
+        :type zoom: int
+        :param x: horizontal tile number
+        :type x: int
+        :param y: vertical tile number
+        :type y: int
+        :param ttl: the new time-to-live of the tile in seconds (defaults to the one of the cache, ``None`` means:
+            never expires)
+        :type ttl: int or ``None``
+        """
+        now = time.time()
+        with self._lock:
+            self._accesses.pop((map_layer, zoom, x, y), None)
+            self._connection.execute(
+                'UPDATE tiles SET expires_at=?, accessed_at=? WHERE map_layer=? AND zoom_level=? AND tile_column=? '
+                'AND tile_row=?', (self._expiry(ttl, now), now, map_layer, zoom, x, y))
+
+    def clear(self):
+        """
+        Removes all tiles
+        """
+        with self._lock:
+            self._accesses.clear()
+            self._connection.execute('DELETE FROM tiles')
+            self._size = 0
+
+    def close(self):
+        """
+        Writes the pending tile accesses and closes the database file
+        """
+        with self._lock:
+            self._write_accesses()
+            self._connection.close()
+
+    def _write_accesses(self):
+        if not self._accesses:
+            return
+        self._connection.execute('BEGIN')
+        try:
+            self._connection.executemany(
+                'UPDATE tiles SET accessed_at=? WHERE map_layer=? AND zoom_level=? AND tile_column=? AND tile_row=?',
+                [(accessed_at,) + key for key, accessed_at in self._accesses.items()])
+        except BaseException:
+            self._connection.execute('ROLLBACK')
+            raise
+        self._connection.execute('COMMIT')
+        self._accesses.clear()
+
+    def _expiry(self, ttl, now):
+        if ttl is _CACHE_TTL:
+            ttl = self.ttl
+        return None if ttl is None else now + ttl
+
+    def __len__(self):
+        with self._lock:
+            return self._size
+
+    def __repr__(self):
+        return "<%s.%s - path=%s, size=%s>" % (__name__, self.__class__.__name__, self.path, len(self))
+
+
+def tile_cache_from(config):
+    """
+    Builds the tile cache described by the `tile_cache` section of the supplied configuration.
+
+    :param config: the configuration dictionary
+    :type config: dict
+    :returns: a *TileCache* instance or ``None`` if tile caching is not enabled
+    """
+    assert isinstance(config, dict)
+    tile_cache_config = config.get('tile_cache')
+    if not tile_cache_config or tile_cache_config.get('path') is None:
+        return None
+    return TileCache(os.path.expanduser(tile_cache_config['path']),
+                     max_size=tile_cache_config.get('max_size', 10000),
+                     ttl=tile_cache_config.get('ttl', 600))
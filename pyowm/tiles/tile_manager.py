@@ -5,7 +5,12 @@ from pyowm.commons.enums import ImageTypeEnum
 from pyowm.commons.http_client import HttpClient
 from pyowm.commons.image import Image
 from pyowm.commons.tile import Tile
+from pyowm.tiles import mosaic as tile_mosaic
 from pyowm.tiles.uris import ROOT_TILE_URL, NAMED_MAP_LAYER_URL
+from pyowm.utils import concurrency, geo
+
+# the default max number of tiles that `TileManager.get_tiles` retrieves with one call
+MAX_TILES = 1024
 
 
 class TileManager:
@@ -20,19 +25,29 @@ class TileManager:
     :type map_layer: str
     :param config: the configuration dictionary
     :type config: dict
+    :param session: a `requests.Session` shared among the HTTP clients (if not provided, each client handles its own)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
+    :param tile_cache: an on-disk cache for tile images (if not provided, tiles are downloaded at each request)
+    :type tile_cache: a `pyowm.tiles.tile_cache.TileCache` instance or `None`
     :returns: a *TileManager* instance
     :raises: *AssertionError* when no API Key or no map layer is provided, or map layer name is not a string
 
     """
 
-    def __init__(self, API_key, map_layer, config):
+    def __init__(self, API_key, map_layer, config, session=None, cache=None, rate_limiter=None, tile_cache=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert map_layer is not None, 'You must provide a valid map layer name'
         assert isinstance(map_layer, str), 'Map layer name must be a string'
         self.map_layer = map_layer
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_TILE_URL, admits_subdomains=False)
+        self.http_client = HttpClient(API_key, config, ROOT_TILE_URL, admits_subdomains=False, session=session,
+                                      cache=cache, rate_limiter=rate_limiter)
+        self.tile_cache = tile_cache
 
     def get_tile(self, x, y, zoom):
         """
@@ -47,11 +62,103 @@ class TileManager:
         :returns: a `pyowm.tiles.Tile` instance
 
         """
-        status, data = self.http_client.get_png(
-            NAMED_MAP_LAYER_URL % self.map_layer + '/%s/%s/%s.png' % (zoom, x, y),
-            params={'appid': self.API_key})
-        img = Image(data, ImageTypeEnum.PNG)
-        return Tile(x, y, zoom, self.map_layer, img)
+        path = _tile_path(self.map_layer, x, y, zoom)
+        if self.tile_cache is None:
+            status, data = self.http_client.get_png(path, params={'appid': self.API_key})
+        else:
+            data = self._get_cached_tile_data(path, x, y, zoom)
+        return _parse_tile(data, x, y, zoom, self.map_layer)
+
+    def _get_cached_tile_data(self, path, x, y, zoom):
+        # fresh tiles are served by the cache, expired ones are revalidated with the validators the server sent
+        entry = self.tile_cache.lookup(self.map_layer, zoom, x, y)
+        if entry is not None:
+            data, etag, last_modified, fresh = entry
+            if fresh:
+                return data
+        else:
+            data, etag, last_modified = None, None, None
+        status, new_data, headers = self.http_client.get_png_if_modified(path, params={'appid': self.API_key},
+                                                                         etag=etag, last_modified=last_modified)
+        if status == 304 and data is not None:
+            self.tile_cache.refresh(self.map_layer, zoom, x, y)
+            return data
+        self.tile_cache.set(self.map_layer, zoom, x, y, new_data, etag=headers.get('ETag'),
+                            last_modified=headers.get('Last-Modified'))
+        return new_data
+
+    def get_tiles(self, area, zoom, max_workers=8, mosaic=False, max_tiles=MAX_TILES):
+        """
+        Retrieves all the tiles at the specified zoom level that cover the specified area, downloading at most
+        `max_workers` tiles at the same time. Polygons are covered by the tiles overlapping with their bounding box.
+
+        For the downloads to really run in parallel, the HTTP connection pool should be at least as large as
+        `max_workers` (see the `pool_maxsize` config key).
+
+        :param area: the area to be covered: either a bounding box, as a (lon_left, lat_bottom, lon_right, lat_top)
+            tuple, or a polygon
+        :type area: tuple or `pyowm.utils.geo.Polygon`
+        :param zoom: zoom level for the tiles
+        :type zoom: int
+        :param max_workers: the max number of concurrent downloads (defaults to 8)
+        :type max_workers: int
+        :param mosaic: whether the tiles should be stitched into one image (defaults to ``False``). Requires the
+            `Pillow` package
+        :type mosaic: bool
+        :param max_tiles: the max number of tiles that the area can be covered by (defaults to 1024): this guards
+            against downloading huge numbers of tiles by mistake, eg. when a large area is requested at a high zoom
+            level. Use ``None`` for no limit
+        :type max_tiles: int or `None`
+        :returns: a list of `pyowm.tiles.Tile` instances, row by row from the north-west corner to the south-east
+            one, or a `pyowm.commons.image.Image` instance when `mosaic` is ``True``
+        :raises: *ValueError* when the area or `max_workers` are not valid or the area is covered by more than
+            `max_tiles` tiles, *ImportError* when a mosaic is requested
+            and Pillow is not installed. If the download of any tile fails, its error is raised
+
+        """
+        assert isinstance(zoom, int) and zoom >= 0, 'Tile zoom level must be a non-negative int'
+        if mosaic:
+            tile_mosaic._assert_pillow_available()
+        assert max_tiles is None or isinstance(max_tiles, int), "'max_tiles' must be an int or None"
+        lon_left, lat_bottom, lon_right, lat_top = self._bbox_of(area)
+        if max_tiles is not None:
+            count = Tile.tiles_count_for_bbox(lon_left, lat_bottom, lon_right, lat_top, zoom)
+            if count > max_tiles:
+                raise ValueError('The area is covered by %d tiles at zoom level %d, more than max_tiles=%d: use a '
+                                 'smaller area or zoom level, or raise max_tiles' % (count, zoom, max_tiles))
+        coords = Tile.tiles_coords_for_bbox(lon_left, lat_bottom, lon_right, lat_top, zoom)
+        tiles = []
+        for _, tile, error in concurrency.fan_out_ordered(lambda xy: self.get_tile(xy[0], xy[1], zoom), coords,
+                                                          max_workers=max_workers):
+            if error is not None:
+                raise error
+            tiles.append(tile)
+        return tile_mosaic.stitch(tiles) if mosaic else tiles
+
+    def _bbox_of(self, area):
+        if isinstance(area, geo.Polygon):
+            points = area.points
+            lons = [point.lon for point in points]
+            lats = [point.lat for point in points]
+            return min(lons), min(lats), max(lons), max(lats)
+        if not isinstance(area, (tuple, list)) or len(area) != 4:
+            raise ValueError('Area must be a (lon_left, lat_bottom, lon_right, lat_top) bounding box or a Polygon')
+        lon_left, lat_bottom, lon_right, lat_top = area
+        geo.assert_is_lon(lon_left)
+        geo.assert_is_lon(lon_right)
+        geo.assert_is_lat(lat_bottom)
+        geo.assert_is_lat(lat_top)
+        return lon_left, lat_bottom, lon_right, lat_top
 
     def __repr__(self):
         return "<%s.%s - layer_name=%s>" % (__name__, self.__class__.__name__, self.map_layer)
+
+
+# Request building and response parsing are shared by TileManager and AsyncTileManager
+
+def _tile_path(map_layer, x, y, zoom):
+    return NAMED_MAP_LAYER_URL % map_layer + '/%s/%s/%s.png' % (zoom, x, y)
+
+
+def _parse_tile(data, x, y, zoom, map_layer):
+    return Tile(x, y, zoom, map_layer, Image(data, ImageTypeEnum.PNG))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+_EXHAUSTED = object()
+
+
+def fan_out(function, items, max_workers=8):
+    """
+    Applies the function to each of the provided items on a pool of threads, yielding results as soon as they are
+    ready. At most `max_workers` calls are in flight at any time and the items are consumed lazily, so that
+    arbitrarily long iterables can be processed with bounded memory. Failures do not abort the whole batch: they are
+    reported along with the item that originated them.
+
+    :param function: the callable to be applied, taking one item as argument
+    :type function: callable
+    :param items: the items to be processed
+    :type items: iterable
+    :param max_workers: the max number of concurrent calls (defaults to 8)
+    :type max_workers: int
+    :returns: a generator of `(item, result, error)` tuples in completion order, where `error` is ``None`` on
+        success and is the raised exception (and `result` is ``None``) on failure
+    """
+    assert isinstance(max_workers, int), "'max_workers' must be an int"
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be greater than zero")
+    return _fan_out(function, iter(items), max_workers)
+
+
+def _fan_out(function, items, max_workers):
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = dict()
+
+        def submit_next():
+            item = next(items, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return False
+            in_flight[executor.submit(function, item)] = item
+            return True
+
+        while len(in_flight) < max_workers and submit_next():
+            pass
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = in_flight.pop(future)
+                error = future.exception()
+                yield item, None if error is not None else future.result(), error
+                submit_next()
+
+
+def fan_out_ordered(function, items, max_workers=8, window=None, stop_on_error=False):
+    """
+    Same as `fan_out`, but results are given back in the same order as the provided items. Results that complete
+    ahead of their turn are held until all the previous ones are yielded: so that memory stays bounded even when a
+    call stalls, an item is not consumed until it is less than `window` items ahead of the next result to be yielded.
+
+    :param function: the callable to be applied, taking one item as argument
+    :type function: callable
+    :param items: the items to be processed
+    :type items: iterable
+    :param max_workers: the max number of concurrent calls (defaults to 8)
+    :type max_workers: int
+    :param window: the max number of items being processed or waiting for their turn (defaults to twice
+        `max_workers`)
+    :type window: int or `None`
+    :param stop_on_error: whether no more items must be consumed once a call fails: the calls already in flight are
+        waited for and their results are yielded too (defaults to ``False``)
+    :type stop_on_error: bool
+    :returns: a generator of `(item, result, error)` tuples in input order
+    """
+    assert isinstance(max_workers, int), "'max_workers' must be an int"
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be greater than zero")
+    if window is None:
+        window = 2 * max_workers
+    assert isinstance(window, int) and window >= max_workers, "'window' must be an int not lower than 'max_workers'"
+    return _fan_out_ordered(function, iter(items), max_workers, window, stop_on_error)
+
+
+def _fan_out_ordered(function, items, max_workers, window, stop_on_error):
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        in_flight = dict()
+        completed = dict()
+        next_index = 0
+        submitted = 0
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < max_workers and submitted < next_index + window:
+                item = next(items, _EXHAUSTED)
+                if item is _EXHAUSTED:
+                    exhausted = True
+                    break
+                in_flight[executor.submit(function, item)] = (submitted, item)
+                submitted += 1
+            if not in_flight:
+                return
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = in_flight.pop(future)
+                error = future.exception()
+                completed[index] = (item, None if error is not None else future.result(), error)
+                if error is not None and stop_on_error:
+                    exhausted = True
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
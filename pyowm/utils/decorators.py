@@ -36,3 +36,32 @@ def deprecated(will_be=None, on_version=None, name=None):
 
     return outer_function
 
+
+def frozen(cls):
+    """
+    Builds a read-only variant of a class declaring `__slots__`: each slot of
+    its instances can be assigned only once (which is what happens upon
+    instantiation) and can neither be reassigned nor deleted afterwards.
+    Instances still behave as instances of the original class.
+    :param cls: the class to be frozen, must declare `__slots__`
+    :return: a subclass of `cls`, named after it with a "Frozen" prefix
+    """
+    assert '__slots__' in cls.__dict__, 'Only classes declaring __slots__ can be frozen'
+
+    def __setattr__(self, name, value):
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError("cannot reassign attribute '%s' of a %s" % (name, type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("cannot delete attribute '%s' of a %s" % (name, type(self).__name__))
+
+    return type('Frozen' + cls.__name__, (cls,), {
+        '__slots__': (),
+        '__module__': cls.__module__,
+        '__doc__': 'Read-only variant of *%s*' % cls.__name__,
+        '__setattr__': __setattr__,
+        '__delattr__': __delattr__})
@@ -40,8 +40,8 @@ def any_status_is(weather_list, status, weather_code_registry):
     
     """
     return any(
-        status_is(weather, status, weather_code_registry)
-        for weather in weather_list
+        weather_status is not None and weather_status.lower() == status
+        for weather_status in weather_code_registry.statuses_for(weather_list)
     )
 
 
@@ -60,10 +60,13 @@ def filter_by_status(weather_list, status, weather_code_registry):
     :returns: ``True`` if the check is positive, ``False`` otherwise
     
     """
+    # the list is scanned twice, so one-shot iterables must be materialized first
+    weather_list = list(weather_list)
+    weather_statuses = weather_code_registry.statuses_for(weather_list)
     return [
         weather
-        for weather in weather_list
-        if status_is(weather, status, weather_code_registry)
+        for weather, weather_status in zip(weather_list, weather_statuses)
+        if weather_status is not None and weather_status.lower() == status
     ]
 
 
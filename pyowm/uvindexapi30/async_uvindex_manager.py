@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.constants import UVINDEX_API_VERSION
+from pyowm.uvindexapi30 import uvindex, uvindex_manager
+from pyowm.uvindexapi30.uris import ROOT_UV_API_URL, UV_INDEX_URL, UV_INDEX_FORECAST_URL, UV_INDEX_HISTORY_URL
+
+
+class AsyncUVIndexManager:
+
+    """
+    The asyncio twin of `pyowm.uvindexapi30.uvindex_manager.UVIndexManager`: it exposes the same methods as
+    coroutines.
+
+    :param API_key: the OWM UV Index API key
+    :type API_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param session: an `aiohttp.ClientSession` shared among the HTTP clients (if not provided, each client handles
+        its own)
+    :type session: `aiohttp.ClientSession` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
+    :returns: an *AsyncUVIndexManager* instance
+    :raises: *AssertionError* when no API Key is provided
+
+    """
+
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
+        assert API_key is not None, 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_UV_API_URL, session=session, cache=cache,
+                                           rate_limiter=rate_limiter)
+
+    def uvindex_api_version(self):
+        return UVINDEX_API_VERSION
+
+    async def uvindex_around_coords(self, lat, lon):
+        """
+        Coroutine version of `UVIndexManager.uvindex_around_coords`
+
+        :param lat: the location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: the location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :return: a *UVIndex* instance or ``None`` if data is not available
+        """
+        params = uvindex_manager._coords_params(lat, lon)
+        _, json_data = await self.http_client.get_json(UV_INDEX_URL, params=params)
+        return uvindex.UVIndex.from_dict(json_data)
+
+    async def uvindex_forecast_around_coords(self, lat, lon):
+        """
+        Coroutine version of `UVIndexManager.uvindex_forecast_around_coords`
+
+        :param lat: the location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: the location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :return: a list of *UVIndex* instances or empty list if data is not available
+        """
+        params = uvindex_manager._coords_params(lat, lon)
+        _, json_data = await self.http_client.get_json(UV_INDEX_FORECAST_URL, params=params)
+        return [uvindex.UVIndex.from_dict(item) for item in json_data]
+
+    async def uvindex_history_around_coords(self, lat, lon, start, end=None):
+        """
+        Coroutine version of `UVIndexManager.uvindex_history_around_coords`
+
+        :param lat: the location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: the location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :param start: the object conveying the time value for the start query boundary
+        :type start: int, ``datetime.datetime`` or ISO8601-formatted string
+        :param end: the object conveying the time value for the end query
+            boundary (defaults to ``None``, in which case the current datetime
+            will be used)
+        :type end: int, ``datetime.datetime`` or ISO8601-formatted string
+        :return: a list of *UVIndex* instances or empty list if data is not available
+        """
+        params = uvindex_manager._history_params(lat, lon, start, end)
+        _, json_data = await self.http_client.get_json(UV_INDEX_HISTORY_URL, params=params)
+        return [uvindex.UVIndex.from_dict(item) for item in json_data]
+
+    async def close(self):
+        """
+        Releases the HTTP session owned by this manager
+        """
+        await self.http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
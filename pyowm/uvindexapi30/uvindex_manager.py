@@ -17,17 +17,24 @@ class UVIndexManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param session: a `requests.Session` shared among the HTTP clients (if not provided, each client handles its own)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
     :returns: a *UVIndexManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
         assert API_key is not None, 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
         self.uv_client = uv_client.UltraVioletHttpClient(
-            API_key, HttpClient(API_key, config, ROOT_UV_API_URL))
+            API_key, HttpClient(API_key, config, ROOT_UV_API_URL, session=session, cache=cache,
+                                rate_limiter=rate_limiter))
 
     def uvindex_api_version(self):
         return UVINDEX_API_VERSION
@@ -48,9 +55,7 @@ class UVIndexManager:
             cannot be parsed, *APICallException* when OWM UV Index API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
+        params = _coords_params(lat, lon)
         json_data = self.uv_client.get_uvi(params)
         return uvindex.UVIndex.from_dict(json_data)
 
@@ -68,9 +73,7 @@ class UVIndexManager:
             cannot be parsed, *APICallException* when OWM UV Index API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
+        params = _coords_params(lat, lon)
         json_data = self.uv_client.get_uvi_forecast(params)
         return [uvindex.UVIndex.from_dict(item) for item in json_data]
 
@@ -96,17 +99,29 @@ class UVIndexManager:
             cannot be parsed, *APICallException* when OWM UV Index API can not be
             reached, *ValueError* for wrong input values
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        assert start is not None
-        start = formatting.timeformat(start, 'unix')
-        if end is None:
-            end = timestamps.now(timeformat='unix')
-        else:
-            end = formatting.timeformat(end, 'unix')
-        params = {'lon': lon, 'lat': lat, 'start': start, 'end': end}
+        params = _history_params(lat, lon, start, end)
         json_data = self.uv_client.get_uvi_history(params)
         return [uvindex.UVIndex.from_dict(item) for item in json_data]
 
     def __repr__(self):
-        return '<%s.%s>' % (__name__, self.__class__.__name__)
\ No newline at end of file
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
+
+
+# Validation and request building are shared by UVIndexManager and AsyncUVIndexManager
+
+def _coords_params(lat, lon):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    return {'lon': str(lon), 'lat': str(lat)}
+
+
+def _history_params(lat, lon, start, end):
+    params = _coords_params(lat, lon)
+    assert start is not None
+    start = formatting.timeformat(start, 'unix')
+    if end is None:
+        end = timestamps.now(timeformat='unix')
+    else:
+        end = formatting.timeformat(end, 'unix')
+    params.update(start=str(start), end=str(end))
+    return params
@@ -0,0 +1,433 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import asyncio
+from typing import Union
+
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.constants import WEATHER_API_VERSION
+from pyowm.weatherapi30 import historian, observation, one_call, weather_manager
+from pyowm.weatherapi30.uris import ROOT_WEATHER_API, OBSERVATION_URI, GROUP_OBSERVATIONS_URI, FIND_OBSERVATIONS_URI, \
+    BBOX_CITY_URI, STATION_WEATHER_HISTORY_URI, ONE_CALL_URI, ONE_CALL_HISTORICAL_URI, ONE_CALL_ROOT_URI
+
+
+class AsyncWeatherManager:
+    """
+    The asyncio twin of `pyowm.weatherapi30.weather_manager.WeatherManager`: it exposes the same methods as
+    coroutines, which take the same parameters and return the same objects. Please refer to the sync manager for
+    the details of each method.
+
+    :param API_key: the OWM Weather API key
+    :type API_key: str
+    :param config: the configuration dictionary
+    :type config: dict
+    :param session: an `aiohttp.ClientSession` shared among the HTTP clients (if not provided, each client handles
+        its own)
+    :type session: `aiohttp.ClientSession` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
+    :returns: an *AsyncWeatherManager* instance
+    :raises: *AssertionError* when no API Key is provided
+
+    """
+
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
+        assert isinstance(API_key, str), 'You must provide a valid API Key'
+        self.API_key = API_key
+        assert isinstance(config, dict)
+        self.http_client = AsyncHttpClient(API_key, config, ROOT_WEATHER_API, session=session, cache=cache,
+                                           rate_limiter=rate_limiter)
+        self.one_call_http_client = AsyncHttpClient(API_key, config, ONE_CALL_ROOT_URI, session=session, cache=cache,
+                                                    rate_limiter=rate_limiter)
+
+    def weather_api_version(self):
+        return WEATHER_API_VERSION
+
+    async def weather_at_place(self, name):
+        """
+        Coroutine version of `WeatherManager.weather_at_place`
+
+        :param name: the location's toponym
+        :type name: str
+        :returns: an *Observation* instance or ``None`` if no weather data is
+            available
+        """
+        _, json_data = await self.http_client.get_json(OBSERVATION_URI, params=weather_manager._place_params(name))
+        return observation.Observation.from_dict(json_data)
+
+    async def weather_at_coords(self, lat, lon):
+        """
+        Coroutine version of `WeatherManager.weather_at_coords`
+
+        :param lat: the location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: the location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :returns: an *Observation* instance or ``None`` if no weather data is
+            available
+        """
+        params = weather_manager._coords_params(lat, lon)
+        _, json_data = await self.http_client.get_json(OBSERVATION_URI, params=params)
+        return observation.Observation.from_dict(json_data)
+
+    async def weather_at_zip_code(self, zipcode, country):
+        """
+        Coroutine version of `WeatherManager.weather_at_zip_code`
+
+        :param zip: the location's zip or postcode
+        :type zip: string
+        :param country: the location's country code
+        :type country: string
+        :returns: an *Observation* instance or ``None`` if no weather data is
+            available
+        """
+        params = weather_manager._zip_code_params(zipcode, country)
+        _, json_data = await self.http_client.get_json(OBSERVATION_URI, params=params)
+        return observation.Observation.from_dict(json_data)
+
+    async def weather_at_id(self, id):
+        """
+        Coroutine version of `WeatherManager.weather_at_id`
+
+        :param id: the location's city ID
+        :type id: int
+        :returns: an *Observation* instance or ``None`` if no weather data is
+            available
+        """
+        _, json_data = await self.http_client.get_json(OBSERVATION_URI, params=weather_manager._id_params(id))
+        return observation.Observation.from_dict(json_data)
+
+    async def weather_at_ids(self, ids_list, max_workers=8):
+        """
+        Coroutine version of `WeatherManager.weather_at_ids`: lists of more than 20 IDs are split into chunks that
+        are queried concurrently, with at most `max_workers` calls awaited at the same time.
+
+        :param ids_list: the list of city IDs
+        :type ids_list: list of int
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :returns: a list of *Observation* instances or an empty list if no
+            weather data is available
+        """
+        weather_manager._assert_ids(ids_list)
+        if len(ids_list) <= weather_manager.MAX_IDS_PER_GROUP_CALL:
+            return await self._weather_at_ids_chunk(ids_list)
+        results = await self._gather(self._weather_at_ids_chunk, weather_manager._id_chunks(ids_list), max_workers)
+        return weather_manager._merge_ids_chunks(results, ids_list)
+
+    async def _weather_at_ids_chunk(self, ids_list):
+        params = weather_manager._ids_params(ids_list)
+        _, json_data = await self.http_client.get_json(GROUP_OBSERVATIONS_URI, params=params)
+        return observation.Observation.from_dict_of_lists(json_data)
+
+    async def weather_at_places(self, pattern, searchtype, limit=None):
+        """
+        Coroutine version of `WeatherManager.weather_at_places`
+
+        :param pattern: the string pattern (not a regex) to be searched for the
+            toponym
+        :type pattern: str
+        :param searchtype: the search mode to be used, must be *'accurate'* for
+          an exact matching or *'like'* for a likelihood matching
+        :type: searchtype: str
+        :param limit: the maximum number of *Observation* items in the returned
+            list (default is ``None``, which stands for any number of items)
+        :param limit: int or ``None``
+        :returns: a list of *Observation* objects or ``None`` if no weather
+            data is available
+        """
+        params = weather_manager._places_params(pattern, searchtype, limit)
+        _, json_data = await self.http_client.get_json(FIND_OBSERVATIONS_URI, params=params)
+        return observation.Observation.from_dict_of_lists(json_data)
+
+    async def weather_at_places_in_bbox(self, lon_left, lat_bottom, lon_right, lat_top,
+                                        zoom=10, cluster=False, tile_zoom=None, max_workers=8,
+                                        max_tiles=weather_manager.MAX_TILES):
+        """
+        Coroutine version of `WeatherManager.weather_at_places_in_bbox`: when `tile_zoom` is given, the bounding box
+        is split into the map tiles it overlaps and their calls are awaited concurrently, at most `max_workers` at
+        the same time
+
+        :param lat_top: latitude for top margin of bounding box, must be
+            between -90.0 and 90.0
+        :type lat_top: int/float
+        :param lon_left: longitude for left margin of bounding box
+            must be between -180.0 and 180.0
+        :type lon_left: int/float
+        :param lat_bottom: latitude for the bottom margin of bounding box, must
+            be between -90.0 and 90.0
+        :type lat_bottom: int/float
+        :param lon_right: longitude for the right margin of bounding box,
+            must be between -180.0 and 180.0
+        :type lon_right: int/float
+        :param zoom: zoom level (defaults to: 10)
+        :type zoom: int
+        :param cluster: use server clustering of points
+        :type cluster: bool
+        :param tile_zoom: the zoom level of the map tiles the bounding box is
+            split into (defaults to ``None``, which means: query the whole
+            bounding box with one call)
+        :type tile_zoom: int or ``None``
+        :param max_workers: the max number of concurrent API calls when the
+            bounding box is split into tiles (defaults to 8)
+        :type max_workers: int
+        :param max_tiles: the max number of tiles that the bounding box can be
+            split into (defaults to 1024): this guards against performing too
+            many API calls, ``None`` means: no limit
+        :type max_tiles: int or ``None``
+        :returns: a list of *Observation* objects or ``None`` if no weather
+            data is available
+        """
+        params = weather_manager._bbox_params(lon_left, lat_bottom, lon_right, lat_top, zoom, cluster)
+        if tile_zoom is None:
+            _, json_data = await self.http_client.get_json(BBOX_CITY_URI, params=params)
+            return observation.Observation.from_dict_of_lists(json_data)
+        sub_bboxes = weather_manager._tiled_bboxes(lon_left, lat_bottom, lon_right, lat_top, tile_zoom, max_tiles)
+        results = await self._gather(lambda bbox: self.weather_at_places_in_bbox(*bbox, zoom=zoom, cluster=cluster),
+                                     sub_bboxes, max_workers)
+        return weather_manager._merge_tiles_observations(results)
+
+    async def weather_around_coords(self, lat, lon, limit=None):
+        """
+        Coroutine version of `WeatherManager.weather_around_coords`
+
+        :param lat: location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :param limit: the maximum number of *Observation* items in the returned
+            list (default is ``None``, which stands for any number of items)
+        :param limit: int or ``None``
+        :returns: a list of *Observation* objects or ``None`` if no weather
+            data is available
+        """
+        params = weather_manager._around_coords_params(lat, lon, limit)
+        _, json_data = await self.http_client.get_json(FIND_OBSERVATIONS_URI, params=params)
+        return observation.Observation.from_dict_of_lists(json_data)
+
+    async def forecast_at_place(self, name, interval, limit=None):
+        """
+        Coroutine version of `WeatherManager.forecast_at_place`
+
+        :param name: the location's toponym
+        :type name: str
+        :param interval: the granularity of the forecast, among `3h` and 'daily'
+        :type interval: str among `3h` and 'daily'
+        :param limit: the maximum number of *Weather* items to be retrieved
+            (default is ``None``, which stands for any number of items)
+        :type limit: int or ``None``
+        :returns: a *Forecaster* instance or ``None`` if forecast data is not
+            available for the specified location
+        """
+        return await self._retrieve_forecast(weather_manager._place_params(name), interval, limit)
+
+    async def forecast_at_coords(self, lat, lon, interval, limit=None):
+        """
+        Coroutine version of `WeatherManager.forecast_at_coords`
+
+        :param lat: location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :param interval: the granularity of the forecast, among `3h` and 'daily'
+        :type interval: str among `3h` and 'daily'
+        :param limit: the maximum number of *Weather* items to be retrieved
+            (default is ``None``, which stands for any number of items)
+        :type limit: int or ``None``
+        :returns: a *Forecaster* instance or ``None`` if forecast data is not
+            available for the specified location
+        """
+        return await self._retrieve_forecast(weather_manager._coords_params(lat, lon), interval, limit)
+
+    async def forecast_at_id(self, id, interval, limit=None):
+        """
+        Coroutine version of `WeatherManager.forecast_at_id`
+
+        :param id: the location's city ID
+        :type id: int
+        :param interval: the granularity of the forecast, among `3h` and 'daily'
+        :type interval: str among `3h` and 'daily'
+        :param limit: the maximum number of *Weather* items to be retrieved
+            (default is ``None``, which stands for any number of items)
+        :type limit: int or ``None``
+        :returns: a *Forecaster* instance or ``None`` if forecast data is not
+            available for the specified location
+        """
+        return await self._retrieve_forecast(weather_manager._id_params(id), interval, limit)
+
+    async def _retrieve_forecast(self, params, interval, limit):
+        """
+        Helper method for forecast_at_X functions.
+        """
+        uri, params = weather_manager._forecast_request(params, interval, limit)
+        _, json_data = await self.http_client.get_json(uri, params=params)
+        return weather_manager._parse_forecast(json_data, interval)
+
+    async def station_tick_history(self, station_ID, limit=None):
+        """
+        Coroutine version of `WeatherManager.station_tick_history`
+
+        :param station_ID: the numeric ID of the meteostation
+        :type station_ID: int
+        :param limit: the maximum number of data points the result shall
+            contain (default is ``None``, which stands for any number of data
+            points)
+        :type limit: int or ``None``
+        :returns: a *Historian* instance or ``None`` if data is not
+            available for the specified meteostation
+        """
+        return await self._retrieve_station_history(station_ID, limit, "tick")
+
+    async def station_hour_history(self, station_ID, limit=None):
+        """
+        Coroutine version of `WeatherManager.station_hour_history`
+
+        :param station_ID: the numeric ID of the meteostation
+        :type station_ID: int
+        :param limit: the maximum number of data points the result shall
+            contain (default is ``None``, which stands for any number of data
+            points)
+        :type limit: int or ``None``
+        :returns: a *Historian* instance or ``None`` if data is not
+            available for the specified meteostation
+        """
+        return await self._retrieve_station_history(station_ID, limit, "hour")
+
+    async def station_day_history(self, station_ID, limit=None):
+        """
+        Coroutine version of `WeatherManager.station_day_history`
+
+        :param station_ID: the numeric ID of the meteostation
+        :type station_ID: int
+        :param limit: the maximum number of data points the result shall
+            contain (default is ``None``, which stands for any number of data
+            points)
+        :type limit: int or ``None``
+        :returns: a *Historian* instance or ``None`` if data is not
+            available for the specified meteostation
+        """
+        return await self._retrieve_station_history(station_ID, limit, "day")
+
+    async def _retrieve_station_history(self, station_ID, limit, interval):
+        """
+        Helper method for station_X_history functions.
+        """
+        params = weather_manager._station_history_params(station_ID, limit, interval)
+        _, json_data = await self.http_client.get_json(STATION_WEATHER_HISTORY_URI, params=params)
+        sh = weather_manager._parse_station_history(json_data, station_ID, interval)
+        if sh is None:
+            return None
+        return historian.Historian(sh)
+
+    async def one_call(self, lat: Union[int, float], lon: Union[int, float], **kwargs) -> one_call.OneCall:
+        """
+        Coroutine version of `WeatherManager.one_call`
+
+        :param lat: location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :returns: a *OneCall* instance or ``None`` if the data is not
+            available for the specified location
+        """
+        params = weather_manager._one_call_params(lat, lon, kwargs)
+        _, json_data = await self.one_call_http_client.get_json(ONE_CALL_URI, params=params)
+        return one_call.OneCall.from_dict(json_data)
+
+    async def one_call_many(self, coords, max_workers=8, **kwargs):
+        """
+        Asynchronous generator version of `WeatherManager.one_call_many`: at most `max_workers` calls are awaited
+        at the same time on the running event loop.
+
+        :param coords: the (lat, lon) couples to be queried
+        :type coords: iterable of tuples
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :param kwargs: the same keyword arguments that `one_call` admits (`exclude`, `units`)
+        :returns: an asynchronous generator of `((lat, lon), one_call, error)` tuples, in completion order: when
+            the iteration is stopped early (eg. by a `break` or by `aclose()`), the calls in flight are cancelled
+        """
+        _assert_max_workers(max_workers)
+
+        async def task(latlon):
+            try:
+                return latlon, await self.one_call(latlon[0], latlon[1], **kwargs), None
+            except Exception as e:
+                return latlon, None, e
+
+        coords = iter(coords)
+        in_flight = set()
+        for latlon in coords:
+            in_flight.add(asyncio.ensure_future(task(latlon)))
+            if len(in_flight) >= max_workers:
+                break
+        try:
+            while in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+                    latlon = next(coords, None)
+                    if latlon is not None:
+                        in_flight.add(asyncio.ensure_future(task(latlon)))
+        finally:
+            # the consumer may stop iterating at any time: calls must not outlive the generator
+            for future in in_flight:
+                future.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def one_call_history(self, lat: Union[int, float], lon: Union[int, float], dt: int = None):
+        """
+        Coroutine version of `WeatherManager.one_call_history`
+
+        :param lat: location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :param dt: timestamp from when the historical data starts. Cannot be less then now - 5 days.
+                    Default = None means now - 5 days
+        :type dt: int
+        :returns: a *OneCall* instance or ``None`` if the data is not
+            available for the specified location
+        """
+        params = weather_manager._one_call_history_params(lat, lon, dt)
+        _, json_data = await self.one_call_http_client.get_json(ONE_CALL_HISTORICAL_URI, params=params)
+        return one_call.OneCall.from_dict(json_data)
+
+    async def _gather(self, coroutine_function, items, max_workers):
+        # awaits the coroutine on each item, at most max_workers at the same time: results are given back in the
+        # order of the items and the first error (in the same order) is raised
+        _assert_max_workers(max_workers)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def task(item):
+            async with semaphore:
+                return await coroutine_function(item)
+
+        results = await asyncio.gather(*[task(item) for item in items], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    async def close(self):
+        """
+        Releases the HTTP sessions owned by this manager
+        """
+        await self.http_client.close()
+        await self.one_call_http_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __repr__(self):
+        return '<%s.%s>' % (__name__, self.__class__.__name__)
+
+
+def _assert_max_workers(max_workers):
+    assert isinstance(max_workers, int), "'max_workers' must be an int"
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be greater than zero")
@@ -5,6 +5,7 @@ import time
 
 from pyowm.commons import  exceptions
 from pyowm.utils import timestamps, formatting
+from pyowm.weatherapi30 import forecast_frame
 from pyowm.weatherapi30 import location
 from pyowm.weatherapi30 import weather
 
@@ -111,8 +112,7 @@ class Forecast:
         else:
             if 'list' in the_dict:
                 try:
-                    weathers = [weather.Weather.from_dict(item) \
-                                for item in the_dict['list']]
+                    weathers = weather.Weather.from_list(the_dict['list'])
                 except KeyError:
                     raise exceptions.ParseAPIResponseError(
                           ''.join([__name__, ': impossible to read weather info from JSON data'])
@@ -135,6 +135,15 @@ class Forecast:
                "location": self.location.to_dict(),
                "weathers": [w.to_dict() for w in self]}
 
+    def to_frame(self):
+        """
+        Returns a columnar view of the *Weather* items of this forecast. Requires the `numpy` package.
+
+        :returns: a *ForecastFrame* instance
+
+        """
+        return forecast_frame.ForecastFrame.from_weathers(self.weathers)
+
     def __len__(self):
         return len(self.weathers)
 
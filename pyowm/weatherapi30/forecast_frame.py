@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from pyowm.commons import exceptions
+from pyowm.weatherapi30 import weathercoderegistry
+
+
+# (column name, dtype) couples, in the same order as the rows that are parsed
+COLUMNS = (
+    ('reference_time', 'int64'),
+    ('temp', 'float64'),
+    ('temp_min', 'float64'),
+    ('temp_max', 'float64'),
+    ('humidity', 'float64'),
+    ('pressure', 'float64'),
+    ('wind_speed', 'float64'),
+    ('wind_deg', 'float64'),
+    ('rain', 'float64'),
+    ('snow', 'float64'),
+    ('weather_code', 'int32'),
+)
+
+ONE_CALL_SERIES = ('minutely', 'hourly', 'daily')
+
+
+def _assert_numpy_available():
+    if numpy is None:
+        raise ImportError('Forecast frames require the numpy package: install it with `pip install pyowm[numpy]`')
+
+
+def _volume(value):
+    # rain/snow volumes come either as plain numbers or as dicts keyed by the
+    # accumulation period (eg: {'3h': 0.5} or {'1h': 0.1})
+    if value is None or isinstance(value, (int, float)):
+        return value
+    for key in ('all', '3h', '1h'):
+        if key in value:
+            return value[key]
+    return None
+
+
+def _row_from_dict(item):
+    main = item.get('main')
+    if main is not None:  # 5 days/3 hours forecast items
+        temp = main.get('temp')
+        temp_min = main.get('temp_min')
+        temp_max = main.get('temp_max')
+        humidity = main.get('humidity')
+        pressure = main.get('pressure')
+    else:  # One Call items
+        temp = item.get('temp')
+        temp_min = temp_max = None
+        if isinstance(temp, dict):
+            temp_min = temp.get('min')
+            temp_max = temp.get('max')
+            temp = temp.get('day')
+        humidity = item.get('humidity')
+        pressure = item.get('pressure')
+    wind = item.get('wind')
+    if wind is not None:
+        wind_speed = wind.get('speed')
+        wind_deg = wind.get('deg')
+    else:
+        wind_speed = item.get('wind_speed')
+        wind_deg = item.get('wind_deg')
+    rain = item.get('rain', item.get('precipitation'))
+    weather_code = item['weather'][0]['id'] if 'weather' in item else 0
+    return (item.get('dt', 0), temp, temp_min, temp_max, humidity, pressure, wind_speed, wind_deg,
+            _volume(rain), _volume(item.get('snow')), weather_code)
+
+
+def _row_from_weather(weather):
+    temperature = weather.temp
+    return (weather.ref_time,
+            temperature.get('temp', temperature.get('day')),
+            temperature.get('temp_min', temperature.get('min')),
+            temperature.get('temp_max', temperature.get('max')),
+            weather.humidity,
+            weather.pressure.get('press') if weather.pressure else None,
+            weather.wnd.get('speed'),
+            weather.wnd.get('deg'),
+            _volume(weather.rain),
+            _volume(weather.snow),
+            weather.weather_code)
+
+
+class ForecastFrame:
+    """
+    A columnar view over a time series of weather data, such as the items of a *Forecast* or the hourly/daily
+    forecasts of a *OneCall*. Each weather parameter is held in a contiguous, typed NumPy array, so that a frame is
+    much lighter than the equivalent list of *Weather* objects and can be queried with vectorized operations.
+
+    Columns are exposed as attributes named after the `COLUMNS` module constant. Temperatures, pressure, wind and
+    precipitation volumes are float arrays where missing values are ``NaN``; reference times are UNIX timestamps and
+    weather codes are ``0`` when missing. Temperatures are in Kelvin unless the data was requested in other units.
+
+    Requires the `numpy` package.
+
+    :param columns: the column arrays, keyed by column name. Any column that is not provided is filled with missing
+        values
+    :type columns: arrays or sequences of the same length
+    :returns: a *ForecastFrame* instance
+    :raises: *ImportError* if numpy is not installed, *ValueError* if columns have different lengths or unknown
+        columns are provided
+
+    """
+
+    def __init__(self, **columns):
+        _assert_numpy_available()
+        unknown = set(columns) - set(name for name, _ in COLUMNS)
+        if unknown:
+            raise ValueError('Unknown columns: %s' % ', '.join(sorted(unknown)))
+        lengths = set(len(values) for values in columns.values())
+        if len(lengths) > 1:
+            raise ValueError('All columns must have the same length')
+        size = lengths.pop() if lengths else 0
+        for name, dtype in COLUMNS:
+            if name in columns:
+                values = numpy.asarray(columns[name], dtype=dtype)
+            elif dtype == 'float64':
+                values = numpy.full(size, numpy.nan)
+            else:
+                values = numpy.zeros(size, dtype=dtype)
+            setattr(self, name, values)
+        self._wc_registry = weathercoderegistry.WeatherCodeRegistry.get_instance()
+
+    @classmethod
+    def _from_rows(cls, rows):
+        _assert_numpy_available()
+        rows = list(rows)
+        if not rows:
+            return cls()
+        return cls(**{name: numpy.array(values, dtype=dtype)
+                      for (name, dtype), values in zip(COLUMNS, zip(*rows))})
+
+    @classmethod
+    def from_dict(cls, the_dict):
+        """
+        Parses a *ForecastFrame* straight out of the raw data dictionary of a weather forecast, without building any
+        intermediate *Weather* object.
+
+        :param the_dict: the input dictionary, as returned by the OWM Weather API forecast endpoints
+        :type the_dict: `dict`
+        :returns: a *ForecastFrame* instance or ``None`` if no data is available
+        :raises: *ParseAPIResponseError* if it is impossible to find or parse the data needed to build the result,
+            *APIResponseError* if the input dictionary embeds an HTTP status error
+
+        """
+        if the_dict is None:
+            raise exceptions.ParseAPIResponseError('JSON data is None')
+        if 'message' in the_dict and 'cod' in the_dict:
+            if the_dict['cod'] == "404":
+                return None
+            elif the_dict['cod'] != "200":
+                raise exceptions.APIResponseError("OWM API: error - response payload", the_dict['cod'])
+        if the_dict.get('count') == "0" or the_dict.get('cnt') == 0:
+            return cls._from_rows([])
+        if 'list' not in the_dict:
+            raise exceptions.ParseAPIResponseError(
+                ''.join([__name__, ': impossible to read weather list from JSON data']))
+        return cls._from_list(the_dict['list'])
+
+    @classmethod
+    def from_one_call_dict(cls, the_dict, series='hourly'):
+        """
+        Parses a *ForecastFrame* straight out of one of the time series in the raw data dictionary of a One Call,
+        without building any intermediate *Weather* object.
+
+        :param the_dict: the input dictionary, as returned by the OWM One Call API
+        :type the_dict: `dict`
+        :param series: the time series to be parsed, among 'minutely', 'hourly' (default) and 'daily'
+        :type series: str
+        :returns: a *ForecastFrame* instance or ``None`` if no data is available
+        :raises: *ParseAPIResponseError* if it is impossible to find or parse the data needed to build the result,
+            *APIResponseError* if the input dictionary embeds an HTTP status error, *ValueError* if the series is
+            not supported
+
+        """
+        if series not in ONE_CALL_SERIES:
+            raise ValueError('Unsupported One Call series: %s' % series)
+        if the_dict is None:
+            raise exceptions.ParseAPIResponseError('Data is None')
+        if 'message' in the_dict and 'cod' in the_dict:
+            if the_dict['cod'] == "404":
+                return None
+            raise exceptions.APIResponseError("OWM API: error - response payload", the_dict['cod'])
+        return cls._from_list(the_dict.get(series, []))
+
+    @classmethod
+    def _from_list(cls, items):
+        try:
+            return cls._from_rows(_row_from_dict(item) for item in items)
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError):
+            raise exceptions.ParseAPIResponseError(
+                ''.join([__name__, ': impossible to read weather info from JSON data']))
+
+    @classmethod
+    def from_weathers(cls, weathers):
+        """
+        Builds a *ForecastFrame* out of a list of *Weather* objects.
+
+        :param weathers: the *Weather* objects, eg. a *Forecast* or the hourly forecast of a *OneCall*
+        :type weathers: iterable of *Weather*
+        :returns: a *ForecastFrame* instance
+
+        """
+        return cls._from_rows(_row_from_weather(weather) for weather in weathers)
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes taken by the column arrays
+
+        :returns: int
+        """
+        return sum(getattr(self, name).nbytes for name, _ in COLUMNS)
+
+    def row(self, index):
+        """
+        Returns the values of all columns at the specified position.
+
+        :param index: the row position
+        :type index: int
+        :returns: a `dict` keyed by column name, with ``None`` in place of missing values
+        """
+        result = dict()
+        for name, _ in COLUMNS:
+            value = getattr(self, name)[index].item()
+            result[name] = None if value != value else value  # NaN check
+        return result
+
+    def take(self, selector):
+        """
+        Returns a new *ForecastFrame* holding only the selected rows.
+
+        :param selector: a boolean mask or an array of row positions
+        :type selector: array-like
+        :returns: a *ForecastFrame* instance
+        """
+        return ForecastFrame(**{name: getattr(self, name)[selector] for name, _ in COLUMNS})
+
+    def _argmax(self, values):
+        if values.size == 0 or numpy.isnan(values).all():
+            return None
+        return int(numpy.nanargmax(values))
+
+    def _argmin(self, values):
+        if values.size == 0 or numpy.isnan(values).all():
+            return None
+        return int(numpy.nanargmin(values))
+
+    def most_hot(self):
+        """
+        Returns the position of the row having the highest max temperature.
+
+        :returns: an int or ``None`` if no row has a max temperature
+        """
+        return self._argmax(self.temp_max)
+
+    def most_cold(self):
+        """
+        Returns the position of the row having the lowest min temperature.
+
+        :returns: an int or ``None`` if no row has a min temperature
+        """
+        return self._argmin(self.temp_min)
+
+    def most_humid(self):
+        """
+        Returns the position of the row having the highest humidity.
+
+        :returns: an int or ``None`` if no row has humidity data
+        """
+        return self._argmax(self.humidity)
+
+    def most_rainy(self):
+        """
+        Returns the position of the row having the highest rain volume.
+
+        :returns: an int or ``None`` if no row has rain data
+        """
+        return self._argmax(self.rain)
+
+    def most_snowy(self):
+        """
+        Returns the position of the row having the highest snow volume.
+
+        :returns: an int or ``None`` if no row has snow data
+        """
+        return self._argmax(self.snow)
+
+    def most_windy(self):
+        """
+        Returns the position of the row having the highest wind speed.
+
+        :returns: an int or ``None`` if no row has wind data
+        """
+        return self._argmax(self.wind_speed)
+
+    def status_mask(self, status):
+        """
+        Returns a boolean mask telling which rows have a weather code related to the specified weather status.
+
+        :param status: the weather status (eg: "rain", "sun", "clouds")
+        :type status: str
+        :returns: a boolean NumPy array
+        """
+        return numpy.isin(self.weather_code, self._wc_registry.codes_for(status))
+
+    def will_have(self, status):
+        """
+        Tells if any of the rows is related to the specified weather status.
+
+        :param status: the weather status (eg: "rain", "sun", "clouds")
+        :type status: str
+        :returns: boolean
+        """
+        return bool(self.status_mask(status).any())
+
+    def when(self, status):
+        """
+        Returns the rows related to the specified weather status.
+
+        :param status: the weather status (eg: "rain", "sun", "clouds")
+        :type status: str
+        :returns: a *ForecastFrame* instance
+        """
+        return self.take(self.status_mask(status))
+
+    def will_have_rain(self):
+        return self.will_have('rain')
+
+    def will_have_clear(self):
+        return self.will_have('sun')
+
+    def will_have_fog(self):
+        return self.will_have('fog')
+
+    def will_have_clouds(self):
+        return self.will_have('clouds')
+
+    def will_have_snow(self):
+        return self.will_have('snow')
+
+    def will_have_storm(self):
+        return self.will_have('storm')
+
+    def will_have_tornado(self):
+        return self.will_have('tornado')
+
+    def will_have_hurricane(self):
+        return self.will_have('hurricane')
+
+    def when_rain(self):
+        return self.when('rain')
+
+    def when_clear(self):
+        return self.when('sun')
+
+    def when_fog(self):
+        return self.when('fog')
+
+    def when_clouds(self):
+        return self.when('clouds')
+
+    def when_snow(self):
+        return self.when('snow')
+
+    def when_storm(self):
+        return self.when('storm')
+
+    def when_tornado(self):
+        return self.when('tornado')
+
+    def when_hurricane(self):
+        return self.when('hurricane')
+
+    def __len__(self):
+        return len(self.reference_time)
+
+    def __repr__(self):
+        return "<%s.%s - rows=%d>" % (__name__, self.__class__.__name__, len(self))
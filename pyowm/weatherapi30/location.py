@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 from pyowm.commons import exceptions
-from pyowm.utils import geo
+from pyowm.utils import decorators, geo
 
 
 class Location:
@@ -30,6 +30,8 @@ class Location:
     :raises: *ValueError* if lon or lat values are provided out of bounds
     """
 
+    __slots__ = ('name', 'lon', 'lat', 'id', 'country')
+
     def __init__(self, name, lon, lat, _id, country=None):
         self.name = name
         if lon is None or lat is None:
@@ -90,7 +92,7 @@ class Location:
             raise KeyError("Impossible to read geographical coordinates from JSON")
         if 'country' in data:
             country = data['country']
-        return Location(name, lon, lat, ID, country)
+        return cls(name, lon, lat, ID, country)
 
     def to_dict(self):
         """Dumps object to a dictionary
@@ -106,4 +108,7 @@ class Location:
     def __repr__(self):
         return "<%s.%s - id=%s, name=%s, lon=%s, lat=%s>" % (__name__, \
                                                              self.__class__.__name__, self.id, self.name, str(self.lon), \
-                                                             str(self.lat))
\ No newline at end of file
+                                                             str(self.lat))
+
+
+FrozenLocation = decorators.frozen(Location)
@@ -3,7 +3,7 @@
 
 import time
 from pyowm.commons import exceptions
-from pyowm.utils import formatting
+from pyowm.utils import decorators, formatting
 from pyowm.weatherapi30 import location
 from pyowm.weatherapi30 import weather
 
@@ -27,6 +27,8 @@ class Observation:
 
     """
 
+    __slots__ = ('rec_time', 'location', 'weather')
+
     def __init__(self, reception_time, location, weather):
         if reception_time < 0:
             raise ValueError("'reception_time' must be greater than 0")
@@ -87,7 +89,7 @@ class Observation:
             raise exceptions.ParseAPIResponseError(
                                       ''.join([__name__, ': impossible to read weather info from JSON data']))
         current_time = int(time.time())
-        return Observation(current_time, place, w)
+        return cls(current_time, place, w)
 
     def to_dict(self):
         """Dumps object to a dictionary
@@ -141,4 +143,7 @@ class Observation:
             return [Observation.from_dict(item) for item in the_dict['list']]
 
         # no way out..
-        raise exceptions.ParseAPIResponseError(''.join([__name__, ': impossible to read JSON data']))
\ No newline at end of file
+        raise exceptions.ParseAPIResponseError(''.join([__name__, ': impossible to read JSON data']))
+
+
+FrozenObservation = decorators.frozen(Observation)
@@ -2,6 +2,7 @@ from typing import Union, Optional, List
 
 from pyowm.commons import exceptions
 from pyowm.utils import geo
+from pyowm.weatherapi30.forecast_frame import ForecastFrame, ONE_CALL_SERIES
 from pyowm.weatherapi30.weather import Weather
 from pyowm.weatherapi30.national_weather_alert import NationalWeatherAlert
 
@@ -51,6 +52,20 @@ class OneCall:
         return geo.Point(self.lon, self.lat)
 
 
+    def to_frame(self, series: str = 'hourly') -> ForecastFrame:
+        """
+        Returns a columnar view of one of the forecasts of this One Call. Requires the `numpy` package.
+
+        :param series: the forecast to be converted, among 'minutely', 'hourly' (default) and 'daily'
+        :type series: str
+        :returns: a *ForecastFrame* instance, empty if the forecast is not available
+        :raises: *ValueError* if the series is not supported
+
+        """
+        if series not in ONE_CALL_SERIES:
+            raise ValueError('Unsupported One Call series: %s' % series)
+        return ForecastFrame.from_weathers(getattr(self, 'forecast_' + series) or [])
+
     @classmethod
     def from_dict(cls, the_dict: dict):
         """
@@ -84,13 +99,13 @@ class OneCall:
             current = Weather.from_dict(the_dict["current"])
             minutely = None
             if "minutely" in the_dict:
-                minutely = [Weather.from_dict(item) for item in the_dict["minutely"]]
+                minutely = Weather.from_onecall_minutely_list(the_dict["minutely"])
             hourly = None
             if "hourly" in the_dict:
-                hourly = [Weather.from_dict(item) for item in the_dict["hourly"]]
+                hourly = Weather.from_onecall_hourly_list(the_dict["hourly"])
             daily = None
             if "daily" in the_dict:
-                daily = [Weather.from_dict(item) for item in the_dict["daily"]]
+                daily = Weather.from_onecall_daily_list(the_dict["daily"])
 
         except KeyError:
             raise exceptions.ParseAPIResponseError(f"{__name__}: impossible to read weather info from input data")
@@ -4,10 +4,51 @@
 import json
 
 from pyowm.commons import exceptions
-from pyowm.utils import formatting, measurables
+from pyowm.utils import decorators, formatting, measurables
 from pyowm.weatherapi30.uris import ICONS_BASE_URI
 
 
+# Keys that, when found at the top level of a weather data dict, require the general purpose parser
+_NESTED_SHAPE_EXCLUDED_KEYS = ('last', 'calc', 'temp', 'humidity', 'pressure', 'sunset', 'sunrise', 'feels_like',
+                               'dew_point')
+_FLAT_SHAPE_EXCLUDED_KEYS = ('last', 'calc', 'main', 'sys', 'wind')
+
+
+def _precipitation(value):
+    if value is None:
+        return {}
+    if isinstance(value, dict):
+        return value.copy()
+    return {'all': value}
+
+
+def _visibility(value):
+    if value is None or isinstance(value, int):
+        return value
+    return value.get('distance')
+
+
+def _clouds(value):
+    if isinstance(value, (int, float)):
+        return value
+    return value.get('all', 0)
+
+
+def _flat_wind(the_dict):
+    wind = {}
+    if 'speed' in the_dict:
+        wind['speed'] = the_dict['speed']
+    elif 'wind_speed' in the_dict:
+        wind['speed'] = the_dict['wind_speed']
+    if 'deg' in the_dict:
+        wind['deg'] = the_dict['deg']
+    elif 'wind_deg' in the_dict:
+        wind['deg'] = the_dict['wind_deg']
+    if 'wind_gust' in the_dict:
+        wind['gust'] = the_dict['wind_gust']
+    return wind
+
+
 class Weather:
     """
     A class encapsulating raw weather data.
@@ -61,6 +102,11 @@ class Weather:
 
     """
 
+    __slots__ = ('ref_time', 'sset_time', 'srise_time', 'clouds', 'rain', 'snow', 'wnd', 'humidity',
+                 'pressure', 'temp', 'status', 'detailed_status', 'weather_code', 'weather_icon_name',
+                 'visibility_distance', 'dewpoint', 'humidex', 'heat_index', 'utc_offset', 'uvi',
+                 'precipitation_probability')
+
     def __init__(self, reference_time, sunset_time, sunrise_time, clouds, rain,
                  snow, wind, humidity, pressure, temperature, status,
                  detailed_status, weather_code, weather_icon_name,
@@ -485,12 +531,149 @@ class Weather:
         # -- Precipitation probability
         precipitation_probability = the_dict.get('pop', None)
 
-        return Weather(reference_time, sunset_time, sunrise_time, clouds,
-                       rain, snow, wind, humidity, pressure, temperature,
-                       status, detailed_status, weather_code, weather_icon_name,
-                       visibility_distance, dewpoint, humidex, heat_index,
-                       utc_offset=utc_offset, uvi=uvi,
-                       precipitation_probability=precipitation_probability)
+        return cls(reference_time, sunset_time, sunrise_time, clouds,
+                   rain, snow, wind, humidity, pressure, temperature,
+                   status, detailed_status, weather_code, weather_icon_name,
+                   visibility_distance, dewpoint, humidex, heat_index,
+                   utc_offset=utc_offset, uvi=uvi,
+                   precipitation_probability=precipitation_probability)
+
+    @classmethod
+    def _from_flat_dict(cls, the_dict):
+        # Fast path for flat weather data dicts, such as One Call and daily forecast items: gives the same result as
+        # from_dict() on well-formed dicts having none of the _FLAT_SHAPE_EXCLUDED_KEYS
+        get = the_dict.get
+        temp = get('temp')
+        if temp is None:
+            temperature = {}
+        elif isinstance(temp, dict):
+            temperature = temp.copy()
+        else:
+            temperature = {'temp': temp}
+        feels_like = get('feels_like')
+        if isinstance(feels_like, dict):
+            for label, value in feels_like.items():
+                temperature[f'feels_like_{label}'] = value
+        elif feels_like is not None:
+            temperature['feels_like'] = feels_like
+        if 'weather' in the_dict:
+            info = the_dict['weather'][0]
+            status, detailed_status, weather_code, weather_icon_name = \
+                info['main'], info['description'], info['id'], info['icon']
+        else:
+            status, detailed_status, weather_code, weather_icon_name = '', '', 0, ''
+        return cls(the_dict['dt'], get('sunset'), get('sunrise'), _clouds(get('clouds', 0)),
+                   _precipitation(the_dict['rain'] if 'rain' in the_dict else get('precipitation')),
+                   _precipitation(get('snow')), _flat_wind(the_dict), get('humidity', 0),
+                   {'press': get('pressure'), 'sea_level': None}, temperature,
+                   status, detailed_status, weather_code, weather_icon_name,
+                   _visibility(get('visibility')), get('dew_point'), None, None,
+                   get('timezone'), get('uvi'), get('pop'))
+
+    @classmethod
+    def _from_nested_dict(cls, the_dict):
+        # Fast path for weather data dicts carrying a "main" section, such as current weather and 3 hours forecast
+        # items: gives the same result as from_dict() on well-formed dicts having none of the
+        # _NESTED_SHAPE_EXCLUDED_KEYS
+        get = the_dict.get
+        main = the_dict['main']
+        if 'temp' in main:
+            main_get = main.get
+            temperature = {'temp': main['temp'],
+                           'temp_kf': main_get('temp_kf'),
+                           'temp_max': main_get('temp_max'),
+                           'temp_min': main_get('temp_min'),
+                           'feels_like': main_get('feels_like')}
+        else:
+            temperature = {}
+        sys_info = get('sys')
+        if sys_info is None:
+            sunset_time = sunrise_time = None
+        else:
+            sunset_time = sys_info.get('sunset')
+            sunrise_time = sys_info.get('sunrise')
+        wind = get('wind')
+        if 'weather' in the_dict:
+            info = the_dict['weather'][0]
+            status, detailed_status, weather_code, weather_icon_name = \
+                info['main'], info['description'], info['id'], info['icon']
+        else:
+            status, detailed_status, weather_code, weather_icon_name = '', '', 0, ''
+        return cls(the_dict['dt'], sunset_time, sunrise_time, _clouds(get('clouds', 0)),
+                   _precipitation(the_dict['rain'] if 'rain' in the_dict else get('precipitation')),
+                   _precipitation(get('snow')), _flat_wind(the_dict) if wind is None else wind.copy(),
+                   main.get('humidity', 0), {'press': main.get('pressure'), 'sea_level': main.get('sea_level')},
+                   temperature, status, detailed_status, weather_code, weather_icon_name,
+                   _visibility(get('visibility')), None, None, None,
+                   get('timezone'), get('uvi'), get('pop'))
+
+    @classmethod
+    def _parser_for(cls, the_dict):
+        # Picks the fastest parser that is able to handle the shape of the provided weather data dict
+        if 'main' in the_dict:
+            if not any(key in the_dict for key in _NESTED_SHAPE_EXCLUDED_KEYS):
+                return cls._from_nested_dict
+        elif not any(key in the_dict for key in _FLAT_SHAPE_EXCLUDED_KEYS):
+            return cls._from_flat_dict
+        return cls.from_dict
+
+    @classmethod
+    def from_list(cls, the_list):
+        """
+        Parses a list of *Weather* instances out of a list of data dictionaries having the same shape, such as the
+        items of a forecast or of a weather history. The parser is chosen once, based on the shape of the first
+        item, and then applied to all of the items: the result is the same as calling `from_dict` on each item, but
+        faster.
+
+        :param the_list: the input data dictionaries
+        :type the_list: list of `dict`
+        :returns: a list of *Weather* instances
+        :raises: *KeyError* if it is impossible to find the data needed to build the result
+
+        """
+        if not the_list:
+            return []
+        parse = cls._parser_for(the_list[0])
+        return [parse(item) for item in the_list]
+
+    @classmethod
+    def from_onecall_minutely_list(cls, the_list):
+        """
+        Parses a list of *Weather* instances out of the "minutely" forecast items of a One Call API response.
+
+        :param the_list: the input data dictionaries
+        :type the_list: list of `dict`
+        :returns: a list of *Weather* instances
+        :raises: *KeyError* if it is impossible to find the data needed to build the result
+
+        """
+        return [cls._from_flat_dict(item) for item in the_list]
+
+    @classmethod
+    def from_onecall_hourly_list(cls, the_list):
+        """
+        Parses a list of *Weather* instances out of the "hourly" forecast items of a One Call API response.
+
+        :param the_list: the input data dictionaries
+        :type the_list: list of `dict`
+        :returns: a list of *Weather* instances
+        :raises: *KeyError* if it is impossible to find the data needed to build the result
+
+        """
+        return [cls._from_flat_dict(item) for item in the_list]
+
+    @classmethod
+    def from_onecall_daily_list(cls, the_list):
+        """
+        Parses a list of *Weather* instances out of the "daily" forecast items of a One Call API response.
+
+        :param the_list: the input data dictionaries
+        :type the_list: list of `dict`
+        :returns: a list of *Weather* instances
+        :raises: *KeyError* if it is impossible to find the data needed to build the result
+
+        """
+        return [cls._from_flat_dict(item) for item in the_list]
 
     @classmethod
     def from_dict_of_lists(cls, the_dict):
@@ -525,7 +708,7 @@ class Weather:
         else:
             if 'list' in the_dict:
                 try:
-                    return [Weather.from_dict(item) for item in the_dict['list']]
+                    return cls.from_list(the_dict['list'])
                 except KeyError:
                     raise exceptions.ParseAPIResponseError(
                         ''.join([__name__, ': impossible to read weather info from input data'])
@@ -561,3 +744,6 @@ class Weather:
                 'utc_offset': self.utc_offset,
                 'uvi': self.uvi,
                 'precipitation_probability': self.precipitation_probability}
+
+
+FrozenWeather = decorators.frozen(Weather)
@@ -4,13 +4,21 @@ from datetime import datetime, timedelta, timezone
 from typing import Union
 
 from pyowm.commons.http_client import HttpClient
+from pyowm.commons.tile import Tile
 from pyowm.constants import WEATHER_API_VERSION
-from pyowm.utils import geo
+from pyowm.utils import concurrency, geo
 from pyowm.weatherapi30 import forecaster, historian, observation, forecast, stationhistory, one_call
+from pyowm.weatherapi30.forecast_frame import ForecastFrame, ONE_CALL_SERIES
 from pyowm.weatherapi30.uris import ROOT_WEATHER_API, OBSERVATION_URI, GROUP_OBSERVATIONS_URI, FIND_OBSERVATIONS_URI, \
     BBOX_CITY_URI, THREE_HOURS_FORECAST_URI, DAILY_FORECAST_URI, STATION_WEATHER_HISTORY_URI, ONE_CALL_URI, \
     ONE_CALL_HISTORICAL_URI, ONE_CALL_ROOT_URI
 
+# the max number of city IDs that the group observations endpoint admits per call
+MAX_IDS_PER_GROUP_CALL = 20
+
+# the default max number of map tiles a bounding box can be split into, that is: of API calls
+MAX_TILES = 1024
+
 
 class WeatherManager:
     """
@@ -20,17 +28,25 @@ class WeatherManager:
     :type API_key: str
     :param config: the configuration dictionary
     :type config: dict
+    :param session: a `requests.Session` shared among the HTTP clients (if not provided, each client handles its own)
+    :type session: `requests.Session` or `None`
+    :param cache: a cache for API responses (if not provided, responses are not cached)
+    :type cache: a `pyowm.commons.cache.Cache` instance or `None`
+    :param rate_limiter: a limiter for the API calls (if not provided, calls are not limited)
+    :type rate_limiter: a `pyowm.commons.rate_limiter.RateLimiter` instance or `None`
     :returns: a *WeatherManager* instance
     :raises: *AssertionError* when no API Key is provided
 
     """
 
-    def __init__(self, API_key, config):
+    def __init__(self, API_key, config, session=None, cache=None, rate_limiter=None):
         assert isinstance(API_key, str), 'You must provide a valid API Key'
         self.API_key = API_key
         assert isinstance(config, dict)
-        self.http_client = HttpClient(API_key, config, ROOT_WEATHER_API)
-        self.one_call_http_client = HttpClient(API_key, config, ONE_CALL_ROOT_URI)
+        self.http_client = HttpClient(API_key, config, ROOT_WEATHER_API, session=session, cache=cache,
+                                      rate_limiter=rate_limiter)
+        self.one_call_http_client = HttpClient(API_key, config, ONE_CALL_ROOT_URI, session=session, cache=cache,
+                                               rate_limiter=rate_limiter)
 
     def weather_api_version(self):
         return WEATHER_API_VERSION
@@ -49,9 +65,7 @@ class WeatherManager:
             reached
         """
 
-        assert isinstance(name, str), "Value must be a string"
-        params = {'q': name}
-        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=params)
+        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=_place_params(name))
         return observation.Observation.from_dict(json_data)
 
     def weather_at_coords(self, lat, lon):
@@ -69,10 +83,7 @@ class WeatherManager:
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=params)
+        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=_coords_params(lat, lon))
         return observation.Observation.from_dict(json_data)
 
     def weather_at_zip_code(self, zipcode, country):
@@ -90,10 +101,7 @@ class WeatherManager:
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
-        assert isinstance(zipcode, str), "Value must be a string"
-        assert isinstance(country, str), "Value must be a string"
-        zip_param = zipcode + ',' + country
-        params = {'zip': zip_param}
+        params = _zip_code_params(zipcode, country)
         _, json_data = self.http_client.get_json(OBSERVATION_URI, params=params)
         return observation.Observation.from_dict(json_data)
 
@@ -110,34 +118,90 @@ class WeatherManager:
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
-        assert type(id) is int, "'id' must be an int"
-        if id < 0:
-            raise ValueError("'id' value must be greater than 0")
-        params = {'id': id}
-        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=params)
+        _, json_data = self.http_client.get_json(OBSERVATION_URI, params=_id_params(id))
         return observation.Observation.from_dict(json_data)
 
-    def weather_at_ids(self, ids_list):
+    def weather_at_ids(self, ids_list, max_workers=8):
         """
         Queries the OWM Weather API for the currently observed weathers at the
         specified city IDs (eg: [5128581,87182])
 
+        As the API admits at most 20 IDs per call, longer lists are split into
+        chunks that are queried concurrently, with at most `max_workers` calls
+        at the same time: results are merged back in the order of the
+        supplied IDs. If any call fails, its error is raised: use
+        `weather_at_ids_chunks` to get per-chunk results and errors instead.
+
         :param ids_list: the list of city IDs
         :type ids_list: list of int
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
         :returns: a list of *Observation* instances or an empty list if no
             weather data is available
         :raises: *ParseResponseException* when OWM Weather API responses' data
             cannot be parsed or *APICallException* when OWM Weather API can not be
             reached
         """
-        assert type(ids_list) is list, "'ids_list' must be a list of integers"
-        for id in ids_list:
-            assert type(id) is int, "'ids_list' must be a list of integers"
-            if id < 0:
-                raise ValueError("id values in 'ids_list' must be greater "
-                                 "than 0")
-        params = {'id': ','.join(list(map(str, ids_list)))}
-        _, json_data = self.http_client.get_json(GROUP_OBSERVATIONS_URI, params=params)
+        _assert_ids(ids_list)
+        if len(ids_list) <= MAX_IDS_PER_GROUP_CALL:
+            return self._weather_at_ids_chunk(ids_list)
+        results = []
+        for _, observations, error in self.weather_at_ids_chunks(ids_list, max_workers=max_workers):
+            if error is not None:
+                raise error
+            results.append(observations)
+        return _merge_ids_chunks(results, ids_list)
+
+    def weather_at_ids_chunks(self, ids_list, max_workers=8):
+        """
+        Queries the OWM Weather API for the currently observed weathers at the
+        specified city IDs, splitting them into chunks of at most 20 IDs
+        (the max the API admits per call) that are queried concurrently, with
+        at most `max_workers` calls at the same time. Failures are reported
+        per-chunk and do not abort the whole batch.
+
+        For the calls to really run in parallel, the HTTP connection pool
+        should be at least as large as `max_workers` (see the `pool_maxsize`
+        config key).
+
+        :param ids_list: the list of city IDs
+        :type ids_list: list of int
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :returns: a generator of `(chunk, observations, error)` tuples in the
+            order of the supplied IDs, where `chunk` is the list of IDs of the
+            call, `observations` is a list of *Observation* instances
+            (``None`` on failure) and `error` is the exception raised for that
+            chunk (``None`` on success)
+        :raises: *ValueError* when `max_workers` is not a positive integer
+        """
+        _assert_ids(ids_list)
+        return concurrency.fan_out_ordered(self._weather_at_ids_chunk, _id_chunks(ids_list),
+                                           max_workers=max_workers)
+
+    def iter_weather_at_ids(self, ids_list):
+        """
+        Streaming variant of `weather_at_ids`: the API response is parsed while being downloaded and the
+        *Observation* objects are yielded one at a time, so that the first ones are available before the download is
+        over and no full list of observations is ever held in memory. Lists of more than 20 IDs are queried one chunk
+        after the other.
+
+        :param ids_list: the list of city IDs
+        :type ids_list: list of int
+        :returns: a generator of *Observation* instances, yielding nothing if no weather data is available
+        :raises: *ParseResponseException* when OWM Weather API responses' data
+            cannot be parsed or *APICallException* when OWM Weather API can not be
+            reached
+        """
+        _assert_ids(ids_list)
+        return self._iter_observations_at_ids(_id_chunks(ids_list))
+
+    def _iter_observations_at_ids(self, chunks):
+        for chunk in chunks:
+            yield from self._iter_observations(GROUP_OBSERVATIONS_URI, _ids_params(chunk))
+
+    def _weather_at_ids_chunk(self, ids_list):
+        _, json_data = self.http_client.get_json(GROUP_OBSERVATIONS_URI, params=_ids_params(ids_list))
         return observation.Observation.from_dict_of_lists(json_data)
 
     def weather_at_places(self, pattern, searchtype, limit=None):
@@ -163,27 +227,47 @@ class WeatherManager:
             reached, *ValueError* when bad value is supplied for the search
             type or the maximum number of items retrieved
         """
-        assert isinstance(pattern, str), "'pattern' must be a str"
-        assert isinstance(searchtype, str), "'searchtype' must be a str"
-        if searchtype not in ["accurate", "like"]:
-            raise ValueError("'searchtype' value must be 'accurate' or 'like'")
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-        params = {'q': pattern, 'type': searchtype}
-        if limit is not None:
-            # fix for OWM 3.0 API bug!
-            params['cnt'] = limit - 1
+        params = _places_params(pattern, searchtype, limit)
         _, json_data = self.http_client.get_json(FIND_OBSERVATIONS_URI, params=params)
         return observation.Observation.from_dict_of_lists(json_data)
 
+    def iter_weather_at_places(self, pattern, searchtype, limit=None):
+        """
+        Streaming variant of `weather_at_places`: the API response is parsed while being downloaded and the
+        *Observation* objects are yielded one at a time.
+
+        :param pattern: the string pattern (not a regex) to be searched for the
+            toponym
+        :type pattern: str
+        :param searchtype: the search mode to be used, must be *'accurate'* for
+          an exact matching or *'like'* for a likelihood matching
+        :type: searchtype: str
+        :param limit: the maximum number of *Observation* items to be yielded
+            (default is ``None``, which stands for any number of items)
+        :param limit: int or ``None``
+        :returns: a generator of *Observation* objects, yielding nothing if no
+            weather data is available
+        :raises: *ParseResponseException* when OWM Weather API responses' data
+            cannot be parsed, *APICallException* when OWM Weather API can not be
+            reached, *ValueError* when bad value is supplied for the search
+            type or the maximum number of items retrieved
+        """
+        params = _places_params(pattern, searchtype, limit)
+        return self._iter_observations(FIND_OBSERVATIONS_URI, params)
+
     def weather_at_places_in_bbox(self, lon_left, lat_bottom, lon_right, lat_top,
-                                  zoom=10, cluster=False):
+                                  zoom=10, cluster=False, tile_zoom=None, max_workers=8, max_tiles=MAX_TILES):
         """
         Queries the OWM Weather API for the weather currently observed by
         meteostations inside the bounding box of latitude/longitude coords.
 
+        As the API caps the number of results of each call, large bounding
+        boxes can be split into the map tiles they overlap at the `tile_zoom`
+        zoom level: one API call is performed for each tile, with at most
+        `max_workers` calls at the same time, and the results are merged into
+        one list, without duplicated cities. If any call fails, its error is
+        raised.
+
         :param lat_top: latitude for top margin of bounding box, must be
             between -90.0 and 90.0
         :type lat_top: int/float
@@ -200,29 +284,79 @@ class WeatherManager:
         :type zoom: int
         :param cluster: use server clustering of points
         :type cluster: bool
+        :param tile_zoom: the zoom level of the map tiles the bounding box is
+            split into (defaults to ``None``, which means: query the whole
+            bounding box with one call)
+        :type tile_zoom: int or ``None``
+        :param max_workers: the max number of concurrent API calls when the
+            bounding box is split into tiles (defaults to 8)
+        :type max_workers: int
+        :param max_tiles: the max number of tiles that the bounding box can be
+            split into (defaults to 1024): this guards against performing too
+            many API calls, ``None`` means: no limit
+        :type max_tiles: int or ``None``
         :returns: a list of *Observation* objects or ``None`` if no weather
             data is available
+        :raises: *ParseResponseException* when OWM Weather API responses' data
+            cannot be parsed, *APICallException* when OWM Weather API can not be
+            reached, *ValueError* when coordinates values are out of bounds or
+            negative values are provided for limit or when the bounding box is
+            split into more than `max_tiles` tiles
+        """
+        params = _bbox_params(lon_left, lat_bottom, lon_right, lat_top, zoom, cluster)
+        if tile_zoom is None:
+            _, json_data = self.http_client.get_json(BBOX_CITY_URI, params=params)
+            return observation.Observation.from_dict_of_lists(json_data)
+        sub_bboxes = _tiled_bboxes(lon_left, lat_bottom, lon_right, lat_top, tile_zoom, max_tiles)
+        results = []
+        for _, observations, error in concurrency.fan_out_ordered(
+                lambda bbox: self.weather_at_places_in_bbox(*bbox, zoom=zoom, cluster=cluster),
+                sub_bboxes, max_workers=max_workers):
+            if error is not None:
+                raise error
+            results.append(observations)
+        return _merge_tiles_observations(results)
+
+    def iter_weather_at_places_in_bbox(self, lon_left, lat_bottom, lon_right, lat_top,
+                                       zoom=10, cluster=False):
+        """
+        Streaming variant of `weather_at_places_in_bbox`: the API response is parsed while being downloaded and the
+        *Observation* objects are yielded one at a time, so that memory usage does not grow with the size of the
+        bounding box.
+
+        :param lat_top: latitude for top margin of bounding box, must be
+            between -90.0 and 90.0
+        :type lat_top: int/float
+        :param lon_left: longitude for left margin of bounding box
+            must be between -180.0 and 180.0
+        :type lon_left: int/float
+        :param lat_bottom: latitude for the bottom margin of bounding box, must
+            be between -90.0 and 90.0
+        :type lat_bottom: int/float
+        :param lon_right: longitude for the right margin of bounding box,
+            must be between -180.0 and 180.0
+        :type lon_right: int/float
+        :param zoom: zoom level (defaults to: 10)
+        :type zoom: int
+        :param cluster: use server clustering of points
+        :type cluster: bool
+        :returns: a generator of *Observation* objects, yielding nothing if no
+            weather data is available
         :raises: *ParseResponseException* when OWM Weather API responses' data
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached, *ValueError* when coordinates values are out of bounds or
             negative values are provided for limit
         """
-        geo.assert_is_lon(lon_left)
-        geo.assert_is_lon(lon_right)
-        geo.assert_is_lat(lat_bottom)
-        geo.assert_is_lat(lat_top)
-        assert type(zoom) is int, "'zoom' must be an int"
-        if zoom <= 0:
-            raise ValueError("'zoom' must greater than zero")
-        assert type(cluster) is bool, "'cluster' must be a bool"
-        params = {'bbox': ','.join([str(lon_left),
-                                    str(lat_bottom),
-                                    str(lon_right),
-                                    str(lat_top),
-                                    str(zoom)]),
-                  'cluster': 'yes' if cluster else 'no'}
-        _, json_data = self.http_client.get_json(BBOX_CITY_URI, params=params)
-        return observation.Observation.from_dict_of_lists(json_data)
+        params = _bbox_params(lon_left, lat_bottom, lon_right, lat_top, zoom, cluster)
+        return self._iter_observations(BBOX_CITY_URI, params)
+
+    def _iter_observations(self, uri, params):
+        _, stream = self.http_client.stream_json_list(uri, params=params)
+        for item in stream:
+            yield observation.Observation.from_dict(item)
+        if not stream.found:
+            # no list in the response: either no results or an error embedded in the payload
+            observation.Observation.from_dict_of_lists(stream.header)
 
     def weather_around_coords(self, lat, lon, limit=None):
         """
@@ -243,14 +377,7 @@ class WeatherManager:
             reached, *ValueError* when coordinates values are out of bounds or
             negative values are provided for limit
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-            params['cnt'] = limit
+        params = _around_coords_params(lat, lon, limit)
         _, json_data = self.http_client.get_json(FIND_OBSERVATIONS_URI, params=params)
         return observation.Observation.from_dict_of_lists(json_data)
 
@@ -274,28 +401,9 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        assert isinstance(name, str), "Value must be a string"
-        assert isinstance(interval, str), "Interval must be a string"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-        params = {'q': name}
-        if limit is not None:
-            params['cnt'] = limit
-        if interval == '3h':
-            uri = THREE_HOURS_FORECAST_URI
-        elif interval == 'daily':
-            uri = DAILY_FORECAST_URI
-        else:
-            raise ValueError("Unsupported time interval for forecast")
+        uri, params = _forecast_request(_place_params(name), interval, limit)
         _, json_data = self.http_client.get_json(uri, params=params)
-        fc = forecast.Forecast.from_dict(json_data)
-        if fc is not None:
-            fc.interval = interval
-            return forecaster.Forecaster(fc)
-        else:
-            return None
+        return _parse_forecast(json_data, interval)
 
     def forecast_at_coords(self, lat, lon, interval, limit=None):
         """
@@ -319,29 +427,9 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        assert isinstance(interval, str), "Interval must be a string"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-        params = {'lon': lon, 'lat': lat}
-        if limit is not None:
-            params['cnt'] = limit
-        if interval == '3h':
-            uri = THREE_HOURS_FORECAST_URI
-        elif interval == 'daily':
-            uri = DAILY_FORECAST_URI
-        else:
-            raise ValueError("Unsupported time interval for forecast")
+        uri, params = _forecast_request(_coords_params(lat, lon), interval, limit)
         _, json_data = self.http_client.get_json(uri, params=params)
-        fc = forecast.Forecast.from_dict(json_data)
-        if fc is not None:
-            fc.interval = interval
-            return forecaster.Forecaster(fc)
-        else:
-            return None
+        return _parse_forecast(json_data, interval)
 
     def forecast_at_id(self, id, interval, limit=None):
         """
@@ -363,30 +451,9 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        assert type(id) is int, "'id' must be an int"
-        if id < 0:
-            raise ValueError("'id' value must be greater than 0")
-        assert isinstance(interval, str), "Interval must be a string"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
-        params = {'id': id}
-        if limit is not None:
-            params['cnt'] = limit
-        if interval == '3h':
-            uri = THREE_HOURS_FORECAST_URI
-        elif interval == 'daily':
-            uri = DAILY_FORECAST_URI
-        else:
-            raise ValueError("Unsupported time interval for forecast")
+        uri, params = _forecast_request(_id_params(id), interval, limit)
         _, json_data = self.http_client.get_json(uri, params=params)
-        fc = forecast.Forecast.from_dict(json_data)
-        if fc is not None:
-            fc.interval = interval
-            return forecaster.Forecaster(fc)
-        else:
-            return None
+        return _parse_forecast(json_data, interval)
 
     def station_tick_history(self, station_ID, limit=None):
         """
@@ -409,11 +476,6 @@ class WeatherManager:
             reached, *ValueError* if the limit value is negative
 
         """
-        assert isinstance(station_ID, int), "'station_ID' must be int"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
         station_history = self._retrieve_station_history(station_ID, limit, "tick")
         if station_history is not None:
             return historian.Historian(station_history)
@@ -442,11 +504,6 @@ class WeatherManager:
             reached, *ValueError* if the limit value is negative
 
         """
-        assert isinstance(station_ID, int), "'station_ID' must be int"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
         station_history = self._retrieve_station_history(station_ID, limit, "hour")
         if station_history is not None:
             return historian.Historian(station_history)
@@ -475,11 +532,6 @@ class WeatherManager:
             reached, *ValueError* if the limit value is negative
 
         """
-        assert isinstance(station_ID, int), "'station_ID' must be int"
-        if limit is not None:
-            assert isinstance(limit, int), "'limit' must be an int or None"
-            if limit < 1:
-                raise ValueError("'limit' must be None or greater than zero")
         station_history = self._retrieve_station_history(station_ID, limit, "day")
         if station_history is not None:
             return historian.Historian(station_history)
@@ -490,15 +542,9 @@ class WeatherManager:
         """
         Helper method for station_X_history functions.
         """
-        params = {'id': station_ID, 'type': interval}
-        if limit is not None:
-            params['cnt'] = limit
+        params = _station_history_params(station_ID, limit, interval)
         _, json_data = self.http_client.get_json(STATION_WEATHER_HISTORY_URI, params=params)
-        sh = stationhistory.StationHistory.from_dict(json_data)
-        if sh is not None:
-            sh.station_id = station_ID
-            sh.interval = interval
-        return sh
+        return _parse_station_history(json_data, station_ID, interval)
 
     def one_call(self, lat: Union[int, float], lon: Union[int, float], **kwargs) -> one_call.OneCall:
         """
@@ -521,17 +567,56 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        params = {'lon': lon, 'lat': lat}
-        for key , value in kwargs.items():
-            if key == 'exclude':
-                params['exclude'] = value
-            elif key == 'units':
-                params['units'] = value
-        _, json_data = self.one_call_http_client.get_json(ONE_CALL_URI, params=params)
+        _, json_data = self.one_call_http_client.get_json(ONE_CALL_URI, params=_one_call_params(lat, lon, kwargs))
         return one_call.OneCall.from_dict(json_data)
 
+    def one_call_frame(self, lat: Union[int, float], lon: Union[int, float], series: str = 'hourly',
+                       **kwargs) -> ForecastFrame:
+        """
+        Queries the OWM Weather API with one call for the specified geographic coordinates and parses one of the
+        returned forecasts straight into a columnar *ForecastFrame*, without building *Weather* objects. This is the
+        cheapest way to hold in memory the forecasts of many locations. Requires the `numpy` package.
+
+        :param lat: location's latitude, must be between -90.0 and 90.0
+        :type lat: int/float
+        :param lon: location's longitude, must be between -180.0 and 180.0
+        :type lon: int/float
+        :param series: the forecast to be parsed, among 'minutely', 'hourly' (default) and 'daily'
+        :type series: str
+        :param kwargs: the same keyword arguments that `one_call` admits (`exclude`, `units`)
+        :returns: a *ForecastFrame* instance or ``None`` if the data is not available for the specified location
+        :raises: *ParseResponseException* when OWM Weather API responses' data
+            cannot be parsed, *APICallException* when OWM Weather API can not be
+            reached, *ValueError* if the series is not supported
+        """
+        params = _one_call_params(lat, lon, kwargs)
+        if series not in ONE_CALL_SERIES:
+            raise ValueError('Unsupported One Call series: %s' % series)
+        _, json_data = self.one_call_http_client.get_json(ONE_CALL_URI, params=params)
+        return ForecastFrame.from_one_call_dict(json_data, series=series)
+
+    def one_call_many(self, coords, max_workers=8, **kwargs):
+        """
+        Queries the OWM Weather API with one call for each of the specified geographic coordinates, performing at
+        most `max_workers` calls at the same time. Results are given back as soon as they are ready, so their order
+        is not the same as the one of the supplied coordinates. Failures are reported per-coordinate and do not
+        abort the whole batch.
+
+        For the calls to really run in parallel, the HTTP connection pool should be at least as large as
+        `max_workers` (see the `pool_maxsize` config key).
+
+        :param coords: the (lat, lon) couples to be queried
+        :type coords: iterable of tuples
+        :param max_workers: the max number of concurrent API calls (defaults to 8)
+        :type max_workers: int
+        :param kwargs: the same keyword arguments that `one_call` admits (`exclude`, `units`)
+        :returns: a generator of `((lat, lon), one_call, error)` tuples, where `one_call` is a *OneCall* instance
+            (``None`` on failure) and `error` is the exception raised for that couple (``None`` on success)
+        :raises: *ValueError* when `max_workers` is not a positive integer
+        """
+        return concurrency.fan_out(lambda latlon: self.one_call(latlon[0], latlon[1], **kwargs),
+                                   coords, max_workers=max_workers)
+
     def one_call_history(self, lat: Union[int, float], lon: Union[int, float], dt: int = None):
         """
         Queries the OWM Weather API with one call for historical weather information for the
@@ -552,20 +637,210 @@ class WeatherManager:
             cannot be parsed, *APICallException* when OWM Weather API can not be
             reached
         """
-        geo.assert_is_lon(lon)
-        geo.assert_is_lat(lat)
-        if dt is None:
-            dt = int((datetime.now(timezone.utc) - timedelta(days=5)).timestamp())
-        else:
-            if not isinstance(dt, int):
-                raise ValueError("dt must be of type int")
-            if dt < 0:
-                raise ValueError("dt must be positive")
-
-        params = {'lon': lon, 'lat': lat, 'dt': dt}
-
+        params = _one_call_history_params(lat, lon, dt)
         _, json_data = self.one_call_http_client.get_json(ONE_CALL_HISTORICAL_URI, params=params)
         return one_call.OneCall.from_dict(json_data)
 
     def __repr__(self):
         return '<%s.%s>' % (__name__, self.__class__.__name__)
+
+
+# Validation, request building and response parsing are shared by WeatherManager and AsyncWeatherManager, so that
+# the two of them only differ in the way API calls are performed
+
+def _place_params(name):
+    assert isinstance(name, str), "Value must be a string"
+    return {'q': name}
+
+
+def _coords_params(lat, lon):
+    geo.assert_is_lon(lon)
+    geo.assert_is_lat(lat)
+    return {'lon': lon, 'lat': lat}
+
+
+def _zip_code_params(zipcode, country):
+    assert isinstance(zipcode, str), "Value must be a string"
+    assert isinstance(country, str), "Value must be a string"
+    return {'zip': zipcode + ',' + country}
+
+
+def _id_params(id):
+    assert type(id) is int, "'id' must be an int"
+    if id < 0:
+        raise ValueError("'id' value must be greater than 0")
+    return {'id': id}
+
+
+def _assert_limit(limit):
+    if limit is not None:
+        assert isinstance(limit, int), "'limit' must be an int or None"
+        if limit < 1:
+            raise ValueError("'limit' must be None or greater than zero")
+
+
+def _assert_ids(ids_list):
+    assert type(ids_list) is list, "'ids_list' must be a list of integers"
+    for id in ids_list:
+        assert type(id) is int, "'ids_list' must be a list of integers"
+        if id < 0:
+            raise ValueError("id values in 'ids_list' must be greater "
+                             "than 0")
+
+
+def _ids_params(ids_list):
+    return {'id': ','.join(list(map(str, ids_list)))}
+
+
+def _id_chunks(ids_list):
+    return [ids_list[i:i + MAX_IDS_PER_GROUP_CALL] for i in range(0, len(ids_list), MAX_IDS_PER_GROUP_CALL)]
+
+
+def _merge_ids_chunks(results, ids_list):
+    # merges the observations of each chunk of IDs back in the order of the supplied IDs
+    merged = [obs for observations in results for obs in observations or []]
+    positions = dict()
+    for i, id in enumerate(ids_list):
+        positions.setdefault(id, i)
+    merged.sort(key=lambda obs: positions.get(obs.location.id, len(ids_list)))
+    return merged
+
+
+def _places_params(pattern, searchtype, limit):
+    assert isinstance(pattern, str), "'pattern' must be a str"
+    assert isinstance(searchtype, str), "'searchtype' must be a str"
+    if searchtype not in ["accurate", "like"]:
+        raise ValueError("'searchtype' value must be 'accurate' or 'like'")
+    _assert_limit(limit)
+    params = {'q': pattern, 'type': searchtype}
+    if limit is not None:
+        # fix for OWM 3.0 API bug!
+        params['cnt'] = limit - 1
+    return params
+
+
+def _bbox_params(lon_left, lat_bottom, lon_right, lat_top, zoom, cluster):
+    geo.assert_is_lon(lon_left)
+    geo.assert_is_lon(lon_right)
+    geo.assert_is_lat(lat_bottom)
+    geo.assert_is_lat(lat_top)
+    assert type(zoom) is int, "'zoom' must be an int"
+    if zoom <= 0:
+        raise ValueError("'zoom' must greater than zero")
+    assert type(cluster) is bool, "'cluster' must be a bool"
+    return {'bbox': ','.join([str(lon_left),
+                              str(lat_bottom),
+                              str(lon_right),
+                              str(lat_top),
+                              str(zoom)]),
+            'cluster': 'yes' if cluster else 'no'}
+
+
+def _tiled_bboxes(lon_left, lat_bottom, lon_right, lat_top, tile_zoom, max_tiles):
+    # the bounding boxes of the tiles overlapping with the specified one, clipped to it
+    assert type(tile_zoom) is int, "'tile_zoom' must be an int or None"
+    if tile_zoom < 0:
+        raise ValueError("'tile_zoom' must be None or not negative")
+    assert max_tiles is None or isinstance(max_tiles, int), "'max_tiles' must be an int or None"
+    if max_tiles is not None:
+        count = Tile.tiles_count_for_bbox(lon_left, lat_bottom, lon_right, lat_top, tile_zoom)
+        if count > max_tiles:
+            raise ValueError('The bounding box is split into %d tiles at zoom level %d, more than max_tiles=%d: use a '
+                             'smaller bounding box or tile zoom level, or raise max_tiles' % (count, tile_zoom,
+                                                                                             max_tiles))
+    result = []
+    for x, y in Tile.tiles_coords_for_bbox(lon_left, lat_bottom, lon_right, lat_top, tile_zoom):
+        left, bottom, right, top = Tile.tile_coords_to_bbox(x, y, tile_zoom)
+        if y == 0:
+            top = 90.
+        if y == 2 ** tile_zoom - 1:
+            bottom = -90.
+        bbox = (max(left, lon_left), max(bottom, lat_bottom), min(right, lon_right), min(top, lat_top))
+        if bbox[0] < bbox[2] and bbox[1] < bbox[3]:
+            result.append(bbox)
+    return result
+
+
+def _merge_tiles_observations(results):
+    merged = []
+    seen = set()
+    for observations in results:
+        for obs in observations or []:
+            loc = obs.location
+            # cities sitting on the border between tiles are returned more than once
+            key = loc.id if loc.id is not None else (loc.lon, loc.lat, loc.name)
+            if key not in seen:
+                seen.add(key)
+                merged.append(obs)
+    return merged
+
+
+def _around_coords_params(lat, lon, limit):
+    params = _coords_params(lat, lon)
+    _assert_limit(limit)
+    if limit is not None:
+        params['cnt'] = limit
+    return params
+
+
+def _forecast_request(params, interval, limit):
+    assert isinstance(interval, str), "Interval must be a string"
+    _assert_limit(limit)
+    if limit is not None:
+        params['cnt'] = limit
+    if interval == '3h':
+        uri = THREE_HOURS_FORECAST_URI
+    elif interval == 'daily':
+        uri = DAILY_FORECAST_URI
+    else:
+        raise ValueError("Unsupported time interval for forecast")
+    return uri, params
+
+
+def _parse_forecast(json_data, interval):
+    fc = forecast.Forecast.from_dict(json_data)
+    if fc is not None:
+        fc.interval = interval
+        return forecaster.Forecaster(fc)
+    else:
+        return None
+
+
+def _station_history_params(station_ID, limit, interval):
+    assert isinstance(station_ID, int), "'station_ID' must be int"
+    _assert_limit(limit)
+    params = {'id': station_ID, 'type': interval}
+    if limit is not None:
+        params['cnt'] = limit
+    return params
+
+
+def _parse_station_history(json_data, station_ID, interval):
+    sh = stationhistory.StationHistory.from_dict(json_data)
+    if sh is not None:
+        sh.station_id = station_ID
+        sh.interval = interval
+    return sh
+
+
+def _one_call_params(lat, lon, kwargs):
+    params = _coords_params(lat, lon)
+    for key, value in kwargs.items():
+        if key == 'exclude':
+            params['exclude'] = value
+        elif key == 'units':
+            params['units'] = value
+    return params
+
+
+def _one_call_history_params(lat, lon, dt):
+    params = _coords_params(lat, lon)
+    if dt is None:
+        dt = int((datetime.now(timezone.utc) - timedelta(days=5)).timestamp())
+    else:
+        if not isinstance(dt, int):
+            raise ValueError("dt must be of type int")
+        if dt < 0:
+            raise ValueError("dt must be positive")
+    params['dt'] = dt
+    return params
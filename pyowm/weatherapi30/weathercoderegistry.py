@@ -74,9 +74,23 @@ class WeatherCodeRegistry:
 
     """
 
+    _default_instance = None
+
     def __init__(self, code_ranges_dict):
         assert isinstance(code_ranges_dict, dict)
         self._code_ranges_dict = code_ranges_dict
+        self._status_by_code = self._build_lookup_table(code_ranges_dict)
+
+    @staticmethod
+    def _build_lookup_table(code_ranges_dict):
+        # statuses are scanned in dict order and the first one claiming a code
+        # wins, which is the same precedence the range walk used to apply
+        table = dict()
+        for status in code_ranges_dict:
+            for _range in code_ranges_dict[status]:
+                for code in range(_range['start'], _range['end'] + 1):
+                    table.setdefault(code, status)
+        return table
 
     def status_for(self, code):
         """
@@ -87,12 +101,36 @@ class WeatherCodeRegistry:
         :type code: int
         :returns: the weather status str or ``None`` if the code is not mapped
         """
-        is_in = lambda start, end, n: start <= n <= end
-        for status in self._code_ranges_dict:
-            for _range in self._code_ranges_dict[status]:
-                if is_in(_range['start'],_range['end'],code):
-                    return status
-        return None
+        return self._status_by_code.get(code)
+
+    def statuses_for(self, codes):
+        """
+        Returns the weather statuses related to each of the specified weather
+        status codes, in the same order. Items can either be weather codes or
+        objects exposing a `weather_code` attribute, so that a whole *Forecast*
+        or the hourly *Weather* list of a *OneCall* can be classified in a
+        single pass.
+
+        :param codes: an iterable of weather status codes or *Weather* objects
+        :type codes: iterable
+        :returns: a list of weather status str, with ``None`` for the codes
+            that are not mapped
+        """
+        lookup = self._status_by_code.get
+        return [lookup(getattr(item, 'weather_code', item)) for item in codes]
+
+    def codes_for(self, status):
+        """
+        Returns all the weather status codes that are mapped to the specified
+        weather status.
+
+        :param status: the weather status (eg: "rain")
+        :type status: str
+        :returns: a sorted list of int weather codes, empty if the status is
+            unknown
+        """
+        return sorted(code for code, code_status in self._status_by_code.items()
+                      if code_status == status)
 
     @classmethod
     def get_instance(cls):
@@ -100,7 +138,9 @@ class WeatherCodeRegistry:
         Factory method returning the default weather code registry
         :return: a `WeatherCodeRegistry` instance
         """
-        return WeatherCodeRegistry(WEATHER_CODES_INTERVALS)
+        if cls._default_instance is None:
+            cls._default_instance = cls(WEATHER_CODES_INTERVALS)
+        return cls._default_instance
 
     def __repr__(self):
         return "<%s.%s>" % (__name__, self.__class__.__name__)
\ No newline at end of file
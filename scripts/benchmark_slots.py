@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+This script measures the memory footprint and the construction time of the
+slotted entity classes (Weather, Location, Observation, Measurement and
+AggregatedMeasurement) against equivalent classes that keep their attributes
+in a per-instance __dict__, which is how these entities were implemented
+before being slotted.
+
+Usage: python scripts/benchmark_slots.py [number of objects]
+"""
+
+import gc
+import sys
+import timeit
+import tracemalloc
+from pyowm.stationsapi30.measurement import AggregatedMeasurement, Measurement
+from pyowm.weatherapi30.location import Location
+from pyowm.weatherapi30.observation import Observation
+from pyowm.weatherapi30.weather import Weather
+
+
+OBSERVATION = {
+    "coord": {"lon": -0.12574, "lat": 51.50853}, "sys": {"country": "GB", "sunrise": 1378877413, "sunset": 1378923812},
+    "weather": [{"id": 804, "main": "Clouds", "description": "overcast clouds", "icon": "04d"}],
+    "main": {"temp": 288.44, "pressure": 1022, "temp_min": 287.59, "temp_max": 289.82, "humidity": 75},
+    "wind": {"speed": 1.54, "gust": 2.57, "deg": 31}, "clouds": {"all": 92}, "visibility": 10000,
+    "dt": 1378895177, "id": 2643743, "name": "London", "cod": 200}
+
+MEASUREMENT = {"station_id": "mytest", "timestamp": 1378459200, "temperature": 21.5, "wind_speed": 2.1,
+               "wind_gust": 6.7, "wind_deg": 80, "pressure": 1012, "humidity": 65, "rain_1h": 0.5}
+
+AGGREGATED_MEASUREMENT = {"station_id": "mytest", "date": 1378459200, "type": "h",
+                          "temp": {"min": 10.1, "max": 21.5, "average": 15.2}, "humidity": {"average": 65},
+                          "wind": {"speed": 2.1}, "pressure": {"average": 1012}, "precipitation": {"rain": 0.5}}
+
+
+def unslotted(cls):
+    """Builds a copy of the class that stores attributes in a __dict__ instead of slots"""
+    namespace = {k: v for k, v in cls.__dict__.items()
+                 if k not in cls.__slots__ and k not in ('__slots__', '__dict__', '__weakref__')}
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+CASES = [
+    ('Weather', Weather, lambda c: c.from_dict(OBSERVATION)),
+    ('Location', Location, lambda c: c.from_dict(OBSERVATION)),
+    ('Observation', Observation, lambda c: c.from_dict(OBSERVATION)),
+    ('Measurement', Measurement, lambda c: c.from_dict(MEASUREMENT)),
+    ('AggregatedMeasurement', AggregatedMeasurement, lambda c: c.from_dict(AGGREGATED_MEASUREMENT)),
+]
+
+
+def bytes_per_object(factory, number):
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory() for _ in range(number)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - before) / number
+
+
+def microsecs_per_object(factory, number):
+    return min(timeit.repeat(factory, number=number, repeat=5)) / number * 1e6
+
+
+def run(number):
+    print('%-22s %12s %12s %8s %12s %12s %8s' % ('Entity', 'dict B/obj', 'slots B/obj', 'delta',
+                                                'dict us/obj', 'slots us/obj', 'delta'))
+    for name, cls, build in CASES:
+        legacy = unslotted(cls)
+        # Observation builds its Weather and Location through their own classes, so only the
+        # outer object changes: that is what is being measured
+        slotted_factory = lambda: build(cls)
+        legacy_factory = lambda: build(legacy)
+        legacy_mem = bytes_per_object(legacy_factory, number)
+        slotted_mem = bytes_per_object(slotted_factory, number)
+        legacy_time = microsecs_per_object(legacy_factory, number)
+        slotted_time = microsecs_per_object(slotted_factory, number)
+        print('%-22s %12.0f %12.0f %7.0f%% %12.2f %12.2f %7.0f%%' % (
+            name, legacy_mem, slotted_mem, (slotted_mem - legacy_mem) / legacy_mem * 100,
+            legacy_time, slotted_time, (slotted_time - legacy_time) / legacy_time * 100))
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) == 2 else 100000)
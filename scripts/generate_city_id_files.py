@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import requests, sys, os, codecs, json, gzip, bz2, collections, csv, sqlite3, re
+from pyowm.commons.cityidregistry import build_search_indexes
 
 
 city_list_url = 'http://bulk.openweathermap.org/sample/city.list.json.gz'
@@ -217,6 +218,14 @@ def populate_db_sqlite(db_path, cities_list):
     print('Populated SQLite database')
 
 
+def index_db_sqlite(db_path):
+    conn = sqlite3.connect(db_path)
+    build_search_indexes(conn)
+    conn.execute('VACUUM')
+    conn.close()
+    print('Built SQLite search indexes')
+
+
 def generate_sqlite_db(target_path='.'):
     DB_NAME = 'cities.db'
     target_folder = os.path.abspath(target_path)
@@ -227,6 +236,7 @@ def generate_sqlite_db(target_path='.'):
     cities = read_all_cities_into_lists()
     create_db_sqlite(db_path)
     populate_db_sqlite(db_path, cities)
+    index_db_sqlite(db_path)
     print('Job finished')
     print("********  DON'T FORGET TO MANUALLY BZ2 COMPRESS THE DB !!!  ******** ")
 
@@ -2,13 +2,18 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+import hashlib
+import io
 import json
 import copy
+import os
+import tempfile
 from pyowm.config import DEFAULT_CONFIG
 from pyowm.constants import AGRO_API_VERSION
 from pyowm.commons.http_client import HttpClient
 from pyowm.commons.enums import ImageTypeEnum
-from pyowm.commons.image import Image
+from pyowm.commons.exceptions import ChecksumMismatchError
+from pyowm.commons.image import Image, MappedImage
 from pyowm.commons.tile import Tile
 from pyowm.agroapi10.agro_manager import AgroManager
 from pyowm.agroapi10.polygon import Polygon, GeoPolygon, GeoPoint
@@ -97,6 +102,39 @@ class MockHttpClientReturningImage(HttpClient):
         return 200, self.d
 
 
+class MockHttpClientDownloading(HttpClient):
+
+    d = b'1234567890'
+    etag = '"v1"'
+    requests = []
+
+    def download_to(self, path, fileobj, params=None, headers=None, mime_type=None, offset=0, if_range=None,
+                    on_response=None):
+        self.requests.append((path, params, mime_type, offset, if_range))
+        if offset > 0 and if_range != self.etag:
+            # the data has changed: it is all sent again
+            fileobj.seek(0)
+            fileobj.truncate()
+            offset = 0
+        if offset >= len(self.d):
+            return 416, offset
+        status = 206 if offset else 200
+        if on_response is not None:
+            on_response(status, {'ETag': self.etag})
+        fileobj.write(self.d[offset:])
+        return status, len(self.d)
+
+
+class MockHttpClientDownloadingInterrupted(MockHttpClientDownloading):
+
+    def download_to(self, path, fileobj, params=None, headers=None, mime_type=None, offset=0, if_range=None,
+                    on_response=None):
+        self.requests.append((path, params, mime_type, offset, if_range))
+        on_response(200, {'ETag': self.etag})
+        fileobj.write(self.d[:4])
+        raise TimeoutError('API call timed out')
+
+
 class MockHttpClientStats(HttpClient):
 
     test_stats_json = '''{"std": 0.19696951630010479, "p25": 0.3090659340659341, "num": 57162, 
@@ -274,6 +312,139 @@ class TestAgroManager(unittest.TestCase):
         self.assertEqual(result.data.image_type, ImageTypeEnum.GEOTIFF)
         self.assertEqual(result.palette, PaletteEnum.GREEN)
 
+    def test_download_satellite_image_to_path(self):
+        MockHttpClientDownloading.requests = []
+        instance = self.factory(MockHttpClientDownloading)
+        metaimg = MetaPNGImage('http://a.com', PresetEnum.FALSE_COLOR,
+                               SatelliteEnum.SENTINEL_2, 1378459200, 98.2, 0.3, 11.7, 7.89, 'a1b2c3d4')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'image.png')
+            result = instance.download_satellite_image_to(metaimg, path, palette=PaletteEnum.BLACK_AND_WHITE,
+                                                          checksum=hashlib.sha256(b'1234567890').hexdigest())
+            self.assertIsInstance(result, SatelliteImage)
+            self.assertIsInstance(result.data, MappedImage)
+            self.assertEqual(ImageTypeEnum.PNG, result.data.image_type)
+            self.assertEqual(PaletteEnum.BLACK_AND_WHITE, result.palette)
+            self.assertEqual(b'1234567890', bytes(result.data.data))
+            result.data.close()
+            self.assertEqual(('http://a.com', dict(paletteid=PaletteEnum.BLACK_AND_WHITE), 'image/png', 0, None),
+                             MockHttpClientDownloading.requests[0])
+            # no sidecar files are left around
+            self.assertEqual(['image.png'], os.listdir(tmp_dir))
+
+    def test_download_satellite_image_to_path_resumes_partial_downloads(self):
+        MockHttpClientDownloading.requests = []
+        instance = self.factory(MockHttpClientDownloading)
+        metaimg = MetaGeoTiffImage('http://a.com', PresetEnum.FALSE_COLOR,
+                                   SatelliteEnum.SENTINEL_2.name, 1378459200, 98.2, 0.3, 11.7, 7.89, 'a1b2c3d4')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'image.tif')
+
+            def leave_partial_download(data, validator):
+                with open(path + '.part', 'wb') as f:
+                    f.write(data)
+                with open(path + '.part.validator', 'w') as f:
+                    f.write(validator)
+
+            leave_partial_download(b'1234', '"v1"')
+            result = instance.download_satellite_image_to(metaimg, path)
+            self.assertEqual(ImageTypeEnum.GEOTIFF, result.data.image_type)
+            self.assertEqual(b'1234567890', bytes(result.data.data))
+            result.data.close()
+            self.assertEqual((4, '"v1"'), MockHttpClientDownloading.requests[0][3:])
+            self.assertEqual(ImageTypeEnum.GEOTIFF.mime_type, MockHttpClientDownloading.requests[0][2])
+            self.assertEqual(['image.tif'], os.listdir(tmp_dir))
+
+            # the image has changed on the server since the partial download
+            leave_partial_download(b'abcd', '"v0"')
+            result = instance.download_satellite_image_to(metaimg, path)
+            self.assertEqual(b'1234567890', bytes(result.data.data))
+            result.data.close()
+            self.assertEqual((4, '"v0"'), MockHttpClientDownloading.requests[1][3:])
+
+            # partial downloads without a validator cannot be resumed
+            with open(path + '.part', 'wb') as f:
+                f.write(b'abcd')
+            result = instance.download_satellite_image_to(metaimg, path)
+            self.assertEqual(b'1234567890', bytes(result.data.data))
+            result.data.close()
+            self.assertEqual((0, None), MockHttpClientDownloading.requests[2][3:])
+
+            # resuming is disabled
+            leave_partial_download(b'abcd', '"v1"')
+            result = instance.download_satellite_image_to(metaimg, path, resume=False)
+            self.assertEqual(b'1234567890', bytes(result.data.data))
+            result.data.close()
+            self.assertEqual((0, None), MockHttpClientDownloading.requests[3][3:])
+
+    def test_download_satellite_image_to_path_keeps_interrupted_downloads(self):
+        MockHttpClientDownloading.requests = []
+        metaimg = MetaPNGImage('http://a.com', PresetEnum.FALSE_COLOR,
+                               SatelliteEnum.SENTINEL_2, 1378459200, 98.2, 0.3, 11.7, 7.89, 'a1b2c3d4')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'image.png')
+            with open(path, 'wb') as f:
+                f.write(b'previous image')
+            with self.assertRaises(TimeoutError):
+                self.factory(MockHttpClientDownloadingInterrupted).download_satellite_image_to(metaimg, path)
+            # the target is left untouched until the download is complete
+            with open(path, 'rb') as f:
+                self.assertEqual(b'previous image', f.read())
+            with open(path + '.part', 'rb') as f:
+                self.assertEqual(b'1234', f.read())
+            with open(path + '.part.validator') as f:
+                self.assertEqual('"v1"', f.read())
+
+            result = self.factory(MockHttpClientDownloading).download_satellite_image_to(metaimg, path)
+            self.assertEqual(b'1234567890', bytes(result.data.data))
+            result.data.close()
+            self.assertEqual((4, '"v1"'), MockHttpClientDownloading.requests[1][3:])
+            self.assertEqual(['image.png'], os.listdir(tmp_dir))
+
+    def test_download_satellite_image_to_path_with_wrong_checksum(self):
+        instance = self.factory(MockHttpClientDownloading)
+        metaimg = MetaPNGImage('http://a.com', PresetEnum.FALSE_COLOR,
+                               SatelliteEnum.SENTINEL_2, 1378459200, 98.2, 0.3, 11.7, 7.89, 'a1b2c3d4')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'image.png')
+            with self.assertRaises(ChecksumMismatchError):
+                instance.download_satellite_image_to(metaimg, path, checksum=hashlib.md5(b'123').hexdigest(),
+                                                     checksum_algorithm='md5')
+            self.assertEqual([], os.listdir(tmp_dir))
+            with self.assertRaises(ValueError):
+                instance.download_satellite_image_to(metaimg, path, checksum='abc', checksum_algorithm='nope')
+
+    def test_download_satellite_image_to_file_object(self):
+        MockHttpClientDownloading.requests = []
+        instance = self.factory(MockHttpClientDownloading)
+        metaimg = MetaTile('http://a.com/{x}/{y}/{z}', PresetEnum.FALSE_COLOR,
+                           SatelliteEnum.SENTINEL_2, 1378459200, 98.2, 0.3, 11.7, 7.89, 'a1b2c3d4')
+        target = io.BytesIO()
+        self.assertIsNone(instance.download_satellite_image_to(
+            metaimg, target, x=1, y=2, zoom=3, checksum=hashlib.sha256(b'1234567890').hexdigest().upper()))
+        self.assertEqual(b'1234567890', target.getvalue())
+        self.assertEqual('http://a.com/1/2/3', MockHttpClientDownloading.requests[0][0])
+        with self.assertRaises(ChecksumMismatchError):
+            instance.download_satellite_image_to(metaimg, io.BytesIO(), x=1, y=2, zoom=3, checksum='abc')
+        with self.assertRaises(AssertionError):
+            instance.download_satellite_image_to(metaimg, io.BytesIO())
+
+    def test_download_satellite_image_to_tile_path(self):
+        instance = self.factory(MockHttpClientDownloading)
+        metaimg = MetaTile('http://a.com/{x}/{y}/{z}', PresetEnum.FALSE_COLOR,
+                           SatelliteEnum.SENTINEL_2, 1378459200, 98.2, 0.3, 11.7, 7.89, 'a1b2c3d4')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = instance.download_satellite_image_to(metaimg, os.path.join(tmp_dir, 'tile.png'), x=1, y=2,
+                                                          zoom=3)
+            self.assertIsInstance(result.data, Tile)
+            self.assertIsInstance(result.data.image, MappedImage)
+            self.assertEqual((1, 2, 3), (result.data.x, result.data.y, result.data.zoom))
+
+    def test_download_satellite_image_to_fails_with_wrong_metaimage_type(self):
+        instance = self.factory(MockHttpClientDownloading)
+        with self.assertRaises(ValueError):
+            instance.download_satellite_image_to('not-a-metaimage', io.BytesIO())
+
     def test_download_satellite_image_with_tile_png_fails_without_tile_coords(self):
         instance = self.factory(MockHttpClientReturningImage)
         metaimg = MetaTile('http://a.com', PresetEnum.FALSE_COLOR,
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+from pyowm.airpollutionapi30 import airstatus
+from pyowm.airpollutionapi30.async_airpollution_manager import AsyncAirPollutionManager
+from pyowm.airpollutionapi30.uris import AIR_POLLUTION_URL, AIR_POLLUTION_FORECAST_URL, AIR_POLLUTION_HISTORY_URL
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.constants import AIRPOLLUTION_API_VERSION
+from tests.unit.airpollutionapi30.test_airstatus import AIRSTATUS_JSON, AIRSTATUS_MULTIPLE_JSON
+
+
+class MockAsyncHttpClient(AsyncHttpClient):
+
+    def __init__(self, json_text):
+        super().__init__('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        self.json_text = json_text
+        self.requests = []
+
+    async def get_json(self, uri, params=None, headers=None):
+        self.requests.append((uri, params))
+        return 200, json.loads(self.json_text)
+
+
+class TestAsyncAirPollutionManager(unittest.IsolatedAsyncioTestCase):
+
+    def _instance(self, json_text):
+        instance = AsyncAirPollutionManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client = MockAsyncHttpClient(json_text)
+        return instance
+
+    def test_get_airpollution_api_version(self):
+        result = AsyncAirPollutionManager('fakeapikey', DEFAULT_CONFIG).airpollution_api_version()
+        self.assertEqual(AIRPOLLUTION_API_VERSION, result)
+
+    async def test_air_quality_at_coords(self):
+        instance = self._instance(AIRSTATUS_JSON)
+        result = await instance.air_quality_at_coords(45, 9)
+        self.assertIsInstance(result, airstatus.AirStatus)
+        self.assertEqual(AIR_POLLUTION_URL, instance.http_client.requests[0][0])
+        with self.assertRaises(ValueError):
+            await instance.air_quality_at_coords(43.7, -200.0)
+
+    async def test_air_quality_forecast_at_coords(self):
+        instance = self._instance(AIRSTATUS_MULTIPLE_JSON)
+        result = await instance.air_quality_forecast_at_coords(45, 9)
+        self.assertTrue(all(isinstance(item, airstatus.AirStatus) for item in result))
+        self.assertEqual(AIR_POLLUTION_FORECAST_URL, instance.http_client.requests[0][0])
+
+    async def test_air_quality_history_at_coords(self):
+        instance = self._instance(AIRSTATUS_MULTIPLE_JSON)
+        result = await instance.air_quality_history_at_coords(45, 9, 12345678, end=12349999)
+        self.assertTrue(all(isinstance(item, airstatus.AirStatus) for item in result))
+        uri, params = instance.http_client.requests[0]
+        self.assertEqual(AIR_POLLUTION_HISTORY_URL, uri)
+        self.assertEqual(12345678, params['start'])
+        self.assertEqual(12349999, params['end'])
+
+    def test_repr(self):
+        repr(AsyncAirPollutionManager('fakeapikey', DEFAULT_CONFIG))
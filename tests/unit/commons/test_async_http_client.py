@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import copy
+import unittest
+import aiohttp
+import pyowm.commons.exceptions
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.commons.rate_limiter import RateLimiter
+
+
+class MockResponse:
+    def __init__(self, status, payload, headers=None):
+        self.status = status
+        self.payload = payload
+        self.headers = headers if headers is not None else dict()
+
+    async def read(self):
+        return self.payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class MockSession:
+    """
+    Replies with the queued responses (or raises the queued exceptions) and records the issued requests
+    """
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.closed = False
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        item = self.responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def close(self):
+        self.closed = True
+
+
+class TestAsyncHttpClient(unittest.IsolatedAsyncioTestCase):
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, AsyncHttpClient, None, DEFAULT_CONFIG, 'test.com', True)
+        self.assertRaises(AssertionError, AsyncHttpClient, 'apikey', None, 'test.com', True)
+        self.assertRaises(AssertionError, AsyncHttpClient, 'apikey', DEFAULT_CONFIG, None, True)
+        self.assertRaises(AssertionError, AsyncHttpClient, 'apikey', DEFAULT_CONFIG, 'test.com', None)
+
+    async def test_get_json(self):
+        session = MockSession(MockResponse(200, b'{"name": "james bond", "designation": "007"}'))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = await instance.get_json('resource', params=dict(a=1, b=None))
+        self.assertEqual(200, status)
+        self.assertEqual(dict(name='james bond', designation='007'), data)
+        method, url, kwargs = session.requests[0]
+        self.assertEqual('GET', method)
+        self.assertEqual('https://api.anyurl.com/resource', url)
+        self.assertEqual('1', kwargs['params']['a'])
+        self.assertNotIn('b', kwargs['params'])
+        self.assertEqual('apikey', kwargs['params']['APPID'])
+
+    async def test_get_json_parse_error(self):
+        session = MockSession(MockResponse(200, b'123846237647236{'))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        with self.assertRaises(pyowm.commons.exceptions.ParseAPIResponseError):
+            await instance.get_json('resource')
+
+    async def test_get_json_failing_with_status_codes(self):
+        for status, exc in [(400, pyowm.commons.exceptions.APIRequestError),
+                            (401, pyowm.commons.exceptions.UnauthorizedError),
+                            (404, pyowm.commons.exceptions.NotFoundError),
+                            (502, pyowm.commons.exceptions.BadGatewayError)]:
+            session = MockSession(MockResponse(status, b'{"message": "error"}'))
+            instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+            with self.assertRaises(exc):
+                await instance.get_json('resource')
+
+    async def test_get_json_failing_with_network_errors(self):
+        session = MockSession(asyncio.TimeoutError())
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        with self.assertRaises(pyowm.commons.exceptions.TimeoutError):
+            await instance.get_json('resource')
+        session = MockSession(aiohttp.ClientConnectionError())
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        with self.assertRaises(pyowm.commons.exceptions.InvalidSSLCertificateError):
+            await instance.get_json('resource')
+
+    async def test_get_json_with_retries(self):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['connection']['max_retries'] = 2
+        session = MockSession(MockResponse(503, b''), asyncio.TimeoutError(), MockResponse(200, b'{"a": 1}'))
+        instance = AsyncHttpClient('apikey', config, 'anyurl.com', session=session)
+        status, data = await instance.get_json('resource')
+        self.assertEqual(dict(a=1), data)
+        self.assertEqual(3, len(session.requests))
+
+        session = MockSession(MockResponse(503, b''), MockResponse(503, b''), MockResponse(503, b''))
+        instance = AsyncHttpClient('apikey', config, 'anyurl.com', session=session)
+        with self.assertRaises(pyowm.commons.exceptions.APIRequestError):
+            await instance.get_json('resource')
+
+    async def test_get_json_with_rate_limiter(self):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['connection']['max_retries'] = 1
+        limiter = RateLimiter(6000, mode='fail')
+        session = MockSession(MockResponse(429, b'', {'Retry-After': '0'}), MockResponse(200, b'{"a": 1}'))
+        instance = AsyncHttpClient('apikey', config, 'anyurl.com', session=session, rate_limiter=limiter)
+        status, data = await instance.get_json('resource')
+        self.assertEqual(dict(a=1), data)
+        self.assertEqual(2, len(session.requests))
+
+        # the retry is held back by the limiter
+        session = MockSession(MockResponse(429, b'', {'Retry-After': '30'}), MockResponse(200, b'{"a": 1}'))
+        instance = AsyncHttpClient('apikey', config, 'anyurl.com', session=session, rate_limiter=limiter)
+        with self.assertRaises(pyowm.commons.exceptions.RateLimitExceededError):
+            await instance.get_json('resource')
+        self.assertEqual(1, len(session.requests))
+
+    async def test_post(self):
+        session = MockSession(MockResponse(201, b'{"key": "value"}'), MockResponse(204, b''))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = await instance.post('resource', data=dict(key='value'))
+        self.assertEqual(dict(key='value'), data)
+        self.assertEqual(dict(key='value'), session.requests[0][2]['json'])
+        status, data = await instance.post('resource', data=dict(key='value'))
+        self.assertEqual(dict(), data)
+
+    async def test_put(self):
+        session = MockSession(MockResponse(200, b'{"key": "value"}'))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = await instance.put('resource', data=dict(key='value'))
+        self.assertEqual(dict(key='value'), data)
+        self.assertEqual('PUT', session.requests[0][0])
+
+    async def test_delete(self):
+        session = MockSession(MockResponse(204, b''))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = await instance.delete('resource')
+        self.assertEqual(204, status)
+        self.assertIsNone(data)
+
+    async def test_ssl_verification_is_honoured_with_provided_sessions(self):
+        session = MockSession(MockResponse(200, b'{}'), MockResponse(200, b'{}'))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        await instance.get_json('/resource')
+        self.assertIsNone(session.requests[0][2]['ssl'])
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['connection']['verify_ssl_certs'] = False
+        instance = AsyncHttpClient('apikey', config, 'anyurl.com', session=session)
+        await instance.get_json('/resource')
+        self.assertIs(False, session.requests[1][2]['ssl'])
+
+    async def test_get_png(self):
+        session = MockSession(MockResponse(200, b'\x89PNG\r\n'))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = await instance.get_png('https://api.anyurl.com/xxx/yyy')
+        self.assertEqual(b'\x89PNG\r\n', data)
+        method, url, kwargs = session.requests[0]
+        self.assertEqual('https://api.anyurl.com/xxx/yyy', url)
+        self.assertEqual('image/png', kwargs['headers']['Accept'])
+
+    async def test_get_geotiff(self):
+        session = MockSession(MockResponse(200, b'II*\x00\x08\x00'))
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        status, data = await instance.get_geotiff('xxx/yyy')
+        self.assertEqual(b'II*\x00\x08\x00', data)
+        self.assertEqual('image/tiff', session.requests[0][2]['headers']['Accept'])
+
+    async def test_socks_proxies_are_not_supported(self):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['connection']['use_proxy'] = True
+        session = MockSession(MockResponse(200, b'{}'))
+        instance = AsyncHttpClient('apikey', config, 'anyurl.com', session=session)
+        with self.assertRaises(pyowm.commons.exceptions.ConfigurationError):
+            await instance.get_json('resource')
+
+    async def test_close(self):
+        # provided sessions are not closed
+        session = MockSession()
+        instance = AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        await instance.close()
+        self.assertFalse(session.closed)
+
+        # owned sessions are lazily created and then closed
+        async with AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com') as instance:
+            owned_session = instance.session
+            self.assertIsInstance(owned_session, aiohttp.ClientSession)
+            self.assertIs(owned_session, instance.session)
+        self.assertTrue(owned_session.closed)
+
+    def test_repr(self):
+        repr(AsyncHttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com'))
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+import os
+import tempfile
+import time
+import unittest
+from pyowm.commons import cache
+from pyowm.commons.cache import LRUCache, SQLiteCache, ShelveCache
+from pyowm.commons.exceptions import ConfigurationError
+from pyowm.config import DEFAULT_CONFIG
+
+
+class TestCacheFunctions(unittest.TestCase):
+
+    def test_cache_key(self):
+        url = 'http://api.openweathermap.org/data/2.5/weather'
+        result = cache.cache_key(url, dict(q='London', APPID='key', lang='en'))
+        self.assertEqual(url + '?lang=en&q=London', result)
+        self.assertEqual(result, cache.cache_key(url, dict(lang='en', q='London', APPID='otherkey')))
+        self.assertEqual(url + '?lat=1.5', cache.cache_key(url, dict(lat=1.5, lon=None, appid='key')))
+        self.assertEqual(url, cache.cache_key(url, dict()))
+
+    def test_cache_ttl_for(self):
+        self.assertEqual((True, 600), cache.cache_ttl_for(DEFAULT_CONFIG, 'weather'))
+        self.assertEqual((True, None), cache.cache_ttl_for(DEFAULT_CONFIG, 'onecall/timemachine'))
+        self.assertEqual((False, None), cache.cache_ttl_for(DEFAULT_CONFIG, 'history/station'))
+        self.assertEqual((False, None), cache.cache_ttl_for(dict(), 'weather'))
+
+    def test_cache_from(self):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        self.assertIsNone(cache.cache_from(config))
+        self.assertIsNone(cache.cache_from(dict()))
+        config['cache']['backend'] = 'memory'
+        config['cache']['max_size'] = 5
+        result = cache.cache_from(config)
+        self.assertIsInstance(result, LRUCache)
+        self.assertEqual(5, result.max_size)
+        config['cache']['backend'] = 'sqlite'
+        self.assertRaises(ConfigurationError, cache.cache_from, config)
+        config['cache']['backend'] = 'unknown'
+        self.assertRaises(ConfigurationError, cache.cache_from, config)
+        with tempfile.TemporaryDirectory() as tmp:
+            config['cache']['path'] = os.path.join(tmp, 'cache.db')
+            config['cache']['backend'] = 'sqlite'
+            result = cache.cache_from(config)
+            self.assertIsInstance(result, SQLiteCache)
+            result.close()
+            config['cache']['path'] = os.path.join(tmp, 'cache.shelve')
+            config['cache']['backend'] = 'shelve'
+            result = cache.cache_from(config)
+            self.assertIsInstance(result, ShelveCache)
+            result.close()
+
+
+class CacheTestMixin:
+
+    def new_cache(self, max_size=3):
+        raise NotImplementedError
+
+    def test_get_and_set(self):
+        instance = self.new_cache()
+        self.assertIsNone(instance.get('a'))
+        instance.set('a', '{"x": 1}')
+        self.assertEqual('{"x": 1}', instance.get('a'))
+        instance.set('a', '{"x": 2}', ttl=10)
+        self.assertEqual('{"x": 2}', instance.get('a'))
+        self.assertEqual(1, len(instance))
+        instance.clear()
+        self.assertIsNone(instance.get('a'))
+        self.assertEqual(0, len(instance))
+        repr(instance)
+
+    def test_expiry(self):
+        instance = self.new_cache()
+        instance.set('a', 'value', ttl=-1)
+        instance.set('b', 'value', ttl=0.1)
+        self.assertIsNone(instance.get('a'))
+        self.assertEqual('value', instance.get('b'))
+        time.sleep(0.2)
+        self.assertIsNone(instance.get('b'))
+        self.assertEqual(0, len(instance))
+
+    def test_lru_eviction(self):
+        instance = self.new_cache(max_size=3)
+        for key in ('a', 'b', 'c'):
+            instance.set(key, key)
+            time.sleep(0.01)
+        instance.get('a')  # 'b' is now the least recently used one
+        time.sleep(0.01)
+        instance.set('d', 'd')
+        self.assertEqual(3, len(instance))
+        self.assertIsNone(instance.get('b'))
+        for key in ('a', 'c', 'd'):
+            self.assertEqual(key, instance.get(key))
+
+
+class TestLRUCache(CacheTestMixin, unittest.TestCase):
+
+    def new_cache(self, max_size=3):
+        return LRUCache(max_size)
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, LRUCache, 0)
+        self.assertRaises(AssertionError, LRUCache, 'test')
+
+
+class TestSQLiteCache(CacheTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.caches = []
+
+    def tearDown(self):
+        for c in self.caches:
+            c.close()
+        self.tmp.cleanup()
+
+    def new_cache(self, max_size=3):
+        result = SQLiteCache(os.path.join(self.tmp.name, 'cache.db'), max_size)
+        self.caches.append(result)
+        return result
+
+    def test_entries_survive_reopening(self):
+        instance = self.new_cache()
+        instance.set('a', 'value')
+        instance.close()
+        self.caches.remove(instance)
+        self.assertEqual('value', self.new_cache().get('a'))
+
+
+class TestShelveCache(CacheTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.caches = []
+
+    def tearDown(self):
+        for c in self.caches:
+            c.close()
+        self.tmp.cleanup()
+
+    def new_cache(self, max_size=3):
+        result = ShelveCache(os.path.join(self.tmp.name, 'cache'), max_size)
+        self.caches.append(result)
+        return result
+
+    def test_entries_survive_reopening(self):
+        instance = self.new_cache()
+        instance.set('a', 'value')
+        instance.set('b', 'value')
+        instance.close()
+        self.caches.remove(instance)
+        reopened = self.new_cache()
+        self.assertEqual(2, len(reopened))
+        self.assertEqual('value', reopened.get('a'))
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import bz2
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pyowm.commons import cityidregistry
+from pyowm.commons.cityidregistry import CityIDRegistry
+
+CITIES = [
+    (2643743, 'London', 'GB', None, 51.50853, -0.12574),
+    (6058560, 'London', 'CA', None, 42.983391, -81.23304),
+    (4298960, 'London', 'US', 'KY', 37.128979, -84.08326),
+    (3181928, 'Bologna', 'IT', None, 44.493809, 11.33875),
+    (6542283, 'Milano', 'IT', None, 45.464161, 9.19199),
+    (2643741, 'City of London', 'GB', None, 51.512791, -0.09184),
+    (4119617, 'London Mills', 'US', 'IL', 40.71, -90.26),
+    (3169070, 'Roma', 'IT', None, 41.894741, 12.4839),
+    (3038800, 'Abbans-Dessus', 'FR', None, 47.120548, 5.88188),
+    (2988507, 'Pâris', 'FR', None, 48.853409, 2.3488),
+    (9999999, '100%_Town', 'XX', None, 0.0, 0.0),
+    (2193733, 'Auckland', 'NZ', None, -36.848461, 174.763336),
+    (4034378, 'Apia', 'WS', None, -13.833333, -171.766663),
+]
+
+
+def make_compressed_db(folder):
+    db_path = os.path.join(folder, 'cities.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute('CREATE TABLE city (id integer NOT NULL PRIMARY KEY, city_id integer NOT NULL, name text NOT NULL, '
+                 'country text NOT NULL, state text, lat real NOT NULL, lon real NOT NULL)')
+    conn.executemany('INSERT INTO city (city_id, name, country, state, lat, lon) VALUES (?, ?, ?, ?, ?, ?)', CITIES)
+    conn.commit()
+    conn.close()
+    with open(db_path, 'rb') as src, bz2.open(db_path + '.bz2', 'wb') as dest:
+        dest.write(src.read())
+    os.remove(db_path)
+    return db_path + '.bz2'
+
+
+class TestCityIDRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = make_compressed_db(self.tmp.name)
+        self.cache_dir = os.path.join(self.tmp.name, 'cache')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_in_memory_registry(self):
+        instance = CityIDRegistry(self.db_path)
+        self.assertEqual([CITIES[0]], instance.ids_for('London', country='GB', matching='exact'))
+        self.assertEqual(5, len(instance.ids_for('lond')))
+        # no temp files are left around
+        self.assertEqual(['cities.db.bz2'], os.listdir(self.tmp.name))
+
+    def test_cached_registry(self):
+        instance = CityIDRegistry(self.db_path, cache_dir=self.cache_dir)
+        self.assertEqual([CITIES[3]], instance.ids_for('Bologna', matching='exact'))
+        self.assertEqual(5, len(instance.locations_for('London')))
+
+        # the DB is decompressed once into a versioned sub-folder
+        versions = os.listdir(self.cache_dir)
+        self.assertEqual(1, len(versions))
+        db_file = os.path.join(self.cache_dir, versions[0], cityidregistry.CITY_ID_DB_FILENAME)
+        self.assertEqual([cityidregistry.CITY_ID_DB_FILENAME], os.listdir(os.path.dirname(db_file)))
+        mtime = os.stat(db_file).st_mtime_ns
+        other = CityIDRegistry(self.db_path, cache_dir=self.cache_dir)
+        self.assertEqual(mtime, os.stat(db_file).st_mtime_ns)
+        self.assertEqual([CITIES[4]], other.ids_for('Milano', matching='exact'))
+
+        # the DB is opened read-only
+        with self.assertRaises(sqlite3.OperationalError):
+            instance.connection.execute('DELETE FROM city')
+
+    def test_cached_registry_can_be_used_from_many_threads(self):
+        instance = CityIDRegistry(self.db_path, cache_dir=self.cache_dir)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(instance.ids_for('London'))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(4, len(results))
+        self.assertTrue(all(len(r) == 5 for r in results))
+
+    def test_ids_for_matching_modes(self):
+        for instance in (CityIDRegistry(self.db_path), CityIDRegistry(self.db_path, cache_dir=self.cache_dir)):
+            # prefix: case-insensitive, shortest names first, wildcards are escaped
+            result = instance.ids_for('lond', matching='prefix')
+            self.assertEqual([2643743, 6058560, 4298960, 4119617], [r[0] for r in result])
+            self.assertEqual([], instance.ids_for('ondon', matching='prefix'))
+            self.assertEqual([], instance.ids_for('1%', matching='prefix'))
+            self.assertEqual([9999999], [r[0] for r in instance.ids_for('100%_', matching='prefix')])
+            self.assertEqual([4119617], [r[0] for r in instance.ids_for('London', 'US', 'IL', matching='prefix')])
+
+            # fts: any word of the name, diacritics-insensitive
+            result = instance.ids_for('lond', matching='fts')
+            self.assertEqual({2643743, 6058560, 4298960, 4119617, 2643741}, {r[0] for r in result})
+            self.assertEqual([2643741], [r[0] for r in instance.ids_for('city lon', matching='fts')])
+            self.assertEqual([2988507], [r[0] for r in instance.ids_for('paris', matching='fts')])
+            self.assertEqual([3038800], [r[0] for r in instance.ids_for('Dessus', matching='fts')])
+            self.assertEqual([], instance.ids_for('"*', matching='fts'))
+
+            # fuzzy: typos are tolerated, closest matches first
+            self.assertEqual([2643743], [r[0] for r in instance.ids_for('Lnodon', country='GB', matching='fuzzy')])
+            self.assertEqual([3181928], [r[0] for r in instance.ids_for('bolonga', matching='fuzzy')])
+            self.assertEqual([6542283], [r[0] for r in instance.ids_for('Milan', matching='fuzzy')])
+            self.assertEqual([3169070], [r[0] for r in instance.ids_for('Rma', matching='fuzzy')])
+            self.assertEqual([], instance.ids_for('Zzzzzzz', matching='fuzzy'))
+            # typos leaving no trigrams in common with the right name
+            self.assertEqual([2643743, 6058560, 4298960], [r[0] for r in instance.ids_for('Lodnon', matching='fuzzy')])
+            self.assertEqual([6542283], [r[0] for r in instance.ids_for('Mialno', matching='fuzzy')])
+            self.assertEqual([3181928], [r[0] for r in instance.ids_for('Bolgona', matching='fuzzy')])
+            self.assertEqual([6542283], [r[0] for r in instance.ids_for('Millano', matching='fuzzy')])
+
+    def test_indexes_are_built_when_needed(self):
+        instance = CityIDRegistry(self.db_path)
+
+        def tables():
+            return {row[0] for row in instance.connection.execute("SELECT name FROM sqlite_master")}
+
+        instance.ids_for('London', matching='exact')
+        self.assertNotIn('city_name_nocase', tables())
+        instance.ids_for('lond', matching='prefix')
+        self.assertIn('city_name_nocase', tables())
+        self.assertNotIn('city_fts', tables())
+        self.assertNotIn('city_trigram', tables())
+        instance.ids_for('lond', matching='fts')
+        self.assertIn('city_fts', tables())
+        self.assertNotIn('city_trigram', tables())
+
+    def test_fuzzy_matching_without_trigram_index(self):
+        instance = CityIDRegistry(self.db_path)
+        instance.ids_for('London', matching='fuzzy')  # builds the indexes
+        instance.connection.execute('DROP TABLE city_trigram')
+        self.assertEqual([2643743], [r[0] for r in instance.ids_for('Lnodon', country='GB', matching='fuzzy')])
+        self.assertEqual([3181928], [r[0] for r in instance.ids_for('bolonga', matching='fuzzy')])
+
+    def test_ids_for_with_limit(self):
+        instance = CityIDRegistry(self.db_path)
+        for matching in ('like', 'prefix', 'fts', 'fuzzy'):
+            self.assertEqual(2, len(instance.ids_for('London', matching=matching, limit=2)))
+        self.assertEqual(1, len(instance.locations_for('London', matching='exact', limit=1)))
+        self.assertEqual(1, len(instance.geopoints_for('London', matching='prefix', limit=1)))
+        self.assertRaises(ValueError, instance.ids_for, 'London', limit=0)
+        self.assertRaises(ValueError, instance.ids_for, 'London', limit='1')
+
+    def test_stale_cached_db_is_replaced(self):
+        # a cached DB without search indexes is replaced by an indexed one
+        instance = CityIDRegistry(self.db_path, cache_dir=self.cache_dir)
+        db_file = instance.connection.execute('PRAGMA database_list').fetchone()[2]
+        instance.connection.close()
+        conn = sqlite3.connect(db_file)
+        conn.execute('DROP TABLE city_fts')
+        conn.execute('DROP INDEX city_name_nocase')
+        conn.commit()
+        conn.close()
+        self.assertFalse(cityidregistry.has_search_indexes(sqlite3.connect(db_file)))
+        instance = CityIDRegistry(self.db_path, cache_dir=self.cache_dir)
+        self.assertTrue(cityidregistry.has_search_indexes(instance.connection))
+        self.assertEqual(1, len(instance.ids_for('bologna', matching='fts')))
+
+    def test_ids_for_many(self):
+        for instance in (CityIDRegistry(self.db_path), CityIDRegistry(self.db_path, cache_dir=self.cache_dir)):
+            queries = [('London', 'US', 'KY'), 'Milano', ('london',), ('London', 'GB'), None, ('Nowhere', None, None),
+                       ('London', 'CA', None), ('Roma', 'IT')]
+            result = instance.ids_for_many(queries)
+            self.assertEqual(len(queries), len(result))
+            for query, items in zip(queries, result):
+                if query is None:
+                    self.assertEqual([], items)
+                    continue
+                query = (query,) if isinstance(query, str) else query
+                self.assertEqual(instance.ids_for(*query, matching='exact'), items)
+
+            result = instance.ids_for_many(['lond', ('lond', 'US'), ('lond', 'US', 'IL')], matching='like')
+            self.assertEqual([5, 2, 1], [len(items) for items in result])
+            self.assertEqual(instance.ids_for('lond', 'US'), result[1])
+
+            # the temp table is emptied after each batch
+            self.assertEqual([[CITIES[4]]], instance.ids_for_many(['Milano']))
+            self.assertEqual([], instance.ids_for_many([]))
+            self.assertEqual([[]], instance.ids_for_many(['']))
+
+    def test_ids_for_many_fails_with_malformed_inputs(self):
+        instance = CityIDRegistry(self.db_path)
+        self.assertRaises(ValueError, instance.ids_for_many, ['London'], matching='fuzzy')
+        self.assertRaises(ValueError, instance.ids_for_many, [('London', 'GBR')])
+        self.assertRaises(ValueError, instance.ids_for_many, [('London', None, 'KY')])
+        self.assertRaises(ValueError, instance.ids_for_many, [('London', 'US', 'KY', 'extra')])
+
+    def test_locations_and_geopoints_for_many(self):
+        instance = CityIDRegistry(self.db_path)
+        locations = instance.locations_for_many([('Milano', 'IT'), 'Nowhere', 'London'])
+        self.assertEqual([1, 0, 3], [len(items) for items in locations])
+        self.assertEqual((6542283, 'Milano', 'IT', 9.19199, 45.464161),
+                         (locations[0][0].id, locations[0][0].name, locations[0][0].country, locations[0][0].lon,
+                          locations[0][0].lat))
+        geopoints = instance.geopoints_for_many([('Milano', 'IT'), 'Nowhere'])
+        self.assertEqual([locations[0][0].to_geopoint().to_dict()], [p.to_dict() for p in geopoints[0]])
+        self.assertEqual([], geopoints[1])
+
+    def test_within(self):
+        for instance in (CityIDRegistry(self.db_path), CityIDRegistry(self.db_path, cache_dir=self.cache_dir)):
+            # London GB and City of London, nearest first
+            result = instance.within(51.505, -0.125, 5)
+            self.assertEqual([2643743, 2643741], [r[0] for r in result])
+            self.assertEqual(CITIES[0], result[0])
+            self.assertEqual([], instance.within(0.5, 30.0, 10))
+            # across the 180th meridian
+            self.assertEqual([4034378], [r[0] for r in instance.within(-13.8, 179.5, 1000)])
+            # around a pole
+            self.assertEqual(len(CITIES), len(instance.within(90.0, 0.0, 21000)))
+            self.assertRaises(ValueError, instance.within, 91.0, 0.0, 10)
+            self.assertRaises(ValueError, instance.within, 0.0, 181.0, 10)
+            self.assertRaises(ValueError, instance.within, 0.0, 0.0, 0)
+
+    def test_nearest(self):
+        instance = CityIDRegistry(self.db_path)
+        self.assertEqual([2643743], [r[0] for r in instance.nearest(51.5, -0.12, k=1)])
+        self.assertEqual([3181928, 6542283, 3169070], [r[0] for r in instance.nearest(44.49, 11.34, k=3)])
+        # far away from all cities
+        self.assertEqual([9999999], [r[0] for r in instance.nearest(-60.0, 12.0, k=1)])
+        # fewer cities than requested
+        self.assertEqual(len(CITIES), len(instance.nearest(0.0, 0.0, k=100)))
+        self.assertRaises(ValueError, instance.nearest, 0.0, 0.0, 0)
+        self.assertRaises(ValueError, instance.nearest, -91.0, 0.0)
+
+    def test_spatial_lookups_build_the_spatial_index_only(self):
+        instance = CityIDRegistry(self.db_path)
+        instance.nearest(51.5, -0.12, k=1)
+        tables = {row[0] for row in instance.connection.execute("SELECT name FROM sqlite_master")}
+        self.assertTrue({'city_rtree', 'city_lat_lon'} & tables)
+        self.assertFalse({'city_name_nocase', 'city_fts', 'city_trigram'} & tables)
+
+    def test_spatial_lookups_without_rtree_index(self):
+        instance = CityIDRegistry(self.db_path)
+        instance.within(0.0, 0.0, 1)  # builds the indexes
+        instance.connection.execute('DROP TABLE city_rtree')
+        instance.connection.execute(cityidregistry.FALLBACK_SPATIAL_INDEX)
+        self.assertEqual([2643743, 2643741], [r[0] for r in instance.within(51.505, -0.125, 5)])
+        self.assertEqual([4034378], [r[0] for r in instance.within(-13.8, 179.5, 1000)])
+
+    def test_distance_km(self):
+        self.assertAlmostEqual(0., cityidregistry._distance_km(10., 10., 10., 10.))
+        # Milano - Bologna is about 200 km
+        self.assertAlmostEqual(200, cityidregistry._distance_km(*CITIES[4][4:], *CITIES[3][4:]), delta=10)
+
+    def test_edit_distance(self):
+        self.assertEqual(0, cityidregistry._edit_distance('london', 'london'))
+        self.assertEqual(1, cityidregistry._edit_distance('london', 'londn'))
+        self.assertEqual(1, cityidregistry._edit_distance('lnodon', 'london'))
+        self.assertEqual(2, cityidregistry._edit_distance('lnodn', 'london'))
+        self.assertEqual(1, cityidregistry._edit_distance('ab', 'ba'))
+        self.assertEqual(3, cityidregistry._edit_distance('', 'abc'))
+
+    def test_get_instance_is_a_singleton(self):
+        original_db_path = cityidregistry.CITY_ID_DB_PATH
+        original_instances = CityIDRegistry._instances
+        cityidregistry.CITY_ID_DB_PATH = self.db_path
+        CityIDRegistry._instances = dict()
+        try:
+            instance = CityIDRegistry.get_instance(cache_dir=self.cache_dir)
+            self.assertIs(instance, CityIDRegistry.get_instance(cache_dir=self.cache_dir))
+            in_memory = CityIDRegistry.get_instance()
+            self.assertIsNot(instance, in_memory)
+            self.assertIs(in_memory, CityIDRegistry.get_instance())
+        finally:
+            cityidregistry.CITY_ID_DB_PATH = original_db_path
+            CityIDRegistry._instances = original_instances
+
+
+if __name__ == "__main__":
+    unittest.main()
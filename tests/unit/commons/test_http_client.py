@@ -1,13 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
+import io
 import unittest
 import requests
 import json
 import pyowm.commons.exceptions
 from pyowm.config import DEFAULT_CONFIG
+from pyowm.commons.cache import LRUCache
+from pyowm.commons.rate_limiter import RateLimiter
 from pyowm.commons.enums import SubscriptionTypeEnum
-from pyowm.commons.http_client import HttpClient, HttpRequestBuilder
+from pyowm.commons.http_client import HttpClient, HttpRequestBuilder, new_session, DEFAULT_POOL_CONNECTIONS, \
+    DEFAULT_POOL_MAXSIZE
 
 
 class MyTestFailedException(Exception):
@@ -15,14 +20,46 @@ class MyTestFailedException(Exception):
 
 
 class MockResponse:
-    def __init__(self, status, payload):
+    def __init__(self, status, payload, headers=None):
         self.status_code = status
         self.text = payload
         self.content = payload
+        self.headers = headers if headers is not None else dict()
 
     def json(self):
         return json.loads(self.text)
 
+    def iter_content(self, chunk_size=1):
+        data = self.text.encode('utf-8')
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class MockStreamedResponse(MockResponse):
+    """
+    A successful response whose body can only be streamed: reading it at once fails the test
+    """
+    def __init__(self, status, payload, headers=None):
+        self.status_code = status
+        self.payload = payload
+        self.headers = headers if headers is not None else dict()
+
+    @property
+    def text(self):
+        raise MyTestFailedException('the body was read at once')
+
+    @property
+    def content(self):
+        raise MyTestFailedException('the body was read at once')
+
+    def iter_content(self, chunk_size=1):
+        data = self.payload.encode('utf-8')
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+
 
 class MockCache:
     def __init__(self, expected_back):
@@ -60,6 +97,92 @@ class TestHTTPClient(unittest.TestCase):
         self.assertEqual(json.loads(expected_data), data)
         requests.get = self.requests_original_get
 
+    def test_get_json_with_json_backend(self):
+        expected_data = '{"name": "james bond", "designation": "007"}'
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            resp = MockResponse(200, expected_data)
+            resp.content = expected_data.encode('utf-8')
+            return resp
+
+        requests.get = monkey_patched_get
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['json_backend']['decode_from_bytes'] = True
+        instance = HttpClient('apikey', config, 'anyurl.com')
+        self.assertTrue(instance.json_backend.decode_from_bytes)
+        status, data = instance.get_json('/resource')
+        self.assertEqual(json.loads(expected_data), data)
+        requests.get = self.requests_original_get
+
+    def test_stream_json_list(self):
+        expected_data = '{"cod": "200", "cnt": 3, "list": [{"id": 1}, {"id": 2}, {"id": 3}]}'
+        responses = []
+
+        def monkey_patched_get(uri, stream=False, params=None, headers=None, proxies=None, timeout=None,
+                               verify=False):
+            self.assertTrue(stream)
+            responses.append(MockResponse(200, expected_data))
+            return responses[-1]
+
+        requests.get = monkey_patched_get
+        status, stream = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').stream_json_list('/resource')
+        self.assertEqual(200, status)
+        self.assertEqual([{"id": 1}, {"id": 2}, {"id": 3}], list(stream))
+        self.assertEqual(dict(cod='200', cnt=3), stream.header)
+        self.assertTrue(responses[0].closed)
+        requests.get = self.requests_original_get
+
+    def test_stream_json_list_does_not_read_the_body_at_once(self):
+        def monkey_patched_get(uri, stream=False, params=None, headers=None, proxies=None, timeout=None,
+                               verify=False):
+            return MockStreamedResponse(200, '{"cod": "200", "cnt": 2, "list": [{"id": 1}, {"id": 2}]}')
+
+        requests.get = monkey_patched_get
+        try:
+            status, stream = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').stream_json_list('/resource')
+            self.assertEqual([{"id": 1}, {"id": 2}], list(stream))
+        finally:
+            requests.get = self.requests_original_get
+
+    def test_stream_json_list_with_cache(self):
+        calls = []
+        expected_data = '{"cod": "200", "cnt": 1, "list": [{"id": 1}]}'
+
+        def monkey_patched_get(uri, stream=False, params=None, headers=None, proxies=None, timeout=None,
+                               verify=False):
+            calls.append(uri)
+            return MockResponse(200, expected_data)
+
+        requests.get = monkey_patched_get
+        cache = LRUCache()
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', cache=cache)
+
+        # the response is cached only once the stream has been consumed
+        _, stream = instance.stream_json_list('group', params=dict(id='1'))
+        self.assertEqual(0, len(cache))
+        self.assertEqual([{"id": 1}], list(stream))
+        self.assertEqual(1, len(cache))
+        _, stream = instance.stream_json_list('group', params=dict(id='1'))
+        self.assertEqual([{"id": 1}], list(stream))
+        self.assertEqual(1, len(calls))
+
+        # cached responses are shared with get_json
+        _, data = instance.get_json('group', params=dict(id='1'))
+        self.assertEqual(json.loads(expected_data), data)
+        self.assertEqual(1, len(calls))
+        requests.get = self.requests_original_get
+
+    def test_stream_json_list_fails_with_http_errors(self):
+
+        def monkey_patched_get(uri, stream=False, params=None, headers=None, proxies=None, timeout=None,
+                               verify=False):
+            return MockResponse(401, '{"cod": 401}')
+
+        requests.get = monkey_patched_get
+        self.assertRaises(pyowm.commons.exceptions.UnauthorizedError,
+                          HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com').stream_json_list, '/resource')
+        requests.get = self.requests_original_get
+
     def test_get_json_parse_error(self):
 
         def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
@@ -155,6 +278,126 @@ class TestHTTPClient(unittest.TestCase):
         self.assertEqual(expected_data, data)
         requests.get = self.requests_original_get
 
+    def test_get_png_if_modified(self):
+        sent_headers = []
+
+        def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            sent_headers.append(headers)
+            if headers.get('If-None-Match') == '"abc"':
+                return MockResponse(304, b'')
+            return MockResponse(200, b'\x89PNG\r\n', headers={'ETag': '"abc"'})
+
+        requests.get = monkey_patched_get
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        status, data, headers = instance.get_png_if_modified('/resource')
+        self.assertEqual((200, b'\x89PNG\r\n', '"abc"'), (status, data, headers['ETag']))
+        self.assertNotIn('If-None-Match', sent_headers[0])
+        self.assertNotIn('If-Modified-Since', sent_headers[0])
+        status, data, headers = instance.get_png_if_modified('/resource', etag='"abc"',
+                                                             last_modified='Wed, 21 Oct 2015 07:28:00 GMT')
+        self.assertEqual((304, None), (status, data))
+        self.assertEqual('Wed, 21 Oct 2015 07:28:00 GMT', sent_headers[1]['If-Modified-Since'])
+        self.assertEqual('image/png', sent_headers[1]['Accept'])
+        requests.get = self.requests_original_get
+
+    def test_download_to(self):
+        sent_headers = []
+
+        def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            sent_headers.append(headers)
+            if 'Range' in headers:
+                return MockResponse(206, '67890')
+            return MockResponse(200, '1234567890')
+
+        requests.get = monkey_patched_get
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        target = io.BytesIO()
+        self.assertEqual((200, 10), instance.download_to('/resource', target, mime_type='image/png'))
+        self.assertEqual(b'1234567890', target.getvalue())
+        self.assertEqual('image/png', sent_headers[0]['Accept'])
+        self.assertNotIn('Range', sent_headers[0])
+
+        target = io.BytesIO(b'12345')
+        target.seek(5)
+        self.assertEqual((206, 10), instance.download_to('/resource', target, offset=5))
+        self.assertEqual(b'1234567890', target.getvalue())
+        self.assertEqual('bytes=5-', sent_headers[1]['Range'])
+        self.assertNotIn('If-Range', sent_headers[1])
+        requests.get = self.requests_original_get
+
+    def test_download_to_with_validators(self):
+        sent_headers = []
+        responses = []
+
+        def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            sent_headers.append(headers)
+            if 'Range' in headers:
+                return MockResponse(206, '67890', headers={'ETag': '"v1"'})
+            return MockResponse(200, '1234567890', headers={'ETag': '"v1"'})
+
+        requests.get = monkey_patched_get
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        target = io.BytesIO(b'12345')
+        target.seek(5)
+        result = instance.download_to('/resource', target, offset=5, if_range='"v1"',
+                                      on_response=lambda status, headers: responses.append((status, headers)))
+        self.assertEqual((206, 10), result)
+        self.assertEqual('"v1"', sent_headers[0]['If-Range'])
+        self.assertEqual([(206, {'ETag': '"v1"'})], responses)
+        # the validator is pointless when the whole data is requested
+        instance.download_to('/resource', io.BytesIO(), if_range='"v1"')
+        self.assertNotIn('If-Range', sent_headers[1])
+        requests.get = self.requests_original_get
+
+    def test_download_to_does_not_read_the_body_at_once(self):
+        def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            return MockStreamedResponse(200, '1234567890')
+
+        requests.get = monkey_patched_get
+        try:
+            instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+            target = io.BytesIO()
+            self.assertEqual((200, 10), instance.download_to('/resource', target))
+            self.assertEqual(b'1234567890', target.getvalue())
+        finally:
+            requests.get = self.requests_original_get
+
+    def test_download_to_when_range_is_not_honoured(self):
+        def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            return MockResponse(200, '1234567890')
+
+        requests.get = monkey_patched_get
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        target = io.BytesIO(b'xxxxxxxxxxxxxxxxxxxx')
+        target.seek(20)
+        self.assertEqual((200, 10), instance.download_to('/resource', target, offset=20))
+        self.assertEqual(b'1234567890', target.getvalue())
+        requests.get = self.requests_original_get
+
+    def test_download_to_when_nothing_is_left(self):
+        def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            return MockResponse(416, '')
+
+        requests.get = monkey_patched_get
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        target = io.BytesIO(b'1234567890')
+        target.seek(10)
+        self.assertEqual((416, 10), instance.download_to('/resource', target, offset=10))
+        self.assertEqual(b'1234567890', target.getvalue())
+        self.assertRaises(AssertionError, instance.download_to, '/resource', target, offset=-1)
+        requests.get = self.requests_original_get
+
+    def test_download_to_fails(self):
+        def monkey_patched_get(uri, stream=True, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            return MockResponse(404, '{"message": "not found"}')
+
+        requests.get = monkey_patched_get
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        target = io.BytesIO()
+        self.assertRaises(pyowm.commons.exceptions.NotFoundError, instance.download_to, '/resource', target)
+        self.assertEqual(b'', target.getvalue())
+        requests.get = self.requests_original_get
+
     def test_get_png_with_different_url_paths(self):
 
         # first case: path equals the metaimage URL
@@ -235,6 +478,94 @@ class TestHTTPClient(unittest.TestCase):
         except MyTestFailedException:
             self.fail()
 
+    def test_instantiation_with_shared_session(self):
+        session = requests.Session()
+        instance1 = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', session=session)
+        instance2 = HttpClient('apikey', DEFAULT_CONFIG, 'otherurl.com', admits_subdomains=False, session=session)
+        self.assertIs(session, instance1.http)
+        self.assertIs(session, instance2.http)
+
+    def test_new_session(self):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['connection']['pool_connections'] = 3
+        config['connection']['pool_maxsize'] = 7
+        config['connection']['max_retries'] = 2
+        session = new_session(config)
+        self.assertIsInstance(session, requests.Session)
+        adapter = session.get_adapter('https://api.openweathermap.org')
+        self.assertIs(adapter, session.get_adapter('http://api.openweathermap.org'))
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(7, adapter._pool_maxsize)
+        self.assertEqual(2, adapter.max_retries.total)
+
+        # pool settings are optional
+        del config['connection']['pool_connections']
+        del config['connection']['pool_maxsize']
+        config['connection']['max_retries'] = None
+        adapter = new_session(config).get_adapter('https://api.openweathermap.org')
+        self.assertEqual(DEFAULT_POOL_CONNECTIONS, adapter._pool_connections)
+        self.assertEqual(DEFAULT_POOL_MAXSIZE, adapter._pool_maxsize)
+        self.assertEqual(0, adapter.max_retries.total)
+
+    def test_get_json_with_cache(self):
+        calls = []
+        expected_data = '{"name": "james bond", "designation": "007"}'
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            calls.append(uri)
+            return MockResponse(200, expected_data)
+
+        requests.get = monkey_patched_get
+        cache = LRUCache()
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', cache=cache)
+        other_key_instance = HttpClient('otherkey', DEFAULT_CONFIG, 'anyurl.com', cache=cache)
+
+        # cacheable endpoint: the API is hit only once, also when using a different API key
+        _, data = instance.get_json('weather', params=dict(q='London'))
+        self.assertEqual(json.loads(expected_data), data)
+        _, data = other_key_instance.get_json('weather', params=dict(q='London'))
+        self.assertEqual(json.loads(expected_data), data)
+        self.assertEqual(1, len(calls))
+
+        # different params
+        instance.get_json('weather', params=dict(q='Rome'))
+        self.assertEqual(2, len(calls))
+
+        # non cacheable endpoint
+        instance.get_json('resource')
+        instance.get_json('resource')
+        self.assertEqual(4, len(calls))
+        self.assertEqual(2, len(cache))
+        requests.get = self.requests_original_get
+
+    def test_get_json_with_rate_limiter(self):
+        responses = [MockResponse(200, '{"a": 1}'), MockResponse(429, '', {'Retry-After': '30'})]
+
+        def monkey_patched_get(uri, params=None, headers=None, proxies=None, timeout=None, verify=False):
+            return responses.pop(0)
+
+        requests.get = monkey_patched_get
+        limiter = RateLimiter(60, mode='fail')
+        instance = HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com', rate_limiter=limiter)
+        _, data = instance.get_json('resource')
+        self.assertEqual(dict(a=1), data)
+        self.assertLess(limiter._buckets[0].tokens, 60)
+
+        # a 429 response makes the limiter hold back the next calls
+        self.assertRaises(pyowm.commons.exceptions.APIRequestError, instance.get_json, 'resource')
+        self.assertRaises(pyowm.commons.exceptions.RateLimitExceededError, instance.get_json, 'resource')
+        self.assertEqual(0, len(responses))
+        requests.get = self.requests_original_get
+
+    def test_new_session_does_not_retry_on_429_when_rate_limited(self):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['connection']['max_retries'] = 2
+        adapter = new_session(config).get_adapter('https://api.openweathermap.org')
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+        config['rate_limiting']['mode'] = 'block'
+        adapter = new_session(config).get_adapter('https://api.openweathermap.org')
+        self.assertNotIn(429, adapter.max_retries.status_forcelist)
+
     def test_repr(self):
         repr(HttpClient('apikey', DEFAULT_CONFIG, 'anyurl.com'))
 
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import unittest
+from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.image import Image, MappedImage
+
+
+class TestMappedImage(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'image.png')
+        with open(self.path, 'wb') as f:
+            f.write(b'\x89PNG\r\n1234567890')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_data_is_mapped_lazily(self):
+        instance = MappedImage(self.path, ImageTypeEnum.PNG)
+        self.assertIsInstance(instance, Image)
+        self.assertIsNone(instance._mmap)
+        self.assertEqual(16, instance.size)
+        self.assertEqual(b'\x89PNG', instance.data[:4])
+        self.assertEqual(b'\x89PNG\r\n1234567890', bytes(instance.data))
+        self.assertIs(instance.data, instance.data)
+        instance.close()
+        self.assertIsNone(instance._mmap)
+        self.assertEqual(16, len(instance.data))
+        instance.close()
+
+    def test_empty_file(self):
+        open(self.path, 'wb').close()
+        instance = MappedImage(self.path)
+        self.assertEqual(b'', instance.data)
+        self.assertEqual(0, instance.size)
+        instance.close()
+
+    def test_persist(self):
+        instance = MappedImage(self.path, ImageTypeEnum.PNG)
+        target = os.path.join(self.tmp_dir.name, 'copy.png')
+        instance.persist(target)
+        with open(target, 'rb') as f:
+            self.assertEqual(b'\x89PNG\r\n1234567890', f.read())
+
+    def test_failures(self):
+        self.assertRaises(AssertionError, MappedImage, 123)
+        self.assertRaises(AssertionError, MappedImage, self.path, 'png')
+
+    def test_repr(self):
+        repr(MappedImage(self.path))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import unittest
+from pyowm.commons import json_backend
+from pyowm.commons.exceptions import ConfigurationError
+from pyowm.commons.json_backend import JSONBackend, json_backend_from
+from pyowm.config import DEFAULT_CONFIG
+
+
+class MockResponse:
+    def __init__(self, payload):
+        self.text = payload
+        self.content = payload.encode('utf-8')
+
+
+class TestJSONBackend(unittest.TestCase):
+
+    payload = '{"name": "città", "temp": [280.15, 281.3], "rain": null}'
+
+    def test_stdlib_backend(self):
+        instance = JSONBackend()
+        self.assertEqual('json', instance.library)
+        self.assertFalse(instance.decode_from_bytes)
+        self.assertEqual(json.loads(self.payload), instance.loads(self.payload))
+        self.assertEqual(json.loads(self.payload), instance.loads(self.payload.encode('utf-8')))
+        self.assertEqual(json.loads(self.payload), json.loads(instance.dumps(json.loads(self.payload))))
+
+    @unittest.skipUnless(json_backend._is_installed('orjson'), 'orjson is not installed')
+    def test_orjson_backend(self):
+        instance = JSONBackend('orjson')
+        self.assertEqual(json.loads(self.payload), instance.loads(self.payload))
+        self.assertEqual(json.loads(self.payload), instance.loads(self.payload.encode('utf-8')))
+        result = instance.dumps(json.loads(self.payload))
+        self.assertIsInstance(result, str)
+        self.assertEqual(json.loads(self.payload), json.loads(result))
+
+    @unittest.skipUnless(json_backend._is_installed('msgspec'), 'msgspec is not installed')
+    def test_msgspec_backend(self):
+        instance = JSONBackend('msgspec')
+        self.assertEqual(json.loads(self.payload), instance.loads(self.payload.encode('utf-8')))
+        self.assertEqual(json.loads(self.payload), json.loads(instance.dumps(json.loads(self.payload))))
+
+    @unittest.skipUnless(json_backend._is_installed('ujson'), 'ujson is not installed')
+    def test_ujson_backend(self):
+        instance = JSONBackend('ujson')
+        self.assertEqual(json.loads(self.payload), instance.loads(self.payload))
+        self.assertEqual(json.loads(self.payload), json.loads(instance.dumps(json.loads(self.payload))))
+
+    def test_auto_picks_the_fastest_installed_library(self):
+        expected = next(lib for lib in json_backend.AUTO_PREFERENCE if json_backend._is_installed(lib))
+        self.assertEqual(expected, JSONBackend('auto').library)
+
+    def test_failures(self):
+        self.assertRaises(ConfigurationError, JSONBackend, 'simdjson')
+        self.assertRaises(AssertionError, JSONBackend, 'json', 'yes')
+        missing = [lib for lib in json_backend.LIBRARIES if not json_backend._is_installed(lib)]
+        for library in missing:
+            self.assertRaises(ImportError, JSONBackend, library)
+
+    def test_decode_response(self):
+        resp = MockResponse(self.payload)
+        self.assertEqual(json.loads(self.payload), JSONBackend().decode_response(resp))
+        resp.text = None
+        self.assertEqual(json.loads(self.payload), JSONBackend(decode_from_bytes=True).decode_response(resp))
+
+    def test_json_backend_from(self):
+        self.assertIsNone(json_backend_from(DEFAULT_CONFIG))
+        self.assertIsNone(json_backend_from(dict()))
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['json_backend']['decode_from_bytes'] = True
+        result = json_backend_from(config)
+        self.assertEqual('json', result.library)
+        self.assertTrue(result.decode_from_bytes)
+        config['json_backend'] = dict(library='auto')
+        result = json_backend_from(config)
+        self.assertIsInstance(result, JSONBackend)
+        self.assertFalse(result.decode_from_bytes)
+        config['json_backend'] = dict(library='simdjson')
+        self.assertRaises(ConfigurationError, json_backend_from, config)
+
+    def test_repr(self):
+        repr(JSONBackend())
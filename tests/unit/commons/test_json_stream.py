@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+from pyowm.commons.exceptions import ParseAPIResponseError
+from pyowm.commons.json_stream import JSONListStream
+from tests.unit.weatherapi30.json_test_responses import SEARCH_RESULTS_JSON, WEATHER_AT_PLACES_IN_BBOX_JSON
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestJSONListStream(unittest.TestCase):
+
+    def test_items_are_the_same_whatever_the_chunking(self):
+        for payload in (SEARCH_RESULTS_JSON, WEATHER_AT_PLACES_IN_BBOX_JSON):
+            expected = json.loads(payload)
+            data = payload.encode('utf-8')
+            for size in (1, 2, 3, 7, 64, 4096, len(data)):
+                stream = JSONListStream(chunked(data, size))
+                self.assertEqual(expected['list'], list(stream))
+                self.assertTrue(stream.found)
+                self.assertEqual({k: v for k, v in expected.items() if k != 'list'}, stream.header)
+
+    def test_text_chunks(self):
+        payload = '{"cod": "200", "list": [1, 2.5, "tre", null, [4], {"cinque": true}], "cnt": 6}'
+        stream = JSONListStream(chunked(payload, 3))
+        self.assertEqual([1, 2.5, 'tre', None, [4], {'cinque': True}], list(stream))
+        self.assertEqual({'cod': '200', 'cnt': 6}, stream.header)
+
+    def test_multibyte_characters_split_among_chunks(self):
+        payload = '{"list": [{"name": "Città di Castello"}, {"name": "Москва"}]}'.encode('utf-8')
+        result = list(JSONListStream(chunked(payload, 1)))
+        self.assertEqual(['Città di Castello', 'Москва'], [item['name'] for item in result])
+
+    def test_numbers_split_among_chunks(self):
+        result = list(JSONListStream([b'{"list": [12', b'345, 6', b'7.', b'89]}']))
+        self.assertEqual([12345, 67.89], result)
+
+    def test_items_are_yielded_before_the_data_is_over(self):
+        def chunks():
+            yield b'{"cnt": 2, "list": [{"id": 1}, '
+            raise AssertionError('the first item should have been yielded before reading here')
+
+        stream = iter(JSONListStream(chunks()))
+        self.assertEqual({'id': 1}, next(stream))
+
+    def test_no_list(self):
+        stream = JSONListStream([b'{"cod": "404", "message": "not found"}'])
+        self.assertEqual([], list(stream))
+        self.assertFalse(stream.found)
+        self.assertEqual({'cod': '404', 'message': 'not found'}, stream.header)
+
+        stream = JSONListStream([b'{"cnt": 0, "list": []}'])
+        self.assertEqual([], list(stream))
+        self.assertTrue(stream.found)
+
+        self.assertEqual([], list(JSONListStream([b' { } '])))
+
+    def test_custom_key(self):
+        stream = JSONListStream([b'{"list": "not me", "data": [1, 2]}'], key='data')
+        self.assertEqual([1, 2], list(stream))
+        self.assertEqual({'list': 'not me'}, stream.header)
+
+    def test_malformed_data(self):
+        for payload in (b'', b'[1, 2]', b'{"list": [1, 2}', b'{"list": [1, 2]', b'{"list": [1 2]}',
+                        b'{"list": [1, 2]} trailing', b'{3: "a"}', b'{"list": [{"a": }]}', b'{} {}'):
+            self.assertRaises(ParseAPIResponseError, list, JSONListStream([payload]))
+
+    def test_can_be_iterated_only_once(self):
+        stream = JSONListStream([b'{"list": [1]}'])
+        list(stream)
+        self.assertRaises(RuntimeError, list, stream)
+
+    def test_repr(self):
+        repr(JSONListStream([]))
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import copy
+import threading
+import time
+import unittest
+from pyowm.commons import rate_limiter
+from pyowm.commons.enums import SubscriptionTypeEnum
+from pyowm.commons.exceptions import ConfigurationError, RateLimitExceededError
+from pyowm.commons.rate_limiter import RateLimiter, TokenBucket
+from pyowm.config import DEFAULT_CONFIG
+
+
+def drain(limiter):
+    for bucket in limiter._buckets:
+        bucket.tokens = 0.
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, TokenBucket, 0, 60)
+        self.assertRaises(AssertionError, TokenBucket, 10, 0)
+
+    def test_wait_time(self):
+        instance = TokenBucket(60, 60)
+        now = time.monotonic()
+        self.assertEqual(0., instance.wait_time(now))
+        instance.tokens = 0.
+        self.assertAlmostEqual(1., instance.wait_time(now), places=3)
+        self.assertAlmostEqual(0.5, instance.wait_time(now + 0.5), places=3)
+        self.assertEqual(0., instance.wait_time(now + 1))
+        instance.take()
+        instance.take()
+        self.assertAlmostEqual(2., instance.wait_time(now + 1), places=3)
+        # never refills over capacity
+        instance.wait_time(now + 3600)
+        self.assertEqual(60, instance.tokens)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_instantiation(self):
+        self.assertRaises(AssertionError, RateLimiter, 0)
+        self.assertRaises(AssertionError, RateLimiter, 60, 0)
+        self.assertRaises(AssertionError, RateLimiter, 60, max_wait_secs=-1)
+        self.assertRaises(ValueError, RateLimiter, 60, mode='unknown')
+        self.assertEqual(1, len(RateLimiter(60)._buckets))
+        self.assertEqual(2, len(RateLimiter(60, 1000)._buckets))
+
+    def test_acquire_takes_tokens_from_all_buckets(self):
+        instance = RateLimiter(60, 1000)
+        instance.acquire()
+        instance.acquire()
+        self.assertLess(instance._buckets[0].tokens, 59)
+        self.assertLess(instance._buckets[1].tokens, 999)
+
+    def test_acquire_in_fail_mode(self):
+        instance = RateLimiter(60, 1000, mode='fail')
+        instance.acquire()
+        drain(instance)
+        self.assertRaises(RateLimitExceededError, instance.acquire)
+
+    def test_acquire_in_block_mode(self):
+        instance = RateLimiter(6000)
+        drain(instance)
+        started_at = time.monotonic()
+        instance.acquire()
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.005)
+
+    def test_acquire_with_max_wait(self):
+        instance = RateLimiter(60, mode='block', max_wait_secs=0.1)
+        drain(instance)
+        self.assertRaises(RateLimitExceededError, instance.acquire)
+        instance = RateLimiter(60, mode='queue', max_wait_secs=0.1)
+        drain(instance)
+        self.assertRaises(RateLimitExceededError, instance.acquire)
+
+    def test_queue_mode_reserves_tokens_in_order(self):
+        instance = RateLimiter(60, mode='queue')
+        drain(instance)
+        now = time.monotonic()
+        waits = [instance._reserve(now) for _ in range(3)]
+        self.assertTrue(all(reserved for _, reserved in waits))
+        self.assertLess(waits[0][0], waits[1][0])
+        self.assertLess(waits[1][0], waits[2][0])
+        self.assertAlmostEqual(3., waits[2][0], places=1)
+
+    def test_block_mode_does_not_reserve_tokens(self):
+        instance = RateLimiter(60, mode='block')
+        drain(instance)
+        wait, reserved = instance._reserve(time.monotonic())
+        self.assertGreater(wait, 0)
+        self.assertFalse(reserved)
+
+    def test_acquire_is_thread_safe(self):
+        instance = RateLimiter(100, mode='fail')
+        results = []
+
+        def worker():
+            for _ in range(50):
+                try:
+                    instance.acquire()
+                    results.append(True)
+                except RateLimitExceededError:
+                    results.append(False)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # only a negligible amount of tokens can be refilled while the test runs
+        self.assertGreaterEqual(results.count(True), 100)
+        self.assertLessEqual(results.count(True), 102)
+
+    def test_acquire_async(self):
+        instance = RateLimiter(6000)
+        drain(instance)
+        started_at = time.monotonic()
+        asyncio.run(instance.acquire_async())
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.005)
+        drain(instance)
+        instance.mode = 'fail'
+        self.assertRaises(RateLimitExceededError, asyncio.run, instance.acquire_async())
+
+    def test_throttle(self):
+        instance = RateLimiter(60, mode='fail')
+        instance.throttle(10)
+        self.assertRaises(RateLimitExceededError, instance.acquire)
+        instance = RateLimiter(60, mode='fail')
+        instance.throttle(0)
+        instance.acquire()
+
+    def test_repr(self):
+        repr(RateLimiter(60))
+        repr(TokenBucket(60, 60))
+
+
+class TestRateLimiterFunctions(unittest.TestCase):
+
+    def test_retry_after_secs(self):
+        self.assertEqual(30., rate_limiter.retry_after_secs({'Retry-After': '30'}))
+        self.assertEqual(0., rate_limiter.retry_after_secs({'Retry-After': '-1'}))
+        self.assertIsNone(rate_limiter.retry_after_secs({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}))
+        self.assertIsNone(rate_limiter.retry_after_secs(dict()))
+        self.assertIsNone(rate_limiter.retry_after_secs(None))
+
+    def test_rate_limiter_from(self):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        self.assertIsNone(rate_limiter.rate_limiter_from(config))
+        self.assertIsNone(rate_limiter.rate_limiter_from(dict()))
+
+        # budgets default to the subscription type ones
+        config['rate_limiting']['mode'] = 'queue'
+        result = rate_limiter.rate_limiter_from(config)
+        self.assertIsInstance(result, RateLimiter)
+        self.assertEqual('queue', result.mode)
+        self.assertEqual(rate_limiter.SUBSCRIPTION_BUDGETS['free'], (result.calls_per_minute, result.calls_per_day))
+        config['subscription_type'] = SubscriptionTypeEnum.DEVELOPER
+        result = rate_limiter.rate_limiter_from(config)
+        self.assertEqual(rate_limiter.SUBSCRIPTION_BUDGETS['developer'],
+                         (result.calls_per_minute, result.calls_per_day))
+
+        # explicit budgets
+        config['rate_limiting']['calls_per_minute'] = 10
+        config['rate_limiting']['calls_per_day'] = 100
+        config['rate_limiting']['max_wait_secs'] = 5
+        result = rate_limiter.rate_limiter_from(config)
+        self.assertEqual((10, 100, 5), (result.calls_per_minute, result.calls_per_day, result.max_wait_secs))
+        del config['subscription_type']
+        self.assertIsInstance(rate_limiter.rate_limiter_from(config), RateLimiter)
+
+        # errors
+        config['rate_limiting']['calls_per_day'] = None
+        self.assertRaises(ConfigurationError, rate_limiter.rate_limiter_from, config)
+        config['rate_limiting']['mode'] = 'unknown'
+        self.assertRaises(ConfigurationError, rate_limiter.rate_limiter_from, config)
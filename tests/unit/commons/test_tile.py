@@ -21,5 +21,25 @@ class TestTile(unittest.TestCase):
         result = instance.bounding_polygon()
         self.assertIsInstance(result, Polygon)
 
+    def test_tiles_coords_for_bbox(self):
+        self.assertEqual([(0, 0)], Tile.tiles_coords_for_bbox(-180, -90, 180, 90, 0))
+        self.assertEqual([(0, 0), (1, 0), (0, 1), (1, 1)], Tile.tiles_coords_for_bbox(-180, -90, 180, 90, 1))
+        self.assertEqual([(1, 0)], Tile.tiles_coords_for_bbox(10, 10, 20, 20, 1))
+        result = Tile.tiles_coords_for_bbox(12.3, 41.7, 12.7, 42.1, 4)
+        self.assertEqual(1, len(result))
+        x, y = result[0]
+        lon_left, lat_bottom, lon_right, lat_top = Tile.tile_coords_to_bbox(x, y, 4)
+        self.assertTrue(lon_left <= 12.3 and 12.7 <= lon_right and lat_bottom <= 41.7 and 42.1 <= lat_top)
+        self.assertEqual(9, len(Tile.tiles_coords_for_bbox(6.6, 36.6, 18.5, 47.1, 6)))
+        self.assertRaises(ValueError, Tile.tiles_coords_for_bbox, 20, 10, 10, 20, 1)
+        self.assertRaises(ValueError, Tile.tiles_coords_for_bbox, 10, 20, 20, 10, 1)
+
+    def test_tiles_count_for_bbox(self):
+        self.assertEqual(1, Tile.tiles_count_for_bbox(-180, -90, 180, 90, 0))
+        self.assertEqual(4, Tile.tiles_count_for_bbox(-180, -90, 180, 90, 1))
+        self.assertEqual(9, Tile.tiles_count_for_bbox(6.6, 36.6, 18.5, 47.1, 6))
+        self.assertEqual(4 ** 18, Tile.tiles_count_for_bbox(-180, -90, 180, 90, 18))
+        self.assertRaises(ValueError, Tile.tiles_count_for_bbox, 20, 10, 10, 20, 1)
+
     def test_repr(self):
         repr(Tile(0, 0, 18, 'temperature', Image(b'x/1')))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.constants import GEOCODING_API_VERSION
+from pyowm.geocodingapi10.async_geocoding_manager import AsyncGeocodingManager
+from pyowm.weatherapi30.location import Location
+
+LOCATIONS_JSON = '[{"name":"London","lat":51.5085,"lon":-0.1257,"country":"GB"},' \
+                 '{"name":"London","lat":39.8865,"lon":-83.4483,"country":"US","state":"OH"}]'
+
+
+class MockAsyncHttpClient(AsyncHttpClient):
+
+    def __init__(self, json_text):
+        super().__init__('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        self.json_text = json_text
+        self.requests = []
+
+    async def get_json(self, uri, params=None, headers=None):
+        self.requests.append((uri, params))
+        return 200, json.loads(self.json_text)
+
+
+class TestAsyncGeocodingManager(unittest.IsolatedAsyncioTestCase):
+
+    def _instance(self):
+        instance = AsyncGeocodingManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client = MockAsyncHttpClient(LOCATIONS_JSON)
+        return instance
+
+    def test_get_geocoding_api_version(self):
+        result = AsyncGeocodingManager('fakeapikey', DEFAULT_CONFIG).geocoding_api_version()
+        self.assertEqual(GEOCODING_API_VERSION, result)
+
+    async def test_geocode(self):
+        instance = self._instance()
+        result = await instance.geocode('London', country='US', state_code='OH', limit=2)
+        self.assertEqual(2, len(result))
+        self.assertTrue(all(isinstance(item, Location) for item in result))
+        self.assertEqual(dict(q='London,OH,US', limit=2), instance.http_client.requests[0][1])
+        with self.assertRaises(ValueError):
+            await instance.geocode('London', country='USA')
+
+    async def test_reverse_geocode(self):
+        instance = self._instance()
+        result = await instance.reverse_geocode(51.5085, -0.1257)
+        self.assertTrue(all(isinstance(item, Location) for item in result))
+        with self.assertRaises(ValueError):
+            await instance.reverse_geocode(200, -0.1257)
+
+    def test_repr(self):
+        repr(AsyncGeocodingManager('fakeapikey', DEFAULT_CONFIG))
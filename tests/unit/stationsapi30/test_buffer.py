@@ -6,7 +6,7 @@ import json
 from copy import deepcopy
 from datetime import datetime as dt
 from pyowm.stationsapi30.measurement import Measurement
-from pyowm.stationsapi30.buffer import Buffer
+from pyowm.stationsapi30.buffer import Buffer, SortedBuffer
 from pyowm.utils.formatting import to_date, to_ISO8601
 
 
@@ -140,3 +140,120 @@ class TestBuffer(unittest.TestCase):
         buf = Buffer(self.station_id)
         buf.append(self.m2)
         str(buf)
+
+
+class TestSortedBuffer(unittest.TestCase):
+
+    station_id = 'mytest'
+
+    def msmt(self, ts, temperature=None):
+        return Measurement(self.station_id, ts, temperature=temperature)
+
+    def test_instantiation(self):
+        buf = SortedBuffer(self.station_id)
+        self.assertIsInstance(buf, Buffer)
+        self.assertEqual('last', buf.keep)
+        self.assertRaises(ValueError, SortedBuffer, self.station_id, keep='any')
+        self.assertRaises(AssertionError, SortedBuffer, None)
+
+    def test_append_keeps_chronological_order(self):
+        buf = SortedBuffer(self.station_id)
+        for ts in [50, 10, 30, 60, 20, 40]:
+            buf.append(self.msmt(ts))
+        self.assertEqual([10, 20, 30, 40, 50, 60], [m.timestamp for m in buf])
+        self.assertEqual([60, 50, 40, 30, 20, 10], [m.timestamp for m in reversed(buf)])
+        buf.sort_chronologically()
+        self.assertEqual(6, len(buf))
+        self.assertRaises(ValueError, buf.sort_reverse_chronologically)
+        self.assertRaises(AssertionError, buf.append, 'not_a_measurement')
+        self.assertRaises(AssertionError, buf.append, Measurement('another_id', 10))
+
+        buf.append_from_dict(dict(station_id=self.station_id, timestamp=15))
+        self.assertEqual(15, buf.measurements[1].timestamp)
+
+    def test_duplicates(self):
+        buf = SortedBuffer(self.station_id)
+        buf.append(self.msmt(10, 1))
+        buf.append(self.msmt(20, 1))
+        buf.append(self.msmt(10, 2))
+        buf.append(self.msmt(20, 2))
+        self.assertEqual([(10, 2), (20, 2)], [(m.timestamp, m.temperature) for m in buf])
+
+        buf = SortedBuffer(self.station_id, keep='first')
+        buf.append(self.msmt(10, 1))
+        buf.append(self.msmt(20, 1))
+        buf.append(self.msmt(10, 2))
+        buf.append(self.msmt(20, 2))
+        self.assertEqual([(10, 1), (20, 1)], [(m.timestamp, m.temperature) for m in buf])
+
+    def test_lookups(self):
+        buf = SortedBuffer(self.station_id)
+        for ts in range(0, 100, 10):
+            buf.append(self.msmt(ts))
+        self.assertEqual(30, buf.get(30).timestamp)
+        self.assertIsNone(buf.get(35))
+        self.assertIsNone(buf.get(1000))
+        self.assertTrue(self.msmt(30) in buf)
+        self.assertFalse(self.msmt(35) in buf)
+        self.assertFalse(Measurement('another_id', 30) in buf)
+        self.assertEqual([30, 40, 50], [m.timestamp for m in buf.between(25, 50)])
+        self.assertEqual([80, 90], [m.timestamp for m in buf.between(from_timestamp=80)])
+        self.assertEqual([0], [m.timestamp for m in buf.between(to_timestamp=5)])
+        self.assertEqual([], buf.between(91, 1000))
+
+        buf.empty()
+        self.assertEqual(0, len(buf))
+        self.assertIsNone(buf.get(30))
+        buf.append(self.msmt(5))
+        self.assertEqual([5], [m.timestamp for m in buf])
+
+    def test_add_and_extend(self):
+        buf1 = SortedBuffer(self.station_id)
+        buf2 = SortedBuffer(self.station_id)
+        for ts in [10, 30, 50]:
+            buf1.append(self.msmt(ts, 1))
+        for ts in [20, 30, 40]:
+            buf2.append(self.msmt(ts, 2))
+        result = buf1 + buf2
+        self.assertIsInstance(result, SortedBuffer)
+        self.assertEqual([(10, 1), (20, 2), (30, 2), (40, 2), (50, 1)], [(m.timestamp, m.temperature) for m in result])
+        self.assertIs(buf1.measurements[0], result.measurements[0])
+        self.assertEqual(3, len(buf1))
+        self.assertEqual(buf1.created_at, result.created_at)
+
+        # plain buffers and iterables are merged too
+        plain = Buffer(self.station_id)
+        plain.append(self.msmt(60))
+        plain.append(self.msmt(0))
+        buf1 += plain
+        self.assertEqual([0, 10, 30, 50, 60], [m.timestamp for m in buf1])
+        buf1.extend([self.msmt(5)])
+        self.assertEqual([0, 5, 10, 30, 50, 60], [m.timestamp for m in buf1])
+        self.assertEqual(5, buf1.get(5).timestamp)
+
+        with self.assertRaises(AssertionError):
+            buf1.extend([Measurement('another_id', 1)])
+
+        # sorted buffers can be added to plain buffers
+        self.assertEqual(5, len(plain + buf2))
+
+    def test_merge(self):
+        buffers = []
+        for minute in range(60):
+            buf = SortedBuffer(self.station_id)
+            for second in range(0, 60, 10):
+                buf.append(self.msmt(minute * 60 + second, minute))
+            buffers.append(buf)
+        # overlaps with the first minute
+        plain = Buffer(self.station_id)
+        plain.append(self.msmt(10, 'dup'))
+        buffers.append(plain)
+
+        result = SortedBuffer.merge(buffers)
+        self.assertEqual(360, len(result))
+        self.assertEqual(sorted(m.timestamp for m in result), [m.timestamp for m in result])
+        self.assertEqual('dup', result.get(10).temperature)
+        self.assertEqual(0, SortedBuffer.merge(buffers, keep='first').get(10).temperature)
+
+        self.assertEqual(0, len(SortedBuffer.merge([], station_id=self.station_id)))
+        self.assertRaises(ValueError, SortedBuffer.merge, [])
@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import threading
+import unittest
+from pyowm.commons.exceptions import APIRequestError
+from pyowm.stationsapi30.buffer import Buffer
+from pyowm.stationsapi30.durable_buffer import DurableBuffer
+from pyowm.stationsapi30.measurement import Measurement
+
+
+class MockStationsManager:
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+        self.sent = threading.Event()
+
+    def send_measurements(self, list_of_measurements):
+        if self.failures > 0:
+            self.failures -= 1
+            raise APIRequestError('service unavailable')
+        self.batches.append(list_of_measurements)
+        self.sent.set()
+
+
+def measurements(n, station_id='mytest'):
+    return [Measurement(station_id, 1378459200 + i, temperature=20.0 + i, humidity=50 + i) for i in range(n)]
+
+
+class TestDurableBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'buffer.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_instantiation_fails_with_wrong_arguments(self):
+        mgr = MockStationsManager()
+        self.assertRaises(AssertionError, DurableBuffer, None, mgr)
+        self.assertRaises(AssertionError, DurableBuffer, self.path, None)
+        self.assertRaises(AssertionError, DurableBuffer, self.path, mgr, batch_size=0)
+        self.assertRaises(AssertionError, DurableBuffer, self.path, mgr, max_age_secs=-1)
+        self.assertRaises(AssertionError, DurableBuffer, self.path, mgr, backoff_secs=0)
+        self.assertRaises(AssertionError, DurableBuffer, self.path, mgr, backoff_secs=10, max_backoff_secs=5)
+        self.assertRaises(AssertionError, DurableBuffer, self.path, mgr, on_error='not-callable')
+
+    def test_append_and_flush(self):
+        mgr = MockStationsManager()
+        instance = DurableBuffer(self.path, mgr, batch_size=2)
+        msmts = measurements(5)
+        instance.append(msmts[0])
+        buf = Buffer('mytest')
+        for m in msmts[1:]:
+            buf.append(m)
+        instance.extend(buf)
+        instance.extend([])
+        self.assertEqual(5, len(instance))
+        self.assertEqual([m.to_dict() for m in msmts], [m.to_dict() for m in instance.pending()])
+        self.assertRaises(AssertionError, instance.append, 'not-a-measurement')
+        self.assertEqual(5, len(instance))
+
+        self.assertEqual(5, instance.flush())
+        self.assertEqual([2, 2, 1], [len(batch) for batch in mgr.batches])
+        self.assertEqual([m.to_dict() for m in msmts], [m.to_dict() for batch in mgr.batches for m in batch])
+        self.assertEqual(0, len(instance))
+        self.assertEqual(0, instance.flush())
+        instance.close()
+
+    def test_pending_measurements_survive_reopening(self):
+        instance = DurableBuffer(self.path, MockStationsManager())
+        instance.extend(measurements(3))
+        instance.close()
+
+        mgr = MockStationsManager()
+        instance = DurableBuffer(self.path, mgr)
+        self.assertEqual(3, len(instance))
+        self.assertEqual(3, instance.flush())
+        instance.close()
+
+    def test_failed_batches_are_kept(self):
+        mgr = MockStationsManager(failures=1)
+        instance = DurableBuffer(self.path, mgr)
+        instance.extend(measurements(3))
+        self.assertRaises(APIRequestError, instance.flush)
+        self.assertEqual(3, len(instance))
+        self.assertEqual(3, instance.flush())
+        instance.close()
+
+    def test_flusher_sends_full_batches(self):
+        mgr = MockStationsManager()
+        instance = DurableBuffer(self.path, mgr, batch_size=3, max_age_secs=60)
+        with instance:
+            self.assertTrue(instance.running)
+            instance.extend(measurements(3))
+            self.assertTrue(mgr.sent.wait(5))
+        self.assertFalse(instance.running)
+        self.assertEqual(1, len(mgr.batches))
+        self.assertEqual(0, len(instance))
+        instance.close()
+
+    def test_flusher_sends_old_measurements(self):
+        mgr = MockStationsManager()
+        instance = DurableBuffer(self.path, mgr, batch_size=100, max_age_secs=0.05)
+        instance.start()
+        self.assertRaises(RuntimeError, instance.start)
+        instance.append(measurements(1)[0])
+        self.assertTrue(mgr.sent.wait(5))
+        instance.stop()
+        self.assertEqual(1, len(mgr.batches))
+        instance.close()
+
+    def test_flusher_retries_failed_batches(self):
+        mgr = MockStationsManager(failures=2)
+        errors = []
+        instance = DurableBuffer(self.path, mgr, batch_size=1, backoff_secs=0.01, max_backoff_secs=0.02,
+                                 on_error=errors.append)
+        instance.start()
+        instance.append(measurements(1)[0])
+        self.assertTrue(mgr.sent.wait(5))
+        instance.stop()
+        self.assertEqual(2, len(errors))
+        self.assertIsInstance(instance.last_error, APIRequestError)
+        self.assertEqual(1, len(mgr.batches))
+        self.assertEqual(0, len(instance))
+        instance.close()
+
+    def test_stop_without_flushing(self):
+        mgr = MockStationsManager()
+        instance = DurableBuffer(self.path, mgr, max_age_secs=60, synchronous_commits=True)
+        instance.start()
+        instance.extend(measurements(2))
+        instance.stop(flush=False)
+        self.assertEqual([], mgr.batches)
+        self.assertEqual(2, len(instance))
+        instance.close()
+
+    def test_repr(self):
+        instance = DurableBuffer(self.path, MockStationsManager())
+        repr(instance)
+        instance.close()
@@ -6,7 +6,9 @@ import json
 import unittest
 from datetime import datetime as dt
 import pyowm.commons.exceptions
-from pyowm.stationsapi30.measurement import AggregatedMeasurement, Measurement
+from pyowm.commons.json_backend import JSONBackend
+from pyowm.stationsapi30.measurement import AggregatedMeasurement, Measurement, FrozenAggregatedMeasurement, \
+    FrozenMeasurement
 
 
 class TestAggregatedMeasurement(unittest.TestCase):
@@ -115,6 +117,13 @@ class TestAggregatedMeasurement(unittest.TestCase):
         self.assertTrue(all(item in result_dict.items()
                             for item in expected_dict.items()))
 
+    def test_frozen_variant(self):
+        d = self._test_instance.to_dict()
+        result = FrozenAggregatedMeasurement(d['station_id'], d['timestamp'], d['aggregated_on'], temp=d['temp'])
+        self.assertIsInstance(result, AggregatedMeasurement)
+        self.assertFalse(hasattr(result, '__dict__'))
+        self.assertRaises(AttributeError, setattr, result, 'timestamp', 123)
+
 
 class TestMeasurement(unittest.TestCase):
 
@@ -200,6 +209,17 @@ class TestMeasurement(unittest.TestCase):
         self.assertTrue(all(item in result_dict.items()
                             for item in expected_dict.items()))
 
+    def test_to_JSON_with_json_backend(self):
+        expected = json.loads(self._test_instance.to_JSON())
+        result = json.loads(self._test_instance.to_JSON(JSONBackend()))
+        self.assertEqual(expected, result)
+
     def test_repr(self):
         str(self._test_instance)
 
+    def test_frozen_variant(self):
+        result = FrozenMeasurement.from_dict(self._test_instance.to_dict())
+        self.assertIsInstance(result, FrozenMeasurement)
+        self.assertEqual(self._test_instance.to_dict(), result.to_dict())
+        self.assertFalse(hasattr(self._test_instance, '__dict__'))
+        self.assertRaises(AttributeError, setattr, result, 'humidex', 10)
@@ -1,11 +1,16 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
+from pyowm.commons.json_backend import JSONBackend
+from pyowm.stationsapi30 import persistence_backend
 from pyowm.stationsapi30.measurement import Measurement
-from pyowm.stationsapi30.persistence_backend import JSONPersistenceBackend
+from pyowm.stationsapi30.persistence_backend import JSONPersistenceBackend, SQLitePersistenceBackend, \
+    ArrowIPCPersistenceBackend, ParquetPersistenceBackend
 from pyowm.stationsapi30.buffer import Buffer
 
 
@@ -52,3 +57,187 @@ class TestJSONPersistenceBackend(unittest.TestCase):
                 test_buffer.measurements = [test_measurement]
                 test_instance.persist_buffer(test_buffer)
                 mocked_open.assert_called_once_with(self.file, 'w')
+
+    def test_load_to_buffer_with_json_backend(self):
+        with patch('os.path.isfile', return_value=True):
+            mocked_file_data = b'[{"station_id": "test_id", "timestamp":142332322}]'
+            with patch('builtins.open', unittest.mock.mock_open(read_data=mocked_file_data)) as mocked_open:
+                test_instance = JSONPersistenceBackend(self.file, self.test_id, json_backend=JSONBackend())
+                result = test_instance.load_to_buffer()
+                mocked_open.assert_called_once_with(self.file, 'rb')
+                self.assertEqual(1, len(result))
+                self.assertEqual(142332322, result.measurements[0].timestamp)
+
+    def test_persist_buffer_with_json_backend(self):
+        with patch('os.path.isfile', return_value=True):
+            with patch('builtins.open', unittest.mock.mock_open()) as mocked_open:
+                test_instance = JSONPersistenceBackend(self.file, self.test_id, json_backend=JSONBackend())
+                test_buffer = Buffer(self.test_id)
+                test_buffer.measurements = [Measurement(self.test_id, self.test_timestamp)]
+                test_instance.persist_buffer(test_buffer)
+                mocked_open.assert_called_once_with(self.file, 'w')
+                written = ''.join(call.args[0] for call in mocked_open().write.call_args_list)
+                self.assertIn('"timestamp": %d' % self.test_timestamp, written)
+
+
+class ColumnarPersistenceBackendTests:
+    # tests shared by the append-only, columnar backends
+
+    test_id = 'test_id'
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'data')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def factory(self, station_id):
+        raise NotImplementedError()
+
+    def buffer(self, timestamps, station_id=None):
+        result = Buffer(station_id or self.test_id)
+        for ts in timestamps:
+            result.append(Measurement(station_id or self.test_id, ts, temperature=20.5, wind_speed=3.2,
+                                      visibility_prefix='N', weather_other='sunny'))
+        return result
+
+    def test_persist_buffer_appends(self):
+        instance = self.factory(self.test_id)
+        self.assertEqual(0, len(instance.load_to_buffer()))
+        instance.persist_buffer(self.buffer([1, 2, 3]))
+        instance.persist_buffer(self.buffer([]))
+        instance.persist_buffer(self.buffer([4, 5]))
+        result = instance.load_to_buffer()
+        self.assertIsInstance(result, Buffer)
+        self.assertEqual([1, 2, 3, 4, 5], [m.timestamp for m in result])
+        self.assertEqual(self.buffer([1]).measurements[0].to_dict(), result.measurements[0].to_dict())
+
+        # data is read back by new instances too
+        self.assertEqual(5, len(self.factory(self.test_id).load_to_buffer()))
+
+    def test_values_not_fitting_typed_columns_are_kept(self):
+        instance = self.factory(self.test_id)
+        msmt = Measurement(self.test_id, 1378459200, temperature=dict(min=0, max=100), wind_speed=2.1,
+                           wind_gust=67, humidex=77, weather_other=dict(key='val'), clouds_cumulus=True)
+        buffer = Buffer(self.test_id)
+        buffer.append(msmt)
+        instance.persist_buffer(buffer)
+        result = instance.load_to_buffer().measurements[0]
+        self.assertEqual(msmt.to_dict(), result.to_dict())
+        self.assertIsInstance(result.wind_gust, int)
+        self.assertIsInstance(result.humidex, int)
+        self.assertIsInstance(result.wind_speed, float)
+        self.assertIs(True, result.clouds_cumulus)
+
+    def test_time_range_and_station_filters(self):
+        instance = self.factory(self.test_id)
+        instance.persist_buffer(self.buffer(range(100, 110)))
+        instance.persist_buffer(self.buffer(range(100, 110), station_id='another'))
+        self.assertEqual(list(range(103, 107)), [m.timestamp for m in instance.load_to_buffer(103, 106)])
+        self.assertEqual(list(range(108, 110)), [m.timestamp for m in instance.iter_measurements(from_timestamp=108)])
+        self.assertEqual([100], [m.timestamp for m in instance.iter_measurements(to_timestamp=100)])
+        self.assertEqual([], list(instance.iter_measurements(200, 300)))
+        self.assertTrue(all(m.station_id == self.test_id for m in instance.iter_measurements()))
+        self.assertEqual(10, len(self.factory('another').load_to_buffer()))
+
+    def test_no_station_id(self):
+        instance = self.factory(None)
+        self.assertRaises(ValueError, instance.load_to_buffer)
+        self.assertRaises(ValueError, instance.iter_measurements)
+
+    def test_repr(self):
+        repr(self.factory(self.test_id))
+
+
+class ArrowPersistenceBackendTests(ColumnarPersistenceBackendTests):
+    # tests shared by the backends writing one file per persisted buffer
+
+    def test_compact(self):
+        instance = self.factory(self.test_id)
+        self.assertEqual(0, instance.compact())
+        instance.persist_buffer(self.buffer(range(0, 3)))
+        self.assertEqual(0, instance.compact())
+        instance.persist_buffer(self.buffer(range(3, 10)))
+        instance.persist_buffer(self.buffer(range(10, 12), station_id='another'))
+        instance.persist_buffer(self.buffer(range(12, 15)))
+        self.assertEqual(4, instance.compact())
+        self.assertEqual(1, len(os.listdir(self.path)))
+        self.assertEqual(list(range(10)) + [12, 13, 14], [m.timestamp for m in instance.iter_measurements()])
+        self.assertEqual([10, 11], [m.timestamp for m in self.factory('another').iter_measurements()])
+        self.assertEqual([5, 6], [m.timestamp for m in instance.iter_measurements(5, 6)])
+
+        # buffers persisted later on are read after the compacted ones
+        instance.persist_buffer(self.buffer([15]))
+        self.assertEqual(15, list(instance.iter_measurements())[-1].timestamp)
+        self.assertEqual(2, instance.compact())
+        self.assertEqual(list(range(10)) + list(range(12, 16)), [m.timestamp for m in instance.iter_measurements()])
+
+
+class TestSQLitePersistenceBackend(ColumnarPersistenceBackendTests, unittest.TestCase):
+
+    def factory(self, station_id):
+        return SQLitePersistenceBackend(self.path, station_id)
+
+    def test_init(self):
+        with self.assertRaises(AssertionError):
+            SQLitePersistenceBackend(None, self.test_id)
+        self.factory(self.test_id)
+        self.assertTrue(os.path.isfile(self.path))
+
+    def test_iter_measurements_is_lazy(self):
+        instance = self.factory(self.test_id)
+        instance.persist_buffer(self.buffer(range(5000)))
+        result = instance.iter_measurements()
+        self.assertEqual(0, next(result).timestamp)
+        result.close()
+
+
+@unittest.skipIf(persistence_backend.pyarrow is None, 'pyarrow is not installed')
+class TestArrowIPCPersistenceBackend(ArrowPersistenceBackendTests, unittest.TestCase):
+
+    def factory(self, station_id):
+        return ArrowIPCPersistenceBackend(self.path, station_id)
+
+    def test_persist_buffer_writes_one_file_per_buffer(self):
+        instance = self.factory(self.test_id)
+        self.assertRaises(AssertionError, ArrowIPCPersistenceBackend, None, self.test_id)
+        instance.persist_buffer(self.buffer([1, 2]))
+        instance.persist_buffer(self.buffer([3]))
+        files = sorted(os.listdir(self.path))
+        self.assertEqual(2, len(files))
+        self.assertTrue(all(name.endswith('.arrow') for name in files))
+
+
+@unittest.skipIf(persistence_backend.pyarrow is None, 'pyarrow is not installed')
+class TestParquetPersistenceBackend(ArrowPersistenceBackendTests, unittest.TestCase):
+
+    def factory(self, station_id):
+        return ParquetPersistenceBackend(self.path, station_id, row_group_size=4)
+
+    def test_persist_buffer_writes_one_file_per_buffer(self):
+        self.assertRaises(AssertionError, ParquetPersistenceBackend, self.path, self.test_id, row_group_size=0)
+        instance = self.factory(self.test_id)
+        instance.persist_buffer(self.buffer(range(10)))
+        files = os.listdir(self.path)
+        self.assertEqual(1, len(files))
+        self.assertTrue(files[0].endswith('.parquet'))
+        metadata = persistence_backend.pyarrow.parquet.ParquetFile(os.path.join(self.path, files[0])).metadata
+        self.assertEqual(3, metadata.num_row_groups)
+
+    def test_compact_fills_row_groups(self):
+        instance = self.factory(self.test_id)
+        for ts in range(10):
+            instance.persist_buffer(self.buffer([ts]))
+        instance.compact()
+        files = os.listdir(self.path)
+        metadata = persistence_backend.pyarrow.parquet.ParquetFile(os.path.join(self.path, files[0])).metadata
+        self.assertEqual([4, 4, 2], [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)])
+
+
+class TestPyarrowAvailability(unittest.TestCase):
+
+    def test_arrow_backends_fail_without_pyarrow(self):
+        with patch.object(persistence_backend, 'pyarrow', None):
+            self.assertRaises(ImportError, ArrowIPCPersistenceBackend, 'path', 'test_id')
+            self.assertRaises(ImportError, ParquetPersistenceBackend, 'path', 'test_id')
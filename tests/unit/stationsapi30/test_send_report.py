@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from pyowm.commons.exceptions import APIRequestError
+from pyowm.stationsapi30.measurement import Measurement
+from pyowm.stationsapi30.send_report import SendReport
+
+
+class TestSendReport(unittest.TestCase):
+
+    def test_add(self):
+        instance = SendReport()
+        self.assertTrue(instance.succeeded)
+        self.assertEqual(0, instance.sent)
+        instance.raise_for_errors()
+
+        ok = [Measurement('a', 1), Measurement('a', 2)]
+        ko = [Measurement('b', 3)]
+        error = APIRequestError('boom')
+        instance.add(ok)
+        instance.add(ko, error)
+        self.assertEqual([(2, None), (1, error)], instance.batches)
+        self.assertEqual(2, instance.sent)
+        self.assertEqual(1, instance.failed)
+        self.assertFalse(instance.succeeded)
+        self.assertEqual([error], instance.errors)
+        self.assertEqual(ko, instance.failed_measurements())
+        self.assertRaises(APIRequestError, instance.raise_for_errors)
+
+    def test_repr(self):
+        repr(SendReport())
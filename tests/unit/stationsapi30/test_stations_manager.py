@@ -4,11 +4,15 @@
 import unittest
 import json
 import copy
+import threading
+import time
 from pyowm.config import DEFAULT_CONFIG
 from pyowm.stationsapi30.station import Station
 from pyowm.stationsapi30.measurement import Measurement, AggregatedMeasurement
 from pyowm.stationsapi30.buffer import Buffer
+from pyowm.stationsapi30.send_report import SendReport
 from pyowm.stationsapi30.stations_manager import StationsManager
+from pyowm.commons.exceptions import APIRequestError
 from pyowm.commons.http_client import HttpClient
 from pyowm.constants import STATIONS_API_VERSION
 
@@ -90,6 +94,56 @@ class MockHttpClientMeasurements(HttpClient):
         return 200, ''
 
 
+class MockHttpClientRecordingPosts(HttpClient):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.posted = []
+        self.lock = threading.Lock()
+
+    def post(self, uri, params=None, data=None, headers=None):
+        if any(item['dt'] == 13 for item in data):
+            raise APIRequestError('bad request')
+        with self.lock:
+            self.posted.append(data)
+        return 200, None
+
+
+class MockHttpClientSlowFailingHead(MockHttpClientRecordingPosts):
+
+    def post(self, uri, params=None, data=None, headers=None):
+        if any(item['dt'] == 0 for item in data):
+            time.sleep(0.2)
+            raise APIRequestError('bad request')
+        return super().post(uri, params=params, data=data, headers=headers)
+
+
+class MockHttpClientHourlyMeasurements(HttpClient):
+    # one hourly measurement per station, every hour from 3600 to 360000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def get_json(self, uri, params=None, headers=None):
+        with self.lock:
+            self.queries.append(params)
+        if params['station_id'] == 'broken':
+            raise APIRequestError('boom')
+        items = [AggregatedMeasurement(params['station_id'], ts, 'h', temp=dict(max=ts)).to_dict()
+                 for ts in range(3600, 360001, 3600) if params['from'] <= ts <= params['to']]
+        for i in items:
+            i['date'] = i.pop('timestamp')
+            i['type'] = i.pop('aggregated_on')
+        return 200, list(reversed(items))[:params['limit']]
+
+
+def measurements(n):
+    for i in range(n):
+        yield Measurement('test_station', i, temperature=dict(min=0, max=i))
+
+
 class TestStationManager(unittest.TestCase):
 
     def factory(self, _kls):
@@ -210,6 +264,92 @@ class TestStationManager(unittest.TestCase):
         with self.assertRaises(AssertionError):
             instance.send_measurements([msmt_1, msmt_2])
 
+    def test_send_measurements_in_batches(self):
+        instance = self.factory(MockHttpClientRecordingPosts)
+        msmts = [m for m in measurements(12)]
+        result = instance.send_measurements(msmts, max_batch_size=5, max_workers=2)
+        self.assertIsInstance(result, SendReport)
+        self.assertTrue(result.succeeded)
+        self.assertEqual(12, result.sent)
+        self.assertEqual([(5, None), (5, None), (2, None)], result.batches)
+        posted = sorted((item for data in instance.http_client.posted for item in data), key=lambda i: i['dt'])
+        self.assertEqual([instance._structure_dict(m) for m in msmts], posted)
+
+    def test_send_measurements_batches_are_capped_by_size_in_bytes(self):
+        instance = self.factory(MockHttpClientRecordingPosts)
+        item_size = len(json.dumps(instance._structure_dict(next(measurements(1))))) + 2
+        result = instance.send_measurements(measurements(10), max_batch_bytes=3 * item_size + 2)
+        self.assertEqual([3, 3, 3, 1], [size for size, _ in result.batches])
+        for data in instance.http_client.posted:
+            self.assertLessEqual(len(json.dumps(data)), 3 * item_size + 2)
+
+        # measurements bigger than the limit are sent alone
+        result = instance.send_measurements(measurements(2), max_batch_bytes=1)
+        self.assertEqual([1, 1], [size for size, _ in result.batches])
+
+    def test_send_measurements_failing_batches(self):
+        instance = self.factory(MockHttpClientRecordingPosts)
+        with self.assertRaises(APIRequestError) as cm:
+            instance.send_measurements(list(measurements(30)), max_batch_size=10)
+        report = cm.exception.report
+        self.assertIsInstance(report, SendReport)
+        # the batches that were already being sent when the failure happened are recorded too
+        self.assertEqual(sum(len(data) for data in instance.http_client.posted), report.sent)
+        self.assertEqual(10, report.failed)
+        self.assertEqual(list(range(10, 20)), [m.timestamp for m in report.failed_measurements()])
+
+        result = instance.send_measurements(measurements(30), max_batch_size=10, raise_on_error=False)
+        self.assertFalse(result.succeeded)
+        self.assertEqual(20, result.sent)
+        self.assertEqual(10, result.failed)
+        self.assertIsNone(result.batches[0][1])
+        self.assertIsInstance(result.batches[1][1], APIRequestError)
+        self.assertEqual(list(range(10, 20)), [m.timestamp for m in result.failed_measurements()])
+        self.assertRaises(APIRequestError, result.raise_for_errors)
+
+    def test_send_measurements_stops_sending_when_a_batch_fails(self):
+        instance = self.factory(MockHttpClientSlowFailingHead)
+        with self.assertRaises(APIRequestError) as cm:
+            instance.send_measurements(measurements(100), max_batch_size=1, max_workers=4)
+        report = cm.exception.report
+        posted = sorted(item['dt'] for data in instance.http_client.posted for item in data)
+        self.assertLess(len(posted), 10)
+        self.assertEqual(len(posted), report.sent)
+        self.assertEqual(1, report.failed)
+        self.assertEqual([0], [m.timestamp for m in report.failed_measurements()])
+        self.assertEqual(list(range(1, len(posted) + 1)), posted)
+
+    def test_send_measurements_batches(self):
+        instance = self.factory(MockHttpClientRecordingPosts)
+        consumed = []
+
+        def tracked(gen):
+            for m in gen:
+                consumed.append(m)
+                yield m
+
+        results = instance.send_measurements_batches(tracked(measurements(25)), max_workers=1, max_batch_size=10)
+        self.assertEqual([], consumed)
+        batch, error = next(results)
+        self.assertEqual(list(range(10)), [m.timestamp for m in batch])
+        self.assertIsNone(error)
+        self.assertLess(len(consumed), 25)
+        batch, error = next(results)
+        self.assertIsInstance(error, APIRequestError)
+        batch, error = next(results)
+        self.assertEqual(5, len(batch))
+        self.assertIsNone(error)
+        self.assertRaises(StopIteration, next, results)
+
+        self.assertRaises(AssertionError, instance.send_measurements_batches, measurements(1), max_batch_size=0)
+        self.assertRaises(AssertionError, instance.send_measurements_batches, measurements(1), max_batch_bytes=0)
+        self.assertRaises(ValueError, instance.send_measurements_batches, measurements(1), max_workers=0)
+
+        msmt = next(measurements(1))
+        msmt.station_id = None
+        with self.assertRaises(AssertionError):
+            instance.send_measurements(iter([msmt]))
+
     def test_get_measurements(self):
         instance = self.factory(MockHttpClientMeasurements)
         station_id = 'id1'
@@ -265,11 +405,53 @@ class TestStationManager(unittest.TestCase):
         with self.assertRaises(ValueError):
             instance.get_measurements('test_station', 'm', 123, 88)
 
+    def test_iter_measurements(self):
+        instance = self.factory(MockHttpClientHourlyMeasurements)
+        results = instance.iter_measurements('st1', 'h', 1, 400000, page_size=10, max_workers=3)
+        timestamps = [m.timestamp for m in results]
+        self.assertEqual(list(range(3600, 360001, 3600)), timestamps)
+        queries = instance.http_client.queries
+        self.assertEqual(12, len(queries))
+        self.assertTrue(all(q['limit'] == 11 for q in queries))
+        self.assertTrue(all(q['to'] - q['from'] <= 36000 for q in queries))
+
+        # window boundaries fall on measurements
+        results = list(instance.iter_measurements('st1', 'h', 36000, 72000, page_size=5))
+        self.assertEqual(list(range(36000, 72001, 3600)), [m.timestamp for m in results])
+        self.assertTrue(all(isinstance(m, AggregatedMeasurement) for m in results))
+
+        results = list(instance.iter_measurements('st1', 'd', 7200, 7200))
+        self.assertEqual([7200], [m.timestamp for m in results])
+
+    def test_iter_measurements_failing(self):
+        instance = self.factory(MockHttpClientHourlyMeasurements)
+        self.assertRaises(ValueError, instance.iter_measurements, 'st1', 'y', 1, 100)
+        self.assertRaises(ValueError, instance.iter_measurements, 'st1', 'h', 100, 1)
+        self.assertRaises(ValueError, instance.iter_measurements, 'st1', 'h', 1, 100, max_workers=0)
+        self.assertRaises(AssertionError, instance.iter_measurements, 'st1', 'h', 1, 100, page_size=0)
+        self.assertRaises(AssertionError, instance.iter_measurements, None, 'h', 1, 100)
+        results = instance.iter_measurements('broken', 'h', 1, 100)
+        self.assertRaises(APIRequestError, list, results)
+
+    def test_get_measurements_many(self):
+        instance = self.factory(MockHttpClientHourlyMeasurements)
+        result = instance.get_measurements_many(['st1', 'st2', 'st3'], 'h', 1, 400000, page_size=25,
+                                                max_workers=4)
+        self.assertEqual(['st1', 'st2', 'st3'], sorted(result))
+        for station_id, items in result.items():
+            self.assertEqual(list(range(3600, 360001, 3600)), [m.timestamp for m in items])
+            self.assertTrue(all(m.station_id == station_id for m in items))
+        self.assertEqual(3 * 5, len(instance.http_client.queries))
+        self.assertEqual(dict(), instance.get_measurements_many([], 'h', 1, 400000))
+        self.assertRaises(APIRequestError, instance.get_measurements_many, ['st1', 'broken'], 'h', 1, 400000)
+        self.assertRaises(ValueError, instance.get_measurements_many, ['st1'], 'y', 1, 400000)
+
     def test_send_buffer(self):
         instance = self.factory(MockHttpClientMeasurements)
         buffer = Buffer(MockHttpClientMeasurements.msmt1.station_id)
         buffer.append(MockHttpClientMeasurements.msmt1)
-        instance.send_buffer(buffer)
+        result = instance.send_buffer(buffer)
+        self.assertEqual(1, result.sent)
 
     def test_send_buffer_failing(self):
         instance = self.factory(MockHttpClientMeasurements)
@@ -1,17 +1,29 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
+import os
+import tempfile
 import unittest
+from pyowm.config import DEFAULT_CONFIG
 from pyowm.owm import OWM
 from pyowm.agroapi10.agro_manager import AgroManager
 from pyowm.airpollutionapi30.airpollution_manager import AirPollutionManager
 from pyowm.alertapi30.alert_manager import AlertManager
+from pyowm.commons.cache import LRUCache
 from pyowm.commons.cityidregistry import CityIDRegistry
+from pyowm.commons.rate_limiter import RateLimiter
 from pyowm.geocodingapi10.geocoding_manager import GeocodingManager
 from pyowm.stationsapi30.stations_manager import StationsManager
+from pyowm.tiles.tile_cache import TileCache
 from pyowm.tiles.tile_manager import TileManager
 from pyowm.uvindexapi30.uvindex_manager import UVIndexManager
 from pyowm.weatherapi30.weather_manager import WeatherManager
+from pyowm.airpollutionapi30.async_airpollution_manager import AsyncAirPollutionManager
+from pyowm.geocodingapi10.async_geocoding_manager import AsyncGeocodingManager
+from pyowm.tiles.async_tile_manager import AsyncTileManager
+from pyowm.uvindexapi30.async_uvindex_manager import AsyncUVIndexManager
+from pyowm.weatherapi30.async_weather_manager import AsyncWeatherManager
 
 
 class TestOWM(unittest.TestCase):
@@ -42,6 +54,61 @@ class TestOWM(unittest.TestCase):
     def test_repr(self):
         repr(self.__test_instance)
 
+    def test_async_managers(self):
+        self.assertIsInstance(self.__test_instance.async_weather_manager(), AsyncWeatherManager)
+        self.assertIsInstance(self.__test_instance.async_airpollution_manager(), AsyncAirPollutionManager)
+        self.assertIsInstance(self.__test_instance.async_uvindex_manager(), AsyncUVIndexManager)
+        self.assertIsInstance(self.__test_instance.async_geocoding_manager(), AsyncGeocodingManager)
+        self.assertIsInstance(self.__test_instance.async_tile_manager('test'), AsyncTileManager)
+
+    def test_http_session_is_shared_among_managers(self):
+        instance = OWM('fake-api-key')
+        session = instance.http_session
+        self.assertIs(session, instance.http_session)
+        self.assertIs(session, instance.weather_manager().http_client.http)
+        self.assertIs(session, instance.weather_manager().one_call_http_client.http)
+        self.assertIs(session, instance.tile_manager('test').http_client.http)
+        self.assertIs(session, instance.stations_manager().http_client.http)
+        self.assertIs(session, instance.airpollution_manager().ap_client._client.http)
+
+    def test_cache_is_shared_among_managers(self):
+        self.assertIsNone(OWM('fake-api-key').cache)
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['cache']['backend'] = 'memory'
+        instance = OWM('fake-api-key', config)
+        cache = instance.cache
+        self.assertIsInstance(cache, LRUCache)
+        self.assertIs(cache, instance.cache)
+        self.assertIs(cache, instance.weather_manager().http_client.cache)
+        self.assertIs(cache, instance.uvindex_manager().uv_client._client.cache)
+        self.assertIs(cache, instance.geocoding_manager().http_client.cache)
+
+    def test_rate_limiter_is_shared_among_managers(self):
+        self.assertIsNone(OWM('fake-api-key').rate_limiter)
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['rate_limiting']['mode'] = 'block'
+        instance = OWM('fake-api-key', config)
+        limiter = instance.rate_limiter
+        self.assertIsInstance(limiter, RateLimiter)
+        self.assertIs(limiter, instance.rate_limiter)
+        self.assertIs(limiter, instance.weather_manager().one_call_http_client.rate_limiter)
+        self.assertIs(limiter, instance.agro_manager().png_downloader_http_client.rate_limiter)
+        self.assertIs(limiter, instance.airpollution_manager().new_ap_client._client.rate_limiter)
+
+    def test_tile_cache_is_shared_among_tile_managers(self):
+        self.assertIsNone(OWM('fake-api-key').tile_cache)
+        self.assertIsNone(OWM('fake-api-key').tile_manager('temp_new').tile_cache)
+        with tempfile.TemporaryDirectory() as tmp:
+            config = copy.deepcopy(DEFAULT_CONFIG)
+            config['tile_cache']['path'] = os.path.join(tmp, 'tiles.db')
+            instance = OWM('fake-api-key', config)
+            tile_cache = instance.tile_cache
+            self.assertIsInstance(tile_cache, TileCache)
+            self.assertIs(tile_cache, instance.tile_cache)
+            self.assertIs(tile_cache, instance.tile_manager('temp_new').tile_cache)
+            self.assertIs(tile_cache, instance.tile_manager('pressure_new').tile_cache)
+            tile_cache.close()
+
     def test_city_id_registry(self):
         result = self.__test_instance.city_id_registry()
         self.assertIsNotNone(result)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.commons.tile import Tile
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.tiles.async_tile_manager import AsyncTileManager
+from pyowm.tiles.enums import MapLayerEnum
+
+
+class MockAsyncHttpClientReturningTile(AsyncHttpClient):
+
+    d = b'1234567890'
+
+    async def get_png(self, uri, params=None, headers=None):
+        return 200, self.d
+
+
+class TestAsyncTileManager(unittest.IsolatedAsyncioTestCase):
+
+    def test_instantiation_with_wrong_params(self):
+        self.assertRaises(AssertionError, AsyncTileManager, None, MapLayerEnum.PRESSURE, dict())
+        self.assertRaises(AssertionError, AsyncTileManager, 'apikey', None, dict())
+        self.assertRaises(AssertionError, AsyncTileManager, 'apikey', MapLayerEnum.PRESSURE, None)
+
+    async def test_get_tile(self):
+        mocked = MockAsyncHttpClientReturningTile('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        instance = AsyncTileManager('apikey', 'a_layer', DEFAULT_CONFIG)
+        instance.http_client = mocked
+        result = await instance.get_tile(1, 2, 3)
+        self.assertIsInstance(result, Tile)
+        self.assertEqual(mocked.d, result.image.data)
+
+    def test_repr(self):
+        repr(AsyncTileManager('apikey', 'a_layer', DEFAULT_CONFIG))
@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import io
+import unittest
+from pyowm.commons.enums import ImageTypeEnum
+from pyowm.commons.image import Image
+from pyowm.commons.tile import Tile
+from pyowm.tiles import mosaic
+
+
+def png(color, size=4):
+    img = mosaic.PILImage.new('RGBA', (size, size), color)
+    out = io.BytesIO()
+    img.save(out, format='PNG')
+    return out.getvalue()
+
+
+@unittest.skipIf(mosaic.PILImage is None, 'Pillow is not installed')
+class TestMosaic(unittest.TestCase):
+
+    def test_stitch(self):
+        red, green, blue = (255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 255, 255)
+        tiles = [Tile(10, 20, 6, 'layer', Image(png(red))),
+                 Tile(11, 20, 6, 'layer', Image(png(green))),
+                 Tile(11, 21, 6, 'layer', Image(png(blue)))]
+        result = mosaic.stitch(tiles)
+        self.assertIsInstance(result, Image)
+        self.assertEqual(ImageTypeEnum.PNG, result.image_type)
+        with mosaic.PILImage.open(io.BytesIO(result.data)) as img:
+            self.assertEqual((8, 8), img.size)
+            self.assertEqual(red, img.getpixel((0, 0)))
+            self.assertEqual(green, img.getpixel((7, 0)))
+            self.assertEqual(blue, img.getpixel((7, 7)))
+            self.assertEqual(0, img.getpixel((0, 7))[3])  # missing tile: transparent
+
+    def test_stitch_fails_with_bad_tiles(self):
+        self.assertRaises(ValueError, mosaic.stitch, [])
+        self.assertRaises(ValueError, mosaic.stitch, [Tile(1, 1, 6, 'layer', Image(png((0, 0, 0, 0)))),
+                                                      Tile(1, 1, 7, 'layer', Image(png((0, 0, 0, 0))))])
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import copy
+import os
+import tempfile
+import threading
+import time
+import sqlite3
+import unittest
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.tiles import tile_cache
+from pyowm.tiles.tile_cache import TileCache, tile_cache_from
+
+
+class TestTileCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.caches = []
+
+    def tearDown(self):
+        for c in self.caches:
+            c.close()
+        self.tmp.cleanup()
+
+    def new_cache(self, max_size=3, ttl=600):
+        result = TileCache(os.path.join(self.tmp.name, 'tiles.db'), max_size=max_size, ttl=ttl)
+        self.caches.append(result)
+        return result
+
+    def test_set_and_get(self):
+        instance = self.new_cache()
+        self.assertIsNone(instance.get('temp_new', 3, 1, 2))
+        self.assertIsNone(instance.lookup('temp_new', 3, 1, 2))
+        instance.set('temp_new', 3, 1, 2, b'\x89PNG-1', etag='"abc"', last_modified='Wed, 21 Oct 2015 07:28:00 GMT')
+        self.assertEqual(b'\x89PNG-1', instance.get('temp_new', 3, 1, 2))
+        self.assertEqual((b'\x89PNG-1', '"abc"', 'Wed, 21 Oct 2015 07:28:00 GMT', True),
+                         instance.lookup('temp_new', 3, 1, 2))
+        # keys are made of layer, zoom, x and y
+        self.assertIsNone(instance.get('pressure_new', 3, 1, 2))
+        self.assertIsNone(instance.get('temp_new', 4, 1, 2))
+        self.assertIsNone(instance.get('temp_new', 3, 2, 1))
+        instance.set('temp_new', 3, 1, 2, b'\x89PNG-2')
+        self.assertEqual((b'\x89PNG-2', None, None, True), instance.lookup('temp_new', 3, 1, 2))
+        self.assertEqual(1, len(instance))
+
+    def test_expired_tiles_are_kept_for_revalidation(self):
+        instance = self.new_cache(ttl=0)
+        instance.set('temp_new', 3, 1, 2, b'data', etag='"abc"')
+        self.assertIsNone(instance.get('temp_new', 3, 1, 2))
+        self.assertEqual((b'data', '"abc"', None, False), instance.lookup('temp_new', 3, 1, 2))
+        instance.refresh('temp_new', 3, 1, 2, ttl=60)
+        self.assertEqual(b'data', instance.get('temp_new', 3, 1, 2))
+        instance.refresh('temp_new', 3, 1, 2)
+        self.assertIsNone(instance.get('temp_new', 3, 1, 2))
+        instance.set('temp_new', 3, 1, 3, b'data', ttl=None)
+        self.assertEqual(b'data', instance.get('temp_new', 3, 1, 3))
+
+    def test_least_recently_used_tiles_are_evicted(self):
+        instance = self.new_cache(max_size=2)
+        instance.set('layer', 1, 0, 0, b'a')
+        time.sleep(0.01)
+        instance.set('layer', 1, 0, 1, b'b')
+        time.sleep(0.01)
+        instance.get('layer', 1, 0, 0)
+        time.sleep(0.01)
+        instance.set('layer', 1, 1, 1, b'c')
+        self.assertEqual(2, len(instance))
+        self.assertEqual(b'a', instance.get('layer', 1, 0, 0))
+        self.assertIsNone(instance.get('layer', 1, 0, 1))
+        self.assertEqual(b'c', instance.get('layer', 1, 1, 1))
+
+    def test_accesses_are_written_in_batches(self):
+        path = os.path.join(self.tmp.name, 'tiles.db')
+        instance = self.new_cache(max_size=1000)
+        for x in range(tile_cache.ACCESSES_BATCH_SIZE):
+            instance.set('layer', 7, x, 0, b'a')
+
+        def accessed_at(x):
+            with sqlite3.connect(path) as connection:
+                return connection.execute('SELECT accessed_at FROM tiles WHERE tile_column=?', (x,)).fetchone()[0]
+
+        stored = [accessed_at(x) for x in range(tile_cache.ACCESSES_BATCH_SIZE)]
+        time.sleep(0.01)
+        for x in range(tile_cache.ACCESSES_BATCH_SIZE - 1):
+            instance.get('layer', 7, x, 0)
+        self.assertEqual(stored[0], accessed_at(0))
+        instance.get('layer', 7, tile_cache.ACCESSES_BATCH_SIZE - 1, 0)
+        self.assertGreater(accessed_at(0), stored[0])
+        self.assertGreater(accessed_at(tile_cache.ACCESSES_BATCH_SIZE - 1), stored[-1])
+        instance.get('layer', 7, 0, 0)
+        instance.close()
+        self.caches.remove(instance)
+        self.assertGreater(accessed_at(0), accessed_at(1))
+
+    def test_size_is_tracked(self):
+        instance = self.new_cache(max_size=2)
+        instance.set('layer', 1, 0, 0, b'a')
+        instance.set('layer', 1, 0, 0, b'b')
+        self.assertEqual(1, len(instance))
+        instance.set('layer', 1, 0, 1, b'c')
+        instance.set('layer', 1, 1, 1, b'd')
+        self.assertEqual(2, len(instance))
+        instance.close()
+        self.caches.remove(instance)
+        instance = self.new_cache(max_size=2)
+        self.assertEqual(2, len(instance))
+        instance.clear()
+        self.assertEqual(0, len(instance))
+
+    def test_clear(self):
+        instance = self.new_cache()
+        instance.set('layer', 1, 0, 0, b'a')
+        instance.clear()
+        self.assertEqual(0, len(instance))
+
+    def test_tiles_survive_reopening(self):
+        instance = self.new_cache()
+        instance.set('layer', 1, 0, 0, b'a')
+        instance.close()
+        self.caches.remove(instance)
+        self.assertEqual(b'a', self.new_cache().get('layer', 1, 0, 0))
+
+    def test_concurrent_access(self):
+        instance = self.new_cache(max_size=1000)
+
+        def worker(x):
+            for y in range(20):
+                instance.set('layer', 5, x, y, bytes([x, y]))
+                self.assertEqual(bytes([x, y]), instance.get('layer', 5, x, y))
+
+        threads = [threading.Thread(target=worker, args=(x,)) for x in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(160, len(instance))
+
+    def test_instantiation_fails_with_wrong_arguments(self):
+        path = os.path.join(self.tmp.name, 'tiles.db')
+        self.assertRaises(AssertionError, TileCache, None)
+        self.assertRaises(AssertionError, TileCache, path, 0)
+        self.assertRaises(AssertionError, TileCache, path, 10, -1)
+        self.assertRaises(AssertionError, TileCache, path, 10, 'ttl')
+
+    def test_tile_cache_from(self):
+        self.assertIsNone(tile_cache_from(DEFAULT_CONFIG))
+        self.assertIsNone(tile_cache_from(dict()))
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['tile_cache'] = dict(path=os.path.join(self.tmp.name, 'tiles.db'), max_size=50, ttl=None)
+        result = tile_cache_from(config)
+        self.caches.append(result)
+        self.assertIsInstance(result, TileCache)
+        self.assertEqual(50, result.max_size)
+        self.assertIsNone(result.ttl)
+
+    def test_repr(self):
+        repr(self.new_cache())
@@ -1,5 +1,13 @@
+import io
+import os
+import tempfile
 import unittest
+import pyowm.commons.exceptions
 from pyowm.config import DEFAULT_CONFIG
+from pyowm.commons.image import Image
+from pyowm.tiles import mosaic
+from pyowm.tiles.tile_cache import TileCache
+from pyowm.utils.geo import Polygon
 from pyowm.commons.http_client import HttpClient
 from pyowm.tiles.tile_manager import TileManager
 from pyowm.commons.tile import Tile
@@ -14,6 +22,38 @@ class MockHttpClientReturningTile(HttpClient):
         return 200, self.d
 
 
+class MockHttpClientRecordingTiles(HttpClient):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.paths = []
+
+    def get_png(self, uri, params=None, headers=None):
+        self.paths.append(uri)
+        if '/6/34/23.png' in uri:
+            raise pyowm.commons.exceptions.TimeoutError('timeout')
+        if mosaic.PILImage is None:
+            return 200, b'1234567890'
+        out = io.BytesIO()
+        mosaic.PILImage.new('RGBA', (2, 2), (255, 0, 0, 255)).save(out, format='PNG')
+        return 200, out.getvalue()
+
+
+class MockHttpClientRevalidatingTiles(HttpClient):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = []
+        self.version = 1
+
+    def get_png_if_modified(self, uri, params=None, headers=None, etag=None, last_modified=None):
+        self.calls.append((uri, etag))
+        current = '"v%d"' % self.version
+        if etag == current:
+            return 304, None, dict()
+        return 200, b'tile-' + current.encode(), {'ETag': current, 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+
 class TestTileManager(unittest.TestCase):
 
     def test_instantiation_with_wrong_params(self):
@@ -29,5 +69,75 @@ class TestTileManager(unittest.TestCase):
         self.assertIsInstance(result, Tile)
         self.assertEqual(mocked.d, result.image.data)
 
+    def test_get_tiles(self):
+        instance = TileManager('apikey', 'a_layer', DEFAULT_CONFIG)
+        instance.http_client = MockHttpClientRecordingTiles('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        result = instance.get_tiles((6.6, 45.1, 18.5, 47.1), 6, max_workers=2)
+        self.assertEqual([(33, 22), (34, 22), (35, 22)], [(tile.x, tile.y) for tile in result])
+        self.assertTrue(all(isinstance(tile, Tile) and tile.zoom == 6 for tile in result))
+        self.assertEqual(3, len(instance.http_client.paths))
+
+        polygon = Polygon([[[6.6, 45.1], [18.5, 45.1], [18.5, 47.1], [6.6, 45.1]]])
+        result = instance.get_tiles(polygon, 6)
+        self.assertEqual([(33, 22), (34, 22), (35, 22)], [(tile.x, tile.y) for tile in result])
+
+    def test_get_tiles_fails(self):
+        instance = TileManager('apikey', 'a_layer', DEFAULT_CONFIG)
+        instance.http_client = MockHttpClientRecordingTiles('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        self.assertRaises(pyowm.commons.exceptions.TimeoutError, instance.get_tiles, (6.6, 36.6, 18.5, 47.1), 6)
+        self.assertRaises(ValueError, instance.get_tiles, (6.6, 36.6, 18.5), 6)
+        self.assertRaises(ValueError, instance.get_tiles, (6.6, 36.6, 190, 47.1), 6)
+        self.assertRaises(ValueError, instance.get_tiles, (18.5, 36.6, 6.6, 47.1), 6)
+        self.assertRaises(AssertionError, instance.get_tiles, (6.6, 36.6, 18.5, 47.1), -1)
+        self.assertRaises(ValueError, instance.get_tiles, (6.6, 45.1, 18.5, 47.1), 6, max_workers=0)
+
+    def test_get_tiles_with_max_tiles(self):
+        instance = TileManager('apikey', 'a_layer', DEFAULT_CONFIG)
+        instance.http_client = MockHttpClientRecordingTiles('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        with self.assertRaises(ValueError) as cm:
+            instance.get_tiles((-180, -85, 180, 85), 18)
+        self.assertIn(str(Tile.tiles_count_for_bbox(-180, -85, 180, 85, 18)), str(cm.exception))
+        self.assertEqual(0, len(instance.http_client.paths))
+        self.assertRaises(ValueError, instance.get_tiles, (6.6, 45.1, 18.5, 47.1), 6, max_tiles=2)
+        self.assertEqual(3, len(instance.get_tiles((6.6, 45.1, 18.5, 47.1), 6, max_tiles=3)))
+        self.assertEqual(3, len(instance.get_tiles((6.6, 45.1, 18.5, 47.1), 6, max_tiles=None)))
+        self.assertRaises(AssertionError, instance.get_tiles, (6.6, 45.1, 18.5, 47.1), 6, max_tiles='3')
+
+    @unittest.skipIf(mosaic.PILImage is None, 'Pillow is not installed')
+    def test_get_tiles_as_mosaic(self):
+        instance = TileManager('apikey', 'a_layer', DEFAULT_CONFIG)
+        instance.http_client = MockHttpClientRecordingTiles('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        result = instance.get_tiles((6.6, 45.1, 18.5, 47.1), 6, mosaic=True)
+        self.assertIsInstance(result, Image)
+        with mosaic.PILImage.open(io.BytesIO(result.data)) as img:
+            self.assertEqual((6, 2), img.size)
+
+    def test_get_tile_with_tile_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tile_cache = TileCache(os.path.join(tmp, 'tiles.db'), ttl=600)
+            instance = TileManager('apikey', 'a_layer', DEFAULT_CONFIG, tile_cache=tile_cache)
+            mocked = MockHttpClientRevalidatingTiles('apikey', DEFAULT_CONFIG, 'anyurl.com')
+            instance.http_client = mocked
+
+            # first download, then served by the cache
+            self.assertEqual(b'tile-"v1"', instance.get_tile(1, 2, 3).image.data)
+            self.assertEqual(b'tile-"v1"', instance.get_tile(1, 2, 3).image.data)
+            self.assertEqual(1, len(mocked.calls))
+            self.assertIsNone(mocked.calls[0][1])
+
+            # expired and unchanged: revalidated, not downloaded again
+            tile_cache.refresh('a_layer', 3, 1, 2, ttl=0)
+            self.assertEqual(b'tile-"v1"', instance.get_tile(1, 2, 3).image.data)
+            self.assertEqual(2, len(mocked.calls))
+            self.assertEqual('"v1"', mocked.calls[1][1])
+            self.assertTrue(tile_cache.lookup('a_layer', 3, 1, 2)[3])
+
+            # expired and changed: downloaded again
+            tile_cache.refresh('a_layer', 3, 1, 2, ttl=0)
+            mocked.version = 2
+            self.assertEqual(b'tile-"v2"', instance.get_tile(1, 2, 3).image.data)
+            self.assertEqual('"v2"', tile_cache.lookup('a_layer', 3, 1, 2)[1])
+            tile_cache.close()
+
     def test_repr(self):
         repr(TileManager('apikey', 'a_layer', DEFAULT_CONFIG))
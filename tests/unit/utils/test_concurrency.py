@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+import unittest
+from pyowm.utils import concurrency
+
+
+class TestConcurrency(unittest.TestCase):
+
+    def test_fan_out(self):
+        def square(n):
+            if n == 3:
+                raise ValueError('boom')
+            return n * n
+
+        result = list(concurrency.fan_out(square, range(6), max_workers=3))
+        self.assertEqual(6, len(result))
+        successes = {item: value for item, value, error in result if error is None}
+        self.assertEqual({0: 0, 1: 1, 2: 4, 4: 16, 5: 25}, successes)
+        failures = [(item, value, error) for item, value, error in result if error is not None]
+        self.assertEqual(1, len(failures))
+        self.assertEqual(3, failures[0][0])
+        self.assertIsNone(failures[0][1])
+        self.assertIsInstance(failures[0][2], ValueError)
+
+    def test_fan_out_is_bounded(self):
+        lock = threading.Lock()
+        counters = dict(current=0, max=0)
+
+        def work(n):
+            with lock:
+                counters['current'] += 1
+                counters['max'] = max(counters['max'], counters['current'])
+            time.sleep(0.01)
+            with lock:
+                counters['current'] -= 1
+            return n
+
+        consumed = []
+
+        def items():
+            for i in range(20):
+                consumed.append(i)
+                yield i
+
+        results = concurrency.fan_out(work, items(), max_workers=4)
+        next(results)
+        # items are consumed lazily
+        self.assertLessEqual(len(consumed), 5)
+        self.assertEqual(19, len(list(results)))
+        self.assertLessEqual(counters['max'], 4)
+
+    def test_fan_out_fails_with_wrong_parameters(self):
+        self.assertRaises(AssertionError, concurrency.fan_out, abs, [1], max_workers='4')
+        self.assertRaises(ValueError, concurrency.fan_out, abs, [1], max_workers=0)
+
+    def test_fan_out_ordered(self):
+        def slow_first(n):
+            time.sleep(0.02 if n == 0 else 0)
+            return -n
+
+        result = list(concurrency.fan_out_ordered(slow_first, range(10), max_workers=4))
+        self.assertEqual(list(range(10)), [item for item, _, _ in result])
+        self.assertEqual([-n for n in range(10)], [value for _, value, _ in result])
+
+    def test_fan_out_ordered_is_bounded_when_a_call_stalls(self):
+        consumed = []
+        release = threading.Event()
+
+        def stall_first(n):
+            if n == 0:
+                release.wait(5)
+            return n
+
+        def items():
+            for i in range(2000):
+                consumed.append(i)
+                yield i
+
+        results = concurrency.fan_out_ordered(stall_first, items(), max_workers=4)
+        head = []
+        first = threading.Thread(target=lambda: head.append(next(results)))
+        first.start()
+        time.sleep(0.2)
+        # the head item stalls: no more than a window of items is consumed meanwhile
+        self.assertEqual(8, len(consumed))
+        release.set()
+        first.join()
+        self.assertEqual((0, 0, None), head[0])
+        self.assertEqual(list(range(1, 2000)), [item for item, _, _ in results])
+
+        results = concurrency.fan_out_ordered(stall_first, iter(range(100)), max_workers=4, window=20)
+        self.assertEqual(list(range(100)), [item for item, _, _ in results])
+        self.assertRaises(AssertionError, concurrency.fan_out_ordered, abs, [1], max_workers=4, window=3)
+        self.assertRaises(ValueError, concurrency.fan_out_ordered, abs, [1], max_workers=0)
+
+    def test_fan_out_ordered_stops_on_error(self):
+        consumed = []
+        called = []
+        lock = threading.Lock()
+
+        def slow_failing_first(n):
+            with lock:
+                called.append(n)
+            if n == 0:
+                time.sleep(0.1)
+                raise ValueError('boom')
+            return n
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        result = list(concurrency.fan_out_ordered(slow_failing_first, items(), max_workers=4, stop_on_error=True))
+        # calls that were in flight when the failure happened complete and are given back in order
+        self.assertEqual(sorted(called), [item for item, _, _ in result])
+        self.assertIsInstance(result[0][2], ValueError)
+        self.assertTrue(all(error is None for _, _, error in result[1:]))
+        self.assertLessEqual(len(consumed), 8)
@@ -38,3 +38,32 @@ class TestDecorators(unittest.TestCase):
             self.assertIn(action, logged_line)
             self.assertIn('.'.join(map(str, version)), logged_line)
             self.assertIn(name, logged_line)
+
+    def test_frozen(self):
+
+        class Slotted:
+            __slots__ = ('a', 'b')
+
+            def __init__(self, a, b):
+                self.a = a
+                self.b = b
+
+        FrozenSlotted = decorators.frozen(Slotted)
+        self.assertEqual('FrozenSlotted', FrozenSlotted.__name__)
+        instance = FrozenSlotted(1, 2)
+        self.assertIsInstance(instance, Slotted)
+        self.assertEqual((1, 2), (instance.a, instance.b))
+        with self.assertRaises(AttributeError):
+            instance.a = 3
+        with self.assertRaises(AttributeError):
+            del instance.b
+        with self.assertRaises(AttributeError):
+            instance.c = 4
+        self.assertEqual((1, 2), (instance.a, instance.b))
+
+    def test_frozen_fails_with_classes_without_slots(self):
+
+        class NotSlotted:
+            pass
+
+        self.assertRaises(AssertionError, decorators.frozen, NotSlotted)
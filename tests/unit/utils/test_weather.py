@@ -74,6 +74,11 @@ class TestWeatherUtils(unittest.TestCase):
         self.assertTrue(weather.status_is(result_2[0], "sun",
                                           self.__test_registry))
 
+    def test_filter_by_status_with_generator(self):
+        result = weather.filter_by_status((w for w in self.__test_weathers), "rain", self.__test_registry)
+        self.assertEqual(1, len(result))
+        self.assertTrue(weather.status_is(result[0], "rain", self.__test_registry))
+
     def test_find_closest_weather(self):
         self.assertEqual(self.__test_weather_rain,
                          weather.find_closest_weather(self.__test_weathers,
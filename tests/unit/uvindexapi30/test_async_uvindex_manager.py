@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.constants import UVINDEX_API_VERSION
+from pyowm.uvindexapi30 import uvindex
+from pyowm.uvindexapi30.async_uvindex_manager import AsyncUVIndexManager
+from tests.unit.uvindexapi30.test_uvindex import UVINDEX_JSON, UVINDEX_LIST_JSON
+
+
+class MockAsyncHttpClient(AsyncHttpClient):
+
+    def __init__(self, json_text):
+        super().__init__('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        self.json_text = json_text
+        self.requests = []
+
+    async def get_json(self, uri, params=None, headers=None):
+        self.requests.append((uri, params))
+        return 200, json.loads(self.json_text)
+
+
+class TestAsyncUVIndexManager(unittest.IsolatedAsyncioTestCase):
+
+    def _instance(self, json_text):
+        instance = AsyncUVIndexManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client = MockAsyncHttpClient(json_text)
+        return instance
+
+    def test_get_uvindex_api_version(self):
+        result = AsyncUVIndexManager('fakeapikey', DEFAULT_CONFIG).uvindex_api_version()
+        self.assertEqual(UVINDEX_API_VERSION, result)
+
+    async def test_uvindex_around_coords(self):
+        instance = self._instance(UVINDEX_JSON)
+        result = await instance.uvindex_around_coords(45, 9)
+        self.assertIsInstance(result, uvindex.UVIndex)
+        with self.assertRaises(ValueError):
+            await instance.uvindex_around_coords(43.7, -200.0)
+
+    async def test_uvindex_forecast_around_coords(self):
+        instance = self._instance(UVINDEX_LIST_JSON)
+        result = await instance.uvindex_forecast_around_coords(45, 9)
+        self.assertTrue(all(isinstance(item, uvindex.UVIndex) for item in result))
+
+    async def test_uvindex_history_around_coords(self):
+        instance = self._instance(UVINDEX_LIST_JSON)
+        result = await instance.uvindex_history_around_coords(45, 9, 1498049953, end=1498481991)
+        self.assertTrue(all(isinstance(item, uvindex.UVIndex) for item in result))
+        self.assertEqual(dict(lat='45', lon='9', start='1498049953', end='1498481991'),
+                         instance.http_client.requests[0][1])
+
+    def test_repr(self):
+        repr(AsyncUVIndexManager('fakeapikey', DEFAULT_CONFIG))
@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import unittest
+from pyowm.commons.async_http_client import AsyncHttpClient
+from pyowm.config import DEFAULT_CONFIG
+from pyowm.constants import WEATHER_API_VERSION
+from pyowm.weatherapi30.async_weather_manager import AsyncWeatherManager
+from pyowm.weatherapi30.forecaster import Forecaster
+from pyowm.weatherapi30.historian import Historian
+from pyowm.weatherapi30.observation import Observation
+from pyowm.weatherapi30.one_call import OneCall
+from tests.unit.weatherapi30.json_test_responses import (
+    OBSERVATION_JSON, SEARCH_RESULTS_JSON, THREE_HOURS_FORECAST_JSON, THREE_HOURS_FORECAST_NOT_FOUND_JSON,
+    STATION_WEATHER_HISTORY_JSON, ONE_CALL_JSON, ONE_CALL_HISTORY_JSON, WEATHER_AT_PLACES_IN_BBOX_JSON)
+
+
+class MockAsyncHttpClient(AsyncHttpClient):
+    """
+    Replies with the supplied JSON and records the issued requests
+    """
+    def __init__(self, json_text):
+        super().__init__('apikey', DEFAULT_CONFIG, 'anyurl.com')
+        self.json_text = json_text
+        self.requests = []
+
+    async def get_json(self, uri, params=None, headers=None):
+        self.requests.append((uri, params))
+        return 200, json.loads(self.json_text)
+
+
+class MockAsyncGroupHttpClient(MockAsyncHttpClient):
+    """
+    Replies to group calls with one observation for each of the requested IDs
+    """
+    def __init__(self):
+        super().__init__(SEARCH_RESULTS_JSON)
+
+    async def get_json(self, uri, params=None, headers=None):
+        self.requests.append((uri, params))
+        template = json.loads(self.json_text)['list'][0]
+        ids = [int(id) for id in params['id'].split(',')]
+        # the API does not guarantee any ordering of the results
+        items = [dict(template, id=id) for id in reversed(ids)]
+        return 200, {'cod': '200', 'cnt': len(items), 'list': items}
+
+
+class MockAsyncSlowHttpClient(MockAsyncHttpClient):
+    """
+    Replies after a while to calls for places north of the equator, tracking the calls in flight
+    """
+    def __init__(self, json_text):
+        super().__init__(json_text)
+        self.in_flight = 0
+
+    async def get_json(self, uri, params=None, headers=None):
+        self.requests.append((uri, params))
+        self.in_flight += 1
+        try:
+            if float(params['lat']) > 0:
+                await asyncio.sleep(5)
+            return 200, json.loads(self.json_text)
+        finally:
+            self.in_flight -= 1
+
+
+class TestAsyncWeatherManager(unittest.IsolatedAsyncioTestCase):
+
+    def _instance(self, json_text):
+        instance = AsyncWeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client = MockAsyncHttpClient(json_text)
+        instance.one_call_http_client = MockAsyncHttpClient(json_text)
+        return instance
+
+    def test_get_weather_api_version(self):
+        result = AsyncWeatherManager('fakeapikey', DEFAULT_CONFIG).weather_api_version()
+        self.assertEqual(result, WEATHER_API_VERSION)
+
+    def test_instantiation_with_wrong_params(self):
+        with self.assertRaises(AssertionError):
+            AsyncWeatherManager(None, dict())
+        with self.assertRaises(AssertionError):
+            AsyncWeatherManager('apikey', None)
+
+    async def test_weather_at_place(self):
+        instance = self._instance(OBSERVATION_JSON)
+        result = await instance.weather_at_place('London,uk')
+        self.assertIsInstance(result, Observation)
+        self.assertEqual(dict(q='London,uk'), instance.http_client.requests[0][1])
+        with self.assertRaises(AssertionError):
+            await instance.weather_at_place(3)
+
+    async def test_weather_at_coords(self):
+        instance = self._instance(OBSERVATION_JSON)
+        result = await instance.weather_at_coords(57.0, -2.15)
+        self.assertIsInstance(result, Observation)
+        with self.assertRaises(ValueError):
+            await instance.weather_at_coords(200.0, -2.15)
+
+    async def test_weather_at_zip_code_and_id(self):
+        instance = self._instance(OBSERVATION_JSON)
+        self.assertIsInstance(await instance.weather_at_zip_code('2000', 'AU'), Observation)
+        self.assertIsInstance(await instance.weather_at_id(5128581), Observation)
+        with self.assertRaises(ValueError):
+            await instance.weather_at_id(-1)
+
+    async def test_multiple_observations(self):
+        instance = self._instance(SEARCH_RESULTS_JSON)
+        result = await instance.weather_at_ids([5128581, 15647, 78654])
+        self.assertTrue(all(isinstance(item, Observation) for item in result))
+        self.assertEqual('5128581,15647,78654', instance.http_client.requests[-1][1]['id'])
+        result = await instance.weather_at_places('London', 'accurate', limit=3)
+        self.assertTrue(all(isinstance(item, Observation) for item in result))
+        self.assertEqual(2, instance.http_client.requests[-1][1]['cnt'])
+        result = await instance.weather_at_places_in_bbox(-2.0, 51.0, -1.0, 52.0)
+        self.assertTrue(all(isinstance(item, Observation) for item in result))
+        result = await instance.weather_around_coords(57.0, -2.15, limit=2)
+        self.assertTrue(all(isinstance(item, Observation) for item in result))
+        with self.assertRaises(ValueError):
+            await instance.weather_at_places('London', 'wrong')
+
+    async def test_weather_at_ids_with_many_ids(self):
+        instance = AsyncWeatherManager('fakeapikey', DEFAULT_CONFIG)
+        instance.http_client = MockAsyncGroupHttpClient()
+        ids = list(range(1, 46))
+        result = await instance.weather_at_ids(ids, max_workers=2)
+        self.assertEqual([ids[:20], ids[20:40], ids[40:]],
+                         [list(map(int, params['id'].split(','))) for _, params in instance.http_client.requests])
+        self.assertEqual(ids, [obs.location.id for obs in result])
+        with self.assertRaises(ValueError):
+            await instance.weather_at_ids(ids, max_workers=0)
+
+    async def test_weather_at_places_in_bbox_with_tiles(self):
+        instance = self._instance(WEATHER_AT_PLACES_IN_BBOX_JSON)  # the same cities for each tile
+        expected = Observation.from_dict_of_lists(json.loads(WEATHER_AT_PLACES_IN_BBOX_JSON))
+        result = await instance.weather_at_places_in_bbox(6.6, 36.6, 18.5, 47.1, zoom=10, tile_zoom=6, max_workers=3)
+        calls = [params['bbox'] for _, params in instance.http_client.requests]
+        self.assertEqual(9, len(set(calls)))
+        self.assertEqual([obs.location.id for obs in expected], [obs.location.id for obs in result])
+        with self.assertRaises(ValueError):
+            await instance.weather_at_places_in_bbox(6.6, 36.6, 18.5, 47.1, tile_zoom=-1)
+        with self.assertRaises(ValueError):
+            await instance.weather_at_places_in_bbox(6.6, 36.6, 18.5, 47.1, tile_zoom=6, max_tiles=8)
+        self.assertEqual(9, len(instance.http_client.requests))
+
+    async def test_forecasts(self):
+        instance = self._instance(THREE_HOURS_FORECAST_JSON)
+        result = await instance.forecast_at_place('London,uk', '3h', limit=5)
+        self.assertIsInstance(result, Forecaster)
+        self.assertEqual('3h', result.forecast.interval)
+        self.assertEqual(dict(q='London,uk', cnt=5), instance.http_client.requests[-1][1])
+        self.assertIsInstance(await instance.forecast_at_coords(51.5, -0.1, '3h'), Forecaster)
+        self.assertIsInstance(await instance.forecast_at_id(2643743, '3h'), Forecaster)
+        with self.assertRaises(ValueError):
+            await instance.forecast_at_id(2643743, '1m')
+        instance = self._instance(THREE_HOURS_FORECAST_NOT_FOUND_JSON)
+        self.assertIsNone(await instance.forecast_at_place('London,uk', '3h'))
+
+    async def test_station_history(self):
+        instance = self._instance(STATION_WEATHER_HISTORY_JSON)
+        result = await instance.station_hour_history(1234, limit=4)
+        self.assertIsInstance(result, Historian)
+        self.assertEqual('hour', result.station_history.interval)
+        self.assertEqual(1234, result.station_history.station_id)
+        self.assertIsInstance(await instance.station_tick_history(1234), Historian)
+        self.assertIsInstance(await instance.station_day_history(1234), Historian)
+        with self.assertRaises(ValueError):
+            await instance.station_day_history(1234, limit=-3)
+
+    async def test_one_call(self):
+        instance = self._instance(ONE_CALL_JSON)
+        result = await instance.one_call(46.23, 12.7, units='imperial', exclude='minutely')
+        self.assertIsInstance(result, OneCall)
+        self.assertEqual('imperial', instance.one_call_http_client.requests[0][1]['units'])
+        instance = self._instance(ONE_CALL_HISTORY_JSON)
+        self.assertIsInstance(await instance.one_call_history(46.23, 12.7, dt=1587678355), OneCall)
+        with self.assertRaises(ValueError):
+            await instance.one_call_history(46.23, 12.7, dt=-1)
+
+    async def test_one_call_many(self):
+        instance = self._instance(ONE_CALL_JSON)
+        coords = [(46.23, 12.7), (200.0, 3.5), (10.1, 20.2)]
+        result = [item async for item in instance.one_call_many(coords, max_workers=2)]
+        self.assertEqual(sorted(coords), sorted(latlon for latlon, _, _ in result))
+        for latlon, oc, error in result:
+            if latlon == (200.0, 3.5):
+                self.assertIsNone(oc)
+                self.assertIsInstance(error, ValueError)
+            else:
+                self.assertIsNone(error)
+                self.assertIsInstance(oc, OneCall)
+        self.assertEqual(2, len(instance.one_call_http_client.requests))
+
+    async def test_one_call_many_cancels_calls_when_stopped_early(self):
+        instance = self._instance(ONE_CALL_JSON)
+        instance.one_call_http_client = MockAsyncSlowHttpClient(ONE_CALL_JSON)
+        coords = [(-10.0, 1.0), (10.0, 2.0), (20.0, 3.0), (30.0, 4.0)]
+        results = instance.one_call_many(coords, max_workers=3)
+        async for latlon, _, _ in results:
+            self.assertEqual((-10.0, 1.0), latlon)
+            break
+        await results.aclose()
+        self.assertEqual(0, instance.one_call_http_client.in_flight)
+        self.assertEqual(3, len(instance.one_call_http_client.requests))
+
+    async def test_close(self):
+        async with AsyncWeatherManager('fakeapikey', DEFAULT_CONFIG) as instance:
+            session = instance.http_client.session
+        self.assertTrue(session.closed)
+
+    def test_repr(self):
+        repr(AsyncWeatherManager('fakeapikey', DEFAULT_CONFIG))
@@ -150,7 +150,7 @@ class TestForecast(unittest.TestCase):
         self.assertFalse(result.interval is not None)
         loc = result.location
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
         self.assertTrue(isinstance(result.weathers, list))
         for weather in result:
             self.assertTrue(weather is not None)
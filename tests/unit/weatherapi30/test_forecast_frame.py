@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+from pyowm.commons import exceptions
+from pyowm.weatherapi30 import forecast_frame
+from pyowm.weatherapi30.forecast import Forecast
+from pyowm.weatherapi30.forecast_frame import ForecastFrame
+from pyowm.weatherapi30.forecaster import Forecaster
+from pyowm.weatherapi30.one_call import OneCall
+from tests.unit.weatherapi30.json_test_responses import (
+    THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON, ONE_CALL_JSON, INTERNAL_SERVER_ERROR_JSON,
+    THREE_HOURS_FORECAST_NOT_FOUND_JSON)
+
+
+@unittest.skipIf(forecast_frame.numpy is None, 'numpy is not installed')
+class TestForecastFrame(unittest.TestCase):
+
+    __test_items = [
+        {'dt': 1000, 'main': {'temp': 280.0, 'temp_min': 279.0, 'temp_max': 281.0, 'humidity': 50,
+                              'pressure': 1010}, 'wind': {'speed': 3.5, 'deg': 90},
+         'rain': {'3h': 0.5}, 'weather': [{'id': 500}]},
+        {'dt': 2000, 'main': {'temp': 285.0, 'temp_min': 277.5, 'temp_max': 286.0, 'humidity': 80,
+                              'pressure': 1005}, 'wind': {'speed': 7.2, 'deg': 180},
+         'snow': {'3h': 1.2}, 'weather': [{'id': 601}]},
+        {'dt': 3000, 'main': {'temp': 283.0, 'temp_min': 278.0, 'temp_max': 284.0, 'humidity': 65,
+                              'pressure': 1020}, 'wind': {'speed': 1.0, 'deg': 270},
+         'rain': {'3h': 2.5}, 'weather': [{'id': 800}]}
+    ]
+
+    def _make_frame(self):
+        return ForecastFrame.from_dict({'cod': '200', 'cnt': 3, 'list': self.__test_items})
+
+    def test_from_dict(self):
+        frame = self._make_frame()
+        self.assertEqual(3, len(frame))
+        self.assertEqual([1000, 2000, 3000], frame.reference_time.tolist())
+        self.assertEqual([281.0, 286.0, 284.0], frame.temp_max.tolist())
+        self.assertEqual([50., 80., 65.], frame.humidity.tolist())
+        self.assertEqual([3.5, 7.2, 1.0], frame.wind_speed.tolist())
+        self.assertEqual([500, 601, 800], frame.weather_code.tolist())
+        self.assertEqual('int64', frame.reference_time.dtype.name)
+        self.assertEqual('float64', frame.rain.dtype.name)
+        self.assertEqual(0.5, frame.rain[0])
+        self.assertTrue(frame.rain.tolist()[1] != frame.rain.tolist()[1])  # NaN
+
+    def test_from_dict_with_real_payloads(self):
+        for payload in (THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON):
+            the_dict = json.loads(payload)
+            frame = ForecastFrame.from_dict(the_dict)
+            self.assertEqual(len(the_dict['list']), len(frame))
+            self.assertEqual([item['dt'] for item in the_dict['list']], frame.reference_time.tolist())
+
+    def test_from_dict_fails_with_bad_data(self):
+        self.assertRaises(exceptions.ParseAPIResponseError, ForecastFrame.from_dict, None)
+        self.assertRaises(exceptions.ParseAPIResponseError, ForecastFrame.from_dict, {'cod': '200'})
+        self.assertRaises(exceptions.ParseAPIResponseError, ForecastFrame.from_dict,
+                          {'list': [{'dt': 1, 'weather': []}]})
+        self.assertRaises(exceptions.APIResponseError, ForecastFrame.from_dict,
+                          json.loads(INTERNAL_SERVER_ERROR_JSON))
+        self.assertIsNone(ForecastFrame.from_dict(json.loads(THREE_HOURS_FORECAST_NOT_FOUND_JSON)))
+
+    def test_from_dict_with_no_items(self):
+        frame = ForecastFrame.from_dict({'cod': '200', 'cnt': 0})
+        self.assertEqual(0, len(frame))
+        self.assertIsNone(frame.most_hot())
+        self.assertFalse(frame.will_have_rain())
+        self.assertEqual(0, len(frame.when_rain()))
+
+    def test_from_one_call_dict(self):
+        the_dict = json.loads(ONE_CALL_JSON)
+        hourly = ForecastFrame.from_one_call_dict(the_dict)
+        self.assertEqual(len(the_dict['hourly']), len(hourly))
+        self.assertEqual([item['temp'] for item in the_dict['hourly']], hourly.temp.tolist())
+        self.assertEqual([item['wind_speed'] for item in the_dict['hourly']], hourly.wind_speed.tolist())
+        daily = ForecastFrame.from_one_call_dict(the_dict, series='daily')
+        self.assertEqual([item['temp']['max'] for item in the_dict['daily']], daily.temp_max.tolist())
+        self.assertEqual([item['temp']['day'] for item in the_dict['daily']], daily.temp.tolist())
+        self.assertEqual(0, len(ForecastFrame.from_one_call_dict({'current': {}}, series='minutely')))
+
+    def test_from_one_call_dict_fails_with_bad_data(self):
+        self.assertRaises(ValueError, ForecastFrame.from_one_call_dict, json.loads(ONE_CALL_JSON), 'weekly')
+        self.assertRaises(exceptions.ParseAPIResponseError, ForecastFrame.from_one_call_dict, None)
+        self.assertRaises(exceptions.APIResponseError, ForecastFrame.from_one_call_dict,
+                          json.loads(INTERNAL_SERVER_ERROR_JSON))
+
+    def test_from_weathers_matches_from_dict(self):
+        the_dict = json.loads(THREE_HOURS_FORECAST_JSON)
+        expected = ForecastFrame.from_dict(the_dict)
+        result = Forecast.from_dict(the_dict).to_frame()
+        for name, _ in forecast_frame.COLUMNS:
+            self.assertEqual(str(getattr(expected, name).tolist()), str(getattr(result, name).tolist()), name)
+
+    def test_one_call_to_frame(self):
+        the_dict = json.loads(ONE_CALL_JSON)
+        one_call = OneCall.from_dict(the_dict)
+        for series in ('hourly', 'daily'):
+            expected = ForecastFrame.from_one_call_dict(the_dict, series=series)
+            result = one_call.to_frame(series)
+            self.assertEqual(expected.reference_time.tolist(), result.reference_time.tolist())
+            self.assertEqual(str(expected.temp_max.tolist()), str(result.temp_max.tolist()))
+            self.assertEqual(expected.weather_code.tolist(), result.weather_code.tolist())
+        self.assertEqual(0, len(one_call.to_frame('minutely')))
+        self.assertRaises(ValueError, one_call.to_frame, 'weekly')
+
+    def test_reductions_agree_with_forecaster(self):
+        frame = self._make_frame()
+        self.assertEqual(1, frame.most_hot())
+        self.assertEqual(1, frame.most_cold())
+        self.assertEqual(1, frame.most_humid())
+        self.assertEqual(2, frame.most_rainy())
+        self.assertEqual(1, frame.most_snowy())
+        self.assertEqual(1, frame.most_windy())
+
+        forecaster = Forecaster(Forecast.from_dict(json.loads(THREE_HOURS_FORECAST_JSON)))
+        frame = forecaster.forecast.to_frame()
+        weathers = forecaster.forecast.weathers
+        self.assertIs(forecaster.most_hot(), weathers[frame.most_hot()])
+        self.assertIs(forecaster.most_cold(), weathers[frame.most_cold()])
+        self.assertIs(forecaster.most_humid(), weathers[frame.most_humid()])
+        self.assertIs(forecaster.most_windy(), weathers[frame.most_windy()])
+
+    def test_reductions_with_missing_data(self):
+        frame = ForecastFrame(reference_time=[1, 2], temp=[280., 290.])
+        self.assertIsNone(frame.most_hot())
+        self.assertIsNone(frame.most_rainy())
+        self.assertEqual(0, frame.weather_code[0])
+
+    def test_statuses(self):
+        frame = self._make_frame()
+        self.assertTrue(frame.will_have_rain())
+        self.assertTrue(frame.will_have_snow())
+        self.assertTrue(frame.will_have_clear())
+        self.assertFalse(frame.will_have_fog())
+        self.assertFalse(frame.will_have_clouds())
+        self.assertFalse(frame.will_have_storm())
+        self.assertFalse(frame.will_have_tornado())
+        self.assertFalse(frame.will_have_hurricane())
+        self.assertEqual([True, False, False], frame.status_mask('rain').tolist())
+        self.assertEqual([1000], frame.when_rain().reference_time.tolist())
+        self.assertEqual([2000], frame.when_snow().reference_time.tolist())
+        self.assertEqual([3000], frame.when_clear().reference_time.tolist())
+        for method in (frame.when_fog, frame.when_clouds, frame.when_storm, frame.when_tornado,
+                       frame.when_hurricane):
+            self.assertEqual(0, len(method()))
+
+        forecaster = Forecaster(Forecast.from_dict(json.loads(THREE_HOURS_FORECAST_JSON)))
+        frame = forecaster.forecast.to_frame()
+        self.assertEqual([w.reference_time() for w in forecaster.when_clouds()],
+                         frame.when_clouds().reference_time.tolist())
+        self.assertEqual(forecaster.will_have_rain(), frame.will_have_rain())
+
+    def test_take_and_row(self):
+        frame = self._make_frame()
+        sub = frame.take([2, 0])
+        self.assertEqual([3000, 1000], sub.reference_time.tolist())
+        row = frame.row(1)
+        self.assertEqual(2000, row['reference_time'])
+        self.assertEqual(601, row['weather_code'])
+        self.assertIsNone(row['rain'])
+        self.assertEqual(1.2, row['snow'])
+
+    def test_nbytes(self):
+        frame = self._make_frame()
+        self.assertEqual(3 * (8 * 10 + 4), frame.nbytes)
+
+    def test_wrong_instantiation_parameters(self):
+        self.assertRaises(ValueError, ForecastFrame, reference_time=[1, 2], temp=[280.])
+        self.assertRaises(ValueError, ForecastFrame, foo=[1])
+
+    def test_repr(self):
+        repr(self._make_frame())
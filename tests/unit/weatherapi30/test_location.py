@@ -4,7 +4,7 @@
 import unittest
 import json
 from pyowm.commons import exceptions
-from pyowm.weatherapi30.location import Location
+from pyowm.weatherapi30.location import Location, FrozenLocation
 from pyowm.utils.geo import Point
 
 
@@ -115,4 +115,15 @@ class TestLocation(unittest.TestCase):
                          sorted(result.geojson()))
 
     def test__repr(self):
-        repr(self.__test_instance)
\ No newline at end of file
+        repr(self.__test_instance)
+
+    def test_frozen_variant(self):
+        result = FrozenLocation(self.__test_name, self.__test_lon, self.__test_lat,
+                                self.__test_ID, self.__test_country)
+        self.assertEqual(self.__test_instance.to_dict(), result.to_dict())
+        result = FrozenLocation.from_dict({"coord": {"lon": -0.12574, "lat": 51.50853}, "id": 2643743,
+                                           "name": "London"})
+        self.assertIsInstance(result, FrozenLocation)
+        self.assertEqual(51.50853, result.lat)
+        self.assertRaises(AttributeError, setattr, result, 'lat', 10.)
+        self.assertFalse(hasattr(self.__test_instance, '__dict__'))
\ No newline at end of file
@@ -6,7 +6,7 @@ import json
 from datetime import datetime
 from pyowm.weatherapi30.location import Location
 from pyowm.weatherapi30.weather import Weather
-from pyowm.weatherapi30.observation import Observation
+from pyowm.weatherapi30.observation import Observation, FrozenObservation
 from pyowm.commons.exceptions import APIResponseError, ParseAPIResponseError
 from tests.unit.weatherapi30.json_test_responses import (
      OBSERVATION_JSON, OBSERVATION_NOT_FOUND_JSON, OBSERVATION_MALFORMED_JSON)
@@ -81,7 +81,7 @@ class TestObservation(unittest.TestCase):
         self.assertFalse(result.reception_time() is None)
         loc = result.location
         self.assertFalse(loc is None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
         weat = result.weather
         self.assertFalse(weat is None)
 
@@ -115,7 +115,7 @@ class TestObservation(unittest.TestCase):
             self.assertFalse(item.reception_time() is None)
             loc = item.location
             self.assertFalse(loc is None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
             weat = item.weather
             self.assertFalse(weat is None)
 
@@ -152,3 +152,9 @@ class TestObservation(unittest.TestCase):
 
     def test__repr(self):
         repr(self.__test_instance)
+
+    def test_frozen_variant(self):
+        result = FrozenObservation.from_dict(json.loads(OBSERVATION_JSON))
+        self.assertIsInstance(result, FrozenObservation)
+        self.assertEqual(Observation.from_dict(json.loads(OBSERVATION_JSON)).to_dict(), result.to_dict())
+        self.assertRaises(AttributeError, setattr, result, 'weather', None)
@@ -1,17 +1,21 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
 import json
 import unittest
 from datetime import datetime
 
 from pyowm.commons.exceptions import APIResponseError, ParseAPIResponseError
 from pyowm.weatherapi30.uris import ICONS_BASE_URI
-from pyowm.weatherapi30.weather import Weather
-from tests.unit.weatherapi30.json_test_responses import (CITY_WEATHER_HISTORY_JSON,
+from pyowm.weatherapi30.weather import Weather, FrozenWeather
+from tests.unit.weatherapi30.json_test_responses import (CITY_WEATHER_HISTORY_JSON, OBSERVATION_JSON,
                                                          CITY_WEATHER_HISTORY_NO_RESULTS_JSON,
                                                          CITY_WEATHER_HISTORY_NOT_FOUND_JSON,
-                                                         INTERNAL_SERVER_ERROR_JSON)
+                                                         INTERNAL_SERVER_ERROR_JSON, ONE_CALL_JSON,
+                                                         ONE_CALL_HISTORY_JSON, THREE_HOURS_FORECAST_JSON,
+                                                         DAILY_FORECAST_JSON, SEARCH_RESULTS_JSON,
+                                                         STATION_TICK_WEATHER_HISTORY_JSON)
 
 
 class TestWeather(unittest.TestCase):
@@ -593,6 +597,77 @@ class TestWeather(unittest.TestCase):
     def test_repr(self):
         repr(self.__test_instance)
 
+    def assert_same_as_from_dict(self, the_list, result):
+        expected = [Weather.from_dict(copy.deepcopy(item)).to_dict() for item in the_list]
+        self.assertEqual(expected, [item.to_dict() for item in result])
+
+    def test_from_list(self):
+        for payload in (THREE_HOURS_FORECAST_JSON, DAILY_FORECAST_JSON, SEARCH_RESULTS_JSON, CITY_WEATHER_HISTORY_JSON,
+                        STATION_TICK_WEATHER_HISTORY_JSON):
+            the_list = json.loads(payload)['list']
+            self.assert_same_as_from_dict(the_list, Weather.from_list(copy.deepcopy(the_list)))
+        self.assertEqual([], Weather.from_list([]))
+
+    def test_from_list_picks_parser_once_by_shape(self):
+        nested = json.loads(THREE_HOURS_FORECAST_JSON)['list'][0]
+        flat = json.loads(ONE_CALL_JSON)['hourly'][0]
+        station = json.loads(STATION_TICK_WEATHER_HISTORY_JSON)['list'][0]
+        self.assertEqual(Weather._from_nested_dict, Weather._parser_for(nested))
+        self.assertEqual(Weather._from_flat_dict, Weather._parser_for(flat))
+        self.assertEqual(Weather.from_dict, Weather._parser_for(dict(flat, calc={'dewpoint': 1.})))
+        self.assertEqual(Weather.from_dict, Weather._parser_for(dict(nested, humidity=10)))
+        self.assertEqual(Weather.from_dict, Weather._parser_for({'last': station}))
+
+    def test_from_onecall_lists(self):
+        for payload in (ONE_CALL_JSON, ONE_CALL_HISTORY_JSON):
+            the_dict = json.loads(payload)
+            self.assert_same_as_from_dict([the_dict['current']],
+                                          Weather.from_onecall_hourly_list([the_dict['current']]))
+            self.assert_same_as_from_dict(the_dict['hourly'], Weather.from_onecall_hourly_list(the_dict['hourly']))
+        daily = json.loads(ONE_CALL_JSON)['daily']
+        self.assert_same_as_from_dict(daily, Weather.from_onecall_daily_list(daily))
+        minutely = [{'dt': 1586001600, 'precipitation': 0.5}, {'dt': 1586001660, 'precipitation': 0}]
+        result = Weather.from_onecall_minutely_list(minutely)
+        self.assert_same_as_from_dict(minutely, result)
+        self.assertEqual({'all': 0.5}, result[0].rain)
+        self.assertNotIn('rain', minutely[0])
+        self.assertEqual([], Weather.from_onecall_hourly_list([]))
+
+    def test_fast_parsers_handle_optional_data(self):
+        flat = [{'dt': 1378897200, 'sunrise': 1378877413, 'sunset': 1378923812, 'timezone': 3600,
+                 'temp': {'day': 293.4, 'min': 283.0, 'max': 293.4}, 'feels_like': {'day': 292.1},
+                 'speed': 3.5, 'deg': 120, 'wind_gust': 7.0, 'clouds': {'all': 40}, 'visibility': {'distance': 900},
+                 'rain': 2.5, 'snow': {'3h': 1.0}, 'humidity': 50, 'pressure': 1012, 'dew_point': 280.1,
+                 'uvi': 2.3, 'pop': 0.4},
+                {'dt': 1378900800, 'temp': 293.4, 'feels_like': 290.0, 'wind_speed': 1.2, 'wind_deg': 10,
+                 'clouds': {}, 'visibility': 1000, 'rain': None, 'weather': [
+                     {'id': 500, 'main': 'Rain', 'description': 'light rain', 'icon': '10d'}]},
+                {'dt': 1378904400}]
+        self.assert_same_as_from_dict(flat, Weather.from_list(flat))
+        nested = [{'dt': 1378897200, 'main': {'temp': 293.4, 'humidity': 50, 'pressure': 1012, 'sea_level': 1020},
+                   'sys': {'sunrise': 1378877413, 'sunset': 1378923812}, 'timezone': 3600, 'visibility': 10000,
+                   'rain': {'1h': 0.2}, 'snow': 3, 'clouds': {'all': 90}, 'wind': {'speed': 2.0, 'deg': 90}},
+                  {'dt': 1378900800, 'main': {}, 'sys': {'pod': 'n'}, 'precipitation': 1.5, 'wind_speed': 3.2},
+                  {'dt': 1378904400, 'main': {'temp': 290.1}, 'wind': None, 'clouds': 20}]
+        self.assert_same_as_from_dict(nested, Weather.from_list(nested))
+
+    def test_fast_parsers_fail_with_missing_data(self):
+        self.assertRaises(KeyError, Weather.from_onecall_hourly_list, [{'temp': 280.}])
+        self.assertRaises(KeyError, Weather.from_list, [{'main': {'temp': 280.}}])
+        self.assertRaises(ValueError, Weather.from_onecall_daily_list, [{'dt': -1}])
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.__test_instance, '__dict__'))
+        self.assertRaises(AttributeError, setattr, self.__test_instance, 'not_an_attribute', 1)
+
+    def test_frozen_variant(self):
+        result = FrozenWeather.from_dict(json.loads(OBSERVATION_JSON))
+        self.assertIsInstance(result, FrozenWeather)
+        self.assertIsInstance(result, Weather)
+        self.assertEqual(Weather.from_dict(json.loads(OBSERVATION_JSON)).to_dict(), result.to_dict())
+        self.assertEqual(1.54, result.wind(unit='meters_sec')['speed'])
+        self.assertRaises(AttributeError, setattr, result, 'clouds', 10)
+
     def test_one_call_current_from_dic(self):
         current1 = {
             "dt": 1586001851,
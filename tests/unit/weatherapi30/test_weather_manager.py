@@ -3,12 +3,17 @@
 
 import json
 import unittest
+import pyowm.commons.exceptions
 from pyowm.weatherapi30.weather_manager import WeatherManager
 from pyowm.commons.http_client import HttpClient
+from pyowm.commons.tile import Tile
+from pyowm.commons.json_stream import JSONListStream
 from pyowm.constants import WEATHER_API_VERSION
 from pyowm.config import DEFAULT_CONFIG
 from pyowm.weatherapi30.historian import Historian
 from pyowm.weatherapi30.forecast import Forecast
+from pyowm.weatherapi30 import forecast_frame
+from pyowm.weatherapi30.forecast_frame import ForecastFrame
 from pyowm.weatherapi30.forecaster import Forecaster
 from pyowm.weatherapi30.location import Location
 from pyowm.weatherapi30.observation import Observation
@@ -82,6 +87,12 @@ class TestWeatherManager(unittest.TestCase):
     def mock_api_call_returning_weather_at_places_in_bbox(self, uri, params=None, headers=None):
         return 200, json.loads(WEATHER_AT_PLACES_IN_BBOX_JSON)
 
+    def mock_stream_call_returning_multiple_obs(self, uri, params=None, headers=None):
+        return 200, JSONListStream([SEARCH_RESULTS_JSON.encode('utf-8')])
+
+    def mock_stream_call_returning_weather_at_places_in_bbox(self, uri, params=None, headers=None):
+        return 200, JSONListStream([WEATHER_AT_PLACES_IN_BBOX_JSON.encode('utf-8')])
+
     def mock_api_call_returning_weather_history_at_coords(self, uri, params=None, headers=None):
         return 200, json.loads(CITY_WEATHER_HISTORY_JSON)
 
@@ -120,7 +131,7 @@ class TestWeatherManager(unittest.TestCase):
         self.assertTrue(result.reception_time() is not None)
         loc = result.location
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
         weat = result.weather
         self.assertTrue(weat is not None)
 
@@ -137,7 +148,7 @@ class TestWeatherManager(unittest.TestCase):
         self.assertTrue(result.reception_time() is not None)
         loc = result.location
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
         weat = result.weather
         self.assertTrue(weat is not None)
 
@@ -151,7 +162,7 @@ class TestWeatherManager(unittest.TestCase):
         self.assertTrue(result.reception_time() is not None)
         loc = result.location
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
         weat = result.weather
         self.assertTrue(weat is not None)
 
@@ -174,7 +185,7 @@ class TestWeatherManager(unittest.TestCase):
         self.assertTrue(result.reception_time() is not None)
         loc = result.location
         self.assertTrue(loc is not None)
-        self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+        self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
         weat = result.weather
         self.assertTrue(weat is not None)
 
@@ -194,6 +205,96 @@ class TestWeatherManager(unittest.TestCase):
             weat = obs.weather
             self.assertTrue(weat is not None)
 
+    def test_iter_weather_at_ids(self):
+        ref_to_original_call_API = HttpClient.stream_json_list
+        HttpClient.stream_json_list = self.mock_stream_call_returning_multiple_obs
+        result = self.__test_instance.iter_weather_at_ids([5128581, 15647, 78654])
+        self.assertFalse(isinstance(result, list))
+        result = list(result)
+        HttpClient.stream_json_list = ref_to_original_call_API
+        expected = Observation.from_dict_of_lists(json.loads(SEARCH_RESULTS_JSON))
+        self.assertEqual([obs.to_dict() for obs in expected], [obs.to_dict() for obs in result])
+
+    def test_iter_weather_at_ids_fails_when_wrong_parameters(self):
+        self.assertRaises(AssertionError, WeatherManager.iter_weather_at_ids, self.__test_instance, "test")
+        self.assertRaises(ValueError, WeatherManager.iter_weather_at_ids, self.__test_instance, [-1, 2, 3])
+
+    def test_iter_weather_with_no_results_or_errors(self):
+        original_func = HttpClient.stream_json_list
+        HttpClient.stream_json_list = lambda instance, uri, params=None, headers=None: \
+            (200, JSONListStream([b'{"message": "not found", "cod": "404"}']))
+        self.assertEqual([], list(self.__test_instance.iter_weather_at_ids([1])))
+        HttpClient.stream_json_list = lambda instance, uri, params=None, headers=None: \
+            (200, JSONListStream([b'{"message": "accurate", "cod": "200", "count": 0, "list": []}']))
+        self.assertEqual([], list(self.__test_instance.iter_weather_at_places('Nowhere', 'accurate')))
+        HttpClient.stream_json_list = lambda instance, uri, params=None, headers=None: \
+            (200, JSONListStream([b'{"message": "error", "cod": "500"}']))
+        self.assertRaises(pyowm.commons.exceptions.APIResponseError, list,
+                          self.__test_instance.iter_weather_at_ids([1]))
+        HttpClient.stream_json_list = original_func
+
+    def mock_group_call(self, uri, params=None, headers=None):
+        template = json.loads(SEARCH_RESULTS_JSON)['list'][0]
+        ids = [int(id) for id in params['id'].split(',')]
+        # the API does not guarantee any ordering of the results
+        items = [dict(template, id=id) for id in reversed(ids)]
+        return 200, {'cod': '200', 'cnt': len(items), 'list': items}
+
+    def test_weather_at_ids_with_many_ids(self):
+        calls = []
+
+        def mock_get_json(instance, uri, params=None, headers=None):
+            calls.append(params['id'])
+            return self.mock_group_call(uri, params=params)
+
+        ids = list(range(1, 46))
+        original_func = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        result = self.__test_instance.weather_at_ids(ids, max_workers=3)
+        HttpClient.get_json = original_func
+        self.assertEqual(3, len(calls))
+        self.assertEqual([20, 20, 5], sorted([len(call.split(',')) for call in calls], reverse=True))
+        self.assertEqual(ids, [obs.location.id for obs in result])
+
+    def test_weather_at_ids_chunks(self):
+        def mock_get_json(instance, uri, params=None, headers=None):
+            if params['id'].startswith('21,'):
+                raise pyowm.commons.exceptions.TimeoutError('timeout')
+            return self.mock_group_call(uri, params=params)
+
+        ids = list(range(1, 46))
+        original_func = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        result = list(self.__test_instance.weather_at_ids_chunks(ids))
+        self.assertRaises(pyowm.commons.exceptions.TimeoutError, self.__test_instance.weather_at_ids, ids)
+        HttpClient.get_json = original_func
+        self.assertEqual([ids[:20], ids[20:40], ids[40:]], [chunk for chunk, _, _ in result])
+        self.assertEqual(20, len(result[0][1]))
+        self.assertIsNone(result[0][2])
+        self.assertIsNone(result[1][1])
+        self.assertIsInstance(result[1][2], pyowm.commons.exceptions.TimeoutError)
+        self.assertEqual(5, len(result[2][1]))
+        self.assertRaises(ValueError, self.__test_instance.weather_at_ids_chunks, ids, max_workers=0)
+        self.assertRaises(AssertionError, self.__test_instance.weather_at_ids_chunks, 'test')
+
+    def test_iter_weather_at_ids_with_many_ids(self):
+        calls = []
+
+        def mock_stream(instance, uri, params=None, headers=None):
+            calls.append(params['id'])
+            _, data = self.mock_group_call(uri, params=params)
+            return 200, JSONListStream([json.dumps(data)])
+
+        original_func = HttpClient.stream_json_list
+        HttpClient.stream_json_list = mock_stream
+        result = self.__test_instance.iter_weather_at_ids(list(range(1, 26)))
+        first = next(result)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(20, first.location.id)
+        self.assertEqual(24, len(list(result)))
+        self.assertEqual(2, len(calls))
+        HttpClient.stream_json_list = original_func
+
     def test_weather_at_ids_fails_when_wrong_parameters(self):
         self.assertRaises(AssertionError, WeatherManager.weather_at_ids, self.__test_instance, "test")
         self.assertRaises(ValueError, WeatherManager.weather_at_ids, self.__test_instance, [-1, 2, 3])
@@ -212,7 +313,7 @@ class TestWeatherManager(unittest.TestCase):
             self.assertTrue(item.reception_time())
             loc = item.location
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
             weat = item.weather
             self.assertTrue(weat is not None)
 
@@ -230,7 +331,7 @@ class TestWeatherManager(unittest.TestCase):
             self.assertTrue(item.reception_time())
             loc = item.location
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
             weat = item.weather
             self.assertTrue(weat is not None)
 
@@ -250,7 +351,7 @@ class TestWeatherManager(unittest.TestCase):
             self.assertTrue(item.reception_time() is not None)
             loc = item.location
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
             weat = item.weather
             self.assertTrue(weat is not None)
 
@@ -266,7 +367,7 @@ class TestWeatherManager(unittest.TestCase):
             self.assertTrue(item.reception_time() is not None)
             loc = item.location
             self.assertTrue(loc is not None)
-            self.assertTrue(all(v is not None for v in loc.__dict__.values()))
+            self.assertTrue(all(getattr(loc, name) is not None for name in loc.__slots__))
             weat = item.weather
             self.assertTrue(weat is not None)
 
@@ -500,6 +601,92 @@ class TestWeatherManager(unittest.TestCase):
             self.assertTrue(isinstance(result.location, Location))
             self.assertTrue(result.reception_time() is not None)
 
+    def test_iter_weather_at_places(self):
+        original_func = HttpClient.stream_json_list
+        HttpClient.stream_json_list = self.mock_stream_call_returning_multiple_obs
+        result = list(self.__test_instance.iter_weather_at_places("London", "accurate", limit=2))
+        HttpClient.stream_json_list = original_func
+        self.assertEqual(2, len(result))
+        self.assertTrue(all(isinstance(item, Observation) for item in result))
+        self.assertRaises(ValueError, WeatherManager.iter_weather_at_places, self.__test_instance, 'London', 'x')
+        self.assertRaises(ValueError, WeatherManager.iter_weather_at_places, self.__test_instance, 'London',
+                          'accurate', -3)
+
+    def test_iter_weather_at_places_in_bbox(self):
+        original_func = HttpClient.stream_json_list
+        HttpClient.stream_json_list = self.mock_stream_call_returning_weather_at_places_in_bbox
+        results = list(self.__test_instance.iter_weather_at_places_in_bbox(12, 32, 15, 37, 10))
+        HttpClient.stream_json_list = original_func
+        expected = Observation.from_dict_of_lists(json.loads(WEATHER_AT_PLACES_IN_BBOX_JSON))
+        self.assertEqual([obs.to_dict() for obs in expected], [obs.to_dict() for obs in results])
+        self.assertRaises(ValueError, WeatherManager.iter_weather_at_places_in_bbox,
+                          self.__test_instance, 12, 32, 15, 37, -30)
+
+    def test_weather_at_places_in_bbox_with_tiles(self):
+        calls = []
+        payload = json.loads(WEATHER_AT_PLACES_IN_BBOX_JSON)
+
+        def mock_get_json(instance, uri, params=None, headers=None):
+            calls.append(params['bbox'])
+            return 200, payload  # the same cities for each tile
+
+        original_func = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        expected = Observation.from_dict_of_lists(payload)
+        results = self.__test_instance.weather_at_places_in_bbox(6.6, 36.6, 18.5, 47.1, zoom=10, tile_zoom=6,
+                                                                 max_workers=3)
+        HttpClient.get_json = original_func
+        self.assertEqual(9, len(calls))
+        self.assertEqual(9, len(set(calls)))
+        for bbox in calls:
+            lon_left, lat_bottom, lon_right, lat_top, zoom = map(float, bbox.split(','))
+            self.assertTrue(6.6 <= lon_left < lon_right <= 18.5)
+            self.assertTrue(36.6 <= lat_bottom < lat_top <= 47.1)
+            self.assertEqual(10, zoom)
+        self.assertEqual([obs.location.id for obs in expected], [obs.location.id for obs in results])
+
+    def test_weather_at_places_in_bbox_with_tiles_fails(self):
+        def mock_get_json(instance, uri, params=None, headers=None):
+            if params['bbox'].startswith('11.25,'):
+                raise pyowm.commons.exceptions.TimeoutError('timeout')
+            return 200, json.loads(WEATHER_AT_PLACES_IN_BBOX_JSON)
+
+        original_func = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        self.assertRaises(pyowm.commons.exceptions.TimeoutError, self.__test_instance.weather_at_places_in_bbox,
+                          6.6, 36.6, 18.5, 47.1, tile_zoom=6)
+        HttpClient.get_json = original_func
+        self.assertRaises(AssertionError, self.__test_instance.weather_at_places_in_bbox, 6.6, 36.6, 18.5, 47.1,
+                          tile_zoom='6')
+        self.assertRaises(ValueError, self.__test_instance.weather_at_places_in_bbox, 6.6, 36.6, 18.5, 47.1,
+                          tile_zoom=-1)
+        self.assertRaises(ValueError, self.__test_instance.weather_at_places_in_bbox, 6.6, 36.6, 18.5, 47.1,
+                          tile_zoom=6, max_workers=0)
+
+    def test_weather_at_places_in_bbox_with_too_many_tiles(self):
+        calls = []
+
+        def mock_get_json(instance, uri, params=None, headers=None):
+            calls.append(params['bbox'])
+            return 200, json.loads(WEATHER_AT_PLACES_IN_BBOX_JSON)
+
+        original_func = HttpClient.get_json
+        HttpClient.get_json = mock_get_json
+        try:
+            with self.assertRaises(ValueError) as cm:
+                self.__test_instance.weather_at_places_in_bbox(-180, -85, 180, 85, tile_zoom=18)
+            self.assertIn(str(Tile.tiles_count_for_bbox(-180, -85, 180, 85, 18)), str(cm.exception))
+            self.assertRaises(ValueError, self.__test_instance.weather_at_places_in_bbox, 6.6, 36.6, 18.5, 47.1,
+                              tile_zoom=6, max_tiles=8)
+            self.assertEqual(0, len(calls))
+            self.__test_instance.weather_at_places_in_bbox(6.6, 36.6, 18.5, 47.1, tile_zoom=6, max_tiles=9)
+            self.__test_instance.weather_at_places_in_bbox(6.6, 36.6, 18.5, 47.1, tile_zoom=6, max_tiles=None)
+            self.assertEqual(18, len(calls))
+            self.assertRaises(AssertionError, self.__test_instance.weather_at_places_in_bbox, 6.6, 36.6, 18.5, 47.1,
+                              tile_zoom=6, max_tiles='9')
+        finally:
+            HttpClient.get_json = original_func
+
     def test_station_tick_history_without_limits(self):
         original_func = HttpClient.get_json
         HttpClient.get_json = \
@@ -624,6 +811,47 @@ class TestWeatherManager(unittest.TestCase):
         self.assertRaises(AssertionError, WeatherManager.one_call, self.__test_instance, None, 12.7)
         self.assertRaises(AssertionError, WeatherManager.one_call, self.__test_instance, 46.23, 'test')
 
+    @unittest.skipIf(forecast_frame.numpy is None, 'numpy is not installed')
+    def test_one_call_frame(self):
+        original_func = HttpClient.get_json
+        HttpClient.get_json = \
+            self.mock_api_call_returning_onecall_data
+        result = self.__test_instance.one_call_frame(46.23, 12.7)
+        daily = self.__test_instance.one_call_frame(46.23, 12.7, series='daily', units='metric')
+        HttpClient.get_json = original_func
+        expected = json.loads(ONE_CALL_JSON)
+        self.assertIsInstance(result, ForecastFrame)
+        self.assertEqual([item['dt'] for item in expected['hourly']], result.reference_time.tolist())
+        self.assertEqual([item['dt'] for item in expected['daily']], daily.reference_time.tolist())
+
+    def test_one_call_frame_fails(self):
+        self.assertRaises(AssertionError, WeatherManager.one_call_frame, self.__test_instance, None, 12.7)
+        self.assertRaises(ValueError, WeatherManager.one_call_frame, self.__test_instance, 46.23, 12.7, 'weekly')
+
+    def test_one_call_many(self):
+        def mock_one_call(instance, lat, lon, **kwargs):
+            if lat < 0:
+                raise pyowm.commons.exceptions.APIResponseError('boom')
+            return OneCall.from_dict(dict(json.loads(ONE_CALL_JSON), lat=lat, lon=lon))
+
+        original_func = WeatherManager.one_call
+        WeatherManager.one_call = mock_one_call
+        coords = [(46.23, 12.7), (-12.0, 3.5), (10.1, 20.2)]
+        result = list(self.__test_instance.one_call_many(iter(coords), max_workers=2, units='metric'))
+        WeatherManager.one_call = original_func
+        self.assertEqual(3, len(result))
+        self.assertEqual(sorted(coords), sorted(latlon for latlon, _, _ in result))
+        for latlon, oc, error in result:
+            if latlon == (-12.0, 3.5):
+                self.assertIsNone(oc)
+                self.assertIsInstance(error, pyowm.commons.exceptions.APIResponseError)
+            else:
+                self.assertIsNone(error)
+                self.assertEqual(latlon, (oc.lat, oc.lon))
+
+    def test_one_call_many_fails_with_wrong_parameters(self):
+        self.assertRaises(ValueError, WeatherManager.one_call_many, self.__test_instance, [(1, 2)], max_workers=0)
+
     def test_one_call_history_without_time_range(self):
         original_func = HttpClient.get_json
         HttpClient.get_json = \
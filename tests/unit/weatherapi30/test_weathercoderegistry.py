@@ -30,9 +30,40 @@ class TestWeatherCodeRegistry(unittest.TestCase):
         self.assertEqual("abc", self.__test_instance.status_for(150))
         self.assertEqual("xyz", self.__test_instance.status_for(345))
 
+    def test_status_for_range_boundaries(self):
+        self.assertEqual("abc", self.__test_instance.status_for(1))
+        self.assertEqual("abc", self.__test_instance.status_for(100))
+        self.assertTrue(self.__test_instance.status_for(0) is None)
+        self.assertTrue(self.__test_instance.status_for(101) is None)
+
+    def test_status_for_overlapping_ranges(self):
+        instance = WeatherCodeRegistry({
+            "first": [{"start": 10, "end": 20}],
+            "second": [{"start": 15, "end": 30}]
+        })
+        self.assertEqual("first", instance.status_for(15))
+        self.assertEqual("second", instance.status_for(21))
+
+    def test_statuses_for(self):
+        self.assertEqual(["abc", None, "xyz"],
+                         self.__test_instance.statuses_for([150, 999, 345]))
+        self.assertEqual([], self.__test_instance.statuses_for([]))
+
+    def test_statuses_for_weathers(self):
+
+        class MockWeather:
+            def __init__(self, weather_code):
+                self.weather_code = weather_code
+
+        weathers = [MockWeather(345), MockWeather(2), MockWeather(200)]
+        self.assertEqual(["xyz", "abc", None],
+                         self.__test_instance.statuses_for(iter(weathers)))
+
     def test_get_instance(self):
         result = WeatherCodeRegistry.get_instance()
         self.assertTrue(isinstance(result, WeatherCodeRegistry))
+        self.assertIs(result, WeatherCodeRegistry.get_instance())
+        self.assertEqual("rain", result.status_for(501))
 
     def test_repr(self):
         repr(self.__test_instance)